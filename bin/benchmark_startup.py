@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Measures the startup time of Hummingbot, each sample in a new Python process so that no module is already imported:
+
+- cli: importing the modules of bin/hummingbot.py (the CLI entry point lists the connectors while importing them)
+- headless: importing TradingCore, creating it and listing the connectors, as the headless startup does
+
+Usage:
+    python bin/benchmark_startup.py [--runs 5] [--no-manifest]
+
+--no-manifest lists the connectors importing their utils modules, instead of reading the connectors manifest, to
+compare with the startup time before the manifest (see hummingbot/client/connector_manifest.py).
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from os.path import dirname, join, realpath
+from typing import Dict, List
+
+import path_util  # noqa: F401
+
+BIN_PATH = realpath(dirname(__file__))
+ROOT_PATH = realpath(join(BIN_PATH, ".."))
+
+SETUP = """
+import sys
+import time
+sys.path.insert(0, {bin_path!r})
+sys.path.insert(0, {root_path!r})
+start = time.perf_counter()
+if {no_manifest!r}:
+    import hummingbot.client.settings
+    hummingbot.client.settings.load_connector_manifest = lambda *args, **kwargs: None
+"""
+
+BENCHMARKS = {
+    "cli": """
+import runpy
+runpy.run_path({script_path!r}, run_name="benchmark")
+from hummingbot.client.settings import AllConnectorSettings
+AllConnectorSettings.get_connector_settings()
+""",
+    "headless": """
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.core.trading_core import TradingCore
+TradingCore(ClientConfigMap())
+AllConnectorSettings.get_connector_settings()
+""",
+}
+
+REPORT = """
+import json
+print(json.dumps({"seconds": time.perf_counter() - start, "modules": len(sys.modules)}))
+"""
+
+
+def run_benchmark(name: str, no_manifest: bool) -> Dict[str, float]:
+    code = (SETUP.format(bin_path=BIN_PATH, root_path=ROOT_PATH, no_manifest=no_manifest)
+            + BENCHMARKS[name].format(script_path=join(BIN_PATH, "hummingbot.py"))
+            + REPORT)
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT_PATH, capture_output=True, text=True)
+    if output.returncode != 0:
+        raise RuntimeError(f"The {name} benchmark failed:\n{output.stderr}")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the startup time of Hummingbot.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of samples of each benchmark.")
+    parser.add_argument("--no-manifest", action="store_true", help="List the connectors importing their modules.")
+    args = parser.parse_args()
+
+    for name in BENCHMARKS:
+        samples: List[Dict[str, float]] = [run_benchmark(name, args.no_manifest) for _ in range(args.runs)]
+        seconds = [sample["seconds"] for sample in samples]
+        print(f"{name}: median {statistics.median(seconds):.3f}s, min {min(seconds):.3f}s, "
+              f"max {max(seconds):.3f}s, {samples[-1]['modules']} modules imported ({args.runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
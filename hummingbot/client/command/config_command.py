@@ -85,6 +85,7 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_storage",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -3,12 +3,13 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
+from hummingbot.client.trade_fills_aggregator import TradeFillsAggregator, TradeFillsSummary
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
@@ -39,17 +40,20 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trading_core.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+        summaries = self.get_trade_fills_summaries(start_time)
+        if not summaries:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.history_report(start_time, summaries, precision))
+
+    def get_trade_fills_summaries(self,  # type: HummingbotApplication
+                                  start_time: float) -> Dict[Tuple[str, str], TradeFillsSummary]:
+        if self.trading_core.markets_recorder is not None:
+            self.trading_core.markets_recorder.flush()
+        aggregator = TradeFillsAggregator(self.trading_core.trade_fill_db, self.strategy_file_name)
+        return aggregator.summaries(int(start_time * 1e3))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -65,15 +69,13 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             summaries: Dict[Tuple[str, str], TradeFillsSummary],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), summary in summaries.items():
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.trading_core.get_current_balances(market), network_timeout)
@@ -82,7 +84,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await PerformanceMetrics.create_from_summary(symbol, summary, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -89,6 +89,9 @@ class MQTTBridgeConfigMap(BaseClientModel):
     model_config = ConfigDict(title="mqtt_bridge")
 
 
+MARKET_DATA_COLLECTION_STORAGES = ["sql", "columnar"]
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=False,
@@ -104,8 +107,22 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         ge=2,
         json_schema_extra={"prompt": lambda cm: "Set the order book collection depth (Default=20)"},
     )
+    market_data_collection_storage: str = Field(
+        default="sql",
+        json_schema_extra={"prompt": lambda cm: (
+            "Where to store the market data? (sql: MarketData table of the trades database, columnar: compact files "
+            "in data/market_data)"
+        )},
+    )
     model_config = ConfigDict(title="market_data_collection")
 
+    @field_validator("market_data_collection_storage", mode="before")
+    @classmethod
+    def validate_market_data_collection_storage(cls, v: str):
+        if v not in MARKET_DATA_COLLECTION_STORAGES:
+            raise ValueError(f"Invalid storage, please choose a value from {MARKET_DATA_COLLECTION_STORAGES}.")
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
@@ -0,0 +1,129 @@
+"""
+Manifest of the connectors packages, used by AllConnectorSettings to list the connectors without importing their
+modules. The manifest is generated from the constants of the connectors utils modules (EXAMPLE_PAIR, CENTRALIZED,
+OTHER_DOMAINS...), that are read from their source without importing them, so it does not depend on the optional
+dependencies installed. Regenerate it after adding a connector or changing those constants with:
+
+    python -m hummingbot.client.connector_manifest
+"""
+import ast
+import json
+from os import DirEntry, scandir
+from os.path import exists, join
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot import root_path
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = Path(__file__).parent / "connector_manifest.json"
+
+CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+CONNECTOR_EXCEPTIONS = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+
+# Constants of the utils modules listed in the manifest, with their default values
+UTILS_MODULE_CONSTANTS = {
+    "CENTRALIZED": True,
+    "EXAMPLE_PAIR": "",
+    "USE_ETHEREUM_WALLET": False,
+    "USE_ETH_GAS_LOOKUP": False,
+    "OTHER_DOMAINS": [],
+    "OTHER_DOMAINS_PARAMETER": {},
+    "OTHER_DOMAINS_EXAMPLE_PAIR": {},
+}
+
+
+def connector_packages(connector_path: Optional[Path] = None) -> List[Tuple[str, str]]:
+    """
+    Lists the connectors packages with a utils module, as (type directory, connector directory) tuples, e.g.
+    ("exchange", "binance"), without importing them.
+    """
+    connector_path = connector_path or root_path() / "hummingbot" / "connector"
+    packages = []
+    type_dirs: List[DirEntry] = [
+        f for f in scandir(connector_path) if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+    ]
+    for type_dir in type_dirs:
+        for connector_dir in scandir(type_dir.path):
+            if (connector_dir.is_dir()
+                    and not connector_dir.name.startswith("_")
+                    and connector_dir.name not in CONNECTOR_EXCEPTIONS
+                    and exists(join(connector_dir.path, "__init__.py"))
+                    and exists(join(connector_dir.path, f"{connector_dir.name}_utils.py"))):
+                packages.append((type_dir.name, connector_dir.name))
+    return sorted(packages)
+
+
+def generate_connector_manifest(connector_path: Optional[Path] = None) -> Dict[str, Any]:
+    connector_path = connector_path or root_path() / "hummingbot" / "connector"
+    connectors = []
+    for type_name, connector_name in connector_packages(connector_path):
+        constants = _read_utils_module_constants(connector_path / type_name / connector_name / f"{connector_name}_utils.py")
+        connectors.append({
+            "name": connector_name,
+            "type": type_name,
+            "utils_module": f"hummingbot.connector.{type_name}.{connector_name}.{connector_name}_utils",
+            "centralised": constants["CENTRALIZED"],
+            "example_pair": constants["EXAMPLE_PAIR"],
+            "use_ethereum_wallet": constants["USE_ETHEREUM_WALLET"],
+            "use_eth_gas_lookup": constants["USE_ETH_GAS_LOOKUP"],
+            "other_domains": [
+                {
+                    "name": domain,
+                    "example_pair": constants["OTHER_DOMAINS_EXAMPLE_PAIR"][domain],
+                    "domain_parameter": constants["OTHER_DOMAINS_PARAMETER"][domain],
+                }
+                for domain in constants["OTHER_DOMAINS"]
+            ],
+        })
+    return {"version": MANIFEST_VERSION, "connectors": connectors}
+
+
+def write_connector_manifest(path: Path = MANIFEST_PATH, connector_path: Optional[Path] = None):
+    with open(path, "w") as f:
+        json.dump(generate_connector_manifest(connector_path), f, indent=2)
+        f.write("\n")
+
+
+def load_connector_manifest(path: Path = MANIFEST_PATH,
+                            connector_path: Optional[Path] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Returns the connectors listed in the manifest, or None if the manifest is missing, was generated by another
+    version, or does not list the same connectors packages as the connector directory.
+    """
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    connectors = manifest["connectors"]
+    if sorted((entry["type"], entry["name"]) for entry in connectors) != connector_packages(connector_path):
+        return None
+    return connectors
+
+
+def _read_utils_module_constants(utils_path: Path) -> Dict[str, Any]:
+    constants = dict(UTILS_MODULE_CONSTANTS)
+    tree = ast.parse(utils_path.read_text(), filename=str(utils_path))
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id in UTILS_MODULE_CONSTANTS:
+                try:
+                    constants[target.id] = ast.literal_eval(value)
+                except ValueError:
+                    raise ValueError(f"{target.id} in {utils_path} must be a literal to be listed in the connectors "
+                                     f"manifest.")
+    return constants
+
+
+if __name__ == "__main__":
+    write_connector_manifest()
+    print(f"Connectors manifest written to {MANIFEST_PATH}")
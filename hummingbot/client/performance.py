@@ -2,7 +2,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
@@ -11,6 +11,9 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
 
+if TYPE_CHECKING:
+    from hummingbot.client.trade_fills_aggregator import TradeFillsSummary
+
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
@@ -71,6 +74,18 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_summary(cls,
+                                  trading_pair: str,
+                                  summary: "TradeFillsSummary",
+                                  current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Same as create, from the totals of the trade fills of the trading pair, see TradeFillsAggregator.
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_summary(trading_pair, summary, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +211,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_totals_and_avg_prices()
+
+        return buys, sells
+
+    def _calculate_totals_and_avg_prices(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +226,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +266,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -267,22 +288,25 @@ class PerformanceMetrics:
 
         # Handle trade_pnl differently for derivatives
         if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
+            self.trade_pnl = self._calculate_derivative_trade_pnl(buys, sells)
 
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
+    def _calculate_derivative_trade_pnl(self, buys: list, sells: list) -> Decimal:
+        buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
+        long = []
+        short = []
 
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
+        while True:
+            lng = self.position_order(buys_copy, sells_copy)
+            if lng is not None:
+                long.append(lng)
 
-            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
+            sht = self.position_order(sells_copy, buys_copy)
+            if sht is not None:
+                short.append(sht)
+            if lng is None and sht is None:
+                break
+
+        return Decimal(str(sum(self.derivative_pnl(long, short))))
 
     async def _initialize_metrics(self,
                                   trading_pair: str,
@@ -302,15 +326,68 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  Decimal(str(trades[0].price)),
+                                                  Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_summary(self,
+                                               trading_pair: str,
+                                               summary: "TradeFillsSummary",
+                                               current_balances: Dict[str, Decimal]):
+        """
+        Calculates the same metrics as _initialize_metrics from the totals of the trades
+        :param trading_pair: the trading market to get performance metrics
+        :param summary: the totals of the trades of the trading market
+        :param current_balances: current user account balance
+        """
+        base, quote = split_hb_trading_pair(trading_pair)
+        self.b_vol_base = summary.buy_base_volume
+        self.b_vol_quote = summary.buy_quote_volume * Decimal("-1")
+        self.s_vol_base = summary.sell_base_volume * Decimal("-1")
+        self.s_vol_quote = summary.sell_quote_volume + summary.deducted_fees_impact
+        self._calculate_totals_and_avg_prices()
+
+        self.num_buys = summary.num_buys
+        self.num_sells = summary.num_sells
+        self.num_trades = self.num_buys + self.num_sells
+
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  summary.first_price,
+                                                  summary.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+        if summary.are_derivatives:
+            self.trade_pnl = self._calculate_derivative_trade_pnl(summary.position_buys, summary.position_sells)
+
+        for fee_token, fee_amount in summary.fees.items():
+            self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             first_price: Decimal,
+                                             last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = first_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +395,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
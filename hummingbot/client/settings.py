@@ -1,13 +1,17 @@
 import importlib
 from decimal import Decimal
 from enum import Enum
-from os import DirEntry, scandir
-from os.path import exists, join
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import (  # noqa: F401
+    CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES,
+    connector_packages,
+    load_connector_manifest,
+)
 from hummingbot.connector.gateway.common_types import ConnectorType as GatewayConnectorType, get_connector_type
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -52,8 +56,6 @@ GATEAWAY_CA_CERT_PATH = DEFAULT_GATEWAY_CERTS_PATH / "ca_cert.pem"
 GATEAWAY_CLIENT_CERT_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_cert.pem"
 GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
-CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
-
 
 class ConnectorType(Enum):
     """
@@ -71,22 +73,74 @@ class ConnectorType(Enum):
 # GatewayConnectionSetting has been removed - gateway connectors are now configured in Gateway, not Hummingbot
 
 
-class ConnectorSetting(NamedTuple):
-    name: str
-    type: ConnectorType
-    example_pair: str
-    centralised: bool
-    use_ethereum_wallet: bool
-    trade_fee_schema: TradeFeeSchema
-    config_keys: Optional["BaseConnectorConfigMap"]
-    is_sub_domain: bool
-    parent_name: Optional[str]
-    domain_parameter: Optional[str]
-    use_eth_gas_lookup: bool
+ConnectorUtilsLoader = Callable[[], Tuple[TradeFeeSchema, Optional["BaseConnectorConfigMap"]]]
+
+
+class ConnectorSetting:
     """
     This class has metadata data about Exchange connections. The name of the connection and the file path location of
     the connector file.
+
+    The trade fee schema and the config keys are defined in the utils module of the connector. The settings listed
+    from the connectors manifest take a utils_loader instead, that imports the module the first time they are used.
     """
+    _fields = ("name", "type", "example_pair", "centralised", "use_ethereum_wallet", "trade_fee_schema", "config_keys",
+               "is_sub_domain", "parent_name", "domain_parameter", "use_eth_gas_lookup")
+
+    def __init__(self,
+                 name: str,
+                 type: ConnectorType,
+                 example_pair: str,
+                 centralised: bool,
+                 use_ethereum_wallet: bool,
+                 trade_fee_schema: Optional[TradeFeeSchema],
+                 config_keys: Optional["BaseConnectorConfigMap"],
+                 is_sub_domain: bool,
+                 parent_name: Optional[str],
+                 domain_parameter: Optional[str],
+                 use_eth_gas_lookup: bool,
+                 utils_loader: Optional[ConnectorUtilsLoader] = None):
+        self.name = name
+        self.type = type
+        self.example_pair = example_pair
+        self.centralised = centralised
+        self.use_ethereum_wallet = use_ethereum_wallet
+        self.is_sub_domain = is_sub_domain
+        self.parent_name = parent_name
+        self.domain_parameter = domain_parameter
+        self.use_eth_gas_lookup = use_eth_gas_lookup
+        self._trade_fee_schema = trade_fee_schema
+        self._config_keys = config_keys
+        self._utils_loader = utils_loader
+
+    @property
+    def trade_fee_schema(self) -> TradeFeeSchema:
+        self._load_utils()
+        return self._trade_fee_schema
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        self._load_utils()
+        return self._config_keys
+
+    @property
+    def utils_loaded(self) -> bool:
+        return self._utils_loader is None
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ConnectorSetting) and self._asdict() == other._asdict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"ConnectorSetting({fields})"
+
+    def _load_utils(self):
+        if self._utils_loader is not None:
+            self._trade_fee_schema, self._config_keys = self._utils_loader()
+            self._utils_loader = None
 
     def uses_gateway_generic_connector(self) -> bool:
         non_gateway_connectors_types = [ConnectorType.Exchange, ConnectorType.Derivative, ConnectorType.Connector]
@@ -239,71 +293,20 @@ class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = True):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Create a dictionary of exchange names to ConnectorSetting.
+
+        The connectors are listed from the connectors manifest, without importing their modules, when it is up to date
+        with the connectors packages (see connector_manifest). Otherwise, iterate over files in specific Python
+        directories importing the utils module of each connector.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        manifest = load_connector_manifest() if use_manifest else None
+        if manifest is not None:
+            cls._create_connector_settings_from_manifest(manifest)
+        else:
+            cls._create_connector_settings_from_modules()
 
         # add gateway connectors dynamically from Gateway API
         # Gateway connectors are now configured in Gateway, not in Hummingbot
@@ -311,6 +314,90 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def _create_connector_settings_from_manifest(cls, manifest: List[Dict[str, Any]]):
+        for entry in manifest:
+            if entry["name"] in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {entry['name']} name.")
+            cls.all_connector_settings[entry["name"]] = ConnectorSetting(
+                name=entry["name"],
+                type=ConnectorType[entry["type"].capitalize()],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=None,
+                config_keys=None,
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+                utils_loader=partial(_load_connector_utils, entry["utils_module"], entry["name"], False),
+            )
+            # Adds other domains of connector
+            for domain in entry["other_domains"]:
+                cls.all_connector_settings[domain["name"]] = ConnectorSetting(
+                    name=domain["name"],
+                    type=ConnectorType[entry["type"].capitalize()],
+                    centralised=entry["centralised"],
+                    example_pair=domain["example_pair"],
+                    use_ethereum_wallet=entry["use_ethereum_wallet"],
+                    trade_fee_schema=None,
+                    config_keys=None,
+                    is_sub_domain=True,
+                    parent_name=entry["name"],
+                    domain_parameter=domain["domain_parameter"],
+                    use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+                    utils_loader=partial(_load_connector_utils, entry["utils_module"], domain["name"], True),
+                )
+
+    @classmethod
+    def _create_connector_settings_from_modules(cls):
+        for type_name, connector_name in connector_packages():
+            if connector_name in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_name} name.")
+            try:
+                util_module_path: str = f"hummingbot.connector.{type_name}." \
+                                        f"{connector_name}.{connector_name}_utils"
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_name, trade_fee_settings
+            )
+            cls.all_connector_settings[connector_name] = ConnectorSetting(
+                name=connector_name,
+                type=ConnectorType[type_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                trade_fee_schema=trade_fee_schema,
+                config_keys=getattr(util_module, "KEYS", None),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = cls.all_connector_settings[connector_name]
+                cls.all_connector_settings[domain] = ConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         cls.paper_trade_connectors_names = paper_trade_exchanges
@@ -323,12 +410,13 @@ class AllConnectorSettings:
                     centralised=base_connector_settings.centralised,
                     example_pair=base_connector_settings.example_pair,
                     use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
+                    trade_fee_schema=None,
+                    config_keys=None,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
+                    utils_loader=partial(_base_connector_utils, base_connector_settings),
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -416,6 +504,24 @@ class AllConnectorSettings:
         return trade_fee_schema
 
 
+def _load_connector_utils(utils_module_path: str,
+                          connector_name: str,
+                          is_sub_domain: bool) -> Tuple[TradeFeeSchema, Optional["BaseConnectorConfigMap"]]:
+    util_module = importlib.import_module(utils_module_path)
+    if is_sub_domain:
+        trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[connector_name]
+        config_keys = getattr(util_module, "OTHER_DOMAINS_KEYS")[connector_name]
+    else:
+        trade_fee_settings = getattr(util_module, "DEFAULT_FEES", None)
+        config_keys = getattr(util_module, "KEYS", None)
+    return AllConnectorSettings._validate_trade_fee_schema(connector_name, trade_fee_settings), config_keys
+
+
+def _base_connector_utils(
+        base_connector_settings: ConnectorSetting) -> Tuple[TradeFeeSchema, Optional["BaseConnectorConfigMap"]]:
+    return base_connector_settings.trade_fee_schema, base_connector_settings.config_keys
+
+
 def gateway_connector_trading_pairs(connector: str) -> List[str]:
     """
     Returns trading pair used by specified gateway connnector.
@@ -0,0 +1,274 @@
+import json
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Text, cast, func
+
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+MS_PER_DAY = 86400 * 1000
+
+MarketKey = Tuple[str, str]
+
+
+@dataclass
+class PositionFill:
+    """
+    The fields of a derivative trade fill needed to pair the open and close position orders, see
+    PerformanceMetrics.aggregate_position_order.
+    """
+    order_id: str
+    trade_type: str
+    price: Decimal
+    amount: Decimal
+    position: str
+
+
+@dataclass
+class TradeFillsSummary:
+    """
+    Totals of the trade fills of a market and trading pair, in the units of PerformanceMetrics: the base and quote
+    volumes are positive, and deducted_fees_impact is the (negative) impact of the fees deducted from the returns on
+    the sell quote volume. Summaries of consecutive time ranges are merged with `add`.
+    """
+    num_buys: int = 0
+    num_sells: int = 0
+    num_nil_buys: int = 0
+    num_nil_sells: int = 0
+    buy_base_volume: Decimal = s_decimal_0
+    buy_quote_volume: Decimal = s_decimal_0
+    sell_base_volume: Decimal = s_decimal_0
+    sell_quote_volume: Decimal = s_decimal_0
+    deducted_fees_impact: Decimal = s_decimal_0
+    # Fees paid by token, the percent fees being in the quote token
+    fees: Dict[str, Decimal] = field(default_factory=lambda: defaultdict(lambda: s_decimal_0))
+    first_timestamp: Optional[int] = None
+    first_price: Optional[Decimal] = None
+    last_timestamp: Optional[int] = None
+    last_price: Optional[Decimal] = None
+    # Buys and sells of a derivative market, in timestamp order
+    position_buys: List[PositionFill] = field(default_factory=list)
+    position_sells: List[PositionFill] = field(default_factory=list)
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        """
+        Same rule as PerformanceMetrics._are_derivatives, applied to the buys and the sells: all the trades of a side
+        have an open or close position.
+        """
+        return ((self.num_buys > 0 and self.num_nil_buys == 0)
+                or (self.num_sells > 0 and self.num_nil_sells == 0))
+
+    def add(self, other: "TradeFillsSummary"):
+        self.num_buys += other.num_buys
+        self.num_sells += other.num_sells
+        self.num_nil_buys += other.num_nil_buys
+        self.num_nil_sells += other.num_nil_sells
+        self.buy_base_volume += other.buy_base_volume
+        self.buy_quote_volume += other.buy_quote_volume
+        self.sell_base_volume += other.sell_base_volume
+        self.sell_quote_volume += other.sell_quote_volume
+        self.deducted_fees_impact += other.deducted_fees_impact
+        for token, amount in other.fees.items():
+            self.fees[token] += amount
+        if other.first_timestamp is not None:
+            self._add_price(other.first_timestamp, other.first_price)
+            self._add_price(other.last_timestamp, other.last_price)
+
+    def add_group(self,
+                  trade_type: str,
+                  position: Optional[str],
+                  price: Decimal,
+                  quote: str,
+                  trade_fee: Dict[str, Any],
+                  count: int,
+                  amount: Decimal,
+                  first_timestamp: int,
+                  last_timestamp: int):
+        """
+        Adds `count` trade fills with the same side, position, price and fee, with a total base `amount`.
+        """
+        quote_volume = amount * price
+        if trade_type.upper() == TradeType.BUY.name:
+            self.num_buys += count
+            self.num_nil_buys += count if position == PositionAction.NIL.value else 0
+            self.buy_base_volume += amount
+            self.buy_quote_volume += quote_volume
+        elif trade_type.upper() == TradeType.SELL.name:
+            self.num_sells += count
+            self.num_nil_sells += count if position == PositionAction.NIL.value else 0
+            self.sell_base_volume += amount
+            self.sell_quote_volume += quote_volume
+
+        if trade_fee.get("percent") is not None:
+            fee_percent = Decimal(str(trade_fee["percent"]))
+            self.fees[quote] += quote_volume * fee_percent
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.deducted_fees_impact -= quote_volume * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"]) * count
+
+        self._add_price(first_timestamp, price)
+        self._add_price(last_timestamp, price)
+
+    def _add_price(self, timestamp: int, price: Decimal):
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp, self.first_price = timestamp, price
+        if self.last_timestamp is None or timestamp >= self.last_timestamp:
+            self.last_timestamp, self.last_price = timestamp, price
+
+
+@dataclass
+class _DailyRollups:
+    # Summaries by day and market of the complete days in [first_day, end_day)
+    first_day: int
+    end_day: int
+    summaries: Dict[int, Dict[MarketKey, TradeFillsSummary]]
+
+
+class TradeFillsAggregator:
+    """
+    Summarizes the trade fills of a strategy config by market and trading pair for the performance reports, see
+    PerformanceMetrics.create_from_summary.
+
+    The volumes, fees and prices are aggregated by the database, grouping the fills by market, trading pair, day,
+    side, position, price and fee, so only the groups are loaded, and the amount sums of the SqliteDecimal columns
+    are exact. The derivative markets also need their fills to pair the open and close positions, which are streamed
+    in chunks of `chunk_size` rows.
+
+    The summaries of the complete UTC days (ended more than `settle_time` seconds ago) are kept by database and config
+    file, so the next reports only query the days after them and the partial first day.
+    """
+    _daily_rollups: Dict[Tuple[str, str], _DailyRollups] = {}
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 config_file_path: str,
+                 chunk_size: int = 1000,
+                 settle_time: float = 3600):
+        self._sql = sql
+        self._config_file_path = config_file_path
+        self._chunk_size = chunk_size
+        self._settle_time = settle_time
+        self._fees_by_json: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def clear_rollups(cls):
+        cls._daily_rollups.clear()
+
+    def summaries(self, start_timestamp: int, now: Optional[float] = None) -> Dict[MarketKey, TradeFillsSummary]:
+        """
+        Returns the summaries of the trade fills from start_timestamp (in milliseconds), by (market, trading pair).
+        """
+        now = time.time() if now is None else now
+        first_full_day = math.ceil(start_timestamp / MS_PER_DAY)
+        settled_end_day = int((now - self._settle_time) * 1e3) // MS_PER_DAY
+        summaries: Dict[MarketKey, TradeFillsSummary] = defaultdict(TradeFillsSummary)
+
+        with self._sql.get_new_session() as session:
+            rollups = None
+            if not self._sql.is_in_memory:
+                rollups_key = (self._sql.db_path, self._config_file_path)
+                rollups = self._daily_rollups.get(rollups_key)
+                if rollups is None or not rollups.first_day <= first_full_day <= rollups.end_day:
+                    rollups = self._daily_rollups[rollups_key] = _DailyRollups(first_full_day, first_full_day, {})
+
+            if rollups is None or rollups.end_day <= first_full_day:
+                self._add_groups(session, summaries, start_timestamp, None, first_full_day, settled_end_day, rollups)
+            else:
+                self._add_groups(session, summaries, start_timestamp, first_full_day * MS_PER_DAY,
+                                 first_full_day, settled_end_day, None)
+                for day in range(first_full_day, rollups.end_day):
+                    for market_key, summary in rollups.summaries.get(day, {}).items():
+                        summaries[market_key].add(summary)
+                self._add_groups(session, summaries, rollups.end_day * MS_PER_DAY, None,
+                                 first_full_day, settled_end_day, rollups)
+            if rollups is not None:
+                rollups.end_day = max(rollups.end_day, settled_end_day)
+
+            for (market, symbol), summary in summaries.items():
+                if summary.are_derivatives:
+                    self._add_position_fills(session, summary, market, symbol, start_timestamp)
+        return dict(summaries)
+
+    def _filters(self, start_timestamp: int, end_timestamp: Optional[int]) -> List[Any]:
+        # Same selection as TradingCore._get_trades_from_session
+        filters = [TradeFill.timestamp >= start_timestamp,
+                   TradeFill.config_file_path.like(f"%{self._config_file_path}%")]
+        if end_timestamp is not None:
+            filters.append(TradeFill.timestamp < end_timestamp)
+        return filters
+
+    def _add_groups(self,
+                    session,
+                    summaries: Dict[MarketKey, TradeFillsSummary],
+                    start_timestamp: int,
+                    end_timestamp: Optional[int],
+                    first_full_day: int,
+                    settled_end_day: int,
+                    rollups: Optional[_DailyRollups]):
+        """
+        Adds the trade fills in [start_timestamp, end_timestamp) to the summaries, and the ones of the settled days to
+        the rollups.
+        """
+        day = TradeFill.timestamp // MS_PER_DAY
+        query = (session
+                 .query(TradeFill.market,
+                        TradeFill.symbol,
+                        TradeFill.quote_asset,
+                        day,
+                        TradeFill.trade_type,
+                        TradeFill.position,
+                        TradeFill.price,
+                        cast(TradeFill.trade_fee, Text),
+                        func.count(),
+                        func.sum(TradeFill.amount),
+                        func.min(TradeFill.timestamp),
+                        func.max(TradeFill.timestamp))
+                 .filter(*self._filters(start_timestamp, end_timestamp))
+                 .group_by(TradeFill.market, TradeFill.symbol, TradeFill.quote_asset, day, TradeFill.trade_type,
+                           TradeFill.position, TradeFill.price, cast(TradeFill.trade_fee, Text))
+                 # In the order of the first fills, for the fee tokens to be listed in that order
+                 .order_by(func.min(TradeFill.timestamp)))
+        for (market, symbol, quote, group_day, trade_type, position, price, trade_fee_json,
+             count, amount, first_timestamp, last_timestamp) in query.yield_per(self._chunk_size):
+            group = (trade_type, position, price, quote, self._trade_fee(trade_fee_json), count, amount,
+                     first_timestamp, last_timestamp)
+            summaries[(market, symbol)].add_group(*group)
+            if rollups is not None and first_full_day <= group_day < settled_end_day:
+                day_summaries = rollups.summaries.setdefault(group_day, {})
+                day_summaries.setdefault((market, symbol), TradeFillsSummary()).add_group(*group)
+
+    def _trade_fee(self, trade_fee_json: str) -> Dict[str, Any]:
+        trade_fee = self._fees_by_json.get(trade_fee_json)
+        if trade_fee is None:
+            trade_fee = self._fees_by_json[trade_fee_json] = json.loads(trade_fee_json)
+        return trade_fee
+
+    def _add_position_fills(self, session, summary: TradeFillsSummary, market: str, symbol: str,
+                            start_timestamp: int):
+        query = (session
+                 .query(TradeFill.order_id, TradeFill.trade_type, TradeFill.price, TradeFill.amount,
+                        TradeFill.position)
+                 .filter(TradeFill.market == market, TradeFill.symbol == symbol,
+                         *self._filters(start_timestamp, None))
+                 .order_by(TradeFill.timestamp))
+        for order_id, trade_type, price, amount, position in query.yield_per(self._chunk_size):
+            fill = PositionFill(order_id, trade_type, price, amount, position)
+            if trade_type.upper() == TradeType.BUY.name:
+                summary.position_buys.append(fill)
+            elif trade_type.upper() == TradeType.SELL.name:
+                summary.position_sells.append(fill)
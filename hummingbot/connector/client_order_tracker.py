@@ -1,9 +1,9 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import ChainMap, defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +29,29 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersByExchangeOrderId(Mapping):
+    """
+    Read-only view of the orders of a ClientOrderTracker mapped by exchange order ID. Lookups go through the tracker
+    index, iterating the view goes through all the orders.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", orders: Mapping[str, InFlightOrder]):
+        self._tracker = tracker
+        self._orders = orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker._order_by_exchange_order_id(exchange_order_id)
+        if order is None or self._orders.get(order.client_order_id) is not order:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter({order.exchange_order_id: None for order in self._orders.values()})
+
+    def __len__(self) -> int:
+        return len({order.exchange_order_id for order in self._orders.values()})
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -62,61 +85,62 @@ class ClientOrderTracker:
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+        # Secondary indexes. The orders can be changed outside of the tracker (e.g. a connector setting the exchange
+        # order id), so the indexes are checked against the orders when they are read.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._indexed_states: Dict[str, OrderState] = {}
+
     @property
-    def active_orders(self) -> Dict[str, InFlightOrder]:
+    def active_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are actively tracked
         """
-        return self._in_flight_orders
+        return MappingProxyType(self._in_flight_orders)
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return MappingProxyType(self._cached_orders)
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return MappingProxyType(ChainMap(self._cached_orders, self._in_flight_orders))
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return MappingProxyType(ChainMap(self._lost_orders, self._cached_orders, self._in_flight_orders))
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(self, self.all_fillable_orders)
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return MappingProxyType(ChainMap(self._lost_orders, self._in_flight_orders))
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(self, self.all_updatable_orders)
 
     @property
     def current_timestamp(self) -> int:
@@ -126,11 +150,11 @@ class ClientOrderTracker:
         return self._connector.current_timestamp
 
     @property
-    def lost_orders(self) -> Dict[str, InFlightOrder]:
+    def lost_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return MappingProxyType(self._lost_orders)
 
     @property
     def lost_order_count_limit(self) -> int:
@@ -140,13 +164,33 @@ class ClientOrderTracker:
     def lost_order_count_limit(self, value: int):
         self._lost_order_count_limit = value
 
+    def active_orders_for_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the actively tracked orders of the trading pair
+        """
+        return MappingProxyType(self._active_orders_by_trading_pair.get(trading_pair, {}))
+
+    def active_orders_in_state(self, state: OrderState) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the actively tracked orders currently in the given state
+        """
+        orders = self._active_orders_by_state.get(state, {})
+        for order in [order for order in orders.values() if order.current_state != state]:
+            self._index_order_state(order)
+        return MappingProxyType(self._active_orders_by_state.get(state, {}))
+
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._index_order_state(order)
+        self._index_exchange_order_id(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
+            self._cached_orders[client_order_id] = order
             del self._in_flight_orders[client_order_id]
+            self._remove_from_active_indexes(order)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -162,6 +206,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_exchange_order_id(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -174,12 +219,14 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
+        if client_order_id in self._in_flight_orders:
+            found_order = self._in_flight_orders[client_order_id]
+        elif client_order_id in self._cached_orders:
+            found_order = self._cached_orders.get(client_order_id)
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+            found_order = self._order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and found_order.client_order_id in self._lost_orders:
+                found_order = None
 
         return found_order
 
@@ -191,9 +238,9 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            found_order = self._order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and self._lost_orders.get(found_order.client_order_id) is not found_order:
+                found_order = None
 
         return found_order
 
@@ -209,6 +256,7 @@ class ClientOrderTracker:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
+            self._reindex_order(tracked_order)
             if updated:
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
@@ -249,6 +297,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._index_exchange_order_id(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -290,6 +339,7 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            self._reindex_order(tracked_order)
             if updated:
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -440,6 +490,65 @@ class ClientOrderTracker:
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
+    def _order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Returns the active, cached or lost order with the exchange order id, if any.
+        """
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is not None and (order.exchange_order_id != exchange_order_id or not self._is_tracked(order)):
+            del self._orders_by_exchange_order_id[exchange_order_id]
+            order = None
+        if order is None and len(self._orders_without_exchange_order_id) > 0:
+            # The exchange order id could have been set after the order was indexed
+            for pending_order in list(self._orders_without_exchange_order_id.values()):
+                self._index_exchange_order_id(pending_order)
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        return order
+
+    def _is_tracked(self, order: InFlightOrder) -> bool:
+        client_order_id = order.client_order_id
+        return (self._in_flight_orders.get(client_order_id) is order
+                or self._lost_orders.get(client_order_id) is order
+                or self._cached_orders.get(client_order_id) is order)
+
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            if order.client_order_id in self._in_flight_orders:
+                self._orders_without_exchange_order_id[order.client_order_id] = order
+            else:
+                self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+            return
+        self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+        self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        # Cached orders expire without notice, the index is pruned when it grows past twice the tracked orders
+        if len(self._orders_by_exchange_order_id) > 2 * (len(self._in_flight_orders) + len(self._lost_orders)
+                                                         + self.MAX_CACHE_SIZE):
+            self._orders_by_exchange_order_id = {
+                exchange_order_id: indexed_order
+                for exchange_order_id, indexed_order in self._orders_by_exchange_order_id.items()
+                if indexed_order.exchange_order_id == exchange_order_id and self._is_tracked(indexed_order)
+            }
+
+    def _index_order_state(self, order: InFlightOrder):
+        previous_state = self._indexed_states.get(order.client_order_id)
+        if previous_state is not None and previous_state != order.current_state:
+            self._active_orders_by_state[previous_state].pop(order.client_order_id, None)
+        if order.client_order_id in self._in_flight_orders:
+            self._indexed_states[order.client_order_id] = order.current_state
+            self._active_orders_by_state[order.current_state][order.client_order_id] = order
+
+    def _reindex_order(self, order: InFlightOrder):
+        if order.client_order_id in self._in_flight_orders:
+            self._index_order_state(order)
+        self._index_exchange_order_id(order)
+
+    def _remove_from_active_indexes(self, order: InFlightOrder):
+        self._active_orders_by_trading_pair[order.trading_pair].pop(order.client_order_id, None)
+        previous_state = self._indexed_states.pop(order.client_order_id, None)
+        if previous_state is not None:
+            self._active_orders_by_state[previous_state].pop(order.client_order_id, None)
+        self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+
     @staticmethod
     def _restore_order_from_json(serialized_order: Dict):
         order = InFlightOrder.from_json(serialized_order)
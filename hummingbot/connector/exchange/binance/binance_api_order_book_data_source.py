@@ -9,6 +9,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_multiplexer import WSMultiplexer
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -103,10 +104,12 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             raise
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
-        ws: WSAssistant = await self._api_factory.get_ws_assistant()
-        await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
-                         ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
-        return ws
+        # The connections are shared with the other data sources and feeds subscribed to the same endpoint
+        multiplexer = WSMultiplexer.for_endpoint(ws_url=CONSTANTS.WSS_URL.format(self._domain),
+                                                 router=web_utils.BinanceWSStreamRouter(),
+                                                 api_factory=self._api_factory,
+                                                 ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
+        return multiplexer.get_ws_assistant()
 
     async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
         snapshot: Dict[str, Any] = await self._request_order_book_snapshot(trading_pair)
@@ -508,6 +508,61 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_open_orders_status(self, trading_pair: str) -> Optional[List[OrderUpdate]]:
+        open_orders = await self._api_get(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)},
+            is_auth_required=True)
+
+        return [
+            OrderUpdate(
+                client_order_id=order_data["clientOrderId"],
+                exchange_order_id=str(order_data["orderId"]),
+                trading_pair=trading_pair,
+                update_timestamp=order_data["updateTime"] * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+            )
+            for order_data in open_orders
+        ]
+
+    async def _all_trade_updates_for_trading_pair(self, trading_pair: str, since: float) -> Optional[List[TradeUpdate]]:
+        if since < self._time_synchronizer.time() - CONSTANTS.MAX_TRADES_REQUEST_TIME_RANGE:
+            # Binance does not return the trades older than the time range in one request
+            return None
+        trades = await self._api_get(
+            path_url=CONSTANTS.MY_TRADES_PATH_URL,
+            params={
+                "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+                "startTime": int(since * 1e3),
+                "limit": CONSTANTS.MAX_TRADES_PER_REQUEST,
+            },
+            is_auth_required=True,
+            limit_id=CONSTANTS.MY_TRADES_PATH_URL)
+        if len(trades) >= CONSTANTS.MAX_TRADES_PER_REQUEST:
+            # The response could be missing fills
+            return None
+
+        trade_updates = []
+        for trade in trades:
+            fee = TradeFeeBase.new_spot_fee(
+                fee_schema=self.trade_fee_schema(),
+                trade_type=TradeType.BUY if trade["isBuyer"] else TradeType.SELL,
+                percent_token=trade["commissionAsset"],
+                flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
+            )
+            trade_updates.append(TradeUpdate(
+                trade_id=str(trade["id"]),
+                client_order_id=None,
+                exchange_order_id=str(trade["orderId"]),
+                trading_pair=trading_pair,
+                fee=fee,
+                fill_base_amount=Decimal(trade["qty"]),
+                fill_quote_amount=Decimal(trade["quoteQty"]),
+                fill_price=Decimal(trade["price"]),
+                fill_timestamp=trade["time"] * 1e-3,
+            ))
+        return trade_updates
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
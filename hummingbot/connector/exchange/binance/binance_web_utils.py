@@ -1,12 +1,15 @@
-from typing import Callable, Optional
+import itertools
+import re
+from typing import Any, Callable, Iterable, List, Optional
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest, WSRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_multiplexer import WSStreamRouter
 
 
 def public_rest_url(path_url: str, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> str:
@@ -73,3 +76,55 @@ async def get_current_server_time(
     )
     server_time = response["serverTime"]
     return server_time
+
+
+class BinanceWSStreamRouter(WSStreamRouter):
+    """
+    Routes the messages of the Binance raw streams endpoints (spot and USD-M futures) for the WSMultiplexer, so that
+    the order book data sources and the candles and liquidations feeds share their connections.
+    """
+
+    max_streams_per_connection = CONSTANTS.WS_MAX_STREAMS_PER_CONNECTION
+
+    _update_speed_suffix = re.compile(r"@\d+m?s$")
+    _request_ids = itertools.count(1)
+
+    def subscribed_streams(self, request: WSRequest) -> Optional[List[str]]:
+        return self._request_streams(request=request, method="SUBSCRIBE")
+
+    def unsubscribed_streams(self, request: WSRequest) -> Optional[List[str]]:
+        return self._request_streams(request=request, method="UNSUBSCRIBE")
+
+    def subscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"method": "SUBSCRIBE", "params": streams, "id": next(self._request_ids)})
+
+    def unsubscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"method": "UNSUBSCRIBE", "params": streams, "id": next(self._request_ids)})
+
+    def stream_key(self, stream: str) -> str:
+        # The events do not include the update speed of the streams (e.g. btcusdt@depth@100ms)
+        return self._update_speed_suffix.sub("", stream)
+
+    def message_stream_keys(self, data: Any) -> Iterable[str]:
+        event_type = data.get("e") if isinstance(data, dict) else None
+        if event_type is None:
+            return []
+        if event_type == "forceOrder":
+            return [f"{data['o']['s'].lower()}@forceOrder", "!forceOrder@arr"]
+        symbol = data["s"].lower()
+        if event_type == "kline":
+            return [f"{symbol}@kline_{data['k']['i']}"]
+        if event_type == CONSTANTS.DIFF_EVENT_TYPE:
+            return [f"{symbol}@depth"]
+        if event_type == "markPriceUpdate":
+            return [f"{symbol}@markPrice"]
+        if event_type == "24hrTicker":
+            return [f"{symbol}@ticker"]
+        return [f"{symbol}@{event_type}"]
+
+    @staticmethod
+    def _request_streams(request: WSRequest, method: str) -> Optional[List[str]]:
+        payload = getattr(request, "payload", None)
+        if isinstance(payload, dict) and payload.get("method") == method:
+            return list(payload.get("params", []))
+        return None
@@ -0,0 +1,216 @@
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import pandas as pd
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_replay import OrderBookReplay, OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class OrderBookReplayTracker(OrderBookTracker):
+    """
+    OrderBookTracker that applies recorded messages synchronously, up to the timestamp passed to advance(), instead of
+    listening to an exchange. Used to drive paper trade order books from a Clock in backtest mode.
+    """
+
+    def __init__(self, replay: OrderBookReplay):
+        super().__init__(data_source=OrderBookReplayDataSource(trading_pairs=replay.trading_pairs,
+                                                               connector_name=replay.connector_name,
+                                                               start_time=replay.start_time,
+                                                               end_time=replay.end_time,
+                                                               root_path=replay.root_path),
+                         trading_pairs=replay.trading_pairs)
+        self._replay = replay
+        self._messages: Optional[Iterator[OrderBookMessage]] = None
+        self._next_message: Optional[OrderBookMessage] = None
+        self._snapshot_trading_pairs: Set[str] = set()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def initialize(self):
+        """
+        Creates the order books and applies the recorded snapshots at the start time of the replay.
+        """
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.order_book_create_function()
+        self._messages = self._replay.messages()
+        self._next_message = next(self._messages, None)
+        self.advance(self._replay.start_time)
+        missing_trading_pairs = set(self._trading_pairs) - self._snapshot_trading_pairs
+        if len(missing_trading_pairs) > 0:
+            raise ValueError(f"No order book recorded for {', '.join(sorted(missing_trading_pairs))} "
+                             f"at {self._replay.start_time}.")
+        self._order_books_initialized.set()
+
+    def advance(self, timestamp: float):
+        """
+        Applies the recorded messages up to timestamp (included) to the order books.
+        """
+        while self._next_message is not None and self._next_message.timestamp <= timestamp:
+            message = self._next_message
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                self._snapshot_trading_pairs.add(message.trading_pair)
+            OrderBookReplay.apply(self._order_books[message.trading_pair], message)
+            self._notify_message_listeners(message)
+            self._next_message = next(self._messages, None)
+
+
+class OrderBookReplayFeed(PyTimeIterator):
+    """
+    Advances an OrderBookReplayTracker on every clock tick. It has to be added to the clock before the markets and
+    strategies, so that they see the order books at the tick timestamp.
+    """
+
+    def __init__(self, tracker: OrderBookReplayTracker):
+        super().__init__()
+        self._tracker = tracker
+
+    def tick(self, timestamp: float):
+        self._tracker.advance(timestamp)
+
+
+class OrderBookBacktest:
+    """
+    Runs strategies against a paper trade market fed with the order book messages recorded by OrderBookRecorder,
+    driving the clock in backtest mode, so that the recorded time range is simulated as fast as the strategies tick.
+
+    Limit orders are filled by the recorded trades that cross them, and market orders are executed against the
+    recorded depth, as in paper trade.
+
+    Usage:
+        backtest = OrderBookBacktest("binance", ["ETH-USDT"], start_time, end_time)
+        backtest.market.set_balance("ETH", Decimal("10"))
+        backtest.market.set_balance("USDT", Decimal("30000"))
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(MarketTradingPairTuple(backtest.market, "ETH-USDT", "ETH", "USDT"), ...)
+        backtest.add_strategy(strategy)
+        results = backtest.run()
+    """
+
+    def __init__(self,
+                 connector_name: str,
+                 trading_pairs: List[str],
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 root_path: Optional[str] = None,
+                 target_market: Optional[Callable] = None):
+        """
+        :param target_market: connector class used by the paper trade market to convert and split the trading
+        pairs, by default the class of connector_name
+        """
+        if target_market is None:
+            from hummingbot.client.config.config_helpers import get_connector_class
+            target_market = get_connector_class(connector_name)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.replay = OrderBookReplay(connector_name=connector_name, trading_pairs=trading_pairs,
+                                      start_time=start_time, end_time=end_time, root_path=root_path)
+        self.tracker = OrderBookReplayTracker(self.replay)
+        self.market = PaperTradeExchange(self.tracker, target_market, exchange_name=connector_name)
+        self.tracker.initialize()
+        # Registers the paper trade market as listener of the order book trades
+        self.market.ready
+
+        self.clock = Clock(ClockMode.BACKTEST, tick_size, start_time, end_time)
+        self.clock.add_iterator(OrderBookReplayFeed(self.tracker))
+        self.clock.add_iterator(self.market)
+        self.fills: List[OrderFilledEvent] = []
+        self._fill_forwarder = EventForwarder(self.fills.append)
+        self.market.add_listener(MarketEvent.OrderFilled, self._fill_forwarder)
+
+    @property
+    def quote_asset(self) -> str:
+        return self.market.split_trading_pair(self.replay.trading_pairs[0])[1]
+
+    def add_strategy(self, strategy: TimeIterator):
+        self.clock.add_iterator(strategy)
+
+    def asset_prices(self) -> Dict[str, Decimal]:
+        """
+        Returns the mid price in the quote asset of the first trading pair, of the assets traded against it.
+        """
+        prices = {self.quote_asset: Decimal("1")}
+        for trading_pair in self.replay.trading_pairs:
+            base_asset, quote_asset = self.market.split_trading_pair(trading_pair)
+            if quote_asset == self.quote_asset:
+                prices[base_asset] = self.market.get_mid_price(trading_pair)
+        return prices
+
+    def portfolio_value(self, balances: Dict[str, Decimal], prices: Dict[str, Decimal]) -> Decimal:
+        """
+        Returns the value of the balances in the quote asset of the first trading pair. Assets without price are not
+        counted.
+        """
+        return sum((amount * prices[asset] for asset, amount in balances.items() if asset in prices), Decimal("0"))
+
+    def run(self) -> Dict[str, Any]:
+        initial_balances = self.market.get_all_balances()
+        initial_prices = self.asset_prices()
+        started = time.perf_counter()
+        self.clock.backtest()
+        elapsed_seconds = time.perf_counter() - started
+        return self.summarize_results(initial_balances, initial_prices, elapsed_seconds)
+
+    def fills_df(self) -> pd.DataFrame:
+        return pd.DataFrame([{
+            "timestamp": fill.timestamp,
+            "order_id": fill.order_id,
+            "trading_pair": fill.trading_pair,
+            "trade_type": fill.trade_type.name,
+            "order_type": fill.order_type.name,
+            "price": float(fill.price),
+            "amount": float(fill.amount),
+        } for fill in self.fills], columns=["timestamp", "order_id", "trading_pair", "trade_type", "order_type",
+                                            "price", "amount"])
+
+    def summarize_results(self,
+                          initial_balances: Dict[str, Decimal],
+                          initial_prices: Dict[str, Decimal],
+                          elapsed_seconds: float) -> Dict[str, Any]:
+        """
+        Summarizes the fills and the portfolio value change. The net PnL compares the final balances with the initial
+        ones, both valued at the final prices, so that it does not include the price change of the initial inventory.
+        """
+        final_prices = self.asset_prices()
+        final_balances = self.market.get_all_balances()
+        initial_value = self.portfolio_value(initial_balances, final_prices)
+        net_pnl_quote = self.portfolio_value(final_balances, final_prices) - initial_value
+        total_volume = Decimal("0")
+        total_fees = Decimal("0")
+        for fill in self.fills:
+            quote_price = final_prices.get(self.market.split_trading_pair(fill.trading_pair)[1], Decimal("NaN"))
+            total_volume += fill.price * fill.amount * quote_price
+            total_fees += fill.trade_fee.fee_amount_in_token(trading_pair=fill.trading_pair,
+                                                             price=fill.price,
+                                                             order_amount=fill.amount,
+                                                             token=self.quote_asset,
+                                                             exchange=self.market)
+        simulated_seconds = self.clock.current_timestamp - self.start_time
+        return {
+            "net_pnl": float(net_pnl_quote / initial_value) if initial_value > 0 else 0.0,
+            "net_pnl_quote": float(net_pnl_quote),
+            "initial_value_quote": float(self.portfolio_value(initial_balances, initial_prices)),
+            "final_value_quote": float(self.portfolio_value(final_balances, final_prices)),
+            "total_volume": float(total_volume),
+            "total_fees_quote": float(total_fees),
+            "total_fills": len(self.fills),
+            "total_buy_fills": len([fill for fill in self.fills if fill.trade_type is TradeType.BUY]),
+            "total_sell_fills": len([fill for fill in self.fills if fill.trade_type is TradeType.SELL]),
+            "simulated_seconds": simulated_seconds,
+            "elapsed_seconds": elapsed_seconds,
+            "speedup": simulated_seconds / elapsed_seconds if elapsed_seconds > 0 else float("inf"),
+        }
@@ -11,11 +11,12 @@ from async_timeout import timeout
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.reference_data_cache import TRADING_FEES, TRADING_RULES, ReferenceDataCache
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -30,6 +31,7 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_request_scheduler import request_priority
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
@@ -59,6 +61,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        # API calls avoided by the batched order status and fills requests in the last status update cycle
+        self._last_status_update_saved_api_calls = 0
+        self._status_update_saved_api_calls = 0
+        self._reference_data_cache: Optional[ReferenceDataCache] = None
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -467,15 +473,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        with request_priority(RequestPriority.CREATE):
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -545,7 +552,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         return None
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.CANCEL):
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -665,6 +673,49 @@ class ExchangePyBase(ExchangeBase, ABC):
     #
     web_utils = None
 
+    def set_reference_data_cache(self, cache: Optional[ReferenceDataCache]):
+        """
+        Sets the on-disk cache the connector stores the exchange info and trading fees it fetches in, to be loaded
+        with load_cached_reference_data on the next start.
+        """
+        self._reference_data_cache = cache
+
+    async def load_cached_reference_data(self) -> bool:
+        """
+        Initializes the trading pair symbol map, the trading rules and the trading fees from the reference data cache,
+        so that the connector can get ready without waiting for the exchange info requests. The polling loops refresh
+        them from the exchange once the network is started.
+
+        :return: True if the trading rules were loaded from the cache
+        """
+        if self._reference_data_cache is None:
+            return False
+        exchange_info = await self._reference_data_cache.get_async(self.name, TRADING_RULES)
+        trading_fees = await self._reference_data_cache.get_async(self.name, TRADING_FEES)
+        if trading_fees:
+            for key, fees in trading_fees.items():
+                self._trading_fees.setdefault(key, fees)
+        if exchange_info is None:
+            return False
+        try:
+            self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+            trading_rules_list = await self._format_trading_rules(exchange_info)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().warning("The cached exchange info could not be loaded, it will be requested again.",
+                                  exc_info=True)
+            self._set_trading_pair_symbol_map(None)
+            return False
+        for trading_rule in trading_rules_list:
+            # Rules already fetched from the exchange are fresher
+            self._trading_rules.setdefault(trading_rule.trading_pair, trading_rule)
+        return True
+
+    async def _cache_reference_data(self, key: str, data: Any):
+        if self._reference_data_cache is not None:
+            await self._reference_data_cache.set_async(self.name, key, data)
+
     async def start_network(self):
         """
         Start all required tasks to update the status of the connector. Those tasks include:
@@ -734,7 +785,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.REFERENCE_DATA):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -754,7 +806,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.REFERENCE_DATA):
+                    await safe_gather(self._update_trading_fees())
+                if self._trading_fees:
+                    await self._cache_reference_data(TRADING_FEES, dict(self._trading_fees))
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -782,7 +837,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                with request_priority(RequestPriority.STATUS):
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -821,7 +877,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.STATUS):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -862,6 +919,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
         self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+        await self._cache_reference_data(TRADING_RULES, exchange_info)
 
     async def _api_get(self, *args, **kwargs):
         kwargs["method"] = RESTMethod.GET
@@ -941,7 +999,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _update_all_balances(self):
         try:
-            await self._update_balances()
+            with request_priority(RequestPriority.BALANCE):
+                await self._update_balances()
             if not self.real_time_balance_update:
                 # This is only required for exchanges that do not provide balance update notifications through websocket
                 self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
@@ -955,6 +1014,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
+        orders = await self._update_orders_fills_by_trading_pair(orders=orders)
         for order in orders:
             try:
                 trade_updates = await self._all_trade_updates_for_order(order=order)
@@ -994,7 +1054,103 @@ class ExchangePyBase(ExchangeBase, ABC):
         else:
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
+    async def _update_orders_fills_by_trading_pair(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Processes the fills of the orders with one request per trading pair, for the connectors implementing
+        _all_trade_updates_for_trading_pair.
+
+        :return: the orders whose fills still have to be requested one by one
+        """
+        remaining_orders = []
+        for trading_pair, pair_orders in self._group_orders_by_trading_pair(orders).items():
+            if len(pair_orders) < 2:
+                remaining_orders.extend(pair_orders)
+                continue
+            try:
+                trade_updates = await self._all_trade_updates_for_trading_pair(
+                    trading_pair=trading_pair,
+                    since=min(order.creation_timestamp for order in pair_orders))
+            except asyncio.CancelledError:
+                raise
+            except Exception as request_error:
+                self.logger().debug(f"Failed to fetch the trade updates of {trading_pair}, requesting them per order. "
+                                    f"Error: {request_error}")
+                trade_updates = None
+            if trade_updates is None:
+                remaining_orders.extend(pair_orders)
+                continue
+            self._status_update_saved_api_calls += len(pair_orders) - 1
+            match_order = self._order_matcher(pair_orders)
+            for trade_update in trade_updates:
+                order = match_order(trade_update.client_order_id, trade_update.exchange_order_id)
+                if order is not None:
+                    self._order_tracker.process_trade_update(
+                        trade_update._replace(client_order_id=order.client_order_id))
+        return remaining_orders
+
+    async def _update_orders_status_by_trading_pair(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Processes the status of the open orders with one request per trading pair, for the connectors implementing
+        _request_open_orders_status. The orders missing from the response (e.g. filled or canceled) are returned.
+
+        :return: the orders whose status still has to be requested one by one
+        """
+        remaining_orders = []
+        for trading_pair, pair_orders in self._group_orders_by_trading_pair(orders).items():
+            if len(pair_orders) < 2:
+                remaining_orders.extend(pair_orders)
+                continue
+            try:
+                order_updates = await self._request_open_orders_status(trading_pair=trading_pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception as request_error:
+                self.logger().debug(f"Failed to fetch the open orders of {trading_pair}, requesting the order "
+                                    f"statuses one by one. Error: {request_error}")
+                order_updates = None
+            if order_updates is None:
+                remaining_orders.extend(pair_orders)
+                continue
+            self._status_update_saved_api_calls -= 1
+            updated_orders = set()
+            match_order = self._order_matcher(pair_orders)
+            for order_update in order_updates:
+                order = match_order(order_update.client_order_id, order_update.exchange_order_id)
+                if order is not None and order.client_order_id not in updated_orders:
+                    updated_orders.add(order.client_order_id)
+                    self._order_tracker.process_order_update(
+                        order_update._replace(client_order_id=order.client_order_id))
+            self._status_update_saved_api_calls += len(updated_orders)
+            remaining_orders.extend(order for order in pair_orders if order.client_order_id not in updated_orders)
+        return remaining_orders
+
+    @staticmethod
+    def _group_orders_by_trading_pair(orders: List[InFlightOrder]) -> Dict[str, List[InFlightOrder]]:
+        orders_by_trading_pair = {}
+        for order in orders:
+            orders_by_trading_pair.setdefault(order.trading_pair, []).append(order)
+        return orders_by_trading_pair
+
+    @staticmethod
+    def _order_matcher(orders: List[InFlightOrder]) -> Callable[[Optional[str], Optional[str]], Optional[InFlightOrder]]:
+        """
+        Returns a function finding the order of an update by client order id, or by exchange order id if the update
+        does not have a known client order id.
+        """
+        orders_by_client_id = {order.client_order_id: order for order in orders}
+        orders_by_exchange_id = {order.exchange_order_id: order for order in orders
+                                 if order.exchange_order_id is not None}
+
+        def match(client_order_id: Optional[str], exchange_order_id: Optional[str]) -> Optional[InFlightOrder]:
+            order = orders_by_client_id.get(client_order_id)
+            if order is None and exchange_order_id is not None:
+                order = orders_by_exchange_id.get(exchange_order_id)
+            return order
+
+        return match
+
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
+        orders = await self._update_orders_status_by_trading_pair(orders=orders)
         for order in orders:
             try:
                 order_update = await self._request_order_status(tracked_order=order)
@@ -1017,12 +1173,22 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
+        self._status_update_saved_api_calls = 0
         await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
         await self._update_orders()
+        self._log_status_update_saved_api_calls()
 
     async def _update_lost_orders_status(self):
+        self._status_update_saved_api_calls = 0
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
         await self._update_lost_orders()
+        self._log_status_update_saved_api_calls()
+
+    def _log_status_update_saved_api_calls(self):
+        self._last_status_update_saved_api_calls = self._status_update_saved_api_calls
+        if self._last_status_update_saved_api_calls != 0:
+            self.logger().debug(f"Order status update cycle saved {self._last_status_update_saved_api_calls} API "
+                                f"calls by requesting the orders and fills per trading pair.")
 
     async def _cancel_lost_orders(self):
         for _, lost_order in self._order_tracker.lost_orders.items():
@@ -1054,6 +1220,27 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_open_orders_status(self, trading_pair: str) -> Optional[List[OrderUpdate]]:
+        """
+        Requests the status of all the open orders of the trading pair at once. Connectors whose exchange supports it
+        can override this method to update the order statuses with one request per trading pair instead of one per
+        order. The updates are matched to the orders by client order id, or by exchange order id if not present.
+
+        :return: the updates of the open orders, or None if the exchange does not support it
+        """
+        return None
+
+    async def _all_trade_updates_for_trading_pair(self, trading_pair: str, since: float) -> Optional[List[TradeUpdate]]:
+        """
+        Requests all the fills of the trading pair since the timestamp at once. Connectors whose exchange supports it
+        can override this method to update the order fills with one request per trading pair instead of one per
+        order. The updates are matched to the orders by client order id, or by exchange order id if not present.
+
+        :param since: the timestamp (in seconds) of the oldest order to get the fills for
+        :return: the fills, or None if the exchange does not support it or can not return all of them
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1075,7 +1262,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _initialize_trading_pair_symbol_map(self):
         try:
-            exchange_info = await self._make_trading_pairs_request()
+            with request_priority(RequestPriority.REFERENCE_DATA):
+                exchange_info = await self._make_trading_pairs_request()
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
@@ -5,8 +5,10 @@ import os.path
 import threading
 import time
 from decimal import Decimal
+from functools import partial
+from itertools import islice
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -34,6 +36,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.data_feed.market_data_store import MarketDataStore
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
@@ -46,6 +49,7 @@ from hummingbot.model.position import Position
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_writer import SQLWriter
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -87,6 +91,9 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_store: Optional[MarketDataStore] = None
+        # The records of the events, executors and positions are written from the writer thread
+        self._sql_writer: SQLWriter = SQLWriter(sql)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -131,28 +138,10 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_collection_config.market_data_collection_storage == "columnar":
+                        self._record_market_data_to_store()
+                    else:
+                        self._record_market_data_to_sql()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -160,6 +149,38 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _record_market_data_to_sql(self):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for market in self._markets:
+                    exchange = market.display_name
+                    for trading_pair in market.trading_pairs:
+                        mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                        best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                        best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                        order_book = market.get_order_book(trading_pair)
+                        depth = self._market_data_collection_config.market_data_collection_depth + 1
+                        market_data = MarketData(
+                            timestamp=self.db_timestamp,
+                            exchange=exchange,
+                            trading_pair=trading_pair,
+                            mid_price=mid_price,
+                            best_bid=best_bid,
+                            best_ask=best_ask,
+                            order_book={
+                                "bid": list(islice(order_book.bid_entries(), depth)),
+                                "ask": list(islice(order_book.ask_entries(), depth))}
+                        )
+                        session.add(market_data)
+
+    def _record_market_data_to_store(self):
+        timestamp = self.db_timestamp / 1e3
+        depth = self._market_data_collection_config.market_data_collection_depth
+        for market in self._markets:
+            for trading_pair in market.trading_pairs:
+                self.market_data_store.append_order_book(
+                    market.display_name, trading_pair, timestamp, market.get_order_book(trading_pair), depth)
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -172,6 +193,16 @@ class MarketsRecorder:
     def strategy_name(self) -> str:
         return self._strategy_name
 
+    @property
+    def market_data_store(self) -> MarketDataStore:
+        if self._market_data_store is None:
+            self._market_data_store = MarketDataStore.get_store()
+        return self._market_data_store
+
+    @property
+    def sql_writer(self) -> SQLWriter:
+        return self._sql_writer
+
     @property
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
@@ -219,88 +250,105 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_store is not None:
+            self._market_data_store.close()
+        self._sql_writer.stop()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the records of the events, executors and positions recorded so far to be written to the database.
+        """
+        return self._sql_writer.flush(timeout)
+
+    def get_write_metrics(self) -> Dict[str, float]:
+        return self._sql_writer.get_metrics()
 
     def store_or_update_executor(self, executor):
-        with self._sql_manager.get_new_session() as session:
-            existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
-            serialized_config = executor.executor_info.model_dump_json()
-            executor_dict = json.loads(serialized_config)
-            if existing_executor:
-                # Update existing executor
-                for attr, value in executor_dict.items():
-                    setattr(existing_executor, attr, value)
-            else:
-                # Insert new executor
-                new_executor = Executors(**executor_dict)
-                session.add(new_executor)
-            session.commit()
+        executor_dict = json.loads(executor.executor_info.model_dump_json())
+        self._sql_writer.submit(partial(self._write_executor, executor_dict),
+                                coalesce_key=("executor", executor_dict["id"]))
+
+    @staticmethod
+    def _write_executor(executor_dict: Dict[str, Any], session: Session):
+        existing_executor = session.query(Executors).filter(Executors.id == executor_dict["id"]).one_or_none()
+        if existing_executor:
+            # Update existing executor
+            for attr, value in executor_dict.items():
+                setattr(existing_executor, attr, value)
+        else:
+            # Insert new executor
+            new_executor = Executors(**executor_dict)
+            session.add(new_executor)
 
     def store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
-            session.add(position)
-            session.commit()
+        self._sql_writer.submit(lambda session: session.add(position))
 
     def update_or_store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
-            # Check if a position already exists for this controller, connector, trading pair, and side
-            existing_position = session.query(Position).filter(
-                Position.controller_id == position.controller_id,
-                Position.connector_name == position.connector_name,
-                Position.trading_pair == position.trading_pair,
-                Position.side == position.side
-            ).first()
-
-            if existing_position:
-                # Update the existing position
-                existing_position.timestamp = position.timestamp
-                existing_position.volume_traded_quote = position.volume_traded_quote
-                existing_position.amount = position.amount
-                existing_position.breakeven_price = position.breakeven_price
-                existing_position.unrealized_pnl_quote = position.unrealized_pnl_quote
-                existing_position.cum_fees_quote = position.cum_fees_quote
-            else:
-                # Insert new position
-                session.add(position)
+        self._sql_writer.submit(partial(self._write_position, position))
 
-            session.commit()
+    @staticmethod
+    def _write_position(position: Position, session: Session):
+        # Check if a position already exists for this controller, connector, trading pair, and side
+        existing_position = session.query(Position).filter(
+            Position.controller_id == position.controller_id,
+            Position.connector_name == position.connector_name,
+            Position.trading_pair == position.trading_pair,
+            Position.side == position.side
+        ).first()
+
+        if existing_position:
+            # Update the existing position
+            existing_position.timestamp = position.timestamp
+            existing_position.volume_traded_quote = position.volume_traded_quote
+            existing_position.amount = position.amount
+            existing_position.breakeven_price = position.breakeven_price
+            existing_position.unrealized_pnl_quote = position.unrealized_pnl_quote
+            existing_position.cum_fees_quote = position.cum_fees_quote
+        else:
+            # Insert new position
+            session.add(position)
 
     def store_controller_config(self, controller_config: ControllerConfigBase):
-        with self._sql_manager.get_new_session() as session:
-            config = json.loads(controller_config.json())
-            base_columns = ["id", "timestamp", "type"]
-            controller = Controllers(id=config["id"],
-                                     timestamp=time.time(),
-                                     type=config["controller_type"],
-                                     config={k: v for k, v in config.items() if k not in base_columns})
-            session.add(controller)
-            session.commit()
+        config = json.loads(controller_config.json())
+        base_columns = ["id", "timestamp", "type"]
+        controller = Controllers(id=config["id"],
+                                 timestamp=time.time(),
+                                 type=config["controller_type"],
+                                 config={k: v for k, v in config.items() if k not in base_columns})
+        self._sql_writer.submit(lambda session: session.add(controller))
 
     def get_executors_by_ids(self, executor_ids: List[str]):
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.id.in_(executor_ids)).all()
             return executors
 
     def get_executors_by_controller(self, controller_id: str = None) -> List[ExecutorInfo]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_all_executors(self) -> List[ExecutorInfo]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_positions_by_ids(self, position_ids: List[str]) -> List[Position]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.id.in_(position_ids)).all()
             return positions
 
     def get_positions_by_controller(self, controller_id: str = None) -> List[Position]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.controller_id == controller_id).all()
             return positions
 
     def get_all_positions(self) -> List[Position]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).all()
             return positions
@@ -308,6 +356,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -323,6 +372,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -334,20 +384,41 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._write_market_states(config_file_path, market.display_name, market.tracking_states, self.db_timestamp,
+                                  session)
+
+    def _submit_market_states(self, market: ConnectorBase):
+        """
+        Submits the write of the current tracking states of the market. Only the last states of a batch are written.
+        """
+        self._sql_writer.submit(
+            partial(self._write_market_states,
+                    self._config_file_path, market.display_name, market.tracking_states, self.db_timestamp),
+            coalesce_key=("market_states", market.display_name))
 
+    @staticmethod
+    def _write_market_states(config_file_path: str,
+                             market_name: str,
+                             tracking_states: Dict[str, Any],
+                             timestamp: int,
+                             session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
@@ -377,31 +448,28 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        self._sql_writer.submit(lambda session: session.add_all([order_record, order_status]))
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._submit_market_states(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -416,56 +484,61 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        self._sql_writer.submit(partial(self._write_order_update, order_id, event_type, timestamp,
+                                        [order_status, trade_fill_record]))
+        self._submit_market_states(market)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+
+    @staticmethod
+    def _write_order_update(order_id: str,
+                            event_type: MarketEvent,
+                            timestamp: int,
+                            records: List[Any],
+                            session: Session):
+        # Try to find the order record, and update it if necessary.
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        if order_record is not None:
+            order_record.last_status = event_type.name
+            order_record.last_update_timestamp = timestamp
+        session.add_all(records)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -477,19 +550,21 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+        self._sql_writer.submit(partial(self._write_funding_payment, funding_payment_record))
+
+    @staticmethod
+    def _write_funding_payment(funding_payment_record: FundingPayment, session: Session):
+        # Try to find the funding payment has been recorded already.
+        payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+            FundingPayment.timestamp == funding_payment_record.timestamp).one_or_none()
+        if payment_record is None:
+            session.add(funding_payment_record)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -535,18 +610,20 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        self._sql_writer.submit(partial(self._write_order_status, order_id, event_type, timestamp))
+        self._submit_market_states(market)
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+    @staticmethod
+    def _write_order_status(order_id: str, event_type: MarketEvent, timestamp: int, session: Session):
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+        if order_record is not None:
+            order_record.last_status = event_type.name
+            order_record.last_update_timestamp = timestamp
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_status)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -582,15 +659,13 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._sql_writer.submit(lambda session: session.add(rp_update))
+        self._submit_market_states(connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -600,17 +675,15 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._sql_writer.submit(lambda session: session.add(rp_fees))
+        self._submit_market_states(connector)
 
     @staticmethod
     async def _sleep(delay):
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from hummingbot.logger import HummingbotLogger
+
+TRADING_RULES = "trading_rules"
+TRADING_FEES = "trading_fees"
+
+
+class ReferenceDataCache:
+    """
+    Local on-disk cache of the reference data of the connectors: the exchange info the trading rules and the trading
+    pair symbol map are built from, and the trading fees schedule.
+
+    The connectors store the data in the cache every time they fetch it from the exchange, and load it when they are
+    created, so that a restart does not have to wait for those requests before the connectors are ready (the data is
+    refreshed in the background by the polling loops as usual). Each connector has a single JSON file, holding every
+    item with the time it was fetched. Items older than max_age, and files written with a different CACHE_VERSION,
+    are ignored.
+
+    Layout:
+        <root_path>/<connector_name>.json
+    """
+    CACHE_VERSION = 1
+    DEFAULT_MAX_AGE = 24 * 60 * 60
+
+    _logger: Optional[HummingbotLogger] = None
+    _instances_by_path: Dict[str, "ReferenceDataCache"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_cache(cls, root_path: Optional[str] = None) -> "ReferenceDataCache":
+        """
+        Returns the cache of the given directory, creating it on the first call.
+        :param root_path: directory of the cache, defaults to <data_path>/reference_data
+        """
+        if root_path is None:
+            from hummingbot import data_path
+            root_path = os.path.join(data_path(), "reference_data")
+        root_path = os.path.abspath(root_path)
+        if root_path not in cls._instances_by_path:
+            cls._instances_by_path[root_path] = cls(root_path)
+        return cls._instances_by_path[root_path]
+
+    def __init__(self, root_path: str, max_age: float = DEFAULT_MAX_AGE):
+        self.root_path = root_path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def _path(self, connector_name: str) -> str:
+        return os.path.join(self.root_path, f"{connector_name}.json")
+
+    def get(self, connector_name: str, key: str) -> Optional[Any]:
+        """
+        Returns a cached item of the connector, or None if it is not cached or too old.
+        """
+        with self._lock:
+            item = self._read_entry(connector_name).get(key)
+        if item is None or time.time() - item["timestamp"] > self.max_age:
+            return None
+        return item["data"]
+
+    def set(self, connector_name: str, key: str, data: Any) -> bool:
+        """
+        Stores an item of the connector, rewriting its cache file.
+        :return: False if the data is not JSON serializable or the file could not be written
+        """
+        with self._lock:
+            entry = dict(self._read_entry(connector_name))
+            entry[key] = {"timestamp": time.time(), "data": data}
+            try:
+                self._write_entry(connector_name, entry)
+            except (TypeError, ValueError):
+                self.logger().debug(f"The {key} of {connector_name} can't be cached, they are not JSON serializable.")
+                return False
+            except OSError:
+                self.logger().warning(f"Could not write the reference data cache of {connector_name}.", exc_info=True)
+                return False
+            self._entries[connector_name] = entry
+        return True
+
+    def clear(self, connector_name: str):
+        with self._lock:
+            self._entries[connector_name] = {}
+            if os.path.exists(self._path(connector_name)):
+                os.remove(self._path(connector_name))
+
+    async def get_async(self, connector_name: str, key: str) -> Optional[Any]:
+        """
+        Same as get, reading the cache file in the executor.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, connector_name, key)
+
+    async def set_async(self, connector_name: str, key: str, data: Any) -> bool:
+        """
+        Same as set, writing the cache file in the executor.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.set, connector_name, key, data)
+
+    def _read_entry(self, connector_name: str) -> Dict[str, Any]:
+        if connector_name not in self._entries:
+            entry = {}
+            try:
+                with open(self._path(connector_name)) as f:
+                    content = json.load(f)
+                if content.get("version") == self.CACHE_VERSION:
+                    entry = content["items"]
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError, AttributeError):
+                self.logger().warning(f"Ignoring the invalid reference data cache of {connector_name}.")
+            self._entries[connector_name] = entry
+        return self._entries[connector_name]
+
+    def _write_entry(self, connector_name: str, entry: Dict[str, Any]):
+        content = json.dumps({"version": self.CACHE_VERSION, "items": entry})
+        os.makedirs(self.root_path, exist_ok=True)
+        path = self._path(connector_name)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_path, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
@@ -8,13 +8,17 @@ from hummingbot.core.api_throttler.async_request_context_base import (
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.rate_limit_scheduler import RateLimitedRequestContext, RateLimitScheduler
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
     """
     An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
     It uses async lock to prevent other instances of this class from running acquire fn before it finishes with it.
+
+    Note: AsyncThrottler does not use this polling context anymore (see RateLimitScheduler). It is kept for the code
+    building its own contexts over a shared list of task logs.
     """
 
     def within_capacity(self) -> bool:
@@ -61,21 +65,26 @@ class AsyncThrottler(AsyncThrottlerBase):
         Pool 1 - rate limit is 10 calls per second
         Task A which consumes capacity from both Pool 0 and Pool 1 can be called at 10 calls per second, any calls after
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
+    Tasks waiting for capacity are woken up when it is freed, instead of checking it every retry_interval, and tasks
+    with a higher priority (e.g. cancels) go before the ones waiting on the same limits.
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._scheduler = RateLimitScheduler(safety_margin_pct=self._safety_margin_pct)
+
+    def execute_task(self, limit_id: str, priority: int = RequestPriority.DEFAULT) -> RateLimitedRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the RequestPriority of the task, used to order the tasks waiting for capacity
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
-        return AsyncRequestContext(
-            task_logs=self._task_logs,
+        return RateLimitedRequestContext(
+            scheduler=self._scheduler,
             rate_limit=rate_limit,
             related_limits=related_rate_limits,
-            lock=self._lock,
-            safety_margin_pct=self._safety_margin_pct,
-            retry_interval=self._retry_interval,
+            priority=priority,
         )
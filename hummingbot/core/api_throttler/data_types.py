@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,19 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority of a throttled request. Requests waiting for capacity are granted by priority (lower values first), then
+    in arrival order. Requests without a priority class use DEFAULT.
+    """
+    CANCEL = 0
+    CREATE = 1
+    STATUS = 2
+    DEFAULT = 3
+    BALANCE = 4
+    REFERENCE_DATA = 5
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
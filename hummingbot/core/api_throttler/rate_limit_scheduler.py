@@ -0,0 +1,230 @@
+import asyncio
+import bisect
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import MAX_CAPACITY_REACHED_WARNING_INTERVAL
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.logger.logger import HummingbotLogger
+
+rls_logger = None
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the weights used on a rate limit. Entries are kept in expiration order with the running sum of
+    their weights, so that both the accounting and the capacity checks are O(1) amortized.
+    """
+    __slots__ = ("entries", "used")
+
+    def __init__(self):
+        self.entries: Deque[Tuple[float, int]] = deque()
+        self.used: int = 0
+
+    def expire(self, now: float):
+        entries = self.entries
+        while entries and entries[0][0] < now:
+            self.used -= entries.popleft()[1]
+
+    def add(self, expiration: float, weight: int):
+        self.entries.append((expiration, weight))
+        self.used += weight
+
+    def available_at(self, limit: int, weight: int) -> Optional[float]:
+        """
+        Returns the time after which the weight fits in the limit, or None if it never does.
+        """
+        if weight > limit:
+            return None
+        freed = 0
+        for expiration, entry_weight in self.entries:
+            freed += entry_weight
+            if self.used - freed + weight <= limit:
+                return expiration
+        return None
+
+
+class RateLimitWaiter:
+    __slots__ = ("limits", "future", "priority", "sequence")
+
+    def __init__(self,
+                 limits: List[Tuple[RateLimit, int]],
+                 future: asyncio.Future,
+                 priority: int,
+                 sequence: int):
+        self.limits = limits
+        self.future = future
+        self.priority = priority
+        self.sequence = sequence
+
+    def __lt__(self, other: "RateLimitWaiter") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class RateLimitScheduler:
+    """
+    Grants requests within their rate limits without polling.
+
+    A request that fits in all its limits, and does not share a limit with an earlier waiting request, is granted
+    right away. Otherwise it waits in a queue ordered by priority (lower values first, see RequestPriority) and then
+    by arrival. Whenever the queue is processed, the waiters are granted in that order while they fit, and a waiter
+    that does not fit blocks the later waiters sharing one of its limits (FIFO per limit). A single timer is then set
+    for the earliest time at which a blocked waiter fits, computed from the expiration of the logged weights.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global rls_logger
+        if rls_logger is None:
+            rls_logger = logging.getLogger(__name__)
+        return rls_logger
+
+    def __init__(self, safety_margin_pct: float = 0.05):
+        self._safety_margin_pct: float = safety_margin_pct
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._waiters: List[RateLimitWaiter] = []
+        self._sequence = itertools.count()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._last_max_cap_warning_ts: float = 0.0
+
+    @property
+    def waiting_requests(self) -> int:
+        return len(self._waiters)
+
+    def used_capacity(self, limit_id: str) -> int:
+        window = self._windows.get(limit_id)
+        if window is None:
+            return 0
+        window.expire(self._time())
+        return window.used
+
+    def within_capacity(self, limits: List[Tuple[RateLimit, int]]) -> bool:
+        now = self._time()
+        for rate_limit, weight in limits:
+            window = self._windows.get(rate_limit.limit_id)
+            if window is not None:
+                window.expire(now)
+                if window.used + weight > rate_limit.limit:
+                    return False
+            elif weight > rate_limit.limit:
+                return False
+        return True
+
+    async def acquire(self, limits: List[Tuple[RateLimit, int]], priority: int = RequestPriority.DEFAULT):
+        if len(self._waiters) == 0 and self.within_capacity(limits):
+            self._log_request(limits)
+            return
+        waiter = RateLimitWaiter(limits=limits,
+                                 future=asyncio.get_running_loop().create_future(),
+                                 priority=priority,
+                                 sequence=next(self._sequence))
+        bisect.insort(self._waiters, waiter)
+        self._process_waiters()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # The waiter could have been blocking the ones behind it
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._process_waiters()
+            raise
+
+    def _process_waiters(self):
+        self._cancel_wake_up()
+        now = self._time()
+        blocked_limit_ids = set()
+        wake_up_time = None
+        remaining_waiters = []
+        for waiter in self._waiters:
+            if waiter.future.done():
+                continue
+            limit_ids = [rate_limit.limit_id for rate_limit, _ in waiter.limits]
+            if not blocked_limit_ids.isdisjoint(limit_ids):
+                blocked_limit_ids.update(limit_ids)
+                remaining_waiters.append(waiter)
+                continue
+            if self.within_capacity(waiter.limits):
+                self._log_request(waiter.limits)
+                waiter.future.set_result(None)
+                continue
+            blocked_limit_ids.update(limit_ids)
+            remaining_waiters.append(waiter)
+            available_at = self._available_at(waiter.limits, now)
+            if available_at is not None and (wake_up_time is None or available_at < wake_up_time):
+                wake_up_time = available_at
+        self._waiters = remaining_waiters
+        if wake_up_time is not None:
+            self._wake_up_handle = asyncio.get_running_loop().call_later(
+                max(wake_up_time - now, 0.0) + 1e-6, self._process_waiters)
+
+    def _cancel_wake_up(self):
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+
+    def _available_at(self, limits: List[Tuple[RateLimit, int]], now: float) -> Optional[float]:
+        available_at = now
+        for rate_limit, weight in limits:
+            window = self._windows.get(rate_limit.limit_id)
+            if window is None or window.used + weight <= rate_limit.limit:
+                continue
+            limit_available_at = window.available_at(rate_limit.limit, weight)
+            if limit_available_at is None:
+                return None
+            available_at = max(available_at, limit_available_at)
+            self._warn_capacity_reached(rate_limit, window.used, now)
+        return available_at
+
+    def _log_request(self, limits: List[Tuple[RateLimit, int]]):
+        now = self._time()
+        for rate_limit, weight in limits:
+            window = self._windows.get(rate_limit.limit_id)
+            if window is None:
+                window = self._windows[rate_limit.limit_id] = RateLimitWindow()
+            window.add(now + rate_limit.time_interval * (1 + self._safety_margin_pct), weight)
+
+    def _warn_capacity_reached(self, rate_limit: RateLimit, capacity_used: int, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            self.logger().notify(f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per "
+                                 f"{rate_limit.time_interval}s) has almost reached. Limits used "
+                                 f"is {capacity_used} in the last {rate_limit.time_interval} seconds")
+            self._last_max_cap_warning_ts = now
+
+    def _time(self) -> float:
+        return time.time()
+
+
+class RateLimitedRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until the RateLimitScheduler grants the request.
+    """
+
+    def __init__(self,
+                 scheduler: RateLimitScheduler,
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 priority: int = RequestPriority.DEFAULT):
+        self._scheduler = scheduler
+        self._rate_limit = rate_limit
+        self._related_limits = related_limits
+        self._priority = priority
+        # Requests without a configured rate limit are not throttled
+        self._limits: List[Tuple[RateLimit, int]] = (
+            [] if rate_limit is None else [(rate_limit, rate_limit.weight)] + related_limits
+        )
+
+    def within_capacity(self) -> bool:
+        return self._scheduler.within_capacity(self._limits)
+
+    async def acquire(self):
+        if len(self._limits) > 0:
+            await self._scheduler.acquire(self._limits, self._priority)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
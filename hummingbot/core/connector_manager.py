@@ -6,6 +6,8 @@ from hummingbot.client.config.security import Security
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.reference_data_cache import ReferenceDataCache
 
 
 class ConnectorManager:
@@ -20,15 +22,20 @@ class ConnectorManager:
     - Manage connector lifecycle independently of strategies
     """
 
-    def __init__(self, client_config: ClientConfigAdapter):
+    def __init__(self,
+                 client_config: ClientConfigAdapter,
+                 reference_data_cache: Optional[ReferenceDataCache] = None):
         """
         Initialize the connector manager.
 
         Args:
             client_config: Client configuration
+            reference_data_cache: Cache of the connectors reference data (trading rules, symbol maps and fees),
+                defaults to the shared on-disk cache
         """
         self._logger = logging.getLogger(__name__)
         self.client_config_map = client_config
+        self.reference_data_cache = reference_data_cache or ReferenceDataCache.get_cache()
 
         # Active connectors
         self.connectors: Dict[str, ExchangeBase] = {}
@@ -96,6 +103,8 @@ class ConnectorManager:
 
                 connector_class = get_connector_class(connector_name)
                 connector = connector_class(**init_params)
+                if isinstance(connector, ExchangePyBase):
+                    connector.set_reference_data_cache(self.reference_data_cache)
 
             # Add to active connectors
             self.connectors[connector_name] = connector
@@ -5,4 +5,5 @@ cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef int c_fill_depth_array(self, bint is_bid, double[:, ::1] out, int n_levels, bint cumulative) except -1
     cdef double c_get_price(self, bint is_buy) except? -1
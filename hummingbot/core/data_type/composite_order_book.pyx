@@ -28,6 +28,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._version += 1
+        self.c_clear_query_cache()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +73,9 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        # The filled amounts are discounted from the entries of this book
+        self._version += 1
+        self.c_clear_query_cache()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -175,6 +180,29 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef int c_fill_depth_array(self, bint is_bid, double[:, ::1] out, int n_levels, bint cumulative) except -1:
+        # The composite entries discount the recorded filled orders, so they can't be read from the books directly
+        cdef:
+            int filled = 0
+            double cumulative_amount = 0
+            double cumulative_quote_amount = 0
+        if n_levels <= 0:
+            return 0
+        for row in (self.bid_entries() if is_bid else self.ask_entries()):
+            out[filled, 0] = row.price
+            if cumulative:
+                cumulative_amount += row.amount
+                cumulative_quote_amount += row.amount * row.price
+                out[filled, 1] = cumulative_amount
+                out[filled, 2] = cumulative_quote_amount
+            else:
+                out[filled, 1] = row.amount
+                out[filled, 2] = row.update_id
+            filled += 1
+            if filled == n_levels:
+                break
+        return filled
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
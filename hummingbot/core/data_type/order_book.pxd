@@ -20,6 +20,9 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef int64_t _version
+    cdef dict _bid_query_cache
+    cdef dict _ask_query_cache
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,6 +33,12 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_clear_query_cache(self)
+    cdef c_invalidate_query_cache(self, bint is_bid, double touched_price)
+    cdef OrderBookQueryResult c_get_cached_query(self, int query_type, bint is_buy, double volume)
+    cdef c_cache_query(self, int query_type, bint is_buy, double volume, OrderBookQueryResult result,
+                       double boundary_price)
+    cdef int c_fill_depth_array(self, bint is_bid, double[:, ::1] out, int n_levels, bint cumulative) except -1
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -34,10 +34,27 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+cdef double INF = float("inf")
+
+# Queries memoized by c_get_cached_query / c_cache_query
+cdef enum:
+    PRICE_FOR_VOLUME_QUERY = 0
+    VWAP_FOR_VOLUME_QUERY = 1
+    PRICE_FOR_QUOTE_VOLUME_QUERY = 2
 
 
 cdef class OrderBook(PubSub):
+    """
+    Bid and ask books of a trading pair.
+
+    The book keeps a version counter that increases on every snapshot or diff applied, and memoizes the results of
+    the price and VWAP for volume queries, which are asked many times per tick with the same arguments. A memoized
+    result is dropped when a diff touches a price level inside the depth the query walked, or when a snapshot is
+    applied.
+    """
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    # Max number of memoized query results per side, the oldest ones are dropped first
+    MAX_QUERY_CACHE_SIZE = 64
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -55,6 +72,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._version = 0
+        self._bid_query_cache = {}
+        self._ask_query_cache = {}
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +85,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double highest_bid_touched = -INF
+            double lowest_ask_touched = INF
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -73,12 +95,24 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            highest_bid_touched = max(highest_bid_touched, bid.getPrice())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            lowest_ask_touched = min(lowest_ask_touched, ask.getPrice())
+
+        # Overlapping entries are truncated from the top of both books, which is inside the depth of every query.
+        bid_iterator = self._bid_book.rbegin()
+        ask_iterator = self._ask_book.begin()
+        if (bid_iterator != self._bid_book.rend() and ask_iterator != self._ask_book.end() and
+                deref(bid_iterator).getPrice() >= deref(ask_iterator).getPrice()):
+            self.c_clear_query_cache()
+        else:
+            self.c_invalidate_query_cache(True, highest_bid_touched)
+            self.c_invalidate_query_cache(False, lowest_ask_touched)
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
@@ -95,6 +129,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -135,6 +170,8 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+        self.c_clear_query_cache()
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -169,14 +206,138 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        Counter increased every time the book changes, consumers can compare it to skip recomputing values derived
+        from an unchanged book.
+        """
+        return self._version
+
+    cdef c_clear_query_cache(self):
+        self._bid_query_cache.clear()
+        self._ask_query_cache.clear()
+
+    cdef c_invalidate_query_cache(self, bint is_bid, double touched_price):
+        """
+        Drops the memoized results of the queries over one side of the book that walked down to touched_price.
+        """
+        cdef:
+            dict cache = self._bid_query_cache if is_bid else self._ask_query_cache
+            double boundary_price
+        if len(cache) == 0 or touched_price == (-INF if is_bid else INF):
+            return
+        stale_keys = []
+        for key, (_, boundary_price) in cache.items():
+            if (touched_price >= boundary_price) if is_bid else (touched_price <= boundary_price):
+                stale_keys.append(key)
+        for key in stale_keys:
+            del cache[key]
+
+    cdef OrderBookQueryResult c_get_cached_query(self, int query_type, bint is_buy, double volume):
+        cdef:
+            dict cache = self._ask_query_cache if is_buy else self._bid_query_cache
+            OrderBookQueryResult result
+        cached = cache.get((query_type, volume))
+        if cached is None:
+            return None
+        result = cached[0]
+        # Results are mutable, each caller gets its own copy
+        return OrderBookQueryResult(result.query_price, result.query_volume, result.result_price, result.result_volume)
+
+    cdef c_cache_query(self, int query_type, bint is_buy, double volume, OrderBookQueryResult result,
+                       double boundary_price):
+        """
+        Memoizes the result of a query that walked one side of the book from the best price down to boundary_price,
+        which is -inf for the bids and inf for the asks when the whole side was walked.
+        """
+        cdef dict cache = self._ask_query_cache if is_buy else self._bid_query_cache
+        if len(cache) >= self.MAX_QUERY_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[(query_type, volume)] = (
+            OrderBookQueryResult(result.query_price, result.query_volume, result.result_price, result.result_volume),
+            boundary_price)
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.get_depth_arrays()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64", copy=False)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64", copy=False)
         return bids_df, asks_df
 
+    cdef int c_fill_depth_array(self, bint is_bid, double[:, ::1] out, int n_levels, bint cumulative) except -1:
+        """
+        Fills out with the [price, amount, update_id] rows of the best n_levels of one side of the book, best price
+        first. When cumulative is True the rows are [price, cumulative amount, cumulative quote amount] instead.
+        Returns the number of rows filled.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            int filled = 0
+            double cumulative_amount = 0
+            double cumulative_quote_amount = 0
+        while filled < n_levels:
+            if is_bid:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+            else:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+            out[filled, 0] = entry.getPrice()
+            if cumulative:
+                cumulative_amount += entry.getAmount()
+                cumulative_quote_amount += entry.getAmount() * entry.getPrice()
+                out[filled, 1] = cumulative_amount
+                out[filled, 2] = cumulative_quote_amount
+            else:
+                out[filled, 1] = entry.getAmount()
+                out[filled, 2] = entry.getUpdateId()
+            filled += 1
+        return filled
+
+    def _get_depth_arrays(self,
+                          n_levels: Optional[int],
+                          bids_out: Optional[np.ndarray],
+                          asks_out: Optional[np.ndarray],
+                          bint cumulative) -> Tuple[np.ndarray, np.ndarray]:
+        cdef int bid_levels = self._bid_book.size() if n_levels is None else min(n_levels, self._bid_book.size())
+        cdef int ask_levels = self._ask_book.size() if n_levels is None else min(n_levels, self._ask_book.size())
+        if bids_out is None:
+            bids_out = np.empty((bid_levels, 3), dtype=np.float64)
+        if asks_out is None:
+            asks_out = np.empty((ask_levels, 3), dtype=np.float64)
+        bid_levels = self.c_fill_depth_array(True, bids_out, min(bid_levels, bids_out.shape[0]), cumulative)
+        ask_levels = self.c_fill_depth_array(False, asks_out, min(ask_levels, asks_out.shape[0]), cumulative)
+        return bids_out[:bid_levels], asks_out[:ask_levels]
+
+    def get_depth_arrays(self,
+                         n_levels: Optional[int] = None,
+                         bids_out: Optional[np.ndarray] = None,
+                         asks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the [price, amount, update_id] rows of the best n_levels bids and asks (all the levels by default) as
+        float64 NumPy arrays, best price first, read directly from the order book without creating OrderBookRow objects.
+        The rows can be written into preallocated C-contiguous float64 arrays of shape (n, 3) to avoid allocating new
+        ones on every call, in that case the returned arrays are views of the filled rows.
+        """
+        return self._get_depth_arrays(n_levels, bids_out, asks_out, False)
+
+    def get_cumulative_depth_arrays(self,
+                                    n_levels: Optional[int] = None,
+                                    bids_out: Optional[np.ndarray] = None,
+                                    asks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same as get_depth_arrays, with [price, cumulative amount, cumulative quote amount] rows, i.e. the base and
+        quote amounts available up to each price level.
+        """
+        return self._get_depth_arrays(n_levels, bids_out, asks_out, True)
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -322,7 +483,10 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookQueryResult result = self.c_get_cached_query(PRICE_FOR_VOLUME_QUERY, is_buy, volume)
 
+        if result is not None:
+            return result
         if is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount
@@ -336,13 +500,21 @@ cdef class OrderBook(PubSub):
                     result_price = order_book_row.price
                     break
 
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+        result = OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+        self.c_cache_query(PRICE_FOR_VOLUME_QUERY, is_buy, volume, result,
+                           result_price if result_price == result_price else (INF if is_buy else -INF))
+        return result
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+            double boundary_price = INF if is_buy else -INF
+            OrderBookQueryResult result = self.c_get_cached_query(VWAP_FOR_VOLUME_QUERY, is_buy, volume)
+
+        if result is not None:
+            return result
         if is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
@@ -354,6 +526,7 @@ cdef class OrderBook(PubSub):
                     total_cost += incremental_amount * order_book_row.price
                     total_volume += incremental_amount
                     result_vwap = total_cost / total_volume
+                    boundary_price = order_book_row.price
                     break
         else:
             for order_book_row in self.bid_entries():
@@ -366,15 +539,21 @@ cdef class OrderBook(PubSub):
                     total_cost += incremental_amount * order_book_row.price
                     total_volume += incremental_amount
                     result_vwap = total_cost / total_volume
+                    boundary_price = order_book_row.price
                     break
 
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+        result = OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+        self.c_cache_query(VWAP_FOR_VOLUME_QUERY, is_buy, volume, result, boundary_price)
+        return result
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookQueryResult result = self.c_get_cached_query(PRICE_FOR_QUOTE_VOLUME_QUERY, is_buy, quote_volume)
 
+        if result is not None:
+            return result
         if is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount * order_book_row.price
@@ -388,7 +567,10 @@ cdef class OrderBook(PubSub):
                     result_price = order_book_row.price
                     break
 
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+        result = OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+        self.c_cache_query(PRICE_FOR_QUOTE_VOLUME_QUERY, is_buy, quote_volume, result,
+                           result_price if result_price == result_price else (INF if is_buy else -INF))
+        return result
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
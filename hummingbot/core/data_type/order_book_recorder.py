@@ -0,0 +1,346 @@
+import logging
+import os
+import struct
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.logger import HummingbotLogger
+
+SECONDS_PER_DAY = 86400
+
+FILE_MAGIC = b"HBOB"
+FORMAT_VERSION = 1
+# magic, format version, length of the trading pair that follows the header
+FILE_HEADER = struct.Struct("<4sHH")
+CHUNK_MAGIC = b"CHNK"
+# magic, compressed flag, messages, price levels, trades, payload size, first and last message timestamps
+CHUNK_HEADER = struct.Struct("<4sBIIIIdd")
+# chunk offset, first and last message timestamps, messages
+INDEX_ENTRY = struct.Struct("<QddI")
+
+MESSAGE_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("type", "u1"),
+    ("update_id", "<i8"),
+    ("first_update_id", "<i8"),
+    ("n_bids", "<u4"),
+    ("n_asks", "<u4"),
+])
+TRADE_DTYPE = np.dtype([
+    ("price", "<f8"),
+    ("amount", "<f8"),
+    ("trade_type", "<f8"),
+    ("trade_id", "S64"),
+])
+
+orr_logger = None
+
+
+class OrderBookMessageWriter:
+    """
+    Appends the order book messages of a trading pair to a binary file.
+
+    The file starts with a header with the trading pair, followed by chunks of up to chunk_size messages. Each chunk
+    has a fixed size header (number of messages and first and last timestamps) and a payload with three arrays: one
+    row per message (timestamp, type, update ids and number of bid and ask levels), the [price, amount] levels of the
+    snapshots and diffs, and the trades. The payload is zlib compressed by default. Every chunk written is added to
+    an index file next to the data file (<path>.idx) with its offset and time range, so readers can seek to a time
+    range without decoding the chunks before it.
+
+    A chunk is written when it reaches chunk_size messages, when its messages span more than max_chunk_seconds and on
+    flush. Messages in the current chunk are lost if the process dies before that, the chunks already written are not
+    affected.
+    """
+
+    def __init__(self, path: str, trading_pair: str, chunk_size: int = 1000, max_chunk_seconds: float = 10.0,
+                 compress: bool = True):
+        self.path = path
+        self.trading_pair = trading_pair
+        self.chunk_size = chunk_size
+        self.max_chunk_seconds = max_chunk_seconds
+        self.compress = compress
+        self._messages: List[OrderBookMessage] = []
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "ab")
+        self._index_file = open(f"{path}.idx", "ab")
+        if self._file.tell() == 0:
+            encoded_pair = trading_pair.encode()
+            self._file.write(FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION, len(encoded_pair)) + encoded_pair)
+            self._file.flush()
+        else:
+            stored_pair = OrderBookMessageReader(path).trading_pair
+            if stored_pair != trading_pair:
+                raise ValueError(f"{path} records {stored_pair}, not {trading_pair}.")
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, message: OrderBookMessage):
+        self._messages.append(message)
+        if (len(self._messages) >= self.chunk_size or
+                self._timestamp(message) - self._timestamp(self._messages[0]) >= self.max_chunk_seconds):
+            self.flush()
+
+    def flush(self):
+        if len(self._messages) == 0:
+            return
+        payload, n_messages, n_levels, n_trades, timestamps = self._encode(self._messages)
+        compressed = self.compress
+        if compressed:
+            payload = zlib.compress(payload, 1)
+        offset = self._file.tell()
+        self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, compressed, n_messages, n_levels, n_trades, len(payload),
+                                           timestamps.min(), timestamps.max()))
+        self._file.write(payload)
+        self._file.flush()
+        # The index entry is only written once the chunk is complete on disk
+        self._index_file.write(INDEX_ENTRY.pack(offset, timestamps.min(), timestamps.max(), n_messages))
+        self._index_file.flush()
+        self._messages = []
+
+    def close(self):
+        if not self.closed:
+            self.flush()
+            self._file.close()
+            self._index_file.close()
+
+    @staticmethod
+    def _timestamp(message: OrderBookMessage) -> float:
+        # Some data sources leave the timestamp of the messages empty
+        return message.timestamp if message.timestamp is not None else time.time()
+
+    def _encode(self, messages: List[OrderBookMessage]) -> Tuple[bytes, int, int, int, np.ndarray]:
+        message_rows = np.zeros(len(messages), dtype=MESSAGE_DTYPE)
+        levels = []
+        trades = []
+        for i, message in enumerate(messages):
+            row = message_rows[i]
+            row["timestamp"] = self._timestamp(message)
+            row["type"] = message.type.value
+            if message.type is OrderBookMessageType.TRADE:
+                row["update_id"] = row["first_update_id"] = -1
+                trades.append((float(message.content["price"]), float(message.content["amount"]),
+                               float(message.content["trade_type"]), str(message.trade_id).encode()))
+            else:
+                bids = message.bids
+                asks = message.asks
+                row["update_id"] = message.update_id
+                row["first_update_id"] = message.content.get("first_update_id", message.update_id)
+                row["n_bids"] = len(bids)
+                row["n_asks"] = len(asks)
+                levels.extend((entry.price, entry.amount) for entry in bids)
+                levels.extend((entry.price, entry.amount) for entry in asks)
+        levels_array = np.array(levels, dtype=np.float64).reshape(-1, 2)
+        trades_array = np.array(trades, dtype=TRADE_DTYPE)
+        payload = message_rows.tobytes() + levels_array.tobytes() + trades_array.tobytes()
+        return payload, len(message_rows), len(levels_array), len(trades_array), message_rows["timestamp"]
+
+
+class OrderBookMessageReader:
+    """
+    Reads the order book messages written by OrderBookMessageWriter, in the order they were written. Chunks that were
+    not completely written (e.g. the process died while writing them) are ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, pair_length = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+            if magic != FILE_MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path} is not an order book recording.")
+            self.trading_pair: str = f.read(pair_length).decode()
+            self._data_offset = FILE_HEADER.size + pair_length
+
+    def chunks(self) -> List[Tuple[int, float, float, int]]:
+        """
+        Returns the (offset, first timestamp, last timestamp, number of messages) of the complete chunks of the file.
+        Reads the index file, and the headers of the chunks written after the last indexed one, if any.
+        """
+        file_size = os.path.getsize(self.path)
+        chunks = []
+        index_path = f"{self.path}.idx"
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                index_data = f.read()
+            for entry in INDEX_ENTRY.iter_unpack(index_data[:len(index_data) - len(index_data) % INDEX_ENTRY.size]):
+                if entry[0] + CHUNK_HEADER.size > file_size:
+                    break
+                chunks.append(entry)
+        offset = self._data_offset
+        if len(chunks) > 0:
+            offset = chunks[-1][0] + CHUNK_HEADER.size + self._chunk_header(chunks[-1][0])[5]
+        with open(self.path, "rb") as f:
+            while offset + CHUNK_HEADER.size <= file_size:
+                f.seek(offset)
+                magic, _, n_messages, _, _, payload_size, first_ts, last_ts = CHUNK_HEADER.unpack(
+                    f.read(CHUNK_HEADER.size))
+                if magic != CHUNK_MAGIC or offset + CHUNK_HEADER.size + payload_size > file_size:
+                    break
+                chunks.append((offset, first_ts, last_ts, n_messages))
+                offset += CHUNK_HEADER.size + payload_size
+        return chunks
+
+    def read(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> Iterator[OrderBookMessage]:
+        """
+        Yields the messages with timestamps in [start_time, end_time], only decoding the chunks that overlap the range.
+        """
+        start_time = -np.inf if start_time is None else start_time
+        end_time = np.inf if end_time is None else end_time
+        for offset, first_ts, last_ts, _ in self.chunks():
+            if last_ts < start_time or first_ts > end_time:
+                continue
+            for message in self._read_chunk(offset):
+                if start_time <= message.timestamp <= end_time:
+                    yield message
+
+    def _chunk_header(self, offset: int) -> Tuple:
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+
+    def _read_chunk(self, offset: int) -> Iterator[OrderBookMessage]:
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            _, compressed, n_messages, n_levels, n_trades, payload_size, _, _ = CHUNK_HEADER.unpack(
+                f.read(CHUNK_HEADER.size))
+            payload = f.read(payload_size)
+        if compressed:
+            payload = zlib.decompress(payload)
+        message_rows = np.frombuffer(payload, dtype=MESSAGE_DTYPE, count=n_messages)
+        position = message_rows.nbytes
+        levels = np.frombuffer(payload, dtype=np.float64, count=n_levels * 2, offset=position).reshape(-1, 2)
+        position += levels.nbytes
+        trades = np.frombuffer(payload, dtype=TRADE_DTYPE, count=n_trades, offset=position)
+
+        level_position = 0
+        trade_position = 0
+        for row in message_rows:
+            message_type = OrderBookMessageType(int(row["type"]))
+            if message_type is OrderBookMessageType.TRADE:
+                trade = trades[trade_position]
+                trade_position += 1
+                trade_id = trade["trade_id"].decode()
+                content = {
+                    "trading_pair": self.trading_pair,
+                    "trade_type": float(trade["trade_type"]),
+                    "trade_id": int(trade_id) if trade_id.lstrip("-").isdigit() else trade_id,
+                    "update_id": -1,
+                    "price": float(trade["price"]),
+                    "amount": float(trade["amount"]),
+                }
+            else:
+                n_bids = int(row["n_bids"])
+                n_asks = int(row["n_asks"])
+                content = {
+                    "trading_pair": self.trading_pair,
+                    "update_id": int(row["update_id"]),
+                    "first_update_id": int(row["first_update_id"]),
+                    "bids": levels[level_position:level_position + n_bids].tolist(),
+                    "asks": levels[level_position + n_bids:level_position + n_bids + n_asks].tolist(),
+                }
+                level_position += n_bids + n_asks
+            yield OrderBookMessage(message_type, content, timestamp=float(row["timestamp"]))
+
+
+def recording_path(root_path: str, connector_name: str, trading_pair: str, day: int) -> str:
+    """
+    Returns the path of the recording of a trading pair for a UTC day (days since the epoch).
+    """
+    day_str = np.datetime64(day * SECONDS_PER_DAY, "s").astype("datetime64[D]").astype(str).replace("-", "")
+    return os.path.join(root_path, connector_name, trading_pair, f"{day_str}.obr")
+
+
+def default_recordings_path() -> str:
+    from hummingbot import data_path
+    return os.path.join(data_path(), "order_books")
+
+
+class OrderBookRecorder:
+    """
+    Records the snapshots, diffs and trades applied by an OrderBookTracker, in one file per trading pair and UTC day:
+        <root_path>/<connector_name>/<trading_pair>/<YYYYMMDD>.obr
+
+    The messages are recorded as the tracker applies them. Each file starts with a snapshot taken from the tracked
+    order book, which makes every day replayable on its own (see OrderBookReplay). The snapshot can already include
+    the diffs recorded right after it (the ones applied in the same batch), which is harmless since diffs set the
+    absolute amount of their price levels: applying them again leaves the order book unchanged.
+
+    Usage:
+        recorder = OrderBookRecorder(connector.order_book_tracker, connector_name="binance")
+        recorder.start()
+        ...
+        recorder.stop()
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global orr_logger
+        if orr_logger is None:
+            orr_logger = logging.getLogger(__name__)
+        return orr_logger
+
+    def __init__(self,
+                 tracker: OrderBookTracker,
+                 connector_name: str,
+                 root_path: Optional[str] = None,
+                 trading_pairs: Optional[List[str]] = None,
+                 chunk_size: int = 1000,
+                 max_chunk_seconds: float = 10.0):
+        self.tracker = tracker
+        self.connector_name = connector_name
+        self.root_path = root_path or default_recordings_path()
+        self.trading_pairs = trading_pairs
+        self.chunk_size = chunk_size
+        self.max_chunk_seconds = max_chunk_seconds
+        self._writers: Dict[str, Tuple[int, OrderBookMessageWriter]] = {}
+
+    def start(self):
+        self.tracker.add_message_listener(self.record)
+
+    def stop(self):
+        self.tracker.remove_message_listener(self.record)
+        for _, writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def flush(self):
+        for _, writer in self._writers.values():
+            writer.flush()
+
+    def record(self, message: OrderBookMessage):
+        trading_pair = message.trading_pair
+        if self.trading_pairs is not None and trading_pair not in self.trading_pairs:
+            return
+        try:
+            day = int((message.timestamp if message.timestamp is not None else time.time()) // SECONDS_PER_DAY)
+            current_day, writer = self._writers.get(trading_pair, (None, None))
+            if writer is None or current_day != day:
+                if writer is not None:
+                    writer.close()
+                writer = OrderBookMessageWriter(recording_path(self.root_path, self.connector_name, trading_pair, day),
+                                                trading_pair, chunk_size=self.chunk_size,
+                                                max_chunk_seconds=self.max_chunk_seconds)
+                self._writers[trading_pair] = (day, writer)
+                order_book = self.tracker.order_books.get(trading_pair)
+                if message.type is not OrderBookMessageType.SNAPSHOT and order_book is not None:
+                    writer.write(self.snapshot_message(order_book, trading_pair, message.timestamp))
+            writer.write(message)
+        except Exception:
+            self.logger().error(f"Unexpected error recording order book message of {trading_pair}.", exc_info=True)
+
+    @staticmethod
+    def snapshot_message(order_book: OrderBook, trading_pair: str, timestamp: float) -> OrderBookMessage:
+        bids, asks = order_book.get_depth_arrays()
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": max(order_book.snapshot_uid, order_book.last_diff_uid),
+            "bids": bids[:, :2].tolist(),
+            "asks": asks[:, :2].tolist(),
+        }, timestamp=timestamp)
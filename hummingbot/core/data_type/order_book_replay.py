@@ -0,0 +1,171 @@
+import asyncio
+import heapq
+import os
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    SECONDS_PER_DAY,
+    OrderBookMessageReader,
+    OrderBookRecorder,
+    default_recordings_path,
+)
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class OrderBookReplay:
+    """
+    Reads back the messages recorded by OrderBookRecorder for a set of trading pairs and a time range.
+
+    messages() yields, for each trading pair, a snapshot of the order book at start_time (rebuilt from the last
+    recorded snapshot before it and the diffs in between), followed by the recorded messages of all the trading pairs
+    merged by timestamp. apply() applies one of those messages to an order book, so the order books can be advanced as
+    fast as the messages can be read.
+    """
+
+    def __init__(self,
+                 connector_name: str,
+                 trading_pairs: List[str],
+                 start_time: float,
+                 end_time: Optional[float] = None,
+                 root_path: Optional[str] = None):
+        self.connector_name = connector_name
+        self.trading_pairs = trading_pairs
+        self.start_time = start_time
+        self.end_time = end_time
+        self.root_path = root_path or default_recordings_path()
+
+    def recording_paths(self, trading_pair: str) -> List[str]:
+        """
+        Returns the recordings of the trading pair for the days of the time range, oldest first.
+        """
+        pair_path = os.path.join(self.root_path, self.connector_name, trading_pair)
+        if not os.path.isdir(pair_path):
+            return []
+        first_day = int(self.start_time // SECONDS_PER_DAY)
+        last_day = int(self.end_time // SECONDS_PER_DAY) if self.end_time is not None else None
+        paths = []
+        for file_name in sorted(os.listdir(pair_path)):
+            if not file_name.endswith(".obr"):
+                continue
+            day = int(np.datetime64(f"{file_name[:4]}-{file_name[4:6]}-{file_name[6:8]}", "D").astype(np.int64))
+            if day >= first_day and (last_day is None or day <= last_day):
+                paths.append(os.path.join(pair_path, file_name))
+        return paths
+
+    def pair_messages(self, trading_pair: str) -> Iterator[OrderBookMessage]:
+        """
+        Yields the snapshot of the trading pair at start_time, then its messages up to end_time. Messages before the
+        first snapshot available are skipped, since there is no order book to apply them to.
+        """
+        order_book = OrderBook()
+        order_book_ready = False
+        started = False
+        for path in self.recording_paths(trading_pair):
+            for message in OrderBookMessageReader(path).read(end_time=self.end_time):
+                if not started:
+                    if message.timestamp < self.start_time:
+                        # Rebuild the order book at start_time from the last snapshot before it
+                        order_book_ready |= message.type is OrderBookMessageType.SNAPSHOT
+                        if order_book_ready and message.type is not OrderBookMessageType.TRADE:
+                            self.apply(order_book, message)
+                        continue
+                    if message.type is not OrderBookMessageType.SNAPSHOT:
+                        if not order_book_ready:
+                            continue
+                        yield OrderBookRecorder.snapshot_message(order_book, trading_pair, self.start_time)
+                    started = True
+                yield message
+        if not started and order_book_ready:
+            yield OrderBookRecorder.snapshot_message(order_book, trading_pair, self.start_time)
+
+    def messages(self) -> Iterator[OrderBookMessage]:
+        """
+        Yields the messages of all the trading pairs merged by timestamp.
+        """
+        return heapq.merge(*[self.pair_messages(trading_pair) for trading_pair in self.trading_pairs],
+                           key=lambda message: message.timestamp)
+
+    @staticmethod
+    def apply(order_book: OrderBook, message: OrderBookMessage):
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.DIFF:
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.TRADE:
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=message.trading_pair,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                trade_id=message.trade_id,
+                type=TradeType.SELL if message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY,
+            ))
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source that feeds an OrderBookTracker with recorded messages instead of a live exchange stream.
+
+    The messages are sent at speed times the recorded pace (e.g. speed=60 replays one hour per minute), or as fast as
+    the tracker consumes them when speed is None.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 connector_name: str,
+                 start_time: float,
+                 end_time: Optional[float] = None,
+                 speed: Optional[float] = None,
+                 root_path: Optional[str] = None):
+        super().__init__(trading_pairs)
+        self.replay = OrderBookReplay(connector_name=connector_name, trading_pairs=trading_pairs,
+                                      start_time=start_time, end_time=end_time, root_path=root_path)
+        self.speed = speed
+        self._last_traded_prices: Dict[str, float] = {}
+        self.replay_finished = asyncio.Event()
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        # NaN (the order book default) until a trade is replayed, so that the tracker does not ask again right away
+        return {trading_pair: self._last_traded_prices.get(trading_pair, float("NaN")) for trading_pair in trading_pairs}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        for message in self.replay.pair_messages(trading_pair):
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                return message
+        raise ValueError(f"No order book recorded for {trading_pair} at {self.replay.start_time}.")
+
+    async def listen_for_subscriptions(self):
+        """
+        Sends the recorded messages to the message queues, waiting between them as many seconds as they were recorded
+        apart divided by speed.
+        """
+        previous_timestamp = None
+        for count, message in enumerate(self.replay.messages()):
+            if self.speed is not None and previous_timestamp is not None and message.timestamp > previous_timestamp:
+                await self._sleep((message.timestamp - previous_timestamp) / self.speed)
+            elif count % 100 == 0:
+                await self._sleep(0)
+            previous_timestamp = message.timestamp
+            if message.type is OrderBookMessageType.TRADE:
+                self._last_traded_prices[message.trading_pair] = float(message.content["price"])
+                self._message_queue[self._trade_messages_queue_key].put_nowait(message)
+            elif message.type is OrderBookMessageType.DIFF:
+                self._message_queue[self._diff_messages_queue_key].put_nowait(message)
+            else:
+                self._message_queue[self._snapshot_messages_queue_key].put_nowait(message)
+        self.replay_finished.set()
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
@@ -2,14 +2,16 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -21,8 +23,29 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookTrackerMetrics:
+    """
+    Statistics of the diff messages applied to the order book of a trading pair.
+    queue_depth is the number of messages waiting to be applied and lag the seconds between the timestamp of the last
+    applied diff message and the time it was applied.
+    The lag is a best-effort value: it relies on the timestamps set by the data sources, which are not normalized to a
+    single unit across connectors. Timestamps that are too large to be seconds are read as milliseconds, microseconds
+    or nanoseconds, and clock differences with the exchange are not corrected.
+    """
+    queue_depth: int = 0
+    diffs_applied: int = 0
+    batches_applied: int = 0
+    price_levels_coalesced: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_DIFFS_PER_BATCH: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,8 +54,17 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 batch_diffs: bool = True):
+        """
+        :param batch_diffs: if True, all the diff messages queued for a trading pair are merged per price level and
+        applied to the order book at once, instead of one by one
+        """
         self._domain: Optional[str] = domain
+        self._batch_diffs: bool = batch_diffs
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -45,6 +77,8 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._metrics: Dict[str, OrderBookTrackerMetrics] = defaultdict(OrderBookTrackerMetrics)
+        self._message_listeners: List[Callable[[OrderBookMessage], None]] = []
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -75,6 +109,33 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def metrics(self) -> Dict[str, OrderBookTrackerMetrics]:
+        """
+        Returns a copy of the diff processing statistics per trading pair, with the current depth of the message
+        queues.
+        """
+        return {
+            trading_pair: replace(self._metrics[trading_pair],
+                                  queue_depth=message_queue.qsize() + len(self._saved_message_queues[trading_pair]))
+            for trading_pair, message_queue in self._tracking_message_queues.items()
+        }
+
+    def add_message_listener(self, listener: Callable[[OrderBookMessage], None]):
+        """
+        Registers a function called with every snapshot, diff and trade message right after it is applied to its
+        order book (after the whole batch for batched diffs), e.g. to record the messages (see OrderBookRecorder).
+        """
+        self._message_listeners.append(listener)
+
+    def remove_message_listener(self, listener: Callable[[OrderBookMessage], None]):
+        if listener in self._message_listeners:
+            self._message_listeners.remove(listener)
+
+    def _notify_message_listeners(self, message: OrderBookMessage):
+        for listener in self._message_listeners:
+            listener(message)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -258,33 +319,45 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        metrics: OrderBookTrackerMetrics = self._metrics[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if pending_message is not None:
+                    message, pending_message = pending_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    diff_messages = [message]
+                    if self._batch_diffs:
+                        pending_message = self._drain_diff_messages(diff_messages, saved_messages, message_queue)
+                    self._apply_diff_messages(order_book, diff_messages, metrics)
+                    for diff_message in diff_messages:
+                        self._notify_message_listeners(diff_message)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}. "
+                                            f"Max batch size: {metrics.max_batch_size}, "
+                                            f"max lag: {metrics.max_lag:.3f}s.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._notify_message_listeners(message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +368,62 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _drain_diff_messages(self,
+                             diff_messages: List[OrderBookMessage],
+                             saved_messages: Deque[OrderBookMessage],
+                             message_queue: asyncio.Queue) -> Optional[OrderBookMessage]:
+        """
+        Appends to diff_messages the diffs that are already queued for the trading pair, without waiting for new ones.
+        Stops at the first message that is not a diff (e.g. a snapshot), which is returned to be processed next.
+        """
+        while len(diff_messages) < self.MAX_DIFFS_PER_BATCH:
+            if len(saved_messages) > 0:
+                message = saved_messages.popleft()
+            elif not message_queue.empty():
+                message = message_queue.get_nowait()
+            else:
+                break
+            if message.type is not OrderBookMessageType.DIFF:
+                return message
+            diff_messages.append(message)
+        return None
+
+    def _apply_diff_messages(self,
+                             order_book: OrderBook,
+                             diff_messages: List[OrderBookMessage],
+                             metrics: OrderBookTrackerMetrics):
+        """
+        Applies the diff messages to the order book in a single pass. Consecutive updates of the same price level are
+        merged, keeping the latest one, so each level is updated only once.
+        """
+        if len(diff_messages) == 1:
+            message = diff_messages[0]
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        else:
+            bids: Dict[float, OrderBookRow] = {}
+            asks: Dict[float, OrderBookRow] = {}
+            received_levels = 0
+            for message in diff_messages:
+                message_bids = message.bids
+                message_asks = message.asks
+                received_levels += len(message_bids) + len(message_asks)
+                bids.update((row.price, row) for row in message_bids)
+                asks.update((row.price, row) for row in message_asks)
+            order_book.apply_diffs(list(bids.values()), list(asks.values()), diff_messages[-1].update_id)
+            metrics.price_levels_coalesced += received_levels - len(bids) - len(asks)
+
+        metrics.diffs_applied += len(diff_messages)
+        metrics.batches_applied += 1
+        metrics.last_batch_size = len(diff_messages)
+        metrics.max_batch_size = max(metrics.max_batch_size, len(diff_messages))
+        timestamp = diff_messages[-1].timestamp
+        if timestamp is not None:
+            # Best effort: some data sources set the timestamps in milliseconds, microseconds or nanoseconds
+            while timestamp > 1e11:
+                timestamp /= 1e3
+            metrics.last_lag = max(time.time() - timestamp, 0.0)
+            metrics.max_lag = max(metrics.max_lag, metrics.last_lag)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -319,6 +448,7 @@ class OrderBookTracker:
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                self._notify_message_listeners(trade_message)
 
                 messages_accepted += 1
 
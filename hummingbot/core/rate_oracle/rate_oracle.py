@@ -1,9 +1,10 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 
 import hummingbot.client.settings  # noqa
+from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
@@ -20,8 +21,9 @@ from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSo
 from hummingbot.core.rate_oracle.sources.hyperliquid_rate_source import HyperliquidRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.mexc_rate_source import MexcRateSource
+from hummingbot.core.rate_oracle.sources.order_book_rate_source import OrderBookRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -46,7 +48,11 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The rates of the pairs are found in these prices through a RateConversionGraph, that keeps the conversion routes
+    between their tokens indexed.
+    The order books tracked by the connectors registered with add_order_book_connector are used as a live source: their
+    prices are pushed to the oracle as the books change and are not replaced by the polled prices, which are still
+    used for the pairs without live order book.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -67,6 +73,9 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._rate_graph = RateConversionGraph()
+        self._order_book_source = OrderBookRateSource()
+        self._order_book_source.add_price_listener(self.set_price)
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -107,7 +116,7 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
-            self._prices = {}
+            self._prices = self._order_book_source.prices
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -116,6 +125,22 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def order_book_source(self) -> OrderBookRateSource:
+        return self._order_book_source
+
+    def add_order_book_connector(self, connector: ConnectorBase) -> bool:
+        """
+        Uses the order books tracked by the connector as live prices source.
+
+        :param connector: A connector tracking order books
+        :return False if the connector does not track order books
+        """
+        return self._order_book_source.add_connector(connector)
+
+    def remove_order_book_connector(self, connector: ConnectorBase):
+        self._order_book_source.remove_connector(connector)
+
     async def start_network(self):
         await self.stop_network()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
@@ -167,7 +192,16 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._rate_graph.find_rate(self._prices, pair)
+
+    def get_rates(self, pairs: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Finds the conversion rates of several trading pairs (see get_pair_rate).
+
+        :param pairs: The trading pairs, e.g. [BTC-USDT, ETH-BTC]
+        :return The conversion rate of each pair, None for the pairs without route
+        """
+        return self._rate_graph.find_rates(self._prices, pairs)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -205,7 +239,12 @@ class RateOracle(NetworkBase):
         while True:
             try:
                 new_prices = await self._source.get_prices(quote_token=self._quote_token)
+                live_pairs = self._order_book_source.trading_pairs
+                if live_pairs:
+                    # The live prices of the order books are fresher than the polled ones
+                    new_prices = {pair: price for pair, price in new_prices.items() if pair not in live_pairs}
                 self._prices.update(new_prices)
+                self._rate_graph.update(self._prices)
 
                 if self._prices:
                     self._ready_event.set()
@@ -0,0 +1,116 @@
+import math
+from decimal import Decimal
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, KeysView, List, Optional
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+    from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookRateSource(RateSourceBase):
+    """
+    Rate source fed by the order books that the connectors already track, without sending any request.
+
+    The price of each trading pair (the mid price by default, the last trade price while a side of the book is empty)
+    is updated when the tracker applies a message to its book, and published right away to the price listeners (e.g.
+    RateOracle.set_price), so that the rates are as fresh as the books. When several connectors track the same pair
+    the price of the last updated book is used.
+    """
+
+    def __init__(self, price_type: PriceType = PriceType.MidPrice):
+        super().__init__()
+        self._price_type = price_type
+        self._trackers: Dict[str, "OrderBookTracker"] = {}
+        self._message_listeners: Dict[str, Callable[[OrderBookMessage], None]] = {}
+        self._price_listeners: List[Callable[[str, Decimal], None]] = []
+        self._prices: Dict[str, Decimal] = {}
+        self._float_prices: Dict[str, float] = {}
+
+    @property
+    def name(self) -> str:
+        return "order_books"
+
+    @property
+    def trading_pairs(self) -> KeysView[str]:
+        """
+        Returns the trading pairs with a live price
+        """
+        return self._prices.keys()
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices.copy()
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        return self._prices.copy()
+
+    def add_price_listener(self, listener: Callable[[str, Decimal], None]):
+        """
+        Registers a function called with the trading pair and the new price every time a live price changes.
+        """
+        self._price_listeners.append(listener)
+
+    def remove_price_listener(self, listener: Callable[[str, Decimal], None]):
+        if listener in self._price_listeners:
+            self._price_listeners.remove(listener)
+
+    def add_connector(self, connector: "ConnectorBase") -> bool:
+        """
+        Starts publishing the prices of the order books tracked by the connector.
+        :return: False if the connector does not track order books
+        """
+        tracker: Optional["OrderBookTracker"] = getattr(connector, "order_book_tracker", None)
+        if tracker is None:
+            return False
+        if connector.name not in self._trackers:
+            listener = partial(self._on_order_book_message, tracker)
+            self._trackers[connector.name] = tracker
+            self._message_listeners[connector.name] = listener
+            tracker.add_message_listener(listener)
+            for trading_pair, order_book in list(tracker.order_books.items()):
+                self._update_price(trading_pair, order_book)
+        return True
+
+    def remove_connector(self, connector: "ConnectorBase"):
+        tracker = self._trackers.pop(connector.name, None)
+        if tracker is None:
+            return
+        tracker.remove_message_listener(self._message_listeners.pop(connector.name))
+        tracked_pairs = {trading_pair for tracker in self._trackers.values() for trading_pair in tracker.order_books}
+        for trading_pair in list(self._prices):
+            if trading_pair not in tracked_pairs:
+                del self._prices[trading_pair]
+                del self._float_prices[trading_pair]
+
+    def _on_order_book_message(self, tracker: "OrderBookTracker", message: OrderBookMessage):
+        order_book = tracker.order_books.get(message.trading_pair)
+        if order_book is not None:
+            self._update_price(message.trading_pair, order_book)
+
+    def _update_price(self, trading_pair: str, order_book: OrderBook):
+        price = self._order_book_price(order_book)
+        if math.isnan(price) or price <= 0 or price == self._float_prices.get(trading_pair):
+            return
+        self._float_prices[trading_pair] = price
+        decimal_price = self._prices[trading_pair] = Decimal(str(price))
+        for listener in self._price_listeners:
+            listener(trading_pair, decimal_price)
+
+    def _order_book_price(self, order_book: OrderBook) -> float:
+        try:
+            if self._price_type is PriceType.BestBid:
+                return order_book.get_price(False)
+            if self._price_type is PriceType.BestAsk:
+                return order_book.get_price(True)
+            if self._price_type is not PriceType.LastTrade:
+                return (order_book.get_price(True) + order_book.get_price(False)) / 2
+        except EnvironmentError:
+            # A side of the book is empty
+            pass
+        return order_book.last_trade_price
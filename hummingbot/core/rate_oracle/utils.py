@@ -1,11 +1,15 @@
+from collections import defaultdict, deque
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, Optional, Set, Tuple
 
-from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
+# A conversion route is a sequence of (price pair, inverted) steps, the inverted steps divide by the pair price
+ConversionRoute = Tuple[Tuple[str, bool], ...]
 
-def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
+
+def find_rate(prices: Dict[str, Decimal], pair: str) -> Optional[Decimal]:
     '''
     Finds exchange rate for a given trading pair from a dictionary of prices
     For example, given prices of {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
@@ -13,25 +17,132 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Use a RateConversionGraph instead to look up rates repeatedly in the same prices dictionary.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
-    if pair in prices:
-        return prices[pair]
-    base, quote = split_hb_trading_pair(trading_pair=pair)
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateConversionGraph().find_rate(prices, pair)
+
+
+class RateConversionGraph:
+    """
+    Index of the conversion routes between the tokens of a prices dictionary (trading pair -> price), used to find the
+    rates of the pairs that are not in the dictionary by chaining the prices of other pairs, up to MAX_ROUTE_HOPS.
+
+    The routes are searched once (preferring the shortest ones) and memoized, and the rates are computed from the
+    current prices of the route pairs, so that the lookups do not scan the prices. The index is updated incrementally
+    when pairs are added to the dictionary, which is checked on each lookup, and the memoized routes are discarded
+    when the pairs change. Price updates of known pairs do not change the routes.
+    """
+
+    MAX_ROUTE_HOPS = 3
+
+    def __init__(self):
+        self._prices: Optional[Dict[str, Decimal]] = None
+        self._indexed_pairs: Set[str] = set()
+        # token -> {linked token -> (price pair, inverted)}
+        self._links: Dict[str, Dict[str, Tuple[str, bool]]] = defaultdict(dict)
+        self._routes: Dict[Tuple[str, str], Optional[ConversionRoute]] = {}
+
+    def update(self, prices: Dict[str, Decimal]):
+        """
+        Indexes the pairs added to the prices dictionary since the last update, or all of them if it is a different
+        dictionary or it has less pairs than indexed.
+        """
+        if prices is not self._prices or len(prices) < len(self._indexed_pairs):
+            self._reset(prices)
+        if len(prices) != len(self._indexed_pairs):
+            for pair in prices.keys() - self._indexed_pairs:
+                self._add_pair(pair)
+            self._routes.clear()
+
+    def find_rate(self, prices: Dict[str, Decimal], pair: str) -> Optional[Decimal]:
+        """
+        Finds the rate of the trading pair from the prices, directly or through a conversion route.
+        :param prices: The dictionary of trading pairs and their prices
+        :param pair: The trading pair
+        :return: The rate, or None if no route was found
+        """
+        price = prices.get(pair)
+        if price is not None:
+            return price
+        self.update(prices)
+        return self._find_rate(prices, pair)
+
+    def find_rates(self, prices: Dict[str, Decimal], pairs: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Finds the rates of several trading pairs from the prices (see find_rate).
+        """
+        self.update(prices)
+        return {pair: self._find_rate(prices, pair) for pair in pairs}
+
+    def _find_rate(self, prices: Dict[str, Decimal], pair: str) -> Optional[Decimal]:
+        price = prices.get(pair)
+        if price is not None:
+            return price
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        try:
+            return self._route_rate(prices, self._route(base, quote))
+        except KeyError:
+            # A pair of the route was removed from the prices
+            self._reset(prices)
+            self.update(prices)
+            return self._route_rate(prices, self._route(base, quote))
+
+    @staticmethod
+    def _route_rate(prices: Dict[str, Decimal], route: Optional[ConversionRoute]) -> Optional[Decimal]:
+        if route is None:
+            return None
+        rate = Decimal("1")
+        for route_pair, inverted in route:
+            rate = rate / prices[route_pair] if inverted else rate * prices[route_pair]
+        return rate
+
+    def _route(self, base: str, quote: str) -> Optional[ConversionRoute]:
+        key = (base, quote)
+        if key not in self._routes:
+            self._routes[key] = self._search_route(base, quote)
+        return self._routes[key]
+
+    def _search_route(self, base: str, quote: str) -> Optional[ConversionRoute]:
+        if base not in self._links or quote not in self._links:
+            return None
+        # Breadth first search, so that the route with less conversions is used
+        previous: Dict[str, Optional[Tuple[str, Tuple[str, bool]]]] = {base: None}
+        tokens = deque([(base, 0)])
+        while tokens:
+            token, hops = tokens.popleft()
+            if hops == self.MAX_ROUTE_HOPS:
+                continue
+            for linked_token, step in self._links[token].items():
+                if linked_token in previous:
+                    continue
+                previous[linked_token] = (token, step)
+                if linked_token == quote:
+                    route = []
+                    while linked_token != base:
+                        linked_token, step = previous[linked_token]
+                        route.append(step)
+                    return tuple(reversed(route))
+                tokens.append((linked_token, hops + 1))
+        return None
+
+    def _add_pair(self, pair: str):
+        self._indexed_pairs.add(pair)
+        try:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+        except ValueError:
+            return
+        # The pair itself is preferred over the inverse of the opposite pair
+        self._links[base][quote] = (pair, False)
+        self._links[quote].setdefault(base, (pair, True))
+
+    def _reset(self, prices: Dict[str, Decimal]):
+        self._prices = prices
+        self._indexed_pairs = set()
+        self._links.clear()
+        self._routes.clear()
@@ -19,11 +19,13 @@ from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import SCRIPT_STRATEGIES_MODULE, STRATEGIES
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector, MetricsCollector
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.connector_manager import ConnectorManager
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.exceptions import InvalidScriptModule
 from hummingbot.logger import HummingbotLogger
@@ -111,6 +113,12 @@ class TradingCore:
         # Metrics collectors mapping (connector_name -> MetricsCollector)
         self._metrics_collectors: Dict[str, MetricsCollector] = {}
 
+        # Duration in seconds of the startup phases of each connector (connector_name -> phase -> seconds), "ready"
+        # is the time it took the connector to get ready since its initialization started
+        self.startup_timings: Dict[str, Dict[str, float]] = {}
+        self._startup_start_times: Dict[str, float] = {}
+        self._startup_timings_task: Optional[asyncio.Task] = None
+
         # Runtime state
         self.init_time: float = time.time()
         self.start_time: Optional[float] = None
@@ -678,21 +686,16 @@ class TradingCore:
 
         This replaces all the redundant initialize_markets* methods with one consistent approach.
 
+        The connectors are initialized concurrently, and start from the reference data (trading rules, symbol maps
+        and trading fees) cached on disk by the previous runs, so they can get ready without waiting for the exchange
+        info requests, that refresh the data in the background. The duration of the startup phases of each connector
+        is kept in startup_timings and logged once all of them are ready.
+
         Args:
             market_names: List of (exchange_name, trading_pairs) tuples
         """
-        # Create connectors for each market
-        for connector_name, trading_pairs in market_names:
-            # for now we identify gateway connector that contain "/" in their name
-            if "/" in connector_name:
-                await self.gateway_monitor.wait_for_online_status()
-            connector = self.connector_manager.create_connector(
-                connector_name, trading_pairs, self._trading_required
-            )
-
-            # Add to clock if running
-            if self.clock and connector:
-                self.clock.add_iterator(connector)
+        await safe_gather(*[self._initialize_market(connector_name, trading_pairs)
+                            for connector_name, trading_pairs in market_names])
 
         # Initialize markets recorder now that connectors exist
         if not self.markets_recorder:
@@ -703,6 +706,49 @@ class TradingCore:
             for connector in self.connector_manager.connectors.values():
                 self.markets_recorder.add_market(connector)
 
+        if self._startup_timings_task is not None:
+            self._startup_timings_task.cancel()
+        self._startup_timings_task = safe_ensure_future(self._report_startup_timings())
+
+    async def _initialize_market(self, connector_name: str, trading_pairs: List[str]):
+        """Create a connector and load its cached reference data, timing each phase."""
+        phase_start = self._startup_start_times[connector_name] = time.perf_counter()
+        # for now we identify gateway connector that contain "/" in their name
+        if "/" in connector_name:
+            await self.gateway_monitor.wait_for_online_status()
+        connector = self.connector_manager.create_connector(
+            connector_name, trading_pairs, self._trading_required
+        )
+        timings = self.startup_timings[connector_name] = {"create": time.perf_counter() - phase_start}
+
+        if isinstance(connector, ExchangePyBase):
+            phase_start = time.perf_counter()
+            if await connector.load_cached_reference_data():
+                timings["cached_reference_data"] = time.perf_counter() - phase_start
+
+        # Add to clock if running
+        if self.clock and connector:
+            self.clock.add_iterator(connector)
+
+    async def _report_startup_timings(self):
+        """Wait until the connectors are ready, then log how long each startup phase took."""
+        pending = [name for name, timings in self.startup_timings.items() if "ready" not in timings]
+        while pending:
+            for connector_name in list(pending):
+                connector = self.connector_manager.connectors.get(connector_name)
+                if connector is None:
+                    pending.remove(connector_name)
+                elif connector.ready:
+                    self.startup_timings[connector_name]["ready"] = (
+                        time.perf_counter() - self._startup_start_times[connector_name])
+                    pending.remove(connector_name)
+            if pending:
+                await asyncio.sleep(0.5)
+        report = "; ".join(
+            f"{name}: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+            for name, timings in self.startup_timings.items())
+        self.logger().info(f"Connectors startup timings - {report}")
+
     def get_balance(self, connector_name: str, asset: str) -> float:
         """Get balance for an asset from a connector."""
         return self.connector_manager.get_balance(connector_name, asset)
@@ -819,6 +865,10 @@ class TradingCore:
 
             self._metrics_collectors.clear()
 
+            if self._startup_timings_task is not None:
+                self._startup_timings_task.cancel()
+                self._startup_timings_task = None
+
             # Remove all connectors
             connector_names = list(self.connector_manager.connectors.keys())
             for name in connector_names:
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph
 
 
 class FixedRateSource:
@@ -9,6 +9,7 @@ class FixedRateSource:
         super().__init__()
 
         self._known_rates: dict = {}
+        self._rate_graph = RateConversionGraph()
 
     def __str__(self):
         return "fixed rates"
@@ -28,4 +29,4 @@ class FixedRateSource:
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._known_rates, pair)
+        return self._rate_graph.find_rate(self._known_rates, pair)
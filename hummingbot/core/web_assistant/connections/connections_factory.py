@@ -1,7 +1,8 @@
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -28,20 +29,20 @@ class ConnectionsFactory:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    async def get_rest_connection(self) -> RESTConnection:
+    async def get_rest_connection(self, json_decoder: Optional[JSONDecoder] = None) -> RESTConnection:
         """
         Get a REST connection using a shared aiohttp.ClientSession.
         """
         client = await self._get_shared_client()
-        return RESTConnection(aiohttp_client_session=client)
+        return RESTConnection(aiohttp_client_session=client, json_decoder=json_decoder)
 
-    async def get_ws_connection(self) -> WSConnection:
+    async def get_ws_connection(self, json_decoder: Optional[JSONDecoder] = None) -> WSConnection:
         """
         Get a WebSocket connection using either the independent session (if set)
         or the shared client.
         """
         client = self._ws_independent_session or await self._get_shared_client()
-        return WSConnection(aiohttp_client_session=client)
+        return WSConnection(aiohttp_client_session=client, json_decoder=json_decoder)
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
         """
@@ -1,4 +1,3 @@
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -7,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder, default_json_decoder
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -86,8 +87,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_decoder: Optional[JSONDecoder] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_decoder = json_decoder or default_json_decoder()
 
     @property
     def url(self) -> str:
@@ -110,14 +112,17 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        if self._aiohttp_response.content_type == "text/plain" or self._aiohttp_response.content_type == "text/html":
-            # aiohttp does not support decoding of text/plain or text/html content types
-            # so we need to read the response as bytes and decode it manually
+        content_type = self._aiohttp_response.content_type
+        if content_type == "text/plain" or content_type == "text/html" or content_type == "application/json":
+            # The body bytes are passed to the decoder, without the conversion to str done by aiohttp.
+            # aiohttp does not support decoding of text/plain or text/html content types either
             # https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.json
             byte_string = await self._aiohttp_response.read()
             if isinstance(byte_string, bytes):
-                decoded_string = byte_string.decode('utf-8')
-                json_ = json.loads(decoded_string)
+                if content_type == "application/json" and not byte_string.strip():
+                    json_ = None
+                else:
+                    json_ = self._json_decoder.loads(byte_string)
             else:
                 json_ = await self._aiohttp_response.json()
         else:
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+JSONData = Union[str, bytes, bytearray, memoryview]
+
+
+class JSONDecoder:
+    """
+    Decodes the JSON payloads of the REST responses and WebSocket messages, using the standard library json module.
+
+    Subclasses can use faster parsers (see OrjsonDecoder and MsgspecDecoder). Decoders take the payloads both as
+    str and as bytes, so that the REST responses can be decoded without converting them to str first.
+
+    A schema, e.g. a TypedDict describing the messages of a stream, can be passed to decode. Decoders able to use it
+    (MsgspecDecoder) decode the messages straight into the schema types and raise ValueError for the messages that do
+    not match it, the others return the same objects as loads.
+    """
+
+    name = "json"
+
+    def loads(self, data: JSONData) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def decode(self, data: JSONData, schema: Optional[Type] = None) -> Any:
+        return self.loads(data)
+
+
+class OrjsonDecoder(JSONDecoder):
+    """
+    Decoder using orjson (optional dependency).
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed.")
+
+    def loads(self, data: JSONData) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecDecoder(JSONDecoder):
+    """
+    Decoder using msgspec (optional dependency). Messages decoded with a schema are validated and converted to the
+    schema types while parsing, skipping the fields not declared in it.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("msgspec is not installed.")
+        self._decoder = msgspec.json.Decoder()
+        self._schema_decoders: Dict[Any, Any] = {}
+
+    def loads(self, data: JSONData) -> Any:
+        return self._decoder.decode(data)
+
+    def decode(self, data: JSONData, schema: Optional[Type] = None) -> Any:
+        if schema is None:
+            return self._decoder.decode(data)
+        decoder = self._schema_decoders.get(schema)
+        if decoder is None:
+            decoder = self._schema_decoders[schema] = msgspec.json.Decoder(schema)
+        return decoder.decode(data)
+
+
+_json_decoders: Dict[str, Type[JSONDecoder]] = {
+    JSONDecoder.name: JSONDecoder,
+    OrjsonDecoder.name: OrjsonDecoder,
+    MsgspecDecoder.name: MsgspecDecoder,
+}
+_default_json_decoder: Optional[JSONDecoder] = None
+
+
+def get_json_decoder(name: str) -> JSONDecoder:
+    """
+    Returns a new decoder of the given type (json, orjson or msgspec).
+    """
+    if name not in _json_decoders:
+        raise ValueError(f"Unknown JSON decoder {name}. Valid decoders: {', '.join(_json_decoders)}.")
+    return _json_decoders[name]()
+
+
+def default_json_decoder() -> JSONDecoder:
+    """
+    Returns the decoder used when none is configured: orjson when it is installed, the standard library otherwise.
+    """
+    global _default_json_decoder
+    if _default_json_decoder is None:
+        _default_json_decoder = OrjsonDecoder() if orjson is not None else JSONDecoder()
+    return _default_json_decoder
@@ -1,10 +1,14 @@
+from typing import Optional
+
 import aiohttp
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder
 
 
 class RESTConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_decoder: Optional[JSONDecoder] = None):
         self._client_session = aiohttp_client_session
+        self._json_decoder = json_decoder
 
     async def call(self, request: RESTRequest) -> RESTResponse:
         aiohttp_resp = await self._client_session.request(
@@ -18,7 +22,6 @@ class RESTConnection:
         resp = await self._build_resp(aiohttp_resp)
         return resp
 
-    @staticmethod
-    async def _build_resp(aiohttp_resp: aiohttp.ClientResponse) -> RESTResponse:
-        resp = RESTResponse(aiohttp_resp)
+    async def _build_resp(self, aiohttp_resp: aiohttp.ClientResponse) -> RESTResponse:
+        resp = RESTResponse(aiohttp_resp, json_decoder=self._json_decoder)
         return resp
@@ -1,19 +1,21 @@
 import asyncio
 import time
-from json import JSONDecodeError
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Type
 
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder, default_json_decoder
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
 
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_decoder: Optional[JSONDecoder] = None):
         self._client_session = aiohttp_client_session
+        self._json_decoder = json_decoder or default_json_decoder()
+        self._message_schema: Optional[Type] = None
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -33,8 +35,13 @@ class WSConnection:
         ping_timeout: float = 10,
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
-        max_msg_size: Optional[int] = None
+        max_msg_size: Optional[int] = None,
+        message_schema: Optional[Type] = None,
     ):
+        """
+        :param message_schema: type of the JSON messages of the stream (e.g. a TypedDict), used by the
+        decoders able to decode the messages straight into it
+        """
         self._ensure_not_connected()
         self._connection = await self._client_session.ws_connect(
             ws_url,
@@ -44,6 +51,7 @@ class WSConnection:
             max_msg_size=max_msg_size,
         )
         self._message_timeout = message_timeout
+        self._message_schema = message_schema
         self._connected = True
 
     async def disconnect(self):
@@ -141,14 +149,22 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
-            try:
-                data = msg.json()
-            except JSONDecodeError:
-                data = msg.data
+            data = self._decode(msg.data)
         response = WSResponse(data)
         return response
+
+    def _decode(self, data: str) -> Any:
+        if self._message_schema is not None:
+            try:
+                return self._json_decoder.decode(data, schema=self._message_schema)
+            except ValueError:
+                # Messages not described by the schema (e.g. subscription confirmations) are decoded as plain JSON
+                pass
+        try:
+            return self._json_decoder.loads(data)
+        except ValueError:
+            return data
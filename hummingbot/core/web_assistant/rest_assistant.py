@@ -9,6 +9,7 @@ from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RES
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_scheduler import RESTRequestScheduler
 
 
 class RESTAssistant:
@@ -17,6 +18,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    The requests are executed in priority order when they wait for the rate limits (see `RESTRequestScheduler`). The
+    priority can be passed to `execute_request`, or set for all the requests of a context with `request_priority`.
     """
 
     def __init__(
@@ -26,12 +30,14 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        request_scheduler: Optional[RESTRequestScheduler] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._request_scheduler = request_scheduler or RESTRequestScheduler()
 
     async def execute_request(
         self,
@@ -44,6 +50,7 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[int] = None,
     ) -> Union[str, Dict[str, Any]]:
         response = await self.execute_request_and_get_response(
             url=url,
@@ -55,6 +62,7 @@ class RESTAssistant:
             return_err=return_err,
             timeout=timeout,
             headers=headers,
+            priority=priority,
         )
         response_json = await response.json()
         return response_json
@@ -70,6 +78,7 @@ class RESTAssistant:
             return_err: bool = False,
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[int] = None,
     ) -> RESTResponse:
 
         headers = headers or {}
@@ -91,7 +100,8 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        async with self._request_scheduler.schedule(
+                throttler=self._throttler, limit_id=throttler_limit_id, priority=priority):
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
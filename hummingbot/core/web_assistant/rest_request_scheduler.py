@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Dict, Optional
+
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RequestPriority
+
+_request_priority: ContextVar[Optional[int]] = ContextVar("request_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Sets the priority of the REST requests executed in the context, including the ones executed by the tasks created
+    in it, that do not set a priority explicitly.
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_request_priority() -> int:
+    priority = _request_priority.get()
+    return RequestPriority.DEFAULT if priority is None else priority
+
+
+class StaleRequestError(asyncio.TimeoutError):
+    """
+    Raised when a request is dropped because it waited to be executed longer than the max wait time of its priority.
+    """
+
+
+class RESTRequestScheduler:
+    """
+    Schedules the REST requests of a connector by priority (see RequestPriority).
+
+    The requests wait for the rate limits capacity in priority order (the throttler grants higher priority requests
+    first), the number of requests of a priority class executing at the same time can be capped, and the requests of a
+    class with a max wait time are dropped raising StaleRequestError when they could not start in time, since their
+    results would be outdated (e.g. a balance refresh that the next polling cycle requests again).
+    """
+
+    DEFAULT_MAX_WAIT_TIMES: Dict[int, float] = {
+        RequestPriority.BALANCE: 30.0,
+        RequestPriority.REFERENCE_DATA: 60.0,
+    }
+
+    def __init__(self,
+                 max_concurrent_requests: Optional[Dict[int, int]] = None,
+                 max_wait_times: Optional[Dict[int, float]] = None):
+        """
+        :param max_concurrent_requests: max number of requests executing at the same time, per priority
+        :param max_wait_times: max time (in seconds) a request can wait to be executed, per priority
+        """
+        self._max_concurrent_requests: Dict[int, int] = max_concurrent_requests or {}
+        self._max_wait_times: Dict[int, float] = (
+            self.DEFAULT_MAX_WAIT_TIMES.copy() if max_wait_times is None else max_wait_times
+        )
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._dropped_requests: Dict[int, int] = defaultdict(int)
+
+    @property
+    def dropped_requests(self) -> Dict[int, int]:
+        """
+        Returns the number of requests dropped for waiting too long, per priority
+        """
+        return dict(self._dropped_requests)
+
+    @asynccontextmanager
+    async def schedule(self, throttler: AsyncThrottlerBase, limit_id: str, priority: Optional[int] = None):
+        """
+        An async context in which a request can be executed within the rate limits and the concurrency caps of its
+        priority. If no priority is passed, the one set with request_priority is used.
+        """
+        priority = current_request_priority() if priority is None else priority
+        max_wait = self._max_wait_times.get(priority)
+        deadline = None if max_wait is None else self._time() + max_wait
+        semaphore = self._semaphore(priority)
+
+        if semaphore is not None:
+            await self._wait(semaphore.acquire(), priority, deadline)
+        try:
+            context = throttler.execute_task(limit_id=limit_id, priority=priority)
+            await self._wait(context.__aenter__(), priority, deadline)
+            try:
+                yield
+            finally:
+                await context.__aexit__(None, None, None)
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def _semaphore(self, priority: int) -> Optional[asyncio.Semaphore]:
+        max_concurrent_requests = self._max_concurrent_requests.get(priority)
+        if max_concurrent_requests is None:
+            return None
+        semaphore = self._semaphores.get(priority)
+        if semaphore is None:
+            semaphore = self._semaphores[priority] = asyncio.Semaphore(max_concurrent_requests)
+        return semaphore
+
+    async def _wait(self, awaitable: Awaitable, priority: int, deadline: Optional[float]):
+        if deadline is None:
+            await awaitable
+            return
+        try:
+            await asyncio.wait_for(awaitable, timeout=max(deadline - self._time(), 0.0))
+        except asyncio.TimeoutError:
+            self._dropped_requests[priority] += 1
+            raise StaleRequestError(f"Request dropped after waiting more than {self._max_wait_times[priority]}s "
+                                    f"to be executed (priority {getattr(priority, 'name', priority)}).")
+
+    def _time(self) -> float:
+        return time.time()
@@ -3,9 +3,11 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_scheduler import RESTRequestScheduler
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
@@ -31,6 +33,8 @@ class WebAssistantsFactory:
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
         connections_factory: Optional[ConnectionsFactory] = None,
+        request_scheduler: Optional[RESTRequestScheduler] = None,
+        json_decoder: Optional[JSONDecoder] = None,
     ):
         self._connections_factory = connections_factory or ConnectionsFactory()
         self._rest_pre_processors = rest_pre_processors or []
@@ -39,28 +43,37 @@ class WebAssistantsFactory:
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        # Shared by all the REST assistants, so that the priorities and concurrency caps apply to all the requests
+        self._request_scheduler = request_scheduler or RESTRequestScheduler()
+        # Decoder of the REST responses and WS messages, the fastest one installed if None (see default_json_decoder)
+        self._json_decoder = json_decoder
 
     @property
     def throttler(self) -> AsyncThrottlerBase:
         return self._throttler
 
+    @property
+    def request_scheduler(self) -> RESTRequestScheduler:
+        return self._request_scheduler
+
     @property
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
     async def get_rest_assistant(self) -> RESTAssistant:
-        connection = await self._connections_factory.get_rest_connection()
+        connection = await self._connections_factory.get_rest_connection(json_decoder=self._json_decoder)
         assistant = RESTAssistant(
             connection=connection,
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            request_scheduler=self._request_scheduler,
         )
         return assistant
 
     async def get_ws_assistant(self) -> WSAssistant:
-        connection = await self._connections_factory.get_ws_connection()
+        connection = await self._connections_factory.get_ws_connection(json_decoder=self._json_decoder)
         assistant = WSAssistant(
             connection, self._ws_pre_processors, self._ws_post_processors, self._auth
         )
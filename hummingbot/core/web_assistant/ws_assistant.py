@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import AsyncGenerator, Dict, List, Optional
+from typing import AsyncGenerator, Dict, List, Optional, Type
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
@@ -40,14 +40,20 @@ class WSAssistant:
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
         max_msg_size: Optional[int] = None,
+        message_schema: Optional[Type] = None,
     ):
+        """
+        :param message_schema: type of the JSON messages of the stream (e.g. a TypedDict). Decoders like
+        MsgspecDecoder decode the messages straight into it, the messages not matching it are decoded as plain JSON.
+        """
         max_msg_size = max_msg_size if max_msg_size else self._connection._MAX_MSG_SIZE
         await self._connection.connect(
             ws_url=ws_url,
             ws_headers=ws_headers,
             ping_timeout=ping_timeout,
             message_timeout=message_timeout,
-            max_msg_size=max_msg_size)
+            max_msg_size=max_msg_size,
+            message_schema=message_schema)
 
     async def disconnect(self):
         await self._connection.disconnect()
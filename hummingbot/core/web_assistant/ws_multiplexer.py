@@ -0,0 +1,415 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Set
+from weakref import WeakKeyDictionary
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class WSStreamRouter(ABC):
+    """
+    Describes the subscription protocol of a WebSocket endpoint for the WSMultiplexer: how the subscription requests
+    are parsed and built, and to which streams the messages belong.
+    """
+
+    max_streams_per_connection: int = 200
+
+    @abstractmethod
+    def subscribed_streams(self, request: WSRequest) -> Optional[List[str]]:
+        """
+        Returns the streams subscribed by the request, or None if it is not a subscription request
+        """
+        ...
+
+    @abstractmethod
+    def unsubscribed_streams(self, request: WSRequest) -> Optional[List[str]]:
+        """
+        Returns the streams unsubscribed by the request, or None if it is not an unsubscription request
+        """
+        ...
+
+    @abstractmethod
+    def subscribe_request(self, streams: List[str]) -> WSRequest:
+        ...
+
+    @abstractmethod
+    def unsubscribe_request(self, streams: List[str]) -> WSRequest:
+        ...
+
+    @abstractmethod
+    def message_stream_keys(self, data: Any) -> Iterable[str]:
+        """
+        Returns the keys (see stream_key) of the streams the message belongs to. The messages without keys, or whose
+        streams have no consumers, are delivered to all the consumers of the connection (e.g. subscription results).
+        """
+        ...
+
+    def stream_key(self, stream: str) -> str:
+        """
+        Returns the key identifying the messages of the stream, e.g. the stream name without its update speed when
+        the messages do not include it.
+        """
+        return stream
+
+
+class _SharedConnection:
+    """
+    A connection of a WSMultiplexer, with the streams it is subscribed to and their consumers.
+    """
+
+    def __init__(self):
+        self.ws: Optional[WSAssistant] = None
+        self.connected = False
+        self.lock = asyncio.Lock()
+        self.listen_task: Optional[asyncio.Task] = None
+        self.release_task: Optional[asyncio.Task] = None
+        self.streams: Dict[str, Set["SharedWSAssistant"]] = {}
+        self.consumers_by_key: Dict[str, Set["SharedWSAssistant"]] = defaultdict(set)
+        # Streams subscribed through the current socket
+        self.subscribed_streams: Set[str] = set()
+
+    @property
+    def last_recv_time(self) -> float:
+        return self.ws.last_recv_time if self.ws is not None else 0
+
+    @property
+    def consumers(self) -> Set["SharedWSAssistant"]:
+        return set().union(*self.streams.values())
+
+
+class WSMultiplexer:
+    """
+    Shares the WebSocket connections to an endpoint between all its consumers (order book data sources, candles feeds,
+    liquidations feeds...) running in the same event loop, instead of opening one connection per consumer.
+
+    The consumers use the SharedWSAssistant returned by get_ws_assistant like a dedicated WSAssistant. The streams they
+    subscribe are combined in as few connections as possible (up to the max streams per connection of the router), a
+    stream subscribed by several consumers is subscribed only once, and each message is delivered only to the
+    consumers of its streams. The messages are shared by the consumers and must not be modified, and they are decoded
+    as plain JSON, since the connections carry the messages of different consumers (no message schema is used).
+
+    When a connection is lost the multiplexer notifies its consumers, reconnects and subscribes again all its streams
+    with a single request. Streams no longer used are unsubscribed after a delay, so that the consumers restarting
+    after an interruption find them still subscribed, and the connections without streams are closed.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+    _multiplexers: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, WSMultiplexer]]" = WeakKeyDictionary()
+
+    RECONNECT_DELAY = 5.0
+    UNSUBSCRIBE_DELAY = 10.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 ws_url: str,
+                 router: WSStreamRouter,
+                 api_factory: WebAssistantsFactory,
+                 ping_timeout: Optional[float] = 10):
+        self._ws_url = ws_url
+        self._router = router
+        self._api_factory = api_factory
+        self._ping_timeout = ping_timeout
+        self._connections: List[_SharedConnection] = []
+        self._stream_connections: Dict[str, _SharedConnection] = {}
+
+    @classmethod
+    def for_endpoint(cls,
+                     ws_url: str,
+                     router: WSStreamRouter,
+                     api_factory: WebAssistantsFactory,
+                     ping_timeout: Optional[float] = 10) -> "WSMultiplexer":
+        """
+        Returns the multiplexer of the endpoint shared by the consumers running in the current event loop. The router,
+        factory and connection parameters are the ones of the consumer that created it.
+        """
+        multiplexers = cls._multiplexers.setdefault(asyncio.get_running_loop(), {})
+        multiplexer = multiplexers.get(ws_url)
+        if multiplexer is None:
+            multiplexer = multiplexers[ws_url] = cls(
+                ws_url=ws_url,
+                router=router,
+                api_factory=api_factory,
+                ping_timeout=ping_timeout)
+        return multiplexer
+
+    @property
+    def ws_url(self) -> str:
+        return self._ws_url
+
+    @property
+    def router(self) -> WSStreamRouter:
+        return self._router
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._connections)
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._stream_connections)
+
+    def get_ws_assistant(self) -> "SharedWSAssistant":
+        return SharedWSAssistant(multiplexer=self)
+
+    async def _subscribe(self, consumer: "SharedWSAssistant", request: WSRequest, streams: List[str]):
+        streams = list(dict.fromkeys(streams))
+        new_streams: Dict[_SharedConnection, List[str]] = defaultdict(list)
+        connections: List[_SharedConnection] = []
+        for stream in streams:
+            connection = self._stream_connections.get(stream)
+            if connection is None:
+                connection = self._connection_with_capacity()
+                self._stream_connections[stream] = connection
+                connection.streams[stream] = set()
+                new_streams[connection].append(stream)
+            self._add_consumer(connection=connection, stream=stream, consumer=consumer)
+            if connection not in connections:
+                connections.append(connection)
+
+        for connection in connections:
+            # The request is sent as is when it subscribes streams used by no other consumer in a single connection
+            forward_request = new_streams.get(connection) == streams
+            await self._subscribe_streams(
+                connection=connection,
+                request=request if forward_request else None,
+                request_streams=streams if forward_request else None)
+
+    def _unsubscribe(self, consumer: "SharedWSAssistant", streams: Iterable[str]):
+        for stream in streams:
+            connection = self._stream_connections.get(stream)
+            if connection is not None and consumer in connection.streams[stream]:
+                connection.streams[stream].discard(consumer)
+                connection.consumers_by_key[self._router.stream_key(stream)].discard(consumer)
+                consumer._streams.discard(stream)
+                if not connection.streams[stream]:
+                    self._schedule_release(connection)
+        consumer._connections = {self._stream_connections[stream] for stream in consumer._streams}
+
+    def _release(self, consumer: "SharedWSAssistant"):
+        self._unsubscribe(consumer=consumer, streams=list(consumer._streams))
+
+    async def _send(self, consumer: "SharedWSAssistant", request: WSRequest):
+        connections = list(consumer._connections)
+        if not connections:
+            raise RuntimeError("WS is not connected. Requests can be sent only after subscribing to a stream.")
+        for connection in connections:
+            await self._subscribe_streams(connection=connection)
+            await connection.ws.send(request)
+
+    def _add_consumer(self, connection: _SharedConnection, stream: str, consumer: "SharedWSAssistant"):
+        connection.streams[stream].add(consumer)
+        connection.consumers_by_key[self._router.stream_key(stream)].add(consumer)
+        consumer._streams.add(stream)
+        consumer._connections.add(connection)
+
+    def _connection_with_capacity(self) -> _SharedConnection:
+        for connection in self._connections:
+            if len(connection.streams) < self._router.max_streams_per_connection:
+                return connection
+        connection = _SharedConnection()
+        self._connections.append(connection)
+        return connection
+
+    async def _subscribe_streams(self,
+                                 connection: _SharedConnection,
+                                 request: Optional[WSRequest] = None,
+                                 request_streams: Optional[List[str]] = None):
+        """
+        Connects the connection if needed and subscribes the streams not subscribed yet through its current socket.
+        """
+        async with connection.lock:
+            if not connection.connected:
+                ws = await self._api_factory.get_ws_assistant()
+                await ws.connect(ws_url=self._ws_url, ping_timeout=self._ping_timeout)
+                connection.ws = ws
+                connection.connected = True
+                connection.subscribed_streams.clear()
+            if connection.listen_task is None or connection.listen_task.done():
+                connection.listen_task = safe_ensure_future(self._listen(connection))
+
+            missing_streams = [stream for stream in connection.streams if stream not in connection.subscribed_streams]
+            if missing_streams:
+                if request is None or set(request_streams) != set(missing_streams):
+                    request = self._router.subscribe_request(missing_streams)
+                await connection.ws.send(request)
+                connection.subscribed_streams.update(missing_streams)
+
+    async def _listen(self, connection: _SharedConnection):
+        while connection.streams:
+            try:
+                async for response in connection.ws.iter_messages():
+                    self._dispatch(connection=connection, response=response)
+                raise ConnectionError("The WS connection was closed.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                self.logger().warning(f"The shared websocket connection to {self._ws_url} was interrupted "
+                                      f"({exception}). Reconnecting...")
+                connection.connected = False
+                await self._disconnect_ws(connection)
+                for consumer in connection.consumers:
+                    consumer._deliver(ConnectionError(f"The shared websocket connection was interrupted ({exception})"))
+                await self._reconnect(connection)
+
+    async def _reconnect(self, connection: _SharedConnection):
+        while connection.streams:
+            try:
+                await self._subscribe_streams(connection=connection)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(f"Error reconnecting to {self._ws_url}. "
+                                        f"Retrying in {self.RECONNECT_DELAY} seconds...")
+                await self._sleep(self.RECONNECT_DELAY)
+
+    def _dispatch(self, connection: _SharedConnection, response: WSResponse):
+        consumers = set()
+        try:
+            for key in self._router.message_stream_keys(response.data):
+                consumers.update(connection.consumers_by_key.get(key, ()))
+        except Exception:
+            self.logger().debug(f"Could not route the websocket message {response.data}", exc_info=True)
+        for consumer in consumers or connection.consumers:
+            consumer._deliver(response)
+
+    def _schedule_release(self, connection: _SharedConnection):
+        if connection.release_task is None or connection.release_task.done():
+            connection.release_task = safe_ensure_future(self._release_unused_streams(connection))
+
+    async def _release_unused_streams(self, connection: _SharedConnection):
+        await self._sleep(self.UNSUBSCRIBE_DELAY)
+        unused_streams = [stream for stream, consumers in connection.streams.items() if not consumers]
+        for stream in unused_streams:
+            del connection.streams[stream]
+            del self._stream_connections[stream]
+            connection.consumers_by_key.pop(self._router.stream_key(stream), None)
+
+        if not connection.streams:
+            await self._close(connection)
+            return
+
+        subscribed_streams = [stream for stream in unused_streams if stream in connection.subscribed_streams]
+        connection.subscribed_streams.difference_update(unused_streams)
+        if subscribed_streams and connection.connected:
+            try:
+                await connection.ws.send(self._router.unsubscribe_request(subscribed_streams))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().warning(f"Error unsubscribing from {subscribed_streams} in {self._ws_url}",
+                                      exc_info=True)
+
+    async def _close(self, connection: _SharedConnection):
+        if connection in self._connections:
+            self._connections.remove(connection)
+        if connection.listen_task is not None and connection.listen_task is not asyncio.current_task():
+            connection.listen_task.cancel()
+        connection.listen_task = None
+        connection.connected = False
+        await self._disconnect_ws(connection)
+        if not self._connections:
+            multiplexers = self._multiplexers.get(asyncio.get_running_loop(), {})
+            if multiplexers.get(self._ws_url) is self:
+                del multiplexers[self._ws_url]
+
+    @staticmethod
+    async def _disconnect_ws(connection: _SharedConnection):
+        ws, connection.ws = connection.ws, None
+        if ws is not None:
+            try:
+                await ws.disconnect()
+            except Exception:
+                pass
+
+    @staticmethod
+    async def _sleep(delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
+
+
+class SharedWSAssistant(WSAssistant):
+    """
+    The WSAssistant of a consumer of a WSMultiplexer, used like the assistant of a dedicated connection: the
+    subscription requests sent through it subscribe the consumer to the streams in the shared connections,
+    iter_messages returns the messages of its streams, and disconnect releases them.
+
+    When a shared connection is lost iter_messages raises ConnectionError, as with a dedicated connection, and the
+    multiplexer subscribes the streams again once reconnected. The consumers can subscribe them again with a new
+    assistant, which does not send the subscriptions again while the streams are still subscribed.
+    """
+
+    def __init__(self, multiplexer: WSMultiplexer):
+        super().__init__(connection=None)
+        self._multiplexer = multiplexer
+        self._streams: Set[str] = set()
+        self._connections: Set[_SharedConnection] = set()
+        self._messages: asyncio.Queue = asyncio.Queue()
+        self._closed = False
+
+    @property
+    def last_recv_time(self) -> float:
+        return max((connection.last_recv_time for connection in self._connections), default=0)
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._streams)
+
+    async def connect(self, ws_url: str, **kwargs):
+        """
+        The shared connections are opened by the multiplexer when the streams are subscribed.
+        """
+        pass
+
+    async def disconnect(self):
+        if not self._closed:
+            self._closed = True
+            self._multiplexer._release(self)
+            self._messages.put_nowait(None)
+
+    async def send(self, request: WSRequest):
+        if self._closed:
+            raise RuntimeError("WS is not connected.")
+        router = self._multiplexer.router
+        subscribed_streams = router.subscribed_streams(request)
+        unsubscribed_streams = router.unsubscribed_streams(request) if subscribed_streams is None else None
+        if subscribed_streams is not None:
+            await self._multiplexer._subscribe(consumer=self, request=request, streams=subscribed_streams)
+        elif unsubscribed_streams is not None:
+            self._multiplexer._unsubscribe(consumer=self, streams=unsubscribed_streams)
+        else:
+            await self._multiplexer._send(consumer=self, request=request)
+
+    async def ping(self):
+        for connection in list(self._connections):
+            if connection.connected:
+                await connection.ws.ping()
+
+    async def iter_messages(self) -> AsyncGenerator[Optional[WSResponse], None]:
+        while not self._closed:
+            response = await self.receive()
+            if response is not None:
+                yield response
+
+    async def receive(self) -> Optional[WSResponse]:
+        item = await self._messages.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def _deliver(self, item: Any):
+        if not self._closed:
+            self._messages.put_nowait(item)
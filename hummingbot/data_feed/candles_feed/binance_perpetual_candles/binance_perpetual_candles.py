@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+from hummingbot.connector.exchange.binance.binance_web_utils import BinanceWSStreamRouter
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
@@ -107,6 +108,9 @@ class BinancePerpetualCandles(CandlesBase):
         }
         return payload
 
+    def _ws_stream_router(self) -> BinanceWSStreamRouter:
+        return BinanceWSStreamRouter()
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
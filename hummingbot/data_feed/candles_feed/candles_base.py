@@ -1,7 +1,6 @@
 import asyncio
 import os
 import time
-from collections import deque
 from typing import List, Optional
 
 import numpy as np
@@ -15,15 +14,21 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_multiplexer import WSMultiplexer, WSStreamRouter
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a CandlesBuffer (a NumPy ring buffer) to
+    store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
+    When the shared CandlesStore is enabled, historical candles are read from the local store and only the ranges
+    missing from it are fetched from the exchange.
     """
     interval_to_seconds = bidict({
         "1s": 1,
@@ -51,12 +56,13 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(maxlen=max_records, n_columns=len(self.columns))
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        self.candles_store: Optional[CandlesStore] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -91,7 +97,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +147,26 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame. The DataFrame is only
+        rebuilt when the candles change, and each call returns a copy of it that the caller can modify.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return self._candles.to_dataframe(self.columns).copy()
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read-only view of the candles stored in the _candles buffer, with the columns of
+        CandlesBase.columns. The view is only valid until the candles change, see candles_version.
+        """
+        return self._candles.values
+
+    @property
+    def candles_version(self) -> int:
+        """
+        This property returns a counter that increases every time the candles change, so consumers can skip
+        recomputing their features when it didn't change since their last update.
+        """
+        return self._candles.version
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -162,27 +185,12 @@ class CandlesBase(NetworkBase):
         self._candles.extendleft(df.values.tolist())
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                    candles_df = pd.concat([fetched_candles_df, candles_df])
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
+            if self.candles_store is not None:
+                candles_df = await self._get_historical_candles_with_store(config.start_time, config.end_time)
+            else:
+                candles_df = await self._fetch_historical_candles_df(config.start_time, config.end_time)
             candles_df = candles_df[(candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
             return candles_df
         except ValueError as e:
@@ -192,6 +200,74 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    async def _fetch_historical_candles_df(self, start_time: int, end_time: int) -> pd.DataFrame:
+        """
+        This method fetches the candles between start_time and end_time from the exchange, page by page from the end.
+        :param start_time: the start time of the candles data to fetch
+        :param end_time: the end time of the candles data to fetch
+        :return: dataframe with the fetched candles
+        """
+        candles_df = pd.DataFrame()
+        current_end_time = self._round_timestamp_to_interval_multiple(end_time)
+        current_start_time = self._round_timestamp_to_interval_multiple(start_time)
+        while current_end_time >= current_start_time:
+            missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
+            candles = await self.fetch_candles(start_time=current_start_time,
+                                               end_time=current_end_time,
+                                               limit=missing_records)
+            if len(candles) <= 1 or missing_records == 0:
+                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
+                candles_df = pd.concat([fetched_candles_df, candles_df])
+                break
+            candles = candles[candles[:, 0] <= current_end_time]
+            current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
+            fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
+            candles_df = pd.concat([fetched_candles_df, candles_df])
+            candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+            candles_df.reset_index(drop=True, inplace=True)
+            self.check_candles_sorted_and_equidistant(candles_df.values)
+        return candles_df
+
+    async def _get_historical_candles_with_store(self, start_time: int, end_time: int) -> pd.DataFrame:
+        """
+        This method returns the candles between start_time and end_time from the candles store, fetching from the
+        exchange only the ranges that are not stored yet. The candle that is still open is never stored.
+        :param start_time: the start time of the candles data
+        :param end_time: the end time of the candles data
+        :return: dataframe with the candles
+        """
+        start_time = self._round_timestamp_to_interval_multiple(start_time)
+        end_time = self._round_timestamp_to_interval_multiple(end_time)
+        last_closed_time = self._round_timestamp_to_interval_multiple(self._time()) - self.interval_in_seconds
+        stored_end_time = min(end_time, last_closed_time)
+        for missing_start, missing_end in self.candles_store.missing_ranges(
+                self.name, self.interval, self.interval_in_seconds, start_time, stored_end_time):
+            fetched_candles_df = await self._fetch_historical_candles_df(missing_start, missing_end)
+            if len(fetched_candles_df) == 0:
+                continue
+            fetched_candles = fetched_candles_df.to_numpy(dtype=float)
+            fetched_candles = fetched_candles[(fetched_candles[:, 0] >= missing_start) &
+                                              (fetched_candles[:, 0] <= missing_end)]
+            if len(fetched_candles) == 0:
+                continue
+            # The exchange can stop returning candles before missing_start (e.g. before the listing of the pair), so
+            # only the range that was actually fetched is marked as covered
+            covered_start = max(missing_start, int(fetched_candles[:, 0].min()))
+            self.candles_store.write(self.name, self.interval, self.interval_in_seconds, fetched_candles,
+                                     covered_start, missing_end)
+        stored_candles = self.candles_store.read(self.name, self.interval, start_time, stored_end_time)
+        if len(stored_candles) > 0:
+            candles_df = pd.DataFrame(stored_candles, columns=self.columns, copy=False)
+        else:
+            candles_df = pd.DataFrame(columns=self.columns, dtype=float)
+        if end_time > stored_end_time:
+            recent_candles_df = await self._fetch_historical_candles_df(
+                max(start_time, stored_end_time + self.interval_in_seconds), end_time)
+            if len(recent_candles_df) > 0:
+                recent_candles_df = recent_candles_df[recent_candles_df["timestamp"] > stored_end_time]
+                candles_df = pd.concat([candles_df, recent_candles_df], ignore_index=True)
+        return candles_df
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -321,14 +397,20 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
             try:
                 end_time = self._round_timestamp_to_interval_multiple(self._candles[0][0])
                 missing_records = self._candles.maxlen - len(self._candles)
-                candles: np.ndarray = await self.fetch_candles(end_time=end_time, limit=missing_records)
+                if self.candles_store is not None:
+                    candles_df = await self._get_historical_candles_with_store(
+                        start_time=end_time - missing_records * self.interval_in_seconds,
+                        end_time=end_time - self.interval_in_seconds)
+                    candles = candles_df.to_numpy(dtype=float)
+                else:
+                    candles = await self.fetch_candles(end_time=end_time, limit=missing_records)
                 candles = candles[candles[:, 0] < end_time]
                 records_to_add = min(missing_records, len(candles))
                 self._candles.extendleft(candles[-records_to_add:][::-1])
@@ -367,10 +449,24 @@ class CandlesBase(NetworkBase):
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
+        router = self._ws_stream_router()
+        if router is not None:
+            multiplexer = WSMultiplexer.for_endpoint(ws_url=self.wss_url,
+                                                     router=router,
+                                                     api_factory=self._api_factory,
+                                                     ping_timeout=self._ping_timeout)
+            return multiplexer.get_ws_assistant()
         ws: WSAssistant = await self._api_factory.get_ws_assistant()
         await ws.connect(ws_url=self.wss_url, ping_timeout=self._ping_timeout)
         return ws
 
+    def _ws_stream_router(self) -> Optional[WSStreamRouter]:
+        """
+        Returns the router of the websocket endpoint when its connections can be shared with other feeds and
+        connectors (see WSMultiplexer), or None to use a dedicated connection.
+        """
+        return None
+
     @property
     def _ping_payload(self):
         return None
@@ -0,0 +1,152 @@
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class CandlesBuffer:
+    """
+    Fixed size ring buffer of candles backed by a preallocated float64 NumPy array, with one row per candle and one
+    column per CandlesBase column.
+
+    It keeps the deque interface used by the candles feeds (maxlen, append, appendleft, extend, extendleft, clear,
+    indexing and iteration, with rows returned as lists) but the websocket updates are written in place into the
+    array. The array has twice the capacity of the buffer, so the stored candles are always a contiguous slice of it
+    and can be exposed as a view without copying; the slice is moved back to the start of the array only when it
+    reaches the end, once every maxlen appends.
+
+    Every change to the candles increments the version, and the DataFrame built from them is cached until the next
+    change, so reading the candles on every tick doesn't rebuild it while the candles are not updated.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self.maxlen = maxlen
+        self._data = np.zeros((2 * max(maxlen, 1), n_columns), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self.version = 0
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._df_cache_version = -1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self.values, dtype=dtype)
+
+    def __getitem__(self, index: int) -> List[float]:
+        return self._data[self._start + self._position(index)].tolist()
+
+    def __setitem__(self, index: int, row: Iterable[float]):
+        position = self._start + self._position(index)
+        row = np.asarray(row, dtype=np.float64)
+        if not np.array_equal(self._data[position], row):
+            self._data[position] = row
+            self.version += 1
+
+    def __iter__(self) -> Iterator[List[float]]:
+        return iter(self.values.tolist())
+
+    def __reversed__(self) -> Iterator[List[float]]:
+        return iter(self.values[::-1].tolist())
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("candles buffer index out of range")
+        return index
+
+    def _move(self, new_start: int):
+        self._data[new_start:new_start + self._size] = self._data[self._start:self._start + self._size]
+        self._start = new_start
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only view of the stored candles, sorted from the oldest to the newest. The view is only valid until the
+        next change to the buffer.
+        """
+        values = self._data[self._start:self._start + self._size]
+        values.flags.writeable = False
+        return values
+
+    def to_dataframe(self, columns: List[str]) -> pd.DataFrame:
+        """
+        Returns the candles as a DataFrame, built only once per version of the buffer. The returned DataFrame is
+        shared between the calls, so callers that modify it need to copy it first.
+        """
+        if self._df_cache is None or self._df_cache_version != self.version:
+            self._df_cache = pd.DataFrame(self.values.copy(), columns=columns)
+            self._df_cache_version = self.version
+        return self._df_cache
+
+    def append(self, row: Iterable[float]):
+        if self.maxlen == 0:
+            return
+        if self._size == self.maxlen:
+            self._start += 1
+            self._size -= 1
+        if self._start + self._size == len(self._data):
+            self._move(0)
+        self._data[self._start + self._size] = row
+        self._size += 1
+        self.version += 1
+
+    def appendleft(self, row: Iterable[float]):
+        self.extendleft([row])
+
+    def extend(self, rows: Iterable[Iterable[float]]):
+        rows = self._as_rows(rows)
+        if len(rows) == 0 or self.maxlen == 0:
+            return
+        if len(rows) >= self.maxlen:
+            self._start = 0
+            self._size = self.maxlen
+            self._data[:self.maxlen] = rows[-self.maxlen:]
+        else:
+            dropped = max(self._size + len(rows) - self.maxlen, 0)
+            self._start += dropped
+            self._size -= dropped
+            if self._start + self._size + len(rows) > len(self._data):
+                self._move(0)
+            self._data[self._start + self._size:self._start + self._size + len(rows)] = rows
+            self._size += len(rows)
+        self.version += 1
+
+    def extendleft(self, rows: Iterable[Iterable[float]]):
+        """
+        Adds the rows to the left of the buffer one by one like deque.extendleft, so they end up in reverse order.
+        When the buffer is full, the newest candles are dropped.
+        """
+        rows = self._as_rows(rows)[::-1]
+        if len(rows) == 0 or self.maxlen == 0:
+            return
+        if len(rows) >= self.maxlen:
+            self._start = 0
+            self._size = self.maxlen
+            self._data[:self.maxlen] = rows[:self.maxlen]
+        else:
+            self._size = min(self._size, self.maxlen - len(rows))
+            if self._start < len(rows):
+                self._move(len(self._data) - self._size)
+            self._start -= len(rows)
+            self._data[self._start:self._start + len(rows)] = rows
+            self._size += len(rows)
+        self.version += 1
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+        self.version += 1
+
+    def _as_rows(self, rows: Iterable[Iterable[float]]) -> np.ndarray:
+        if not isinstance(rows, np.ndarray):
+            rows = list(rows)
+        rows = np.asarray(rows, dtype=np.float64)
+        if rows.size == 0:
+            return np.empty((0, self._data.shape[1]), dtype=np.float64)
+        return rows.reshape(len(rows), -1)
@@ -0,0 +1,185 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+SECONDS_PER_DAY = 86400
+
+
+class CandlesStore:
+    """
+    Local on-disk store of historical candles shared by the live candles feeds, the backtesting data provider and the
+    download candles script.
+
+    The candles are partitioned by feed (connector and trading pair, as in CandlesBase.name), interval and UTC day.
+    Each partition is a .npy float64 array with the CandlesBase columns, sorted by timestamp, that is read back memory
+    mapped so reads that fall into a single day don't copy any data. Next to the partitions, a coverage index keeps
+    the time ranges that were already fetched from the exchange (including gaps where the exchange has no candles),
+    so only the missing ranges hit the network.
+
+    Writes hold an exclusive lock on the feed and interval directory (where fcntl is available), so several processes
+    can share the same store without erasing each other's candles or coverage ranges.
+
+    Layout:
+        <root_path>/<feed_name>/<interval>/coverage.json
+        <root_path>/<feed_name>/<interval>/.lock
+        <root_path>/<feed_name>/<interval>/<YYYYMMDD>.npy
+    """
+    _instances_by_path: Dict[str, "CandlesStore"] = {}
+
+    @classmethod
+    def get_store(cls, root_path: Optional[str] = None) -> "CandlesStore":
+        """
+        Returns the store of the given directory, creating it on the first call. There is a single instance per
+        directory in the process, so all the feeds of the process share its cached coverage index.
+        :param root_path: directory of the store, defaults to <data_path>/candles
+        """
+        if root_path is None:
+            from hummingbot import data_path
+            root_path = os.path.join(data_path(), "candles")
+        root_path = os.path.abspath(root_path)
+        if root_path not in cls._instances_by_path:
+            cls._instances_by_path[root_path] = cls(root_path)
+        return cls._instances_by_path[root_path]
+
+    def __init__(self, root_path: str):
+        self.root_path = root_path
+        self._lock = threading.Lock()
+        self._coverage_cache: Dict[Tuple[str, str], List[List[int]]] = {}
+
+    def _partition_dir(self, feed_name: str, interval: str) -> str:
+        return os.path.join(self.root_path, feed_name, interval)
+
+    def _partition_path(self, feed_name: str, interval: str, day: int) -> str:
+        day_str = np.datetime64(day * SECONDS_PER_DAY, "s").astype("datetime64[D]").astype(str).replace("-", "")
+        return os.path.join(self._partition_dir(feed_name, interval), f"{day_str}.npy")
+
+    @staticmethod
+    def _atomic_write(path: str, write_function):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write_function(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @contextmanager
+    def _directory_lock(self, feed_name: str, interval: str):
+        with open(os.path.join(self._partition_dir(feed_name, interval), ".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_coverage(self, feed_name: str, interval: str) -> List[List[int]]:
+        path = os.path.join(self._partition_dir(feed_name, interval), "coverage.json")
+        if not os.path.exists(path):
+            return []
+        with open(path, "r") as f:
+            return json.load(f)["ranges"]
+
+    def coverage(self, feed_name: str, interval: str) -> List[List[int]]:
+        """
+        Returns the sorted and merged [start, end] ranges (candle open timestamps, inclusive) already stored. The
+        ranges are cached after the first read and refreshed on every write of this instance, so ranges written by
+        other processes in between can be missing (they are only fetched again).
+        """
+        key = (feed_name, interval)
+        if key not in self._coverage_cache:
+            self._coverage_cache[key] = self._read_coverage(feed_name, interval)
+        return self._coverage_cache[key]
+
+    def missing_ranges(self, feed_name: str, interval: str, interval_in_seconds: int,
+                       start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Returns the [start, end] ranges of candle timestamps in [start_time, end_time] that are not covered by the
+        store. Timestamps are expected to be multiples of the interval.
+        """
+        missing = []
+        current_start = start_time
+        for covered_start, covered_end in self.coverage(feed_name, interval):
+            if covered_end < current_start:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > current_start:
+                missing.append((current_start, covered_start - interval_in_seconds))
+            current_start = max(current_start, covered_end + interval_in_seconds)
+            if current_start > end_time:
+                break
+        if current_start <= end_time:
+            missing.append((current_start, end_time))
+        return missing
+
+    def write(self, feed_name: str, interval: str, interval_in_seconds: int, candles: np.ndarray,
+              start_time: int, end_time: int):
+        """
+        Stores the candles of the range [start_time, end_time] and marks the range as covered. Candles outside the
+        range are ignored and candles already stored with the same timestamp are replaced.
+        """
+        os.makedirs(self._partition_dir(feed_name, interval), exist_ok=True)
+        with self._lock, self._directory_lock(feed_name, interval):
+            candles = np.asarray(candles, dtype=np.float64)
+            if len(candles) > 0:
+                candles = candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= end_time)]
+                days = (candles[:, 0] // SECONDS_PER_DAY).astype(np.int64)
+                for day in np.unique(days):
+                    self._write_partition(feed_name, interval, int(day), candles[days == day])
+            self._add_coverage(feed_name, interval, interval_in_seconds, start_time, end_time)
+
+    def _write_partition(self, feed_name: str, interval: str, day: int, candles: np.ndarray):
+        path = self._partition_path(feed_name, interval, day)
+        if os.path.exists(path):
+            # New candles first so np.unique keeps them over the stored ones
+            candles = np.concatenate([candles, np.load(path)])
+        _, unique_idx = np.unique(candles[:, 0], return_index=True)
+        self._atomic_write(path, lambda f: np.save(f, candles[unique_idx]))
+
+    def _add_coverage(self, feed_name: str, interval: str, interval_in_seconds: int, start_time: int, end_time: int):
+        # Re-read the index under the directory lock, the cached ranges can miss the ones written by other processes
+        merged = []
+        for covered_start, covered_end in sorted(self._read_coverage(feed_name, interval) + [[start_time, end_time]]):
+            if merged and covered_start <= merged[-1][1] + interval_in_seconds:
+                merged[-1][1] = max(merged[-1][1], covered_end)
+            else:
+                merged.append([covered_start, covered_end])
+        self._coverage_cache[(feed_name, interval)] = merged
+        path = os.path.join(self._partition_dir(feed_name, interval), "coverage.json")
+        self._atomic_write(path, lambda f: f.write(json.dumps({"ranges": merged}).encode()))
+
+    def read(self, feed_name: str, interval: str, start_time: int, end_time: int) -> np.ndarray:
+        """
+        Returns the stored candles with timestamps in [start_time, end_time]. When the range falls into a single day
+        partition the result is a view over the memory mapped file, otherwise the partitions are concatenated.
+        Partitions are mapped copy-on-write, so callers can modify the result without touching the store.
+        """
+        chunks = []
+        for day in range(int(start_time) // SECONDS_PER_DAY, int(end_time) // SECONDS_PER_DAY + 1):
+            path = self._partition_path(feed_name, interval, day)
+            if not os.path.exists(path):
+                continue
+            partition = np.load(path, mmap_mode="c")
+            timestamps = partition[:, 0]
+            first = np.searchsorted(timestamps, start_time, side="left")
+            last = np.searchsorted(timestamps, end_time, side="right")
+            if last > first:
+                chunks.append(partition[first:last])
+        if len(chunks) == 0:
+            return np.empty((0, 0))
+        if len(chunks) == 1:
+            return chunks[0]
+        return np.concatenate(chunks)
@@ -0,0 +1,610 @@
+import math
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+TIMESTAMP = CandlesBase.columns.index("timestamp")
+HIGH = CandlesBase.columns.index("high")
+LOW = CandlesBase.columns.index("low")
+CLOSE = CandlesBase.columns.index("close")
+NAN = float("nan")
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """
+    Float division with the NaN and inf results of pandas instead of ZeroDivisionError.
+    """
+    if denominator == 0:
+        if numerator == 0 or math.isnan(numerator):
+            return NAN
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
+
+
+class _Presma:
+    """
+    Replaces the first length values of a series by NaN and the SMA of those values, as pandas-ta does to seed its EMA
+    and ATR.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self._count = 0
+        self._seed: List[float] = []
+
+    def push(self, value: float) -> float:
+        self._count += 1
+        if self._count < self.length:
+            self._seed.append(value)
+            return NAN
+        if self._count == self.length:
+            self._seed.append(value)
+            seed = np.array(self._seed)
+            return float(np.mean(seed[~np.isnan(seed)])) if not np.isnan(seed).all() else NAN
+        return value
+
+    def get_state(self) -> int:
+        return self._count
+
+    def set_state(self, state: int):
+        self._count = state
+        del self._seed[state:]
+
+
+class _EWM:
+    """
+    Exponentially weighted mean with adjust=False that reproduces the float operations of pandas ewm().mean(). Leading
+    NaNs are skipped and the first observation initializes the mean.
+    """
+
+    def __init__(self, com: float):
+        self._alpha = 1. / (1. + com)
+        self._old_weight = 1. - self._alpha
+        self.value = NAN
+
+    @classmethod
+    def from_span(cls, span: float) -> "_EWM":
+        return cls(com=(span - 1) / 2.)
+
+    @classmethod
+    def from_alpha(cls, alpha: float) -> "_EWM":
+        return cls(com=1. / alpha - 1.)
+
+    def push(self, value: float) -> float:
+        if math.isnan(self.value):
+            self.value = value
+        elif not math.isnan(value) and self.value != value:
+            self.value = (self._old_weight * self.value + self._alpha * value) / (self._old_weight + self._alpha)
+        return self.value
+
+    def get_state(self) -> float:
+        return self.value
+
+    def set_state(self, state: float):
+        self.value = state
+
+
+class _RollingWindow:
+    """
+    Rolling mean and variance of the last length values, updated with Welford's algorithm in O(1). The statistics are
+    recomputed from the window once every length updates, so the floating point error doesn't accumulate over time.
+    The last push can be undone to revise the value of the last candle.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self._values = deque()
+        self._mean = 0.
+        self._m2 = 0.
+        self._updates = 0
+        self._undo: Optional[Tuple] = None
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.length
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.full else NAN
+
+    def var(self, ddof: int = 1) -> float:
+        if not self.full or self.length <= ddof:
+            return NAN
+        if self.length == 1:
+            return 0.
+        return max(self._m2, 0.) / (self.length - ddof)
+
+    def push(self, value: float):
+        popped = self._values.popleft() if self.full else None
+        self._undo = (popped, self._mean, self._m2, self._updates)
+        if popped is not None:
+            if len(self._values) == 0:
+                self._mean, self._m2 = 0., 0.
+            else:
+                delta = popped - self._mean
+                self._mean -= delta / len(self._values)
+                self._m2 -= delta * (popped - self._mean)
+        self._values.append(value)
+        self._updates += 1
+        if self._updates >= self.length:
+            values = np.fromiter(self._values, dtype=np.float64, count=len(self._values))
+            self._mean = float(values.mean())
+            self._m2 = float(((values - self._mean) ** 2).sum())
+            self._updates = 0
+        else:
+            delta = value - self._mean
+            self._mean += delta / len(self._values)
+            self._m2 += delta * (value - self._mean)
+
+    def undo(self):
+        popped, self._mean, self._m2, self._updates = self._undo
+        self._values.pop()
+        if popped is not None:
+            self._values.appendleft(popped)
+
+
+class StreamingIndicator:
+    """
+    Base class of the technical indicators that are updated in O(1) per candle instead of being recomputed over the
+    whole candles frame. Each indicator keeps the rolling history of its outputs, with the same column names and
+    values as the pandas-ta indicator it replaces.
+
+    update() adds a new candle and revise() replaces the last one, e.g. when the websocket updates the candle that is
+    still open. The candles are numpy rows with the columns of CandlesBase.columns.
+    """
+
+    def __init__(self, max_records: int = 500):
+        self.max_records = max_records
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        raise NotImplementedError
+
+    def _reset_state(self):
+        raise NotImplementedError
+
+    def _get_state(self):
+        raise NotImplementedError
+
+    def _set_state(self, state):
+        raise NotImplementedError
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        raise NotImplementedError
+
+    def update(self, candle: np.ndarray):
+        self._checkpoint = self._get_state()
+        self._has_checkpoint = True
+        self._history.append(self._next(candle))
+
+    def revise(self, candle: np.ndarray):
+        if not self._has_checkpoint:
+            self.update(candle)
+            return
+        self._set_state(self._checkpoint)
+        self._history[-1] = self._next(candle)
+
+    def reset(self):
+        self._history = CandlesBuffer(maxlen=self.max_records, n_columns=len(self.columns))
+        self._checkpoint = None
+        self._has_checkpoint = False
+        self._reset_state()
+
+    @property
+    def key(self) -> Tuple:
+        """
+        Identifies the indicator by its class and parameters, e.g. to share the indicators with the same parameters.
+        """
+        parameters = tuple((name, value) for name, value in sorted(vars(self).items())
+                           if not name.startswith("_") and name != "max_records")
+        return (type(self).__name__,) + parameters
+
+    @property
+    def latest(self) -> Dict[str, float]:
+        if len(self._history) == 0:
+            return {column: NAN for column in self.columns}
+        return dict(zip(self.columns, self._history[-1]))
+
+    @property
+    def history(self) -> np.ndarray:
+        """
+        Read-only view of the last max_records outputs, one column per output.
+        """
+        return self._history.values
+
+    def to_frame(self) -> pd.DataFrame:
+        return self._history.to_dataframe(self.columns).copy()
+
+
+class SMA(StreamingIndicator):
+    def __init__(self, length: int = 10, max_records: int = 500):
+        self.length = length
+        super().__init__(max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"SMA_{self.length}"]
+
+    def _reset_state(self):
+        self._window = _RollingWindow(self.length)
+
+    def _get_state(self):
+        return None
+
+    def _set_state(self, state):
+        self._window.undo()
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        self._window.push(candle[CLOSE])
+        return [self._window.mean]
+
+
+class EMA(StreamingIndicator):
+    def __init__(self, length: int = 10, max_records: int = 500):
+        self.length = length
+        super().__init__(max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self.length}"]
+
+    def _reset_state(self):
+        self._presma = _Presma(self.length)
+        self._ewm = _EWM.from_span(self.length)
+
+    def _get_state(self):
+        return self._presma.get_state(), self._ewm.get_state()
+
+    def _set_state(self, state):
+        self._presma.set_state(state[0])
+        self._ewm.set_state(state[1])
+
+    def _push(self, value: float) -> float:
+        return self._ewm.push(self._presma.push(value))
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        return [self._push(candle[CLOSE])]
+
+
+class BBands(StreamingIndicator):
+    def __init__(self, length: int = 5, lower_std: float = 2.0, upper_std: float = 2.0, ddof: int = 1,
+                 max_records: int = 500):
+        self.length = length
+        self.lower_std = lower_std
+        self.upper_std = upper_std
+        self.ddof = ddof if 0 <= ddof < length else 1
+        super().__init__(max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self.length}_{self.lower_std}_{self.upper_std}"
+        return [f"BBL{props}", f"BBM{props}", f"BBU{props}", f"BBB{props}", f"BBP{props}"]
+
+    def _reset_state(self):
+        self._window = _RollingWindow(self.length)
+
+    def _get_state(self):
+        return None
+
+    def _set_state(self, state):
+        self._window.undo()
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        close = candle[CLOSE]
+        self._window.push(close)
+        mid = self._window.mean
+        std = math.sqrt(self._window.var(self.ddof))
+        lower = mid - self.lower_std * std
+        upper = mid + self.upper_std * std
+        upper_lower_range = upper - lower
+        if upper_lower_range == 0:
+            upper_lower_range += np.finfo(float).eps
+        close_lower_range = close - lower
+        if close_lower_range == 0:
+            close_lower_range += np.finfo(float).eps
+        return [lower, mid, upper, _divide(100 * upper_lower_range, mid),
+                _divide(close_lower_range, upper_lower_range)]
+
+
+class MACD(StreamingIndicator):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, max_records: int = 500):
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        super().__init__(max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self.fast}_{self.slow}_{self.signal}"
+        return [f"MACD{props}", f"MACDh{props}", f"MACDs{props}"]
+
+    def _reset_state(self):
+        self._fast_ema = EMA(self.fast, max_records=0)
+        self._slow_ema = EMA(self.slow, max_records=0)
+        self._signal_ema = EMA(self.signal, max_records=0)
+
+    def _get_state(self):
+        return self._fast_ema._get_state(), self._slow_ema._get_state(), self._signal_ema._get_state()
+
+    def _set_state(self, state):
+        self._fast_ema._set_state(state[0])
+        self._slow_ema._set_state(state[1])
+        self._signal_ema._set_state(state[2])
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        macd = self._fast_ema._push(candle[CLOSE]) - self._slow_ema._push(candle[CLOSE])
+        if math.isnan(macd):
+            return [NAN, NAN, NAN]
+        signal = self._signal_ema._push(macd)
+        return [macd, macd - signal, signal]
+
+
+class RSI(StreamingIndicator):
+    def __init__(self, length: int = 14, scalar: float = 100, max_records: int = 500):
+        self.length = length
+        self.scalar = float(scalar)
+        super().__init__(max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self.length}"]
+
+    def _reset_state(self):
+        self._previous_close = NAN
+        self._positive_avg = _EWM.from_alpha(1. / self.length)
+        self._negative_avg = _EWM.from_alpha(1. / self.length)
+
+    def _get_state(self):
+        return self._previous_close, self._positive_avg.get_state(), self._negative_avg.get_state()
+
+    def _set_state(self, state):
+        self._previous_close = state[0]
+        self._positive_avg.set_state(state[1])
+        self._negative_avg.set_state(state[2])
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        change = candle[CLOSE] - self._previous_close
+        self._previous_close = candle[CLOSE]
+        positive_avg = self._positive_avg.push(max(change, 0.) if not math.isnan(change) else NAN)
+        negative_avg = self._negative_avg.push(min(change, 0.) if not math.isnan(change) else NAN)
+        return [_divide(self.scalar * positive_avg, positive_avg + abs(negative_avg))]
+
+
+class ATR(StreamingIndicator):
+    """
+    Average True Range smoothed with RMA, as pandas-ta atr() with the default mamode.
+    """
+
+    def __init__(self, length: int = 14, max_records: int = 500):
+        self.length = length
+        super().__init__(max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"ATRr_{self.length}"]
+
+    def _new_average(self) -> _EWM:
+        return _EWM.from_alpha(1. / self.length)
+
+    def _reset_state(self):
+        self._previous_close = NAN
+        self._presma = _Presma(self.length)
+        self._average = self._new_average()
+
+    def _get_state(self):
+        return self._previous_close, self._presma.get_state(), self._average.get_state()
+
+    def _set_state(self, state):
+        self._previous_close = state[0]
+        self._presma.set_state(state[1])
+        self._average.set_state(state[2])
+
+    def _next_atr(self, candle: np.ndarray) -> float:
+        high, low = candle[HIGH], candle[LOW]
+        true_range = abs(high - low)
+        if not math.isnan(self._previous_close):
+            true_range = max(abs(true_range), abs(high - self._previous_close), abs(self._previous_close - low))
+        self._previous_close = candle[CLOSE]
+        return self._average.push(self._presma.push(true_range))
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        return [self._next_atr(candle)]
+
+
+class NATR(ATR):
+    """
+    Normalized ATR, smoothed with EMA as pandas-ta natr() with the default mamode.
+    """
+
+    def __init__(self, length: int = 14, scalar: float = 100, max_records: int = 500):
+        self.scalar = float(scalar)
+        super().__init__(length, max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self.length}"]
+
+    def _new_average(self) -> _EWM:
+        return _EWM.from_span(self.length)
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        return [self.scalar / candle[CLOSE] * self._next_atr(candle)]
+
+
+class SuperTrend(StreamingIndicator):
+    def __init__(self, length: int = 7, multiplier: float = 3.0, atr_length: Optional[int] = None,
+                 max_records: int = 500):
+        self.length = length
+        self.multiplier = multiplier
+        self.atr_length = atr_length or length
+        super().__init__(max_records)
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self.length}_{self.multiplier}"
+        return [f"SUPERT{props}", f"SUPERTd{props}", f"SUPERTl{props}", f"SUPERTs{props}"]
+
+    def _reset_state(self):
+        self._atr = ATR(self.atr_length, max_records=0)
+        self._count = 0
+        self._direction = 1
+        self._lower_band = NAN
+        self._upper_band = NAN
+
+    def _get_state(self):
+        return self._atr._get_state(), self._count, self._direction, self._lower_band, self._upper_band
+
+    def _set_state(self, state):
+        self._atr._set_state(state[0])
+        self._count, self._direction, self._lower_band, self._upper_band = state[1:]
+
+    def _next(self, candle: np.ndarray) -> List[float]:
+        close = candle[CLOSE]
+        hl2 = 0.5 * (candle[HIGH] + candle[LOW])
+        band = self.multiplier * self._atr._next_atr(candle)
+        lower_band, upper_band = hl2 - band, hl2 + band
+        first = self._count == 0
+        self._count += 1
+        if not first:
+            if close > self._upper_band:
+                self._direction = 1
+            elif close < self._lower_band:
+                self._direction = -1
+            else:
+                if self._direction > 0 and lower_band < self._lower_band:
+                    lower_band = self._lower_band
+                if self._direction < 0 and upper_band > self._upper_band:
+                    upper_band = self._upper_band
+        self._lower_band, self._upper_band = lower_band, upper_band
+        if first:
+            trend, long, short = NAN, NAN, NAN
+        elif self._direction > 0:
+            trend, long, short = lower_band, lower_band, NAN
+        else:
+            trend, long, short = upper_band, NAN, upper_band
+        direction = float(self._direction) if self._count > self.length else NAN
+        return [trend, direction, long, short]
+
+
+class CandlesIndicators:
+    """
+    Keeps a set of streaming indicators in sync with the candles of a feed. Each call to update() only feeds the
+    candles that changed since the previous call: the new candles are added and the last candle is revised when its
+    values changed. When older candles are prepended (e.g. when the feed fills the history) or the candles are not
+    contiguous with the ones already processed, the indicators are recomputed from the first candle.
+
+    The EMA based indicators (EMA, MACD, RSI, ATR, NATR, SuperTrend) are seeded from the first candle processed, so
+    they match the pandas-ta indicators computed over the same candles. The history of the indicators is resized to
+    the max_records of the engine.
+
+    Usage:
+        indicators = CandlesIndicators([BBands(length=100, lower_std=2.0, upper_std=2.0), MACD(12, 26, 9)])
+        indicators.update(candles_feed.candles_array, version=candles_feed.candles_version)
+        df = indicators.to_frame()  # same columns as df.ta.bbands(append=True) and df.ta.macd(append=True)
+    """
+
+    def __init__(self, indicators: List[StreamingIndicator], max_records: int = 500):
+        self.indicators = indicators
+        self.max_records = max_records
+        for indicator in self.indicators:
+            indicator.max_records = max_records
+            indicator.reset()
+        self._candles = CandlesBuffer(maxlen=max_records, n_columns=len(CandlesBase.columns))
+        self._first_timestamp: Optional[float] = None
+        self._source_version: Optional[Hashable] = None
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version = -1
+
+    @property
+    def columns(self) -> List[str]:
+        return [column for indicator in self.indicators for column in indicator.columns]
+
+    @property
+    def version(self) -> int:
+        return self._candles.version
+
+    def reset(self):
+        self._candles.clear()
+        self._first_timestamp = None
+        self._source_version = None
+        for indicator in self.indicators:
+            indicator.reset()
+
+    def update(self, candles: np.ndarray, version: Optional[Hashable] = None) -> bool:
+        """
+        Feeds the candles that changed since the last update to the indicators.
+        :param candles: array with the columns of CandlesBase.columns, sorted by timestamp
+        :param version: any value that changes when the candles change (e.g. CandlesBase.candles_version), to skip
+        the update when the candles didn't change
+        :return: True if the indicators changed
+        """
+        if version is not None and version == self._source_version:
+            return False
+        if len(candles) == 0:
+            return False
+        initial_version = self.version
+        timestamps = candles[:, TIMESTAMP]
+        start = 0
+        if len(self._candles) > 0:
+            last_timestamp = self._candles[-1][TIMESTAMP]
+            start = int(np.searchsorted(timestamps, last_timestamp))
+            if timestamps[0] < self._first_timestamp or last_timestamp > timestamps[-1]:
+                self.reset()
+                start = 0
+            elif timestamps[start] == last_timestamp:
+                if not np.array_equal(candles[start], self._candles[-1], equal_nan=True):
+                    self._revise(candles[start])
+                start += 1
+            elif start > 0:
+                self.reset()
+                start = 0
+        for candle in candles[start:]:
+            self._update(candle)
+        self._source_version = version
+        return self.version != initial_version
+
+    def _update(self, candle: np.ndarray):
+        if self._first_timestamp is None:
+            self._first_timestamp = candle[TIMESTAMP]
+        self._candles.append(candle)
+        for indicator in self.indicators:
+            indicator.update(candle)
+
+    def _revise(self, candle: np.ndarray):
+        self._candles[-1] = candle
+        for indicator in self.indicators:
+            indicator.revise(candle)
+
+    @property
+    def latest(self) -> Dict[str, float]:
+        latest = {}
+        for indicator in self.indicators:
+            latest.update(indicator.latest)
+        return latest
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the last max_records candles with the indicator columns appended, like the frame produced by calling
+        df.ta.<indicator>(append=True) for each indicator. The frame is built once per change of the candles and each
+        call returns a copy of it.
+        """
+        if self._frame is None or self._frame_version != self.version:
+            candles = self._candles.values
+            n_candles = len(candles)
+            blocks = [candles]
+            for indicator in self.indicators:
+                values = np.full((n_candles, len(indicator.columns)), NAN)
+                history = indicator.history[-n_candles:] if n_candles > 0 else indicator.history[:0]
+                values[n_candles - len(history):] = history
+                blocks.append(values)
+            self._frame = pd.DataFrame(np.hstack(blocks), columns=CandlesBase.columns + self.columns)
+            self._frame_version = self.version
+        return self._frame.copy()
@@ -4,10 +4,12 @@ from typing import Any, Dict, Optional, Set
 
 from bidict import bidict
 
+from hummingbot.connector.exchange.binance.binance_web_utils import BinanceWSStreamRouter
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_multiplexer import WSMultiplexer
 from hummingbot.data_feed.liquidations_feed.binance import constants as CONSTANTS
 from hummingbot.data_feed.liquidations_feed.liquidations_base import Liquidation, LiquidationsBase, LiquidationSide
 from hummingbot.logger import HummingbotLogger
@@ -54,6 +56,14 @@ class BinancePerpetualLiquidations(LiquidationsBase):
     def get_exchange_trading_pair(self, trading_pair):
         return self._trading_pairs_map.inverse.get(trading_pair)
 
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        # The connections are shared with the candles feeds subscribed to the same endpoint
+        multiplexer = WSMultiplexer.for_endpoint(ws_url=self.wss_url,
+                                                 router=BinanceWSStreamRouter(),
+                                                 api_factory=self._api_factory,
+                                                 ping_timeout=30)
+        return multiplexer.get_ws_assistant()
+
     async def _subscribe_channels(self, ws: WSAssistant):
         """
         Subscribes to the liquidations events through the provided websocket connection.
@@ -4,6 +4,7 @@ import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.config_helpers import (
@@ -19,7 +20,9 @@ from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import CandlesIndicators, StreamingIndicator
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -39,14 +42,20 @@ class MarketDataProvider:
 
     def __init__(self,
                  connectors: Dict[str, ConnectorBase],
-                 rates_update_interval: int = 60):
+                 rates_update_interval: int = 60,
+                 use_candles_store: bool = True):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        # Local store of historical candles shared with the backtesting engine and the download candles script
+        self.candles_store: Optional[CandlesStore] = CandlesStore.get_store() if use_candles_store else None
+        self.candles_indicators: Dict[Tuple[str, Tuple], CandlesIndicators] = {}
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
         self._rates = {}
         self._non_trading_connectors = LazyDict[str, ConnectorBase](self._create_non_trading_connector)
         self._rates_required = GroupedSetDict[str, ConnectorPair]()
+        # Trading connectors whose order books feed the rate oracle
+        self._order_book_rate_connectors: Dict[str, ConnectorBase] = {}
         self.conn_settings = AllConnectorSettings.get_connector_settings()
 
     def stop(self):
@@ -57,6 +66,9 @@ class MarketDataProvider:
             self._rates_update_task = None
         self.candles_feeds.clear()
         self._rates_required.clear()
+        for connector in self._order_book_rate_connectors.values():
+            RateOracle.get_instance().remove_order_book_connector(connector)
+        self._order_book_rate_connectors.clear()
 
     @property
     def ready(self) -> bool:
@@ -70,10 +82,13 @@ class MarketDataProvider:
     def initialize_rate_sources(self, connector_pairs: List[ConnectorPair]):
         """
         Initializes a rate source based on the given connector pair.
+        The order books of the trading connectors are used as live rate sources, the rates of the pairs without live
+        order book are polled every rates update interval.
         :param connector_pairs: List[ConnectorPair]
         """
         for connector_pair in connector_pairs:
             self._rates_required.add_or_update(connector_pair.connector_name, connector_pair)
+            self._add_order_book_rate_connector(connector_pair.connector_name)
         if not self._rates_update_task:
             self._rates_update_task = safe_ensure_future(self.update_rates_task())
 
@@ -167,13 +182,18 @@ class MarketDataProvider:
                     except Exception as e:
                         self.logger().error(f"Error fetching gateway prices: {e}", exc_info=True)
 
-                # Process non-gateway connectors
+                # Process non-gateway connectors, the pairs with a live order book are already up to date
+                live_pairs = rate_oracle.order_book_source.trading_pairs
                 for connector, connector_pairs in non_gateway_connectors.items():
+                    trading_pairs = [pair.trading_pair for pair in connector_pairs
+                                     if pair.trading_pair not in live_pairs]
+                    if not trading_pairs:
+                        continue
                     try:
                         connector_instance = self._non_trading_connectors[connector]
                         prices = await self._safe_get_last_traded_prices(
                             connector=connector_instance,
-                            trading_pairs=[pair.trading_pair for pair in connector_pairs])
+                            trading_pairs=trading_pairs)
                         for pair, rate in prices.items():
                             rate_oracle.set_price(pair, rate)
                     except Exception as e:
@@ -185,6 +205,12 @@ class MarketDataProvider:
         finally:
             self._rates_update_task = None
 
+    def _add_order_book_rate_connector(self, connector_name: str):
+        connector = self.connectors.get(connector_name)
+        if connector is not None and connector_name not in self._order_book_rate_connectors:
+            if RateOracle.get_instance().add_order_book_connector(connector):
+                self._order_book_rate_connectors[connector_name] = connector
+
     def initialize_candles_feed(self, config: CandlesConfig):
         """
         Initializes a candle feed based on the given configuration.
@@ -220,6 +246,8 @@ class MarketDataProvider:
 
             # Create a new feed with updated max_records
             candle_feed = CandlesFactory.get_candle(config)
+            if self.candles_store is not None:
+                candle_feed.candles_store = self.candles_store
             self.candles_feeds[key] = candle_feed
             if hasattr(candle_feed, 'start'):
                 candle_feed.start()
@@ -368,6 +396,41 @@ class MarketDataProvider:
         ))
         return candles.candles_df.iloc[-max_records:]
 
+    def get_candles_indicators(self, connector_name: str, trading_pair: str, interval: str,
+                               indicators: List[StreamingIndicator], max_records: int = 500) -> CandlesIndicators:
+        """
+        Retrieves the streaming indicators of the candles for a trading pair, updated only with the candles that
+        changed since the last call.
+        The indicators are kept per candles feed and set of indicator classes and parameters, so the indicators passed
+        in later calls with the same parameters are ignored and the existing ones are updated.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param indicators: List of streaming indicators
+        :param max_records: int
+        :return: CandlesIndicators instance.
+        """
+        candles = self.get_candles_feed(CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        ))
+        candles_indicators = self._get_or_create_candles_indicators(connector_name, trading_pair, interval,
+                                                                    indicators, max_records)
+        candles_indicators.update(candles.candles_array, version=(id(candles), candles.candles_version))
+        return candles_indicators
+
+    def _get_or_create_candles_indicators(self, connector_name: str, trading_pair: str, interval: str,
+                                          indicators: List[StreamingIndicator], max_records: int) -> CandlesIndicators:
+        feed_key = f"{connector_name}_{trading_pair}_{interval}"
+        key = (feed_key, tuple(indicator.key for indicator in indicators))
+        candles_indicators = self.candles_indicators.get(key)
+        if candles_indicators is None or candles_indicators.max_records < max_records:
+            candles_indicators = CandlesIndicators(indicators, max_records=max_records)
+            self.candles_indicators[key] = candles_indicators
+        return candles_indicators
+
     async def get_historical_candles_df(self, connector_name: str, trading_pair: str, interval: str,
                                         start_time: Optional[int] = None, end_time: Optional[int] = None,
                                         max_records: Optional[int] = None, max_cache_records: int = 10000):
@@ -479,13 +542,11 @@ class MarketDataProvider:
 
                     # Update the candles feed cache
                     candles_feed._candles.clear()
-                    for _, row in combined_df.iterrows():
-                        candles_feed._candles.append(row.values)
+                    candles_feed._candles.extend(combined_df.to_numpy())
                 else:
                     # Update the candles feed cache with new data
                     candles_feed._candles.clear()
-                    for _, row in new_df.iloc[-max_cache_records:].iterrows():
-                        candles_feed._candles.append(row.values)
+                    candles_feed._candles.extend(new_df.iloc[-max_cache_records:].to_numpy())
 
                 # Return filtered data for requested range
                 final_df = candles_feed.candles_df
@@ -554,6 +615,24 @@ class MarketDataProvider:
         order_book = connector.get_order_book(trading_pair)
         return order_book.snapshot
 
+    def get_order_book_depth(self, connector_name: str, trading_pair: str, n_levels: int = 20,
+                             cumulative: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieves the best n_levels of the order book for a trading pair from the specified connector, as a tuple of
+        bid and ask NumPy arrays with [price, amount, update_id] rows, or [price, cumulative amount, cumulative quote
+        amount] rows if cumulative is True. Cheaper than get_order_book_snapshot for vectorized depth features.
+        :param connector_name: str
+        :param trading_pair: str
+        :param n_levels: int
+        :param cumulative: bool
+        :return: Tuple of bid and ask arrays.
+        """
+        connector = self.get_connector_with_fallback(connector_name)
+        order_book = connector.get_order_book(trading_pair)
+        if cumulative:
+            return order_book.get_cumulative_depth_arrays(n_levels)
+        return order_book.get_depth_arrays(n_levels)
+
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
         """
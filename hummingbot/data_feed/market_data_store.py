@@ -0,0 +1,236 @@
+import json
+import os
+import threading
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+SECONDS_PER_DAY = 86400
+
+
+class MarketDataPartition:
+    """
+    Columns of the market data samples of a trading pair in a UTC day, one append-only float64 file per column. The
+    depth columns have `depth` values per sample, best price first, padded with NaN when the book has fewer levels.
+
+    The timestamp column is written last, so it holds the number of complete samples: a sample partially written by a
+    crash is ignored by the reads and overwritten by the next append.
+    """
+    SCALAR_COLUMNS = ("mid_price", "best_bid", "best_ask", "spread")
+    DEPTH_COLUMNS = ("bid_price", "bid_amount", "ask_price", "ask_amount")
+
+    def __init__(self, path: str, depth: int):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, "r") as f:
+                depth = json.load(f)["depth"]
+        else:
+            with open(meta_path, "w") as f:
+                json.dump({"depth": depth}, f)
+        self.depth = depth
+        self._files: Dict[str, BinaryIO] = {}
+
+    @classmethod
+    def column_width(cls, column: str, depth: int) -> int:
+        return depth if column in cls.DEPTH_COLUMNS else 1
+
+    def column_path(self, column: str) -> str:
+        return os.path.join(self.path, f"{column}.f64")
+
+    def rows_count(self) -> int:
+        timestamp_path = self.column_path("timestamp")
+        return os.path.getsize(timestamp_path) // 8 if os.path.exists(timestamp_path) else 0
+
+    def append(self, timestamp: float, scalars: np.ndarray, depth_values: np.ndarray):
+        """
+        Appends a sample, with the SCALAR_COLUMNS values and the (len(DEPTH_COLUMNS), depth) DEPTH_COLUMNS values.
+        """
+        if not self._files:
+            self._open_files()
+        for i, column in enumerate(self.SCALAR_COLUMNS):
+            self._files[column].write(scalars[i:i + 1].tobytes())
+        for i, column in enumerate(self.DEPTH_COLUMNS):
+            self._files[column].write(depth_values[i].tobytes())
+        for column in self.SCALAR_COLUMNS + self.DEPTH_COLUMNS:
+            self._files[column].flush()
+        self._files["timestamp"].write(np.float64(timestamp).tobytes())
+        self._files["timestamp"].flush()
+
+    def _open_files(self):
+        rows_count = self.rows_count()
+        for column in self.SCALAR_COLUMNS + self.DEPTH_COLUMNS + ("timestamp",):
+            f = open(self.column_path(column), "ab")
+            # Drop the values of a sample that was not completely written
+            f.truncate(rows_count * self.column_width(column, self.depth) * 8)
+            self._files[column] = f
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def read(self, start_time: float, end_time: float, columns: Sequence[str]) -> Dict[str, np.ndarray]:
+        rows_count = self.rows_count()
+        timestamps = np.fromfile(self.column_path("timestamp"), dtype=np.float64, count=rows_count)
+        first = int(np.searchsorted(timestamps, start_time, side="left"))
+        last = int(np.searchsorted(timestamps, end_time, side="right"))
+        result = {"timestamp": timestamps[first:last]}
+        for column in columns:
+            width = self.column_width(column, self.depth)
+            values = np.fromfile(self.column_path(column), dtype=np.float64, count=(last - first) * width,
+                                 offset=first * width * 8)
+            result[column] = values.reshape(-1, width) if column in self.DEPTH_COLUMNS else values
+        return result
+
+
+class MarketDataStore:
+    """
+    Local append-only store of the market data samples collected by the MarketsRecorder: timestamp, mid price, best bid
+    and ask, spread, and the price and amount of the top `depth` levels of each side of the order book.
+
+    The samples are partitioned by exchange, trading pair and UTC day, and stored column by column (see
+    MarketDataPartition), so a query only reads the columns and time range it needs. The samples of a trading pair
+    are expected to be appended in timestamp order.
+
+    Layout:
+        <root_path>/<exchange>/<trading_pair>/<YYYYMMDD>/meta.json
+        <root_path>/<exchange>/<trading_pair>/<YYYYMMDD>/<column>.f64
+    """
+    _instances_by_path: Dict[str, "MarketDataStore"] = {}
+
+    @classmethod
+    def get_store(cls, root_path: Optional[str] = None) -> "MarketDataStore":
+        """
+        Returns the store of the given directory, creating it on the first call.
+        :param root_path: directory of the store, defaults to <data_path>/market_data
+        """
+        if root_path is None:
+            from hummingbot import data_path
+            root_path = os.path.join(data_path(), "market_data")
+        root_path = os.path.abspath(root_path)
+        if root_path not in cls._instances_by_path:
+            cls._instances_by_path[root_path] = cls(root_path)
+        return cls._instances_by_path[root_path]
+
+    def __init__(self, root_path: str):
+        self.root_path = root_path
+        self._lock = threading.Lock()
+        # Partition being appended to for each (exchange, trading pair), and its day
+        self._partitions: Dict[Tuple[str, str], Tuple[int, MarketDataPartition]] = {}
+        # Buffers the depth arrays are read into, by depth
+        self._depth_buffers: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _partition_path(self, exchange: str, trading_pair: str, day: int) -> str:
+        day_str = np.datetime64(day * SECONDS_PER_DAY, "s").astype("datetime64[D]").astype(str).replace("-", "")
+        return os.path.join(self.root_path, exchange, trading_pair, day_str)
+
+    def append(self, exchange: str, trading_pair: str, timestamp: float, bids: np.ndarray, asks: np.ndarray,
+               depth: int):
+        """
+        Appends a sample from the [price, amount, ...] rows of the best bids and asks, best price first. Only the first
+        `depth` levels are stored (the depth of the day partition, if it was created with another one).
+        """
+        day = int(timestamp // SECONDS_PER_DAY)
+        with self._lock:
+            key = (exchange, trading_pair)
+            current = self._partitions.get(key)
+            if current is None or current[0] != day:
+                if current is not None:
+                    current[1].close()
+                current = (day, MarketDataPartition(self._partition_path(exchange, trading_pair, day), depth))
+                self._partitions[key] = current
+            partition = current[1]
+
+            best_bid = bids[0, 0] if len(bids) > 0 else np.nan
+            best_ask = asks[0, 0] if len(asks) > 0 else np.nan
+            scalars = np.array([(best_bid + best_ask) / 2, best_bid, best_ask, best_ask - best_bid], dtype=np.float64)
+            depth_values = np.full((len(MarketDataPartition.DEPTH_COLUMNS), partition.depth), np.nan)
+            bid_levels = min(len(bids), partition.depth)
+            ask_levels = min(len(asks), partition.depth)
+            depth_values[0, :bid_levels] = bids[:bid_levels, 0]
+            depth_values[1, :bid_levels] = bids[:bid_levels, 1]
+            depth_values[2, :ask_levels] = asks[:ask_levels, 0]
+            depth_values[3, :ask_levels] = asks[:ask_levels, 1]
+            partition.append(timestamp, scalars, depth_values)
+
+    def append_order_book(self, exchange: str, trading_pair: str, timestamp: float, order_book: OrderBook,
+                          depth: int):
+        """
+        Appends a sample of the order book, reading only its top `depth` levels.
+        """
+        buffers = self._depth_buffers.get(depth)
+        if buffers is None:
+            buffers = self._depth_buffers[depth] = (np.empty((depth, 3), dtype=np.float64),
+                                                    np.empty((depth, 3), dtype=np.float64))
+        bids, asks = order_book.get_depth_arrays(depth, bids_out=buffers[0], asks_out=buffers[1])
+        self.append(exchange, trading_pair, timestamp, bids, asks, depth)
+
+    def close(self):
+        with self._lock:
+            for _, partition in self._partitions.values():
+                partition.close()
+            self._partitions.clear()
+
+    def trading_pairs(self, exchange: str) -> List[str]:
+        exchange_path = os.path.join(self.root_path, exchange)
+        return sorted(os.listdir(exchange_path)) if os.path.isdir(exchange_path) else []
+
+    def read(self,
+             exchange: str,
+             trading_pair: str,
+             start_time: float,
+             end_time: float,
+             columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns the samples with timestamps in [start_time, end_time] as NumPy arrays by column, always including
+        "timestamp". The depth columns are (samples, depth) arrays, with the smallest depth of the days read.
+        :param columns: columns to read, defaults to all of them
+        """
+        if columns is None:
+            columns = MarketDataPartition.SCALAR_COLUMNS + MarketDataPartition.DEPTH_COLUMNS
+        columns = list(columns)
+        chunks: List[Dict[str, np.ndarray]] = []
+        for day in range(int(start_time // SECONDS_PER_DAY), int(end_time // SECONDS_PER_DAY) + 1):
+            path = self._partition_path(exchange, trading_pair, day)
+            if os.path.exists(os.path.join(path, "meta.json")):
+                chunks.append(MarketDataPartition(path, depth=0).read(start_time, end_time, columns))
+        if len(chunks) == 0:
+            return {column: np.empty((0, 0) if column in MarketDataPartition.DEPTH_COLUMNS else 0)
+                    for column in ["timestamp"] + columns}
+        if len(chunks) == 1:
+            return chunks[0]
+        result = {}
+        for column, values in chunks[0].items():
+            if values.ndim == 2:
+                depth = min(chunk[column].shape[1] for chunk in chunks)
+                result[column] = np.concatenate([chunk[column][:, :depth] for chunk in chunks])
+            else:
+                result[column] = np.concatenate([chunk[column] for chunk in chunks])
+        return result
+
+    def read_df(self,
+                exchange: str,
+                trading_pair: str,
+                start_time: float,
+                end_time: float,
+                columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Same as read, as a DataFrame indexed by timestamp. Each level of the depth columns is a column suffixed by its
+        index, e.g. bid_price_0 for the best bid price.
+        """
+        arrays = self.read(exchange, trading_pair, start_time, end_time, columns)
+        data = {}
+        for column, values in arrays.items():
+            if column == "timestamp":
+                continue
+            if values.ndim == 2:
+                for level in range(values.shape[1]):
+                    data[f"{column}_{level}"] = values[:, level]
+            else:
+                data[column] = values
+        return pd.DataFrame(data, index=pd.Index(arrays["timestamp"], name="timestamp"))
@@ -3,7 +3,7 @@ from enum import Enum
 from os.path import join
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
@@ -73,6 +73,8 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            if self._engine.dialect.name == "sqlite" and not self.is_in_memory:
+                event.listen(self._engine, "connect", self._configure_sqlite_connection)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -100,9 +102,25 @@ class SQLConnectionManager(TransactionBase):
     def engine(self) -> Engine:
         return self._engine
 
+    @property
+    def is_in_memory(self) -> bool:
+        """
+        Whether the database is an in-memory SQLite database, that is not shared between the connections (and threads).
+        """
+        return self._engine.dialect.name == "sqlite" and self._engine.url.database in (None, "", ":memory:")
+
     def get_new_session(self) -> Session:
         return self._session_cls()
 
+    @staticmethod
+    def _configure_sqlite_connection(dbapi_connection, connection_record):
+        # In WAL mode the readers do not block the writer (see SQLWriter), and a commit only needs to sync the log.
+        # A crash can lose the last commits, but the database always holds a prefix of the committed transactions.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
     def get_local_db_version(self, session: Session):
         query: Query = (session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.transaction_base import TransactionBase
+
+SQLWrite = Callable[[Session], None]
+
+
+class SQLWriter:
+    """
+    Write-behind queue of the writes to a database. The writes are functions adding or updating the records in a
+    session, that are run in batched transactions from a writer thread, so that the caller (the event loop) does not
+    wait for the queries and commits.
+
+    A batch is written when it has max_batch_size writes, or flush_interval seconds after its first write was
+    submitted, so the writes are delayed by at most flush_interval seconds plus the duration of the previous batch.
+    The writes are run in the order they were submitted, each batch in a single transaction, so after a crash the
+    database holds the writes submitted up to some point, and never a later write without an earlier one. A write
+    submitted with a coalesce_key is skipped when a later write with the same key is in the same batch.
+
+    flush() waits for the submitted writes to be committed, and is called before reading the records written. An
+    in-memory SQLite database is not shared with the writer thread, so its writes are run when they are submitted.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql: TransactionBase,
+                 flush_interval: float = 0.25,
+                 max_batch_size: int = 500,
+                 write_behind: Optional[bool] = None):
+        self._sql = sql
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._write_behind = write_behind if write_behind is not None else not getattr(sql, "is_in_memory", False)
+        self._condition = threading.Condition()
+        # Pending writes, as (sequence number, submission time, write, coalesce key)
+        self._pending: Deque[Tuple[int, float, SQLWrite, Optional[Hashable]]] = deque()
+        self._submitted_seq = 0
+        self._written_seq = 0
+        self._flush_requests = 0
+        self._stopping = False
+        self._writer_thread: Optional[threading.Thread] = None
+        # Metrics
+        self._max_queue_depth = 0
+        self._batches_count = 0
+        self._writes_count = 0
+        self._coalesced_writes_count = 0
+        self._failed_writes_count = 0
+        self._last_flush_time = 0.0
+        self._max_flush_time = 0.0
+        self._total_flush_time = 0.0
+
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def submit(self, write: SQLWrite, coalesce_key: Optional[Hashable] = None):
+        if not self._write_behind:
+            self._write_batch([write])
+            return
+        with self._condition:
+            self._submitted_seq += 1
+            self._pending.append((self._submitted_seq, time.monotonic(), write, coalesce_key))
+            self._max_queue_depth = max(self._max_queue_depth, len(self._pending))
+            self._start_writer_thread()
+            if len(self._pending) == 1 or len(self._pending) >= self._max_batch_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the writes submitted so far to be committed. Returns False if they were not committed in time.
+        """
+        with self._condition:
+            target_seq = self._submitted_seq
+            if self._written_seq >= target_seq:
+                return True
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(lambda: self._written_seq >= target_seq, timeout)
+            finally:
+                self._flush_requests -= 1
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Writes the pending writes and stops the writer thread. The thread is started again by the next write.
+        """
+        with self._condition:
+            writer_thread = self._writer_thread
+            self._stopping = True
+            self._condition.notify_all()
+        if writer_thread is not None:
+            writer_thread.join(timeout)
+        with self._condition:
+            self._writer_thread = None
+            self._stopping = False
+
+    def get_metrics(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "batches": self._batches_count,
+            "writes": self._writes_count,
+            "coalesced_writes": self._coalesced_writes_count,
+            "failed_writes": self._failed_writes_count,
+            "last_flush_time": self._last_flush_time,
+            "mean_flush_time": self._total_flush_time / self._batches_count if self._batches_count else 0.0,
+            "max_flush_time": self._max_flush_time,
+        }
+
+    def _start_writer_thread(self):
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._run, name="SQLWriter", daemon=True)
+            self._writer_thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            last_seq = batch[-1][0]
+            last_write_index = {key: i for i, (_, _, _, key) in enumerate(batch) if key is not None}
+            writes = [write for i, (_, _, write, key) in enumerate(batch) if key is None or last_write_index[key] == i]
+            self._coalesced_writes_count += len(batch) - len(writes)
+            self._write_batch(writes)
+            with self._condition:
+                self._written_seq = last_seq
+                self._condition.notify_all()
+
+    def _next_batch(self) -> Optional[List[Tuple[int, float, SQLWrite, Optional[Hashable]]]]:
+        with self._condition:
+            while not self._pending:
+                if self._stopping:
+                    return None
+                self._condition.wait()
+            deadline = self._pending[0][1] + self._flush_interval
+            while (len(self._pending) < self._max_batch_size
+                   and not self._stopping
+                   and self._flush_requests == 0
+                   and time.monotonic() < deadline):
+                self._condition.wait(deadline - time.monotonic())
+            return [self._pending.popleft() for _ in range(min(len(self._pending), self._max_batch_size))]
+
+    def _write_batch(self, writes: List[SQLWrite]):
+        start_time = time.perf_counter()
+        try:
+            self._run_writes(writes)
+        except Exception:
+            if len(writes) == 1:
+                self._failed_writes_count += 1
+                self.logger().error("Error writing to the database.", exc_info=True)
+            else:
+                # Write them in separate transactions, so that a failed write does not discard the others
+                self.logger().warning("Error writing a batch to the database. Writing its records one by one.",
+                                      exc_info=True)
+                for write in writes:
+                    try:
+                        self._run_writes([write])
+                    except Exception:
+                        self._failed_writes_count += 1
+                        self.logger().error("Error writing to the database.", exc_info=True)
+        flush_time = time.perf_counter() - start_time
+        self._batches_count += 1
+        self._writes_count += len(writes)
+        self._last_flush_time = flush_time
+        self._total_flush_time += flush_time
+        self._max_flush_time = max(self._max_flush_time, flush_time)
+
+    def _run_writes(self, writes: List[SQLWrite]):
+        with self._sql.get_new_session() as session:
+            with session.begin():
+                for write in writes:
+                    write(session)
@@ -35,7 +35,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StopExecutorAction,
     StoreExecutorAction,
 )
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, ExecutorsChangeSet
 
 
 class StrategyV2ConfigBase(BaseClientModel):
@@ -312,6 +312,8 @@ class StrategyV2Base(ScriptStrategyBase):
                 controller_report = self.controller_reports.get(controller_id, {})
                 controller.executors_info = controller_report.get("executors", [])
                 controller.positions_held = controller_report.get("positions", [])
+                controller.executors_changes = controller.executors_changes.merge(
+                    controller_report.get("executors_changes", ExecutorsChangeSet()))
                 controller.executors_update_event.set()
         except Exception as e:
             self.logger().error(f"Error updating controller reports: {e}", exc_info=True)
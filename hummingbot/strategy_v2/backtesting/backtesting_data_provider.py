@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -11,6 +11,7 @@ from hummingbot.core.data_type.common import LazyDict, PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import CandlesIndicators, StreamingIndicator
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
 # Set up logging
@@ -25,13 +26,16 @@ class BacktestingDataProvider(MarketDataProvider):
                            "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid", "injective_v2_perpetual", "injective_v2"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
-        super().__init__(connectors)
+    def __init__(self, connectors: Dict[str, ConnectorBase], use_candles_store: bool = True):
+        super().__init__(connectors, use_candles_store=use_candles_store)
         self.start_time = None
         self.end_time = None
         self.prices = {}
         self._time = None
         self.trading_rules = {}
+        # Time range requested for each candles feed. The candles of a feed can end before the end of its range (e.g.
+        # when the end time is not aligned to the interval), so the range is what tells if the feed can be reused.
+        self.candles_feeds_ranges: Dict[str, Tuple[int, int]] = {}
         self.conn_settings = AllConnectorSettings.get_connector_settings()
         self.connectors = LazyDict[str, Optional[ConnectorBase]](
             lambda name: self.get_connector(name) if (
@@ -93,12 +97,14 @@ class BacktestingDataProvider(MarketDataProvider):
         # existing_feed = self.ensure_epoch_index(existing_feed)
 
         if not existing_feed.empty:
-            existing_feed_start_time = existing_feed["timestamp"].min()
-            existing_feed_end_time = existing_feed["timestamp"].max()
+            existing_feed_start_time, existing_feed_end_time = self.candles_feeds_ranges.get(
+                key, (existing_feed["timestamp"].min(), existing_feed["timestamp"].max()))
             if existing_feed_start_time <= self.start_time and existing_feed_end_time >= self.end_time:
                 return existing_feed
         # Create a new feed or restart the existing one with updated max_records
         candle_feed = CandlesFactory.get_candle(config)
+        if self.candles_store is not None:
+            candle_feed.candles_store = self.candles_store
         candles_buffer = config.max_records * CandlesBase.interval_to_seconds[config.interval]
         candles_df = await candle_feed.get_historical_candles(config=HistoricalCandlesConfig(
             connector_name=config.connector,
@@ -110,6 +116,7 @@ class BacktestingDataProvider(MarketDataProvider):
         # TODO: fix pandas-ta improper float index slicing to allow us to use float indexes
         # candles_df = self.ensure_epoch_index(candles_df)
         self.candles_feeds[key] = candles_df
+        self.candles_feeds_ranges[key] = (self.start_time - candles_buffer, self.end_time)
         return candles_df
 
     def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
@@ -124,6 +131,24 @@ class BacktestingDataProvider(MarketDataProvider):
         candles_df = self.candles_feeds.get(f"{connector_name}_{trading_pair}_{interval}")
         return candles_df[(candles_df["timestamp"] >= self.start_time) & (candles_df["timestamp"] <= self.end_time)]
 
+    def get_candles_indicators(self, connector_name: str, trading_pair: str, interval: str,
+                               indicators: List[StreamingIndicator], max_records: int = 500) -> CandlesIndicators:
+        """
+        Retrieves the streaming indicators of the backtesting candles for a trading pair. The indicators keep the
+        history of the whole backtesting period, like the candles returned by get_candles_df.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param indicators: List of streaming indicators
+        :param max_records: int
+        :return: CandlesIndicators instance.
+        """
+        candles_df = self.get_candles_df(connector_name, trading_pair, interval, max_records)
+        candles_indicators = self._get_or_create_candles_indicators(connector_name, trading_pair, interval,
+                                                                    indicators, max(max_records, len(candles_df)))
+        candles_indicators.update(candles_df[CandlesBase.columns].to_numpy(dtype=float))
+        return candles_indicators
+
     def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
         """
         Retrieves the price for a trading pair from the specified connector based on the price type.
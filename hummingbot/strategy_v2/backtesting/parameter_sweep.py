@@ -0,0 +1,247 @@
+import asyncio
+import csv
+import itertools
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+
+logger = logging.getLogger(__name__)
+
+# Handles of the shared memory blocks attached by a worker process, kept alive for the life of the worker
+_worker_shared_memory: List[SharedMemory] = []
+_worker_engine: Optional[BacktestingEngineBase] = None
+
+
+class SharedCandlesFeed:
+    """
+    Candles DataFrame stored as a single float64 block in shared memory. Worker processes attach to the block and
+    build a DataFrame over it without copying the data.
+    """
+
+    def __init__(self, name: str, shape: Tuple[int, int], columns: List[str]):
+        self.name = name
+        self.shape = shape
+        self.columns = columns
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> Tuple["SharedCandlesFeed", SharedMemory]:
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+        shared_memory = SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=np.float64, buffer=shared_memory.buf)[:] = values
+        return cls(name=shared_memory.name, shape=values.shape, columns=list(df.columns)), shared_memory
+
+    def attach(self) -> Tuple[pd.DataFrame, SharedMemory]:
+        shared_memory = SharedMemory(name=self.name)
+        values = np.ndarray(self.shape, dtype=np.float64, buffer=shared_memory.buf)
+        values.flags.writeable = False
+        return pd.DataFrame(values, columns=self.columns, copy=False), shared_memory
+
+
+def _initialize_worker(engine_class: Type[BacktestingEngineBase],
+                       shared_feeds: Dict[str, SharedCandlesFeed],
+                       feeds_ranges: Dict[str, Tuple[int, int]],
+                       trading_rules: Dict[str, Dict]):
+    global _worker_engine
+    _worker_engine = engine_class()
+    for key, shared_feed in shared_feeds.items():
+        candles_df, shared_memory = shared_feed.attach()
+        _worker_shared_memory.append(shared_memory)
+        _worker_engine.backtesting_data_provider.candles_feeds[key] = candles_df
+    _worker_engine.backtesting_data_provider.candles_feeds_ranges.update(feeds_ranges)
+    _worker_engine.backtesting_data_provider.trading_rules = trading_rules
+
+
+def _run_backtesting_in_worker(controller_config: ControllerConfigBase, start: int, end: int,
+                               backtesting_resolution: str, trade_cost: float) -> Dict[str, Any]:
+    backtesting_result = asyncio.run(_worker_engine.run_backtesting(
+        controller_config=controller_config,
+        start=start,
+        end=end,
+        backtesting_resolution=backtesting_resolution,
+        trade_cost=trade_cost,
+    ))
+    return backtesting_result["results"]
+
+
+class ParameterSweepRunner:
+    """
+    Runs the backtest of a controller config over a grid or a random sample of parameters. The candles and trading
+    rules are loaded once in the parent process, the candles are shared with the workers through shared memory and
+    the runs are spread over a process pool. The summarize_results dict of each run is streamed as soon as it finishes.
+
+    Usage:
+        runner = ParameterSweepRunner(base_config=config, start=start, end=end, max_workers=8)
+        parameter_sets = ParameterSweepRunner.grid({"bb_length": [50, 100], "stop_loss": [0.01, 0.02]})
+        results_df = await runner.run(parameter_sets, results_path="sweep.csv")
+    """
+
+    def __init__(self,
+                 base_config: ControllerConfigBase,
+                 start: int, end: int,
+                 backtesting_resolution: str = "1m",
+                 trade_cost: float = 0.0006,
+                 max_workers: Optional[int] = None,
+                 engine_class: Type[BacktestingEngineBase] = BacktestingEngineBase,
+                 mp_context: str = "spawn"):
+        self.base_config = base_config
+        self.start = start
+        self.end = end
+        self.backtesting_resolution = backtesting_resolution
+        self.trade_cost = trade_cost
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.engine_class = engine_class
+        self.mp_context = mp_context
+        self.engine = engine_class()
+
+    @staticmethod
+    def grid(parameter_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Expands a parameter grid into the list of all its combinations.
+        :param parameter_grid: Dict of parameter name to the list of values to test.
+        :return: List of parameter sets.
+        """
+        names = list(parameter_grid.keys())
+        return [dict(zip(names, values)) for values in itertools.product(*parameter_grid.values())]
+
+    @staticmethod
+    def random_search(parameter_space: Dict[str, Union[List[Any], Tuple[Any, Any]]], n_samples: int,
+                      seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Samples parameter sets from a parameter space. Lists are sampled as a choice of values, tuples as a uniform
+        distribution between (low, high). Integer bounds sample integers and Decimal bounds sample Decimals.
+        :param parameter_space: Dict of parameter name to the values or the bounds to sample from.
+        :param n_samples: Number of parameter sets to sample.
+        :param seed: Seed of the random generator.
+        :return: List of parameter sets.
+        """
+        rng = random.Random(seed)
+        parameter_sets = []
+        for _ in range(n_samples):
+            parameter_set = {}
+            for name, space in parameter_space.items():
+                if isinstance(space, tuple):
+                    low, high = space
+                    if isinstance(low, int) and isinstance(high, int):
+                        parameter_set[name] = rng.randint(low, high)
+                    elif isinstance(low, Decimal) or isinstance(high, Decimal):
+                        parameter_set[name] = Decimal(str(rng.uniform(float(low), float(high))))
+                    else:
+                        parameter_set[name] = rng.uniform(low, high)
+                else:
+                    parameter_set[name] = rng.choice(space)
+            parameter_sets.append(parameter_set)
+        return parameter_sets
+
+    def build_config(self, parameters: Dict[str, Any]) -> ControllerConfigBase:
+        """
+        Creates a new controller config from the base config with the parameters overridden and validated.
+        """
+        config_data = self.base_config.model_dump()
+        config_data.pop("id", None)
+        config_data.update(parameters)
+        return type(self.base_config)(**config_data)
+
+    async def load_market_data(self, controller_configs: List[ControllerConfigBase]):
+        """
+        Fetches the trading rules and every candles feed required by the controller configs once, using the largest
+        max_records requested for each feed.
+        """
+        data_provider = self.engine.backtesting_data_provider
+        data_provider.update_backtesting_time(self.start, self.end)
+        candles_configs = {}
+        for controller_config in controller_configs:
+            await data_provider.initialize_trading_rules(controller_config.connector_name)
+            controller_class = controller_config.get_controller_class()
+            controller = controller_class(config=controller_config.model_copy(deep=True),
+                                          market_data_provider=data_provider, actions_queue=None)
+            backtesting_candles_config = CandlesConfig(connector=controller_config.connector_name,
+                                                       trading_pair=controller_config.trading_pair,
+                                                       interval=self.backtesting_resolution)
+            for candles_config in controller.config.candles_config + [backtesting_candles_config]:
+                key = data_provider._generate_candle_feed_key(candles_config)
+                if key not in candles_configs or candles_configs[key].max_records < candles_config.max_records:
+                    candles_configs[key] = candles_config
+        for candles_config in candles_configs.values():
+            await data_provider.initialize_candles_feed(candles_config)
+
+    async def stream(self, parameter_sets: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Runs the backtests of all the parameter sets in the process pool and yields one row per run, with the run id,
+        the parameters, the summarized results and the error of the run if it failed, in the order the runs finish.
+        """
+        controller_configs = [self.build_config(parameters) for parameters in parameter_sets]
+        await self.load_market_data(controller_configs)
+        data_provider = self.engine.backtesting_data_provider
+        shared_feeds = {}
+        feeds_ranges = {}
+        shared_memory_blocks = []
+        try:
+            for key, candles_df in data_provider.candles_feeds.items():
+                shared_feeds[key], shared_memory = SharedCandlesFeed.from_dataframe(candles_df)
+                shared_memory_blocks.append(shared_memory)
+                # load_market_data made sure every feed covers the sweep, so the workers never fetch them again
+                feeds_ranges[key] = data_provider.candles_feeds_ranges.get(key, (self.start, self.end))
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, max(len(controller_configs), 1)),
+                                     mp_context=get_context(self.mp_context),
+                                     initializer=_initialize_worker,
+                                     initargs=(self.engine_class, shared_feeds, feeds_ranges,
+                                               data_provider.trading_rules)) as pool:
+                futures = {
+                    loop.run_in_executor(pool, _run_backtesting_in_worker, controller_config, self.start, self.end,
+                                         self.backtesting_resolution, self.trade_cost): run_id
+                    for run_id, controller_config in enumerate(controller_configs)
+                }
+                pending = set(futures.keys())
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        run_id = futures[future]
+                        row = {"run_id": run_id, **parameter_sets[run_id]}
+                        try:
+                            row.update(future.result())
+                            row["error"] = None
+                        except Exception as e:
+                            logger.error(f"Backtest of parameters {parameter_sets[run_id]} failed: {e}")
+                            row["error"] = str(e)
+                        yield row
+        finally:
+            for shared_memory in shared_memory_blocks:
+                shared_memory.close()
+                shared_memory.unlink()
+
+    async def run(self, parameter_sets: List[Dict[str, Any]], results_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Runs the sweep and collects the results table. If results_path is provided, each row is appended to that csv
+        file as soon as its run finishes.
+        """
+        rows = []
+        writer = None
+        results_file = open(results_path, "w", newline="") if results_path else None
+        try:
+            if results_file is not None:
+                parameter_names = list(dict.fromkeys(name for parameters in parameter_sets for name in parameters))
+                result_names = list(BacktestingEngineBase.summarize_results([]).keys())
+                writer = csv.DictWriter(results_file, fieldnames=["run_id"] + parameter_names + result_names + ["error"])
+                writer.writeheader()
+            async for row in self.stream(parameter_sets):
+                rows.append(row)
+                if writer is not None:
+                    writer.writerow(row)
+                    results_file.flush()
+        finally:
+            if results_file is not None:
+                results_file.close()
+        return pd.DataFrame(rows).sort_values("run_id").reset_index(drop=True) if rows else pd.DataFrame()
@@ -0,0 +1,426 @@
+import heapq
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import DirectionalTradingControllerBase
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+def _first_true(mask: np.ndarray) -> Optional[int]:
+    if mask.size == 0:
+        return None
+    idx = int(np.argmax(mask))
+    return idx if mask[idx] else None
+
+
+class CandleExtremaIndex:
+    """
+    Precomputed per-block maxima and minima of a price column. Answers "first row in [start, stop) where the price
+    crosses a threshold" by scanning the block extrema first and only touching the raw values of the partial blocks
+    at the edges and of the block that contains the crossing.
+    """
+
+    def __init__(self, values: np.ndarray, block_size: int = 256):
+        self.values = values
+        self.block_size = block_size
+        pad = (-len(values)) % block_size
+        self.block_max = np.fmax.reduce(
+            np.concatenate([values, np.full(pad, -np.inf)]).reshape(-1, block_size), axis=1)
+        self.block_min = np.fmin.reduce(
+            np.concatenate([values, np.full(pad, np.inf)]).reshape(-1, block_size), axis=1)
+
+    def first_above(self, threshold: float, start: int, stop: int, inclusive: bool = False) -> Optional[int]:
+        if inclusive:
+            return self._search(start, stop, lambda x: x >= threshold, self.block_max)
+        return self._search(start, stop, lambda x: x > threshold, self.block_max)
+
+    def first_below(self, threshold: float, start: int, stop: int, inclusive: bool = False) -> Optional[int]:
+        if inclusive:
+            return self._search(start, stop, lambda x: x <= threshold, self.block_min)
+        return self._search(start, stop, lambda x: x < threshold, self.block_min)
+
+    def _search(self, start: int, stop: int, predicate, blocks: np.ndarray) -> Optional[int]:
+        if start >= stop:
+            return None
+        bs = self.block_size
+        head_end = min(stop, (start // bs + 1) * bs)
+        idx = _first_true(predicate(self.values[start:head_end]))
+        if idx is not None:
+            return start + idx
+        if head_end >= stop:
+            return None
+        first_block = head_end // bs
+        last_block = (stop - 1) // bs
+        block = _first_true(predicate(blocks[first_block:last_block + 1]))
+        if block is None:
+            return None
+        block_start = (first_block + block) * bs
+        idx = _first_true(predicate(self.values[block_start:min(stop, block_start + bs)]))
+        # A hit in the last block can lie beyond stop, in that case there is no crossing inside the range
+        return block_start + idx if idx is not None else None
+
+
+class VectorizedPositionSimulation:
+    """
+    Columnar result of a position executor simulation. Holds one value per candle from the creation row up to the
+    close row, so the executor info at any timestamp is a single array lookup.
+    """
+
+    def __init__(self, config: PositionExecutorConfig, start_row: int, timestamps: np.ndarray, close: np.ndarray,
+                 net_pnl_pct: np.ndarray, filled_amount_quote: np.ndarray, trade_cost: float,
+                 close_type: CloseType):
+        self.config = config
+        self.start_row = start_row
+        self.close_row = start_row + len(timestamps) - 1
+        self.timestamps = timestamps
+        self.close = close
+        self.net_pnl_pct = net_pnl_pct
+        self.net_pnl_quote = net_pnl_pct * filled_amount_quote
+        self.cum_fees_quote = trade_cost * filled_amount_quote
+        self.filled_amount_quote = filled_amount_quote.copy()
+        self.filled_amount_quote[-1] = self.filled_amount_quote[-1] * 2
+        self.close_type = close_type
+
+    def get_executor_info_at_row(self, row: int) -> ExecutorInfo:
+        pos = min(row, self.close_row) - self.start_row
+        is_active = pos < len(self.timestamps) - 1
+        filled_amount_quote = self.filled_amount_quote[pos]
+        return ExecutorInfo(
+            id=self.config.id,
+            timestamp=self.config.timestamp,
+            type=self.config.type,
+            close_timestamp=None if is_active else float(self.timestamps[pos]),
+            close_type=None if is_active else self.close_type,
+            status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
+            config=self.config,
+            net_pnl_pct=Decimal(self.net_pnl_pct[pos]),
+            net_pnl_quote=Decimal(self.net_pnl_quote[pos]),
+            cum_fees_quote=Decimal(self.cum_fees_quote[pos]),
+            filled_amount_quote=Decimal(filled_amount_quote),
+            is_active=is_active,
+            is_trading=filled_amount_quote > 0 and is_active,
+            custom_info={
+                "close_price": self.close[pos],
+                "level_id": self.config.level_id,
+                "side": self.config.side,
+                "current_position_average_price": float(self.config.entry_price),
+            }
+        )
+
+    def to_executor_simulation(self) -> ExecutorSimulation:
+        """
+        Materializes the simulation as the DataFrame based ExecutorSimulation used by BacktestingEngineBase.
+        """
+        df = pd.DataFrame({
+            "timestamp": self.timestamps,
+            "close": self.close,
+            "net_pnl_pct": self.net_pnl_pct,
+            "net_pnl_quote": self.net_pnl_quote,
+            "cum_fees_quote": self.cum_fees_quote,
+            "filled_amount_quote": self.filled_amount_quote,
+            "current_position_average_price": float(self.config.entry_price),
+        }, index=pd.Index(self.timestamps, name="epoch_seconds"))
+        return ExecutorSimulation(config=self.config, executor_simulation=df, close_type=self.close_type)
+
+
+class DataFrameSimulationAdapter:
+    """
+    Exposes a DataFrame based ExecutorSimulation (e.g. DCA executors) through the row based interface used by the
+    vectorized engine.
+    """
+
+    def __init__(self, simulation: ExecutorSimulation, start_row: int, timestamps: np.ndarray):
+        self.simulation = simulation
+        self.config = simulation.config
+        self.start_row = start_row
+        self.close_row = int(np.searchsorted(timestamps, simulation.executor_simulation.index.max(), side="right")) - 1
+        self._timestamps = timestamps
+
+    def get_executor_info_at_row(self, row: int) -> ExecutorInfo:
+        return self.simulation.get_executor_info_at_timestamp(self._timestamps[row])
+
+
+class VectorizedBacktestingEngine(BacktestingEngineBase):
+    """
+    Columnar backtesting engine. Runs over NumPy arrays of timestamps and OHLCV instead of iterating the processed
+    features DataFrame, resolves triple barrier exits of position executors with precomputed block extrema instead of
+    per-executor DataFrame copies, and only calls back into the controller on the rows where its decision can change:
+    when one of the signal columns changes, when an executor finishes, when a cooldown expires and on the last row.
+
+    The results are the same as the ones of BacktestingEngineBase for controllers whose executor actions depend only
+    on the signal columns, the executors state and the cooldown time (e.g. the directional trading controllers). For
+    the other controllers (non directional ones, missing or constant signal columns, custom action proposals) the
+    controller is called back on every row, which keeps the results of BacktestingEngineBase and still resolves the
+    executors over the candle arrays.
+    """
+    # Relative margin applied to the take profit price bound so float rounding of the cumulative returns never
+    # makes the bound tighter than the exact barrier.
+    TP_BOUND_MARGIN = 1e-8
+    # Methods of DirectionalTradingControllerBase whose default implementations only act on signal changes, executors
+    # state and cooldowns. Controllers overriding any of them are called back on every row.
+    ACTION_METHODS = ("determine_executor_actions", "create_actions_proposal", "can_create_executor",
+                      "stop_actions_proposal")
+
+    def __init__(self, signal_columns: Tuple[str, ...] = ("signal",), block_size: int = 256):
+        super().__init__()
+        self.signal_columns = signal_columns
+        self.block_size = block_size
+
+    async def simulate_execution(self, trade_cost: float) -> list:
+        """
+        Simulates the controller over historical data, considering trading costs.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        self.active_executor_simulations: List[Union[VectorizedPositionSimulation, DataFrameSimulationAdapter]] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        n_rows = len(processed_features)
+        if n_rows == 0:
+            return self.controller.executors_info
+
+        self._features = processed_features
+        self._columns: Dict[str, np.ndarray] = {col: processed_features[col].to_numpy() for col in processed_features.columns}
+        self._timestamps = processed_features["timestamp"].to_numpy(dtype=float)
+        self._close = processed_features["close"].to_numpy(dtype=float)
+        self._high = processed_features["high"].to_numpy(dtype=float)
+        self._low = processed_features["low"].to_numpy(dtype=float)
+        self._close_index = CandleExtremaIndex(self._close, self.block_size)
+        self._high_index = CandleExtremaIndex(self._high, self.block_size)
+        self._low_index = CandleExtremaIndex(self._low, self.block_size)
+
+        if self.requires_every_row():
+            pending_rows = list(range(n_rows))
+        else:
+            pending_rows = list(self.signal_change_rows())
+            pending_rows.append(n_rows - 1)
+        heapq.heapify(pending_rows)
+        last_row = -1
+        while pending_rows:
+            row = heapq.heappop(pending_rows)
+            if row <= last_row:
+                continue
+            last_row = row
+            self.update_state_at_row(row)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    simulation = self.simulate_executor_at_row(action.executor_config, row, trade_cost)
+                    if simulation is not None:
+                        self.active_executor_simulations.append(simulation)
+                        for wake_up_row in self.wake_up_rows(simulation, row):
+                            heapq.heappush(pending_rows, wake_up_row)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action_at_row(action, row)
+        return self.controller.executors_info
+
+    def requires_every_row(self) -> bool:
+        """
+        Returns True when the executor actions of the controller can change on rows where the signal columns don't,
+        so it has to be called back on every row: the controller is not a directional trading controller, it overrides
+        any of the methods that turn the signal into executor actions, or the signal columns are missing or constant
+        (e.g. market making controllers).
+        """
+        if not isinstance(self.controller, DirectionalTradingControllerBase):
+            return True
+        controller_class = type(self.controller)
+        if any(getattr(controller_class, method) is not getattr(DirectionalTradingControllerBase, method)
+               for method in self.ACTION_METHODS):
+            return True
+        signals = [self._columns.get(column) for column in self.signal_columns]
+        if any(values is None for values in signals):
+            return True
+        return all(bool((values == values[0]).all()) for values in signals)
+
+    def signal_change_rows(self) -> np.ndarray:
+        """
+        Returns the rows where any of the signal columns differs from the previous row, including the first one.
+        """
+        n_rows = len(self._timestamps)
+        changed = np.zeros(n_rows, dtype=bool)
+        changed[0] = True
+        for column in self.signal_columns:
+            values = self._columns.get(column)
+            if values is not None and n_rows > 1:
+                changed[1:] |= values[1:] != values[:-1]
+        return np.flatnonzero(changed)
+
+    def wake_up_rows(self, simulation: Union[VectorizedPositionSimulation, DataFrameSimulationAdapter],
+                     creation_row: int) -> List[int]:
+        """
+        Rows where the controller has to be called back because of a new executor: the row where it is reported as
+        finished and the rows around the end of the cooldown period.
+        """
+        n_rows = len(self._timestamps)
+        rows = [max(simulation.close_row, creation_row + 1)]
+        cooldown_time = getattr(self.controller.config, "cooldown_time", None)
+        if cooldown_time is not None:
+            cooldown_row = int(np.searchsorted(self._timestamps, simulation.config.timestamp + cooldown_time, side="left"))
+            rows.extend([cooldown_row, cooldown_row + 1])
+        return [row for row in rows if row < n_rows]
+
+    def update_state_at_row(self, row: int):
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        timestamp = self._timestamps[row]
+        self.controller.market_data_provider.prices = {key: Decimal(float(self._columns["close_bt"][row]))}
+        self.controller.market_data_provider._time = timestamp
+        self.controller.processed_data.update({col: values[row] for col, values in self._columns.items()})
+        self.update_executors_info_at_row(row)
+
+    def update_executors_info_at_row(self, row: int):
+        active_executors_info = []
+        active_simulations = []
+        for simulation in self.active_executor_simulations:
+            executor_info = simulation.get_executor_info_at_row(row)
+            if executor_info.status == RunnableStatus.TERMINATED:
+                self.stopped_executors_info.append(executor_info)
+            else:
+                active_executors_info.append(executor_info)
+                active_simulations.append(simulation)
+        self.active_executor_simulations = active_simulations
+        self.controller.executors_info = active_executors_info + self.stopped_executors_info
+
+    def handle_stop_action_at_row(self, action: StopExecutorAction, row: int):
+        timestamp = self._timestamps[row]
+        for simulation in self.active_executor_simulations:
+            if simulation.config.id == action.executor_id:
+                executor_info = simulation.get_executor_info_at_row(row)
+                executor_info.status = RunnableStatus.TERMINATED
+                executor_info.close_type = CloseType.EARLY_STOP
+                executor_info.is_active = False
+                executor_info.close_timestamp = timestamp
+                self.stopped_executors_info.append(executor_info)
+                self.active_executor_simulations.remove(simulation)
+                break
+
+    def simulate_executor_at_row(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], row: int,
+                                 trade_cost: float) -> Optional[Union[VectorizedPositionSimulation, DataFrameSimulationAdapter]]:
+        """
+        Simulates an executor created at the given row. Position executors are resolved over the candle arrays, other
+        executor types fall back to the DataFrame simulators of BacktestingEngineBase.
+        """
+        if isinstance(config, PositionExecutorConfig):
+            return self.simulate_position_executor(config, row, trade_cost)
+        simulation = self.simulate_executor(config, self._features.iloc[row:], trade_cost)
+        if simulation is None or simulation.close_type == CloseType.FAILED or simulation.executor_simulation.empty:
+            return None
+        return DataFrameSimulationAdapter(simulation, row, self._timestamps)
+
+    def simulate_position_executor(self, config: PositionExecutorConfig, row: int,
+                                   trade_cost: float) -> VectorizedPositionSimulation:
+        """
+        Resolves the triple barrier of a position executor created at the given row. Mirrors
+        PositionExecutorSimulator: the entry, stop loss and time limit rows come from the block extrema searches and the
+        net pnl is only computed over the window that can still contain the exit.
+        """
+        timestamps = self._timestamps
+        close = self._close
+        n_rows = len(timestamps)
+        is_buy = config.side == TradeType.BUY
+        side_multiplier = 1 if is_buy else -1
+        barriers = config.triple_barrier_config
+
+        # Entry row
+        if barriers.open_order_type.is_limit_type():
+            entry_price = float(config.entry_price)
+            if is_buy:
+                entry_row = self._close_index.first_below(entry_price, row, n_rows, inclusive=True)
+            else:
+                entry_row = self._close_index.first_above(entry_price, row, n_rows, inclusive=True)
+        else:
+            entry_row = row
+
+        # Time limit
+        tl_timestamp = config.timestamp + barriers.time_limit if barriers.time_limit else timestamps[-1]
+        tl_row = int(np.searchsorted(timestamps, tl_timestamp, side="right")) - 1
+
+        if entry_row is None:
+            window_end = max(tl_row, row)
+            return VectorizedPositionSimulation(
+                config=config, start_row=row, timestamps=timestamps[row:window_end + 1],
+                close=close[row:window_end + 1], net_pnl_pct=np.zeros(window_end + 1 - row),
+                filled_amount_quote=np.zeros(window_end + 1 - row), trade_cost=trade_cost,
+                close_type=CloseType.TIME_LIMIT)
+
+        entry_close = close[entry_row]
+
+        # Stop loss, compared against the candle extremes
+        sl_row = None
+        if barriers.stop_loss:
+            sl_price = entry_close * (1 - float(barriers.stop_loss) * side_multiplier)
+            if is_buy:
+                sl_row = self._low_index.first_below(sl_price, row, tl_row + 1, inclusive=True)
+            else:
+                sl_row = self._high_index.first_above(sl_price, row, tl_row + 1, inclusive=True)
+
+        # Upper bound for the take profit row, using a slightly wider barrier on the close price
+        window_end = tl_row if sl_row is None else sl_row
+        tp = float(barriers.take_profit) if barriers.take_profit else None
+        if tp and entry_row <= window_end:
+            if is_buy:
+                tp_bound_price = entry_close * (1 + tp + trade_cost) * (1 + self.TP_BOUND_MARGIN)
+                tp_bound_row = self._close_index.first_above(tp_bound_price, entry_row, window_end + 1)
+            else:
+                tp_bound_price = entry_close * (1 - tp - trade_cost) * (1 - self.TP_BOUND_MARGIN)
+                tp_bound_row = self._close_index.first_below(tp_bound_price, entry_row, window_end + 1)
+            if tp_bound_row is not None:
+                window_end = tp_bound_row
+        window_end = max(window_end, row)
+
+        # Net pnl over the window, with the same float operations as the DataFrame simulator
+        window_size = window_end + 1 - row
+        net_pnl_pct = np.zeros(window_size)
+        filled_amount_quote = np.zeros(window_size)
+        if entry_row <= window_end:
+            entry_close_window = close[entry_row:window_end + 1]
+            returns = np.zeros(len(entry_close_window))
+            returns[1:] = entry_close_window[1:] / entry_close_window[:-1] - 1
+            net_pnl_pct[entry_row - row:] = (np.cumprod(1 + returns) - 1) * side_multiplier - trade_cost
+            filled_amount_quote[entry_row - row:] = float(config.amount) * entry_close
+
+        tp_row = None
+        if tp:
+            tp_offset = _first_true(net_pnl_pct > tp)
+            tp_row = row + tp_offset if tp_offset is not None else None
+
+        ts_row = None
+        if barriers.trailing_stop:
+            trigger_pct = float(barriers.trailing_stop.activation_price)
+            delta_pct = float(barriers.trailing_stop.trailing_delta)
+            activated = np.maximum.accumulate(net_pnl_pct > trigger_pct)
+            trailing_stop = np.maximum.accumulate(net_pnl_pct - delta_pct)
+            ts_offset = _first_true(activated & (net_pnl_pct < trailing_stop))
+            ts_row = row + ts_offset if ts_offset is not None else None
+
+        candidates = [timestamps[r] for r in (tp_row, sl_row, ts_row) if r is not None] + [tl_timestamp]
+        close_timestamp = min(candidates)
+        if tp_row is not None and close_timestamp == timestamps[tp_row]:
+            close_type = CloseType.TAKE_PROFIT
+        elif sl_row is not None and close_timestamp == timestamps[sl_row]:
+            close_type = CloseType.STOP_LOSS
+        elif ts_row is not None and close_timestamp == timestamps[ts_row]:
+            close_type = CloseType.TRAILING_STOP
+        else:
+            close_type = CloseType.TIME_LIMIT
+        close_row = int(np.searchsorted(timestamps, close_timestamp, side="right")) - 1
+        close_offset = max(close_row, row) - row
+
+        return VectorizedPositionSimulation(
+            config=config, start_row=row, timestamps=timestamps[row:row + close_offset + 1],
+            close=close[row:row + close_offset + 1], net_pnl_pct=net_pnl_pct[:close_offset + 1],
+            filled_amount_quote=filled_amount_quote[:close_offset + 1], trade_cost=trade_cost,
+            close_type=close_type)
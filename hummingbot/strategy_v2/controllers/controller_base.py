@@ -13,7 +13,7 @@ from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import ExecutorAction
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, ExecutorsChangeSet
 from hummingbot.strategy_v2.models.position_config import InitialPositionConfig
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 from hummingbot.strategy_v2.utils.common import generate_unique_id
@@ -136,6 +136,9 @@ class ControllerBase(RunnableBase):
         super().__init__(update_interval=update_interval)
         self.config = config
         self.executors_info: List[ExecutorInfo] = []
+        # Executors created, updated and removed since the last control task, for the controllers that only process
+        # the changes instead of the executors_info list
+        self.executors_changes: ExecutorsChangeSet = ExecutorsChangeSet()
         self.positions_held: List[PositionSummary] = []
         self.market_data_provider: MarketDataProvider = market_data_provider
         self.actions_queue: asyncio.Queue = actions_queue
@@ -170,8 +173,12 @@ class ControllerBase(RunnableBase):
 
     async def control_task(self):
         if self.market_data_provider.ready and self.executors_update_event.is_set():
+            executors_changes = self.executors_changes
             await self.update_processed_data()
             executor_actions: List[ExecutorAction] = self.determine_executor_actions()
+            if self.executors_changes is executors_changes:
+                # Otherwise new changes were merged while updating the processed data, kept for the next task
+                self.executors_changes = ExecutorsChangeSet()
             if len(executor_actions) > 0:
                 self.logger().debug(f"Sending actions: {executor_actions}")
                 await self.send_actions(executor_actions)
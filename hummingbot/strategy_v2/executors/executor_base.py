@@ -1,6 +1,6 @@
 from decimal import Decimal
-from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -25,6 +25,9 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+
 
 class ExecutorBase(RunnableBase):
     """
@@ -47,15 +50,21 @@ class ExecutorBase(RunnableBase):
         self._held_position_orders = []  # Keep track of orders that become held positions
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
+        self._scheduler: Optional["ExecutorScheduler"] = None
+
+        # Last executor info built and the state it was built from (see executor_info)
+        self._order_events_count = 0
+        self._executor_info: Optional[ExecutorInfo] = None
+        self._executor_info_state: Optional[Tuple] = None
 
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = self._order_event_forwarder(self.process_order_created_event)
+        self._create_sell_order_forwarder = self._order_event_forwarder(self.process_order_created_event)
+        self._fill_order_forwarder = self._order_event_forwarder(self.process_order_filled_event)
+        self._complete_buy_order_forwarder = self._order_event_forwarder(self.process_order_completed_event)
+        self._complete_sell_order_forwarder = self._order_event_forwarder(self.process_order_completed_event)
+        self._cancel_order_forwarder = self._order_event_forwarder(self.process_order_canceled_event)
+        self._failed_order_forwarder = self._order_event_forwarder(self.process_order_failed_event)
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -107,29 +116,36 @@ class ExecutorBase(RunnableBase):
     def executor_info(self) -> ExecutorInfo:
         """
         Returns the executor info.
-        """
-        ei = ExecutorInfo(
-            id=self.config.id,
-            timestamp=self.config.timestamp,
-            type=self.config.type,
-            status=self.status,
-            close_type=self.close_type,
-            close_timestamp=self.close_timestamp,
-            config=self.config,
-            net_pnl_pct=self.net_pnl_pct,
-            net_pnl_quote=self.net_pnl_quote,
-            cum_fees_quote=self.cum_fees_quote,
-            filled_amount_quote=self.filled_amount_quote,
-            is_active=self.is_active,
-            is_trading=self.is_trading,
-            custom_info=self.get_custom_info(),
-            controller_id=self.config.controller_id,
-        )
-        ei.filled_amount_quote = ei.filled_amount_quote if not ei.filled_amount_quote.is_nan() else Decimal("0")
-        ei.net_pnl_quote = ei.net_pnl_quote if not ei.net_pnl_quote.is_nan() else Decimal("0")
-        ei.cum_fees_quote = ei.cum_fees_quote if not ei.cum_fees_quote.is_nan() else Decimal("0")
-        ei.net_pnl_pct = ei.net_pnl_pct if not ei.net_pnl_pct.is_nan() else Decimal("0")
-        return ei
+
+        The info is only built again when the executor state changed since the last call: the status, the close type,
+        the order events processed, the PnL, fees and filled amount, or the custom info state. Otherwise the same
+        instance is returned, so that the callers can tell that the executor did not change by identity.
+        """
+        net_pnl_quote = self._zero_if_nan(self.net_pnl_quote)
+        cum_fees_quote = self._zero_if_nan(self.cum_fees_quote)
+        filled_amount_quote = self._zero_if_nan(self.filled_amount_quote)
+        state = (self.status, self.close_type, self.close_timestamp, self._order_events_count, net_pnl_quote,
+                 cum_fees_quote, filled_amount_quote, self.executor_info_custom_state())
+        if self._executor_info is None or state != self._executor_info_state:
+            self._executor_info = ExecutorInfo(
+                id=self.config.id,
+                timestamp=self.config.timestamp,
+                type=self.config.type,
+                status=self.status,
+                close_type=self.close_type,
+                close_timestamp=self.close_timestamp,
+                config=self.config,
+                net_pnl_pct=self._zero_if_nan(self.net_pnl_pct),
+                net_pnl_quote=net_pnl_quote,
+                cum_fees_quote=cum_fees_quote,
+                filled_amount_quote=filled_amount_quote,
+                is_active=self.is_active,
+                is_trading=self.is_trading,
+                custom_info=self.get_custom_info(),
+                controller_id=self.config.controller_id,
+            )
+            self._executor_info_state = state
+        return self._executor_info
 
     def get_custom_info(self) -> Dict:
         """
@@ -138,6 +154,32 @@ class ExecutorBase(RunnableBase):
         """
         return {}
 
+    def executor_info_custom_state(self) -> Tuple:
+        """
+        Returns the values of the custom info that can change without an order event or a PnL change (e.g. the
+        market prices the executor tracks), so that the executor info is built again when they change. Returns an
+        empty tuple by default, and can be reimplemented by subclasses.
+        """
+        return ()
+
+    @staticmethod
+    def _zero_if_nan(value: Decimal) -> Decimal:
+        # NaN is the only value not equal to itself
+        return value if value == value else Decimal("0")
+
+    def _order_event_forwarder(self, process_event: Callable[[int, ConnectorBase, Any], None]) -> SourceInfoEventForwarder:
+        return SourceInfoEventForwarder(partial(self._process_order_event, process_event))
+
+    def _process_order_event(self,
+                             process_event: Callable[[int, ConnectorBase, Any], None],
+                             event_tag: int,
+                             market: ConnectorBase,
+                             event: Any):
+        self._order_events_count += 1
+        process_event(event_tag, market, event)
+        if self._scheduler is not None:
+            self._scheduler.wake(self)
+
     @staticmethod
     def is_perpetual_connector(connector_name: str):
         """
@@ -155,6 +197,21 @@ class ExecutorBase(RunnableBase):
             AllConnectorSettings.get_gateway_amm_connector_names()
         )
 
+    def set_scheduler(self, scheduler: "ExecutorScheduler"):
+        """
+        Sets the scheduler that runs the control task of the executor once started, instead of its own control loop.
+        """
+        self._scheduler = scheduler
+
+    def order_book_markets(self) -> List[Tuple[str, str]]:
+        """
+        Returns the connector name and trading pair of the order books the executor follows, so that the scheduler
+        runs its control task early when they are updated. Defaults to the connector and trading pair of the config.
+        """
+        connector_name = getattr(self.config, "connector_name", None)
+        trading_pair = getattr(self.config, "trading_pair", None)
+        return [(connector_name, trading_pair)] if connector_name and trading_pair else []
+
     def start(self):
         """
         Starts the executor and registers the events.
@@ -162,6 +219,12 @@ class ExecutorBase(RunnableBase):
         super().start()
         self.register_events()
 
+    def _start_control_loop(self):
+        if self._scheduler is not None:
+            self._scheduler.add(self)
+        else:
+            super()._start_control_loop()
+
     def stop(self):
         """
         Stops the executor and unregisters the events.
@@ -169,6 +232,8 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        if self._scheduler is not None:
+            self._scheduler.wake(self)
 
     async def on_start(self):
         """
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -28,7 +30,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors import CloseType
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, ExecutorsChangeSet, PerformanceReport
 
 
 class PositionHold:
@@ -157,15 +159,25 @@ class ExecutorOrchestrator:
                  strategy: "StrategyV2Base",
                  executors_update_interval: float = 1.0,
                  executors_max_retries: int = 10,
-                 initial_positions_by_controller: Optional[dict] = None):
+                 initial_positions_by_controller: Optional[dict] = None,
+                 executor_scheduler: Optional[ExecutorScheduler] = None):
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.executors_max_retries = executors_max_retries
+        # Runs the control tasks of all the executors, instead of a control loop task per executor
+        self.executor_scheduler = executor_scheduler or ExecutorScheduler()
         self.active_executors = {}
         self.positions_held = {}
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
+        # Last info of the active executors by controller, the performance aggregated from them, and the changes not
+        # reported yet (see _update_executors_info)
+        self._executors_info: Dict[str, Dict[ExecutorBase, ExecutorInfo]] = {}
+        self._executors_info_lists: Dict[str, List[ExecutorInfo]] = {}
+        self._executors_performance: Dict[str, PerformanceReport] = {}
+        self._updated_executors_info: Dict[str, Dict[ExecutorBase, ExecutorInfo]] = {}
+        self._removed_executors_ids: Dict[str, List[str]] = {}
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
@@ -301,6 +313,7 @@ class ExecutorOrchestrator:
                     for executor in executors_list]):
                 continue
             await asyncio.sleep(2.0)
+        self.executor_scheduler.stop()
         # Store all positions
         self.store_all_positions()
         # Clear executors and trigger garbage collection
@@ -397,6 +410,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.set_scheduler(self.executor_scheduler)
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -522,16 +536,86 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor info: {executor.executor_info} | Config: {executor.config}")
 
         self.active_executors[controller_id].remove(executor)
+        self._remove_executor_info(controller_id, executor)
         del executor
         # Trigger garbage collection after executor cleanup
 
+    def _update_executors_info(self):
+        """
+        Update the info of the active executors. The executors info is only built again when the executor changed
+        (see ExecutorBase.executor_info), so only the changed executors update the aggregated performance, with the
+        difference between their new and previous info, and are added to the changes reported to the controllers.
+        """
+        for controller_id in [controller_id for controller_id in self._executors_info
+                              if controller_id not in self.active_executors]:
+            for executor in list(self._executors_info[controller_id]):
+                self._remove_executor_info(controller_id, executor)
+
+        for controller_id, executors_list in self.active_executors.items():
+            executors_info = self._executors_info.setdefault(controller_id, {})
+            performance = self._executors_performance.setdefault(controller_id, PerformanceReport())
+            for executor in executors_list:
+                executor_info = executor.executor_info
+                previous_info = executors_info.get(executor)
+                if executor_info is previous_info:
+                    continue
+                if previous_info is not None:
+                    self._add_executor_performance(performance, previous_info, sign=-1)
+                self._add_executor_performance(performance, executor_info, sign=1)
+                executors_info[executor] = executor_info
+                self._updated_executors_info.setdefault(controller_id, {})[executor] = executor_info
+                self._executors_info_lists.pop(controller_id, None)
+            if len(executors_info) > len(executors_list):
+                # Executors removed from the active executors without storing them
+                active_executors = set(executors_list)
+                for executor in [executor for executor in executors_info if executor not in active_executors]:
+                    self._remove_executor_info(controller_id, executor)
+
+    def _remove_executor_info(self, controller_id: str, executor: ExecutorBase):
+        executor_info = self._executors_info.get(controller_id, {}).pop(executor, None)
+        if executor_info is None:
+            return
+        self._add_executor_performance(self._executors_performance[controller_id], executor_info, sign=-1)
+        self._updated_executors_info.get(controller_id, {}).pop(executor, None)
+        self._removed_executors_ids.setdefault(controller_id, []).append(executor_info.id)
+        self._executors_info_lists.pop(controller_id, None)
+
+    @staticmethod
+    def _add_executor_performance(report: PerformanceReport, executor_info: ExecutorInfo, sign: int):
+        """
+        Add (sign 1) or subtract (sign -1) the contribution of an active executor to the aggregated performance.
+        """
+        if not executor_info.is_done:
+            report.unrealized_pnl_quote += sign * executor_info.net_pnl_quote
+        else:
+            report.realized_pnl_quote += sign * executor_info.net_pnl_quote
+            if executor_info.close_type:
+                count = report.close_type_counts.get(executor_info.close_type, 0) + sign
+                if count:
+                    report.close_type_counts[executor_info.close_type] = count
+                else:
+                    del report.close_type_counts[executor_info.close_type]
+        report.volume_traded += sign * executor_info.filled_amount_quote
+
+    def _pop_executors_changes(self, controller_id: str) -> ExecutorsChangeSet:
+        updated = self._updated_executors_info.pop(controller_id, None)
+        removed = self._removed_executors_ids.pop(controller_id, None)
+        if not updated and not removed:
+            return ExecutorsChangeSet()
+        # The executors info are already validated
+        return ExecutorsChangeSet.model_construct(updated=list(updated.values()) if updated else [],
+                                                  removed=removed or [])
+
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
-        Generate a report of all executors.
+        Generate a report of all executors. The list of a controller is only built again when its executors changed.
         """
+        self._update_executors_info()
         report = {}
-        for controller_id, executors_list in self.active_executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+        for controller_id in self.active_executors:
+            if controller_id not in self._executors_info_lists:
+                self._executors_info_lists[controller_id] = list(self._executors_info[controller_id].values())
+            report[controller_id] = self._executors_info_lists[controller_id]
         return report
 
     def get_positions_report(self) -> Dict[str, List[PositionSummary]]:
@@ -551,7 +635,8 @@ class ExecutorOrchestrator:
     def get_all_reports(self) -> Dict[str, Dict]:
         """
         Generate a unified report containing executors, positions, and performance for all controllers.
-        Returns a dictionary with controller_id as key and a dict containing all reports as value.
+        Returns a dictionary with controller_id as key and a dict containing all reports as value. The executors
+        changes are the executors created, updated and removed since the previous report.
         """
         # Update any pending position holds from done executors
         self._update_positions_from_done_executors()
@@ -570,7 +655,8 @@ class ExecutorOrchestrator:
             controller_id: {
                 "executors": executors_report.get(controller_id, []),
                 "positions": positions_report.get(controller_id, []),
-                "performance": self.generate_performance_report(controller_id)
+                "performance": self.generate_performance_report(controller_id),
+                "executors_changes": self._pop_executors_changes(controller_id),
             }
             for controller_id in all_controller_ids
         }
@@ -585,20 +671,16 @@ class ExecutorOrchestrator:
         report.volume_traded = cached_report.volume_traded
         report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
 
-        # Add data from active executors
-        active_executors = self.active_executors.get(controller_id, [])
-        positions = self.positions_held.get(controller_id, [])
-
-        for executor in active_executors:
-            executor_info = executor.executor_info
-            if not executor_info.is_done:
-                report.unrealized_pnl_quote += executor_info.net_pnl_quote
-            else:
-                report.realized_pnl_quote += executor_info.net_pnl_quote
-                if executor_info.close_type:
-                    report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
+        # Add data from active executors, aggregated as they change
+        self._update_executors_info()
+        executors_performance = self._executors_performance.get(controller_id, PerformanceReport())
+        report.unrealized_pnl_quote += executors_performance.unrealized_pnl_quote
+        report.realized_pnl_quote += executors_performance.realized_pnl_quote
+        report.volume_traded += executors_performance.volume_traded
+        for close_type, count in executors_performance.close_type_counts.items():
+            report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + count
 
-            report.volume_traded += executor_info.filled_amount_quote
+        positions = self.positions_held.get(controller_id, [])
 
         # Add data from positions held and collect position summaries
         positions_summary = []
@@ -0,0 +1,293 @@
+import asyncio
+import bisect
+import heapq
+import logging
+import math
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class TickDurationHistogram:
+    """
+    Histogram of the durations of the control tasks of an executor, counted in buckets by their upper bound in
+    seconds.
+    """
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, math.inf)
+
+    def __init__(self):
+        self.bucket_counts: List[int] = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, duration: float):
+        self.bucket_counts[bisect.bisect_left(self.BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def percentile(self, pct: float) -> float:
+        """
+        Returns the upper bound of the bucket of the given percentile (0 to 100) of the durations.
+        """
+        threshold = self.count * pct / 100
+        cumulative_count = 0
+        for bound, bucket_count in zip(self.BUCKETS, self.bucket_counts):
+            cumulative_count += bucket_count
+            if bucket_count and cumulative_count >= threshold:
+                return min(bound, self.max)
+        return 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "buckets": dict(zip(self.BUCKETS, self.bucket_counts)),
+        }
+
+
+class ExecutorScheduler:
+    """
+    Runs the control tasks of the executors from a single task, instead of a control loop task per executor.
+
+    The executors are kept in a timer wheel, in slots of `resolution` seconds by the time their control task is due.
+    The scheduler task sleeps until the first slot is due, then runs the control tasks of all the due executors
+    (concurrently, in batches of max_batch_size) and schedules each of them again after its update interval, as its
+    own control loop did. The event loop is then woken by the due slots instead of by every executor.
+
+    The executors are also woken early when they receive an order event, and when an order book of their markets is
+    updated (see ExecutorBase.order_book_markets), but their control task does not run more often than every
+    min_tick_interval seconds. The duration of the control tasks of each executor is recorded in tick_durations.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 resolution: float = 0.05,
+                 min_tick_interval: float = 0.2,
+                 max_batch_size: int = 50,
+                 wake_on_order_book_updates: bool = True):
+        self._resolution = resolution
+        self._min_tick_interval = min_tick_interval
+        self._max_batch_size = max_batch_size
+        self._wake_on_order_book_updates = wake_on_order_book_updates
+        self._executors: Set["ExecutorBase"] = set()
+        self._started_executors: Set["ExecutorBase"] = set()
+        self._ticking_executors: Set["ExecutorBase"] = set()
+        self._woken_while_ticking: Set["ExecutorBase"] = set()
+        self._last_tick_timestamps: Dict["ExecutorBase", float] = {}
+        # Timer wheel: slot -> executors due in it (dict used as an ordered set), and the heap of the slots
+        self._wheel: Dict[int, Dict["ExecutorBase", None]] = {}
+        self._slots: List[int] = []
+        self._executors_slots: Dict["ExecutorBase", int] = {}
+        # (connector name, trading pair) -> executors woken by the order book updates, and the trackers listened
+        self._order_book_executors: Dict[Tuple[str, str], Set["ExecutorBase"]] = {}
+        self._order_book_listeners: Dict[str, Tuple[OrderBookTracker, partial]] = {}
+        self.tick_durations: Dict[str, TickDurationHistogram] = {}
+        self._wake_event: Optional[asyncio.Event] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+
+    @property
+    def executors(self) -> Set["ExecutorBase"]:
+        return self._executors
+
+    def start(self):
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._wake_event = asyncio.Event()
+            self._scheduler_task = safe_ensure_future(self._scheduler_loop())
+
+    def stop(self):
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+        for executor in list(self._executors):
+            self.remove(executor)
+
+    def add(self, executor: "ExecutorBase"):
+        """
+        Schedules the control task of a started executor, starting the scheduler if needed. The executor on_start is
+        run before its first control task, and its on_stop after it is terminated.
+        """
+        if executor in self._executors:
+            return
+        self._executors.add(executor)
+        self.tick_durations[executor.config.id] = TickDurationHistogram()
+        if self._wake_on_order_book_updates:
+            for connector_name, trading_pair in executor.order_book_markets():
+                self._add_order_book_executor(executor, connector_name, trading_pair)
+        self.start()
+        self._schedule(executor, self._time())
+
+    def remove(self, executor: "ExecutorBase"):
+        if executor not in self._executors:
+            return
+        self._executors.discard(executor)
+        self._started_executors.discard(executor)
+        self._woken_while_ticking.discard(executor)
+        self._last_tick_timestamps.pop(executor, None)
+        self.tick_durations.pop(executor.config.id, None)
+        self._unschedule(executor)
+        for connector_name, trading_pair in [market for market, executors in self._order_book_executors.items()
+                                             if executor in executors]:
+            self._remove_order_book_executor(executor, connector_name, trading_pair)
+        if executor.terminated.is_set():
+            executor.on_stop()
+
+    def wake(self, executor: "ExecutorBase"):
+        """
+        Runs the control task of the executor as soon as possible, but not before min_tick_interval seconds after its
+        previous control task.
+        """
+        if executor not in self._executors:
+            return
+        if executor in self._ticking_executors:
+            self._woken_while_ticking.add(executor)
+            return
+        earliest_timestamp = self._last_tick_timestamps.get(executor, 0) + self._min_tick_interval
+        self._schedule(executor, max(earliest_timestamp, self._time()), only_if_earlier=True)
+
+    def get_tick_durations(self) -> Dict[str, Dict]:
+        return {executor_id: histogram.to_dict() for executor_id, histogram in self.tick_durations.items()}
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
+
+    def _schedule(self, executor: "ExecutorBase", timestamp: float, only_if_earlier: bool = False):
+        slot = math.ceil(timestamp / self._resolution)
+        current_slot = self._executors_slots.get(executor)
+        if current_slot is not None:
+            if only_if_earlier and current_slot <= slot:
+                return
+            self._unschedule(executor)
+        self._executors_slots[executor] = slot
+        slot_executors = self._wheel.get(slot)
+        if slot_executors is None:
+            slot_executors = self._wheel[slot] = {}
+            if (not self._slots or slot < self._slots[0]) and self._wake_event is not None:
+                self._wake_event.set()
+            heapq.heappush(self._slots, slot)
+        slot_executors[executor] = None
+
+    def _unschedule(self, executor: "ExecutorBase"):
+        slot = self._executors_slots.pop(executor, None)
+        if slot is not None:
+            slot_executors = self._wheel[slot]
+            del slot_executors[executor]
+            if not slot_executors:
+                # The slot stays in the heap, and is discarded when it is due
+                del self._wheel[slot]
+
+    def _pop_due_executors(self, timestamp: float) -> List["ExecutorBase"]:
+        due_executors = []
+        current_slot = math.floor(timestamp / self._resolution + 1e-9)
+        while self._slots and self._slots[0] <= current_slot:
+            slot_executors = self._wheel.pop(heapq.heappop(self._slots), None)
+            if slot_executors:
+                for executor in slot_executors:
+                    del self._executors_slots[executor]
+                due_executors.extend(slot_executors)
+        return due_executors
+
+    async def _wait_for_due_slot(self):
+        self._wake_event.clear()
+        while self._slots and self._slots[0] not in self._wheel:
+            heapq.heappop(self._slots)
+        timer = None
+        if self._slots:
+            delay = self._slots[0] * self._resolution - self._time()
+            if delay <= 0:
+                return
+            timer = asyncio.get_running_loop().call_later(delay, self._wake_event.set)
+        try:
+            await self._wake_event.wait()
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    async def _scheduler_loop(self):
+        while True:
+            try:
+                await self._wait_for_due_slot()
+                due_executors = self._pop_due_executors(self._time())
+                for i in range(0, len(due_executors), self._max_batch_size):
+                    await safe_gather(*[self._tick(executor) for executor in due_executors[i:i + self._max_batch_size]])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error running the executors control tasks.", exc_info=True)
+
+    async def _tick(self, executor: "ExecutorBase"):
+        if executor not in self._executors:
+            return
+        if executor.terminated.is_set():
+            self.remove(executor)
+            return
+        self._ticking_executors.add(executor)
+        start_timestamp = self._time()
+        try:
+            if executor not in self._started_executors:
+                self._started_executors.add(executor)
+                await executor.on_start()
+            if not executor.terminated.is_set():
+                await executor.control_task()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            executor.logger().error(e, exc_info=True)
+        finally:
+            self._ticking_executors.discard(executor)
+        end_timestamp = self._time()
+        if executor not in self._executors:
+            return
+        self.tick_durations[executor.config.id].observe(end_timestamp - start_timestamp)
+        self._last_tick_timestamps[executor] = end_timestamp
+        if executor.terminated.is_set():
+            self.remove(executor)
+        elif executor in self._woken_while_ticking:
+            self._woken_while_ticking.discard(executor)
+            self._schedule(executor, end_timestamp + min(self._min_tick_interval, executor.update_interval))
+        else:
+            self._schedule(executor, end_timestamp + executor.update_interval)
+
+    def _add_order_book_executor(self, executor: "ExecutorBase", connector_name: str, trading_pair: str):
+        tracker = getattr(executor.connectors.get(connector_name), "order_book_tracker", None)
+        if not isinstance(tracker, OrderBookTracker):
+            return
+        if connector_name not in self._order_book_listeners:
+            listener = partial(self._on_order_book_message, connector_name)
+            self._order_book_listeners[connector_name] = (tracker, listener)
+            tracker.add_message_listener(listener)
+        self._order_book_executors.setdefault((connector_name, trading_pair), set()).add(executor)
+
+    def _remove_order_book_executor(self, executor: "ExecutorBase", connector_name: str, trading_pair: str):
+        executors = self._order_book_executors[(connector_name, trading_pair)]
+        executors.discard(executor)
+        if not executors:
+            del self._order_book_executors[(connector_name, trading_pair)]
+            if not any(market[0] == connector_name for market in self._order_book_executors):
+                tracker, listener = self._order_book_listeners.pop(connector_name)
+                tracker.remove_message_listener(listener)
+
+    def _on_order_book_message(self, connector_name: str, message: OrderBookMessage):
+        for executor in self._order_book_executors.get((connector_name, message.trading_pair), ()):
+            self.wake(executor)
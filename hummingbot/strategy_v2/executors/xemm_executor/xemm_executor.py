@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from hummingbot.connector.connector_base import ConnectorBase, Union
 from hummingbot.connector.utils import split_hb_trading_pair
@@ -297,6 +297,14 @@ class XEMMExecutor(ExecutorBase):
             self._current_retries += 1
             self.place_taker_order()
 
+    def order_book_markets(self) -> List[Tuple[str, str]]:
+        return [(market.connector_name, market.trading_pair)
+                for market in (self.config.buying_market, self.config.selling_market)]
+
+    def executor_info_custom_state(self) -> Tuple:
+        return (self._current_trade_profitability, self._tx_cost, self._tx_cost_pct, self._taker_result_price,
+                self._maker_target_price)
+
     def get_custom_info(self) -> Dict:
         # Since we can't make this method async, we'll skip the profitability calculation
         # The profitability will still be shown in the status message which is async
@@ -67,3 +67,31 @@ class PerformanceReport(BaseModel):
     volume_traded: Decimal = Decimal("0")
     positions_summary: List = []
     close_type_counts: Dict[CloseType, int] = {}
+
+
+class ExecutorsChangeSet(BaseModel):
+    """
+    Changes of the executors of a controller since the previous report: the executors info that were created or
+    updated, and the ids of the executors that were stored and removed.
+    """
+    updated: List[ExecutorInfo] = []
+    removed: List[str] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.updated and not self.removed
+
+    def merge(self, other: "ExecutorsChangeSet") -> "ExecutorsChangeSet":
+        """
+        Returns the changes of this change set followed by the ones of the other, keeping the last info of each
+        executor.
+        """
+        if other.is_empty:
+            return self
+        if self.is_empty:
+            return other
+        removed = self.removed + other.removed
+        removed_ids = set(other.removed)
+        updated = {executor_info.id: executor_info for executor_info in self.updated + other.updated
+                   if executor_info.id not in removed_ids}
+        return ExecutorsChangeSet.model_construct(updated=list(updated.values()), removed=removed)
@@ -47,7 +47,13 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            self._start_control_loop()
+
+    def _start_control_loop(self):
+        """
+        Start the task running the control loop. Can be overridden in subclasses to run the control task differently.
+        """
+        safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
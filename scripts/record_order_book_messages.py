@@ -0,0 +1,35 @@
+import os
+from typing import Dict
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class RecordOrderBookMessages(ScriptStrategyBase):
+    """
+    Records the order book snapshots, diffs and trades of the trading pairs in the compact binary format of
+    OrderBookRecorder (data/order_books/<exchange>/<trading_pair>/<YYYYMMDD>.obr). The recordings can be fed back to an
+    order book with OrderBookReplay or OrderBookReplayDataSource.
+    """
+    exchange = os.getenv("EXCHANGE", "binance")
+    trading_pairs = os.getenv("TRADING_PAIRS", "ETH-USDT,BTC-USDT")
+    trading_pairs = [pair for pair in trading_pairs.split(",")]
+    time_between_flushes = 10
+    markets = {exchange: set(trading_pairs)}
+
+    def __init__(self, connectors: Dict[str, ConnectorBase]):
+        super().__init__(connectors)
+        self.recorder = OrderBookRecorder(self.connectors[self.exchange].order_book_tracker,
+                                          connector_name=self.exchange,
+                                          trading_pairs=self.trading_pairs)
+        self.recorder.start()
+        self.last_flush_timestamp = 0
+
+    def on_tick(self):
+        if self.last_flush_timestamp + self.time_between_flushes <= self.current_timestamp:
+            self.recorder.flush()
+            self.last_flush_timestamp = self.current_timestamp
+
+    async def on_stop(self):
+        self.recorder.stop()
@@ -44,7 +44,8 @@ def main():
         "hummingbot": [
             "core/cpp/*",
             "VERSION",
-            "templates/*TEMPLATE.yml"
+            "templates/*TEMPLATE.yml",
+            "client/connector_manifest.json"
         ],
     }
     install_requires = [
@@ -89,6 +89,7 @@ class ConfigCommandTest(IsolatedAsyncioWrapperTestCase):
                            "    | ∟ market_data_collection_enabled  | False                |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | ∟ market_data_collection_storage  | sql                  |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
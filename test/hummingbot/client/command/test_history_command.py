@@ -6,11 +6,13 @@ from pathlib import Path
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.mock.mock_cli import CLIMockingAssistant
 from typing import List
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.trade_fills_aggregator import TradeFillsAggregator
 from hummingbot.connector.exchange.paper_trade import PaperTradeExchange
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.model.order import Order
@@ -33,7 +35,9 @@ class HistoryCommandTest(IsolatedAsyncioWrapperTestCase):
     def tearDown(self) -> None:
         self.cli_mock_assistant.stop()
         db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
-        db_path.unlink(missing_ok=True)
+        for path in [db_path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")]:
+            path.unlink(missing_ok=True)
+        TradeFillsAggregator.clear_rollups()
         super().tearDown()
 
     @staticmethod
@@ -138,3 +142,43 @@ class HistoryCommandTest(IsolatedAsyncioWrapperTestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    async def test_history_report_from_trade_fills_summaries(self):
+        self.mock_strategy_name = "test-history-strategy"
+        self.client_config_map.db_mode = DBSqliteMode()
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.app.trading_core.trade_fill_db = SQLConnectionManager.get_trade_fills_instance(
+            self.client_config_map, self.mock_strategy_name
+        )
+        trades = self.get_trades()
+        trades.append(TradeFill(
+            config_file_path=f"{self.mock_strategy_name}.yml",
+            strategy=self.mock_strategy_name,
+            market="binance",
+            symbol="BTC-USDT",
+            base_asset="BTC",
+            quote_asset="USDT",
+            timestamp=trades[0].timestamp + 1,
+            order_id="someOtherId",
+            trade_type="SELL",
+            order_type="LIMIT",
+            price=3,
+            amount=1,
+            leverage=1,
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.1")).to_json(),
+            exchange_trade_id="someOtherExchangeId",
+        ))
+        with self.app.trading_core.trade_fill_db.get_new_session() as session:
+            session.add_all(trades)
+            session.commit()
+            trades = self.app._get_trades_from_session(0, session=session)
+            balances = {"BTC": Decimal("10"), "USDT": Decimal("100")}
+            expected = await PerformanceMetrics.create("BTC-USDT", trades, balances)
+
+        summaries = self.app.get_trade_fills_summaries(start_time=0)
+        self.app.trading_core.get_current_balances = AsyncMock(return_value=balances)
+        return_pct = await self.app.history_report(0, summaries, display_report=False)
+
+        self.assertEqual([("binance", "BTC-USDT")], list(summaries))
+        self.assertEqual(2, summaries[("binance", "BTC-USDT")].num_trades)
+        self.assertEqual(expected.return_pct, return_pct)
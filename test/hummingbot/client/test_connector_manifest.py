@@ -0,0 +1,109 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from hummingbot.client.connector_manifest import (
+    MANIFEST_PATH,
+    generate_connector_manifest,
+    load_connector_manifest,
+    write_connector_manifest,
+)
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+
+
+class ConnectorManifestTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.connector_path = Path(self.temp_dir.name) / "connector"
+        self.add_connector("exchange", "alpha", 'EXAMPLE_PAIR = "ALPHA-USDT"\n'
+                                                'DEFAULT_FEES = [0.1, 0.2]\n'
+                                                'OTHER_DOMAINS = ["alpha_testnet"]\n'
+                                                'OTHER_DOMAINS_PARAMETER = {"alpha_testnet": "testnet"}\n'
+                                                'OTHER_DOMAINS_EXAMPLE_PAIR = {"alpha_testnet": "ALPHA-USDC"}\n')
+        (self.connector_path / "gateway").mkdir()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def add_connector(self, type_name: str, name: str, utils_source: str):
+        package_path = self.connector_path / type_name / name
+        package_path.mkdir(parents=True)
+        (package_path / "__init__.py").write_text("")
+        (package_path / f"{name}_utils.py").write_text(utils_source)
+
+    def test_committed_manifest_is_up_to_date(self):
+        with open(MANIFEST_PATH) as f:
+            self.assertEqual(generate_connector_manifest(), json.load(f))
+
+    def test_generate_manifest_reads_the_utils_modules_constants(self):
+        manifest = generate_connector_manifest(self.connector_path)
+
+        self.assertEqual(
+            [{
+                "name": "alpha",
+                "type": "exchange",
+                "utils_module": "hummingbot.connector.exchange.alpha.alpha_utils",
+                "centralised": True,
+                "example_pair": "ALPHA-USDT",
+                "use_ethereum_wallet": False,
+                "use_eth_gas_lookup": False,
+                "other_domains": [{"name": "alpha_testnet", "example_pair": "ALPHA-USDC", "domain_parameter": "testnet"}],
+            }],
+            manifest["connectors"])
+
+    def test_stale_manifest_is_not_loaded(self):
+        manifest_path = Path(self.temp_dir.name) / "connector_manifest.json"
+        write_connector_manifest(manifest_path, self.connector_path)
+        self.assertEqual(1, len(load_connector_manifest(manifest_path, self.connector_path)))
+
+        self.add_connector("derivative", "beta", 'EXAMPLE_PAIR = "BETA-USDT"\n')
+
+        self.assertIsNone(load_connector_manifest(manifest_path, self.connector_path))
+        self.assertIsNone(load_connector_manifest(Path(self.temp_dir.name) / "missing.json", self.connector_path))
+
+    def test_non_literal_constant_is_rejected(self):
+        self.add_connector("exchange", "gamma", 'EXAMPLE_PAIR = "-".join(["GAMMA", "USDT"])\n')
+
+        with self.assertRaises(ValueError):
+            generate_connector_manifest(self.connector_path)
+
+    def test_connector_settings_load_the_utils_module_on_first_use(self):
+        utils_loader = MagicMock(return_value=(TradeFeeSchema(), None))
+        conn_settings = ConnectorSetting(
+            name="alpha",
+            type=ConnectorType.Exchange,
+            example_pair="ALPHA-USDT",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=None,
+            config_keys=None,
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=False,
+            utils_loader=utils_loader,
+        )
+
+        self.assertEqual("alpha_exchange", conn_settings.module_name())
+        utils_loader.assert_not_called()
+        self.assertFalse(conn_settings.utils_loaded)
+
+        self.assertIsNone(conn_settings.config_keys)
+        self.assertEqual(TradeFeeSchema(), conn_settings.trade_fee_schema)
+        utils_loader.assert_called_once()
+        self.assertTrue(conn_settings.utils_loaded)
+
+    def test_manifest_settings_match_the_utils_modules(self):
+        manifest_settings = dict(AllConnectorSettings.create_connector_settings())
+        self.assertFalse(manifest_settings["binance_us"].utils_loaded)
+
+        module_settings = AllConnectorSettings.create_connector_settings(use_manifest=False)
+
+        for name in ["binance", "binance_us", "kucoin_hft", "binance_perpetual_testnet"]:
+            self.assertEqual(module_settings[name], manifest_settings[name])
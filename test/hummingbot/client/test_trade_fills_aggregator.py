@@ -0,0 +1,158 @@
+import asyncio
+import tempfile
+import unittest
+from dataclasses import fields
+from decimal import Decimal
+from os.path import join
+from typing import Awaitable, List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.trade_fills_aggregator import MS_PER_DAY, TradeFillsAggregator
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+
+class TradeFillsAggregatorTest(unittest.TestCase):
+    day_start = 1700006400 * 1000  # 2023-11-15 00:00:00 UTC
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                        db_path=join(self.temp_dir.name, "test.sqlite"))
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+        self.fills_count = 0
+
+    def tearDown(self) -> None:
+        TradeFillsAggregator.clear_rollups()
+        RateOracle._shared_instance = None
+        self.sql.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def add_fill(self, timestamp: int, trade_type: str, price: str, amount: str, fee=None,
+                 market: str = "binance", symbol: str = "ETH-USDT", position: str = PositionAction.NIL.value,
+                 order_id: str = None, config_file_path: str = "strategy.yml"):
+        self.fills_count += 1
+        fee = fee or AddedToCostTradeFee(percent=Decimal("0.001"))
+        with self.sql.get_new_session() as session:
+            with session.begin():
+                session.add(TradeFill(
+                    config_file_path=config_file_path,
+                    strategy="pure_market_making",
+                    market=market,
+                    symbol=symbol,
+                    base_asset=symbol.split("-")[0],
+                    quote_asset=symbol.split("-")[1],
+                    timestamp=timestamp,
+                    order_id=order_id or f"order{self.fills_count}",
+                    trade_type=trade_type,
+                    order_type="LIMIT",
+                    price=Decimal(price),
+                    amount=Decimal(amount),
+                    trade_fee=fee.to_json(),
+                    exchange_trade_id=f"trade{self.fills_count}",
+                    position=position,
+                ))
+
+    def trades(self, start_timestamp: int) -> List[TradeFill]:
+        with self.sql.get_new_session() as session:
+            return (session.query(TradeFill)
+                    .filter(TradeFill.timestamp >= start_timestamp, TradeFill.config_file_path == "strategy.yml")
+                    .order_by(TradeFill.timestamp)
+                    .all())
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, metrics: PerformanceMetrics):
+        for metric in fields(PerformanceMetrics):
+            self.assertEqual(getattr(expected, metric.name), getattr(metrics, metric.name), metric.name)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+
+    def assert_metrics_from_summaries(self, start_timestamp: int, now: float, balances):
+        trades = self.trades(start_timestamp)
+        summaries = TradeFillsAggregator(self.sql, "strategy.yml").summaries(start_timestamp, now=now)
+
+        self.assertEqual(set((t.market, t.symbol) for t in trades), set(summaries))
+        for (market, symbol), summary in summaries.items():
+            market_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+            expected = self.async_run_with_timeout(PerformanceMetrics.create(symbol, market_trades, balances))
+            metrics = self.async_run_with_timeout(
+                PerformanceMetrics.create_from_summary(symbol, summary, balances))
+            self.assert_same_metrics(expected, metrics)
+
+    def test_spot_metrics_match_the_metrics_of_the_trades(self):
+        deducted_fee = DeductedFromReturnsTradeFee(percent=Decimal("0.002"))
+        bnb_fee = AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.0015"))])
+        self.add_fill(self.day_start + 1000, "BUY", "2000.5", "1.25")
+        self.add_fill(self.day_start + 2000, "BUY", "2000.5", "0.75")
+        self.add_fill(self.day_start + 3000, "SELL", "2010", "1.5", fee=deducted_fee)
+        self.add_fill(self.day_start + 4000, "SELL", "2010", "0.1", fee=bnb_fee)
+        self.add_fill(self.day_start + MS_PER_DAY + 1000, "SELL", "2020.123456", "0.3", fee=bnb_fee)
+        self.add_fill(self.day_start + 5000, "BUY", "30000", "0.01", symbol="BTC-USDT")
+        self.add_fill(self.day_start + 6000, "BUY", "30000", "0.01", config_file_path="other.yml")
+
+        self.assert_metrics_from_summaries(self.day_start, now=self.day_start / 1e3 + 3 * 86400,
+                                           balances={"ETH": Decimal("10"), "USDT": Decimal("5000")})
+
+    def test_derivative_metrics_match_the_metrics_of_the_trades(self):
+        flat_fee = AddedToCostTradeFee(flat_fees=[TokenAmount("USDT", Decimal("0.5"))])
+        self.add_fill(self.day_start + 1000, "BUY", "10", "50", position="OPEN", order_id="order1",
+                      market="binance_perpetual", fee=flat_fee)
+        self.add_fill(self.day_start + 2000, "BUY", "11", "50", position="OPEN", order_id="order1",
+                      market="binance_perpetual", fee=flat_fee)
+        self.add_fill(self.day_start + 3000, "SELL", "15", "100", position="CLOSE", market="binance_perpetual")
+        self.add_fill(self.day_start + 4000, "SELL", "20", "100", position="OPEN", market="binance_perpetual",
+                      fee=DeductedFromReturnsTradeFee(percent=Decimal("0.1")))
+        self.add_fill(self.day_start + 5000, "BUY", "15", "100", position="CLOSE", market="binance_perpetual")
+
+        summaries = TradeFillsAggregator(self.sql, "strategy.yml", chunk_size=2).summaries(self.day_start)
+        summary = summaries[("binance_perpetual", "ETH-USDT")]
+        self.assertTrue(summary.are_derivatives)
+        self.assertEqual(3, len(summary.position_buys))
+        self.assertEqual(2, len(summary.position_sells))
+        self.assert_metrics_from_summaries(self.day_start, now=self.day_start / 1e3 + 86400,
+                                           balances={"USDT": Decimal("1000")})
+
+    def test_settled_days_are_read_from_the_rollups(self):
+        for day in range(3):
+            self.add_fill(self.day_start + day * MS_PER_DAY + 1000, "BUY", "2000", "1")
+            self.add_fill(self.day_start + day * MS_PER_DAY + 2000, "SELL", "2100", "1")
+        now = self.day_start / 1e3 + 2 * 86400 + 7200
+        aggregator = TradeFillsAggregator(self.sql, "strategy.yml")
+        self.assertEqual(6, aggregator.summaries(self.day_start, now=now)[("binance", "ETH-USDT")].num_trades)
+
+        # A fill added to a settled day is not queried again, the fills of the current day are
+        self.add_fill(self.day_start + MS_PER_DAY + 3000, "BUY", "2000", "5")
+        self.add_fill(self.day_start + 2 * MS_PER_DAY + 3000, "BUY", "2000", "2")
+        summary = aggregator.summaries(self.day_start, now=now)[("binance", "ETH-USDT")]
+        self.assertEqual(7, summary.num_trades)
+        self.assertEqual(Decimal("5"), summary.buy_base_volume)
+
+        # Starting in the middle of a day, that day is queried and the next ones are read from the rollups
+        summary = aggregator.summaries(self.day_start + 1500, now=now)[("binance", "ETH-USDT")]
+        self.assertEqual(6, summary.num_trades)
+        self.assertEqual(Decimal("2100"), summary.first_price)
+        self.assertEqual(Decimal("2000"), summary.last_price)
+
+    def test_in_memory_database_is_not_rolled_up(self):
+        self.sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                        db_path=":memory:")
+        self.add_fill(self.day_start + 1000, "BUY", "2000", "1")
+        aggregator = TradeFillsAggregator(self.sql, "strategy.yml")
+        now = self.day_start / 1e3 + 3 * 86400
+
+        self.assertEqual(1, aggregator.summaries(self.day_start, now=now)[("binance", "ETH-USDT")].num_trades)
+        self.add_fill(self.day_start + 2000, "BUY", "2000", "1")
+        self.assertEqual(2, aggregator.summaries(self.day_start, now=now)[("binance", "ETH-USDT")].num_trades)
+        self.assertEqual({}, TradeFillsAggregator._daily_rollups)
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import re
+import tempfile
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from unittest.mock import AsyncMock, patch
@@ -10,6 +11,7 @@ from aioresponses.core import RequestCall
 
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.reference_data_cache import ReferenceDataCache
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -678,6 +680,21 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
     def trade_event_for_full_fill_websocket_update(self, order: InFlightOrder):
         return None
 
+    @aioresponses()
+    async def test_trading_rules_loaded_from_the_reference_data_cache(self, mock_api):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.exchange.set_reference_data_cache(ReferenceDataCache(cache_dir))
+            self.configure_trading_rules_response(mock_api=mock_api)
+            await self.exchange._update_trading_rules()
+
+            restarted_exchange = self.create_exchange_instance()
+            restarted_exchange.set_reference_data_cache(ReferenceDataCache(cache_dir))
+            loaded = await restarted_exchange.load_cached_reference_data()
+
+        self.assertTrue(loaded)
+        self.assertTrue(restarted_exchange.trading_pair_symbol_map_ready())
+        self.assertEqual(repr(self.expected_trading_rule), repr(restarted_exchange.trading_rules[self.trading_pair]))
+
     @aioresponses()
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
     def test_update_time_synchronizer_successfully(self, mock_api, seconds_counter_mock):
@@ -977,6 +994,70 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    @aioresponses()
+    def test_update_order_status_requests_open_orders_and_fills_per_trading_pair(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in [("OID1", "100234"), ("OID2", "100235")]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        filled_order = self.exchange.in_flight_orders["OID2"]
+
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        trade_fill = {
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "id": 28457,
+            "orderId": int(filled_order.exchange_order_id),
+            "orderListId": -1,
+            "price": "10000",
+            "qty": "1",
+            "quoteQty": "10000",
+            "commission": "10",
+            "commissionAsset": self.quote_asset,
+            "time": 1640780001000,
+            "isBuyer": True,
+            "isMaker": True,
+            "isBestMatch": True
+        }
+        mock_api.get(re.compile(f"^{trades_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps([trade_fill]))
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps([self._order_status_request_open_mock_response(order=open_order)]))
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        mock_api.get(re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps(self._order_status_request_completely_filled_mock_response(order=filled_order)))
+
+        with patch.object(self.exchange._time_synchronizer, "time", return_value=1640780010):
+            self.async_run_with_timeout(self.exchange._update_order_status())
+
+        trades_request = self._all_executed_requests(mock_api, trades_url)[0]
+        self.validate_auth_credentials_present(trades_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         trades_request.kwargs["params"]["symbol"])
+        self.assertEqual(1640780000 * 1e3, trades_request.kwargs["params"]["startTime"])
+        open_orders_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.validate_auth_credentials_present(open_orders_request)
+        # Only the order missing from the open orders is requested individually
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(filled_order.client_order_id, order_requests[0].kwargs["params"]["origClientOrderId"])
+        self.assertEqual(1, self.exchange._last_status_update_saved_api_calls)
+
+        self.assertTrue(open_order.is_open)
+        self.assertTrue(filled_order.is_filled)
+        fill_event: OrderFilledEvent = self.order_filled_logger.event_log[0]
+        self.assertEqual(filled_order.client_order_id, fill_event.order_id)
+        self.assertEqual(Decimal(trade_fill["qty"]), fill_event.amount)
+        self.assertEqual(1, len(self.buy_order_completed_logger.event_log))
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
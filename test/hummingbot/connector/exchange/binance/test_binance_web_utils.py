@@ -17,3 +17,18 @@ class BinanceUtilTestCases(unittest.TestCase):
         domain = "com"
         expected_url = CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
         self.assertEqual(expected_url, web_utils.private_rest_url(path_url, domain))
+
+    def test_ws_stream_router_routes_the_events_to_their_streams(self):
+        router = web_utils.BinanceWSStreamRouter()
+        subscription = router.subscribe_request(["btcusdt@trade", "btcusdt@depth@100ms"])
+
+        self.assertEqual(["btcusdt@trade", "btcusdt@depth@100ms"], router.subscribed_streams(subscription))
+        self.assertIsNone(router.unsubscribed_streams(subscription))
+        self.assertEqual("btcusdt@depth", router.stream_key("btcusdt@depth@100ms"))
+        self.assertEqual(["btcusdt@depth"], router.message_stream_keys({"e": "depthUpdate", "s": "BTCUSDT"}))
+        self.assertEqual(["btcusdt@trade"], router.message_stream_keys({"e": "trade", "s": "BTCUSDT"}))
+        self.assertEqual(["btcusdt@kline_1m"],
+                         router.message_stream_keys({"e": "kline", "s": "BTCUSDT", "k": {"i": "1m"}}))
+        self.assertEqual(["btcusdt@forceOrder", "!forceOrder@arr"],
+                         router.message_stream_keys({"e": "forceOrder", "o": {"s": "BTCUSDT"}}))
+        self.assertEqual([], router.message_stream_keys({"result": None, "id": 1}))
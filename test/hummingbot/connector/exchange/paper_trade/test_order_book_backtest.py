@@ -0,0 +1,131 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from test.hummingbot.core.data_type.test_order_book_recorder import diff_message, snapshot_message, trade_message
+from typing import List
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.order_book_backtest import OrderBookBacktest
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookMessageWriter, recording_path
+from hummingbot.core.data_type.order_book_replay import OrderBookReplay
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+class OrderBookBacktestTest(unittest.TestCase):
+    connector_name = "binance"
+    trading_pair = "COINALPHA-HBOT"
+    start_time = 1704067200.0  # 2024-01-01 00:00:00 UTC
+    end_time = start_time + 3600
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.messages = self.recorded_messages()
+        writer = OrderBookMessageWriter(
+            recording_path(self.tmp_dir.name, self.connector_name, self.trading_pair, int(self.start_time // 86400)),
+            self.trading_pair)
+        for message in self.messages:
+            writer.write(message)
+        writer.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def recorded_messages(self) -> List[OrderBookMessage]:
+        """
+        An order book moving around 100 every 5 seconds, with trades 1% away from the mid price every 20 seconds,
+        alternately on each side.
+        """
+        rng = np.random.default_rng(5)
+        mid_price = 100.0
+        levels = np.arange(1, 21) * 0.1
+        messages = [snapshot_message(self.trading_pair, 1, [[mid_price - level, 10] for level in levels],
+                                     [[mid_price + level, 10] for level in levels], self.start_time - 60)]
+        for i in range(1, int((self.end_time - self.start_time + 60) / 5)):
+            timestamp = self.start_time - 60 + i * 5
+            new_mid_price = round(mid_price + float(rng.choice([-0.1, 0, 0.1])), 1)
+            bids = [[round(mid_price - level, 1), 0] for level in levels]
+            bids += [[round(new_mid_price - level, 1), 10] for level in levels]
+            asks = [[round(mid_price + level, 1), 0] for level in levels]
+            asks += [[round(new_mid_price + level, 1), 10] for level in levels]
+            messages.append(diff_message(self.trading_pair, i + 1, bids, asks, timestamp))
+            mid_price = new_mid_price
+            if i % 4 == 0:
+                trade_price = mid_price * (0.99 if i % 8 == 0 else 1.01)
+                message = trade_message(self.trading_pair, i, trade_price, 5, timestamp + 1)
+                message.content["trade_type"] = float(TradeType.SELL.value if i % 8 == 0 else TradeType.BUY.value)
+                messages.append(message)
+        return messages
+
+    def new_backtest(self) -> OrderBookBacktest:
+        return OrderBookBacktest(self.connector_name, [self.trading_pair], self.start_time, self.end_time,
+                                 root_path=self.tmp_dir.name)
+
+    def expected_order_book(self, timestamp: float) -> OrderBook:
+        order_book = OrderBook()
+        for message in self.messages:
+            if message.timestamp <= timestamp and message.type is not OrderBookMessageType.TRADE:
+                OrderBookReplay.apply(order_book, message)
+        return order_book
+
+    def assert_order_books_equal(self, expected: OrderBook, order_book: OrderBook):
+        expected_bids, expected_asks = expected.get_depth_arrays()
+        bids, asks = order_book.get_depth_arrays()
+        self.assertEqual(expected_bids[:, :2].tolist(), bids[:, :2].tolist())
+        self.assertEqual(expected_asks[:, :2].tolist(), asks[:, :2].tolist())
+
+    def test_order_books_follow_the_recording(self):
+        backtest = self.new_backtest()
+        self.assertTrue(backtest.market.ready)
+        self.assert_order_books_equal(self.expected_order_book(self.start_time),
+                                      backtest.market.get_order_book(self.trading_pair))
+
+        backtest.clock.backtest_til(self.start_time + 1000)
+        self.assert_order_books_equal(self.expected_order_book(self.start_time + 1000),
+                                      backtest.market.get_order_book(self.trading_pair))
+
+    def test_market_making_strategy_fills_and_results(self):
+        backtest = self.new_backtest()
+        backtest.market.set_balance("COINALPHA", Decimal("100"))
+        backtest.market.set_balance("HBOT", Decimal("10000"))
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(backtest.market, self.trading_pair, "COINALPHA", "HBOT"),
+            bid_spread=Decimal("0.005"),
+            ask_spread=Decimal("0.005"),
+            order_amount=Decimal("1"),
+            order_refresh_time=10.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            minimum_spread=-1,
+        )
+        backtest.add_strategy(strategy)
+        results = backtest.run()
+
+        fills_df = backtest.fills_df()
+        self.assertGreater(results["total_buy_fills"], 0)
+        self.assertGreater(results["total_sell_fills"], 0)
+        self.assertEqual(len(fills_df), results["total_fills"])
+        self.assertEqual(self.end_time, backtest.clock.current_timestamp)
+        self.assertEqual(self.end_time - self.start_time, results["simulated_seconds"])
+        self.assertGreater(results["speedup"], 1)
+
+        buys = fills_df[fills_df["trade_type"] == TradeType.BUY.name]
+        sells = fills_df[fills_df["trade_type"] == TradeType.SELL.name]
+        # Buys at 99.5% of the mid price and sells at 100.5% make money with the recorded book moving around 100
+        self.assertLess((buys["price"] * buys["amount"]).sum() / buys["amount"].sum(),
+                        (sells["price"] * sells["amount"]).sum() / sells["amount"].sum())
+        final_mid_price = backtest.market.get_mid_price(self.trading_pair)
+        balances = backtest.market.get_all_balances()
+        final_value = balances["COINALPHA"] * final_mid_price + balances["HBOT"]
+        self.assertAlmostEqual(float(final_value - (Decimal("100") * final_mid_price + Decimal("10000"))),
+                               results["net_pnl_quote"], places=6)
+
+    def test_missing_recordings_raise_error(self):
+        with self.assertRaises(ValueError):
+            OrderBookBacktest(self.connector_name, [self.trading_pair, "WETH-HBOT"], self.start_time, self.end_time,
+                              root_path=self.tmp_dir.name)
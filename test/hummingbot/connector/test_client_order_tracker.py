@@ -1130,3 +1130,109 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _new_order(self, client_order_id: str, exchange_order_id=None, trading_pair=None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=trading_pair or self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+    def test_order_views_are_read_only_and_not_copies(self):
+        order = self._new_order("OID1", "EOID1")
+        active_orders = self.tracker.active_orders
+        all_fillable_orders = self.tracker.all_fillable_orders
+
+        self.tracker.start_tracking_order(order)
+
+        self.assertIs(order, active_orders["OID1"])
+        self.assertIs(order, all_fillable_orders["OID1"])
+        self.assertEqual({"OID1": order}, self.tracker.all_orders)
+        with self.assertRaises(TypeError):
+            active_orders["OID2"] = order
+
+    def test_orders_by_exchange_order_id_follow_the_order_updates(self):
+        order = self._new_order("OID1")
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+        self.async_run_with_timeout(self.tracker.process_order_update(OrderUpdate(
+            client_order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )))
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["EOID1"])
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id.get("EOID1"))
+        self.assertEqual(["EOID1"], list(self.tracker.all_fillable_orders_by_exchange_order_id))
+
+        self.tracker.stop_tracking_order("OID1")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["EOID1"])
+        self.assertNotIn("EOID1", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+    def test_exchange_order_id_set_outside_the_tracker_is_found(self):
+        order = self._new_order("OID1")
+        self.tracker.start_tracking_order(order)
+
+        order.update_exchange_order_id("EOID1")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID2"))
+
+    def test_expired_cached_orders_are_not_found_by_exchange_order_id(self):
+        order = self._new_order("OID1", "EOID1")
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order("OID1")
+
+        del self.tracker._cached_orders["OID1"]
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertNotIn("EOID1", self.tracker.all_fillable_orders_by_exchange_order_id)
+
+    def test_lost_orders_fetched_by_exchange_order_id(self):
+        self.tracker.lost_order_count_limit = 1
+        order = self._new_order("OID1", "EOID1")
+        self.tracker.start_tracking_order(order)
+
+        for _ in range(self.tracker.lost_order_count_limit + 1):
+            self.async_run_with_timeout(self.tracker.process_order_not_found(client_order_id="OID1"))
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertIs(order, self.tracker.fetch_lost_order(exchange_order_id="EOID1"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["EOID1"])
+
+    def test_active_orders_by_trading_pair_and_state(self):
+        order = self._new_order("OID1", "EOID1")
+        other_pair_order = self._new_order("OID2", "EOID2", trading_pair="WETH-USDT")
+        self.tracker.start_tracking_order(order)
+        self.tracker.start_tracking_order(other_pair_order)
+
+        self.assertEqual({"OID1": order}, self.tracker.active_orders_for_trading_pair(self.trading_pair))
+        self.assertEqual({"OID2": other_pair_order}, self.tracker.active_orders_for_trading_pair("WETH-USDT"))
+        self.assertEqual({"OID1": order, "OID2": other_pair_order},
+                         self.tracker.active_orders_in_state(OrderState.PENDING_CREATE))
+
+        self.async_run_with_timeout(self.tracker.process_order_update(OrderUpdate(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )))
+
+        self.assertEqual({"OID2": other_pair_order}, self.tracker.active_orders_in_state(OrderState.PENDING_CREATE))
+        self.assertEqual({"OID1": order}, self.tracker.active_orders_in_state(OrderState.OPEN))
+
+        self.tracker.stop_tracking_order("OID1")
+
+        self.assertEqual({}, self.tracker.active_orders_for_trading_pair(self.trading_pair))
+        self.assertEqual({}, self.tracker.active_orders_in_state(OrderState.OPEN))
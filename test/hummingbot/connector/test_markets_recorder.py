@@ -1,6 +1,8 @@
 import asyncio
+import tempfile
 import time
 from decimal import Decimal
+from os.path import join
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import Awaitable
 from unittest.mock import MagicMock, PropertyMock, patch
@@ -21,9 +23,11 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.data_feed.market_data_store import MarketDataStore
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
@@ -289,6 +293,79 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_events_are_written_behind_to_a_file_database(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                       db_path=join(temp_dir.name, "test.sqlite"))
+        self.addCleanup(manager.engine.dispose)
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        self.assertTrue(recorder.sql_writer.write_behind)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642030000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * fill_event.price,
+            order_type=create_event.type,
+            exchange_order_id="EOID1",
+        )
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        # The recorder queries wait for the pending writes
+        trade_fills = recorder.get_trades_for_config(self.config_file_path)
+        orders = recorder.get_orders_for_config_and_market(self.config_file_path, self)
+        with manager.get_new_session() as session:
+            order_status = [status.status for status in session.query(Order).one().status]
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(trade_fills))
+        self.assertEqual(fill_event.exchange_trade_id, trade_fills[0].exchange_trade_id)
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+        self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name,
+                          MarketEvent.BuyOrderCompleted.name], order_status)
+        self.assertEqual(1, len(market_states))
+        metrics = recorder.get_write_metrics()
+        self.assertEqual(0, metrics["queue_depth"])
+        self.assertEqual(2, metrics["coalesced_writes"])
+        recorder.sql_writer.stop()
+
     def test_trade_fee_in_quote_not_available(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -442,6 +519,42 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_to_columnar_store(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=2,
+                market_data_collection_storage="columnar",
+            ),
+        )
+        recorder._market_data_store = MarketDataStore(temp_dir.name)
+        order_book = OrderBook(dex=False)
+        bids_array = np.array([[3, 1, 1], [2, 1, 2], [1, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        with patch.object(self, "get_order_book", return_value=order_book):
+            with self.assertRaises(asyncio.CancelledError):
+                self.async_run_with_timeout(recorder._record_market_data())
+        recorder.market_data_store.close()
+
+        data = recorder.market_data_store.read(self.display_name, self.trading_pair, 0, time.time())
+        self.assertEqual(2, len(data["timestamp"]))
+        self.assertEqual([3.5, 3.5], data["mid_price"].tolist())
+        self.assertEqual([[4, 5], [4, 5]], data["ask_price"].tolist())
+        self.assertEqual([[1, 2], [1, 2]], data["ask_amount"].tolist())
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
+
     def test_store_position(self):
         recorder = MarketsRecorder(
             sql=self.manager,
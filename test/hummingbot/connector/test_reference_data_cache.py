@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.reference_data_cache import TRADING_FEES, TRADING_RULES, ReferenceDataCache
+
+
+class ReferenceDataCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root_path = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_items_persisted_across_instances(self):
+        cache = ReferenceDataCache(self.root_path)
+        self.assertIsNone(cache.get("binance", TRADING_RULES))
+
+        self.assertTrue(cache.set("binance", TRADING_RULES, {"symbols": [{"symbol": "BTCUSDT"}]}))
+        self.assertTrue(cache.set("binance", TRADING_FEES, {"BTC-USDT": {"maker": "0.001"}}))
+
+        restarted_cache = ReferenceDataCache(self.root_path)
+        self.assertEqual({"symbols": [{"symbol": "BTCUSDT"}]}, restarted_cache.get("binance", TRADING_RULES))
+        self.assertEqual({"BTC-USDT": {"maker": "0.001"}}, restarted_cache.get("binance", TRADING_FEES))
+        self.assertIsNone(restarted_cache.get("kucoin", TRADING_RULES))
+
+    def test_stale_items_and_other_versions_ignored(self):
+        cache = ReferenceDataCache(self.root_path)
+        cache.set("binance", TRADING_RULES, {"symbols": []})
+
+        self.assertIsNone(ReferenceDataCache(self.root_path, max_age=-1).get("binance", TRADING_RULES))
+
+        path = os.path.join(self.root_path, "binance.json")
+        with open(path) as f:
+            content = json.load(f)
+        content["version"] = ReferenceDataCache.CACHE_VERSION + 1
+        with open(path, "w") as f:
+            json.dump(content, f)
+
+        self.assertIsNone(ReferenceDataCache(self.root_path).get("binance", TRADING_RULES))
+
+    def test_invalid_items_not_cached(self):
+        cache = ReferenceDataCache(self.root_path)
+        cache.set("binance", TRADING_RULES, {"symbols": []})
+
+        self.assertFalse(cache.set("binance", TRADING_FEES, {"BTC-USDT": Decimal("0.001")}))
+
+        self.assertIsNone(cache.get("binance", TRADING_FEES))
+        self.assertEqual({"symbols": []}, ReferenceDataCache(self.root_path).get("binance", TRADING_RULES))
+        self.assertEqual(["binance.json"], os.listdir(self.root_path))
+
+    def test_corrupted_file_ignored(self):
+        with open(os.path.join(self.root_path, "binance.json"), "w") as f:
+            f.write("{not json")
+
+        cache = ReferenceDataCache(self.root_path)
+        self.assertIsNone(cache.get("binance", TRADING_RULES))
+
+        cache.set("binance", TRADING_RULES, {"symbols": []})
+        cache.clear("binance")
+        self.assertIsNone(cache.get("binance", TRADING_RULES))
+        self.assertFalse(os.path.exists(os.path.join(self.root_path, "binance.json")))
@@ -4,6 +4,7 @@ import math
 import sys
 import time
 import unittest
+from collections import defaultdict
 from decimal import Decimal
 from typing import Dict, List
 from unittest.mock import patch
@@ -11,7 +12,7 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -47,7 +48,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def setUp(self) -> None:
         super().setUp()
         self.throttler = AsyncThrottler(rate_limits=self.rate_limits)
-        self._req_counters: Dict[str, int] = {limit.limit_id: 0 for limit in self.rate_limits}
+        self._req_counters: Dict[str, int] = defaultdict(int)
         self.client_config_map = ClientConfigAdapter(ClientConfigMap())
 
     async def execute_requests(self, no_request: int, limit_id: str, throttler: AsyncThrottler):
@@ -275,3 +276,79 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_execute_task_waits_exactly_until_capacity_is_freed(self):
+        rate_limit = RateLimit(limit_id="limit", limit=2, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+        grant_times = []
+
+        async def request():
+            async with throttler.execute_task(limit_id="limit"):
+                grant_times.append(time.time())
+
+        started = time.time()
+        self.ev_loop.run_until_complete(asyncio.gather(*[request() for _ in range(6)]))
+
+        self.assertEqual(6, len(grant_times))
+        for i in range(2, 6):
+            self.assertGreaterEqual(grant_times[i] - grant_times[i - 2], 0.2)
+        self.assertGreaterEqual(grant_times[-1] - started, 0.4)
+        # Woken up when the capacity is freed, not one retry_interval later
+        self.assertLess(grant_times[-1] - started, 0.4 + 0.5 * throttler._retry_interval)
+        self.assertEqual(0, throttler._scheduler.waiting_requests)
+
+    def test_execute_task_grants_waiting_tasks_by_priority(self):
+        rate_limit = RateLimit(limit_id="limit", limit=1, time_interval=0.1)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+        granted = []
+
+        async def request(name: str, priority: RequestPriority):
+            async with throttler.execute_task(limit_id="limit", priority=priority):
+                granted.append(name)
+
+        async def requests():
+            await request("first", RequestPriority.STATUS)
+            await asyncio.gather(request("status_1", RequestPriority.STATUS),
+                                 request("create", RequestPriority.CREATE),
+                                 request("status_2", RequestPriority.STATUS),
+                                 request("cancel", RequestPriority.CANCEL))
+
+        self.ev_loop.run_until_complete(requests())
+        self.assertEqual(["first", "cancel", "create", "status_1", "status_2"], granted)
+
+    def test_waiting_task_does_not_block_tasks_on_other_limits(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="slow", limit=1, time_interval=10),
+                                                RateLimit(limit_id="fast", limit=10, time_interval=10)])
+        granted = []
+
+        async def request(limit_id: str):
+            async with throttler.execute_task(limit_id=limit_id):
+                granted.append(limit_id)
+
+        async def requests():
+            await request("slow")
+            slow_task = asyncio.ensure_future(request("slow"))
+            await asyncio.sleep(0)
+            await asyncio.wait_for(request("fast"), timeout=1)
+            self.assertEqual(1, throttler._scheduler.waiting_requests)
+            self.assertFalse(throttler.execute_task(limit_id="slow").within_capacity())
+            # Cancelled waiters are removed from the queue
+            slow_task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await slow_task
+            self.assertEqual(0, throttler._scheduler.waiting_requests)
+
+        self.ev_loop.run_until_complete(requests())
+        self.assertEqual(["slow", "fast"], granted)
+
+    def test_execute_task_logs_linked_limits(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_2_ID, self.throttler))
+
+        self.assertEqual(1, self.throttler._scheduler.used_capacity(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(6, self.throttler._scheduler.used_capacity(TEST_WEIGHTED_POOL_ID))
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+        # Tasks without rate limit are not throttled
+        self.ev_loop.run_until_complete(self.execute_requests(1, "unknown_limit_id", self.throttler))
@@ -2,9 +2,14 @@
 
 import logging
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
 import numpy as np
 
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
 
 class OrderBookUnitTest(unittest.TestCase):
     @classmethod
@@ -50,6 +55,123 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_arrays_match_entries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 3, 3], [7, 4, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.get_depth_arrays()
+        self.assertEqual([list(row) for row in order_book.bid_entries()], bids.tolist())
+        self.assertEqual([list(row) for row in order_book.ask_entries()], asks.tolist())
+
+        bids, asks = order_book.get_depth_arrays(2)
+        self.assertEqual([[3., 3., 3.], [2., 2., 2.]], bids.tolist())
+        self.assertEqual([[4., 1., 1.], [5., 2., 2.]], asks.tolist())
+
+        bids, asks = order_book.get_cumulative_depth_arrays(3)
+        self.assertEqual([[3., 3., 9.], [2., 5., 13.], [1., 6., 14.]], bids.tolist())
+        self.assertEqual([[4., 1., 4.], [5., 3., 14.], [6., 6., 32.]], asks.tolist())
+
+    def test_depth_arrays_fill_preallocated_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 2, 2]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 2, 2], [6, 3, 3]], dtype=np.float64))
+        bids_out = np.zeros((5, 3))
+        asks_out = np.zeros((2, 3))
+        bids, asks = order_book.get_depth_arrays(5, bids_out=bids_out, asks_out=asks_out)
+        self.assertTrue(np.shares_memory(bids, bids_out))
+        self.assertTrue(np.shares_memory(asks, asks_out))
+        self.assertEqual([[2., 2., 2.], [1., 1., 1.]], bids.tolist())
+        self.assertEqual([[4., 1., 1.], [5., 2., 2.]], asks.tolist())
+
+        empty_bids, empty_asks = OrderBook().get_depth_arrays(5)
+        self.assertEqual((0, 3), empty_bids.shape)
+        self.assertEqual((0, 3), empty_asks.shape)
+
+    def test_composite_order_book_depth_arrays_discount_filled_orders(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 2, 2]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 2, 2]], dtype=np.float64))
+        order_book.record_filled_order(OrderFilledEvent(
+            timestamp=3, order_id="order", trading_pair="COINALPHA-HBOT", trade_type=TradeType.BUY,
+            order_type=OrderType.MARKET, price=4.0, amount=0.5, trade_fee=AddedToCostTradeFee()))
+        bids, asks = order_book.get_depth_arrays()
+        self.assertEqual([list(row) for row in order_book.ask_entries()], asks.tolist())
+        self.assertEqual([4., 0.5, 1.], asks[0].tolist())
+        self.assertEqual([[2., 2., 2.], [1., 1., 1.]], bids.tolist())
+
+    def assert_query_results_equal(self, expected, result):
+        for field in ["query_price", "query_volume", "result_price", "result_volume"]:
+            expected_value, value = getattr(expected, field), getattr(result, field)
+            if np.isnan(expected_value):
+                self.assertTrue(np.isnan(value))
+            else:
+                self.assertAlmostEqual(expected_value, value, places=9)
+
+    def test_memoized_queries_match_fresh_order_book(self):
+        rng = np.random.default_rng(5)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[price, 1, 1] for price in range(90, 100)], dtype=np.float64),
+                                        np.array([[price, 1, 1] for price in range(101, 111)], dtype=np.float64))
+        volumes = [0.5, 2.0, 5.5, 30.0]
+        for update_id in range(2, 200):
+            bids = [[float(rng.integers(80, 100)), float(rng.choice([0, rng.uniform(0.1, 3)])), update_id]]
+            asks = [[float(rng.integers(101, 121)), float(rng.choice([0, rng.uniform(0.1, 3)])), update_id]]
+            order_book.apply_numpy_diffs(np.array(bids, dtype=np.float64), np.array(asks, dtype=np.float64))
+            bids_array, asks_array = order_book.get_depth_arrays()
+            fresh_order_book = OrderBook()
+            fresh_order_book.apply_numpy_snapshot(bids_array.copy(), asks_array.copy())
+            for is_buy in [True, False]:
+                for volume in volumes:
+                    self.assert_query_results_equal(fresh_order_book.get_price_for_volume(is_buy, volume),
+                                                    order_book.get_price_for_volume(is_buy, volume))
+                    self.assert_query_results_equal(fresh_order_book.get_vwap_for_volume(is_buy, volume),
+                                                    order_book.get_vwap_for_volume(is_buy, volume))
+                    self.assert_query_results_equal(fresh_order_book.get_price_for_quote_volume(is_buy, volume * 100),
+                                                    order_book.get_price_for_quote_volume(is_buy, volume * 100))
+
+    def test_memoized_query_results_are_copies(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64), np.array([[4, 1, 1]], dtype=np.float64))
+        result = order_book.get_price_for_volume(True, 1)
+        result.result_price = 0
+        self.assertEqual(4, order_book.get_price_for_volume(True, 1).result_price)
+
+    def test_version_and_memoized_queries_after_snapshot_and_overlap(self):
+        order_book = OrderBook()
+        self.assertEqual(0, order_book.version)
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 1]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, order_book.version)
+        self.assertEqual(2, order_book.get_price_for_volume(False, 1).result_price)
+        self.assertEqual(4, order_book.get_price_for_volume(True, 1).result_price)
+
+        # A bid crossing the asks truncates the top of the asks
+        order_book.apply_numpy_diffs(np.array([[4.5, 1, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(2, order_book.version)
+        self.assertEqual(4.5, order_book.get_price_for_volume(False, 1).result_price)
+        self.assertEqual(5, order_book.get_price_for_volume(True, 1).result_price)
+
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 3]], dtype=np.float64), np.array([[3, 1, 3]], dtype=np.float64))
+        self.assertEqual(3, order_book.version)
+        self.assertEqual(1, order_book.get_price_for_volume(False, 1).result_price)
+        self.assertEqual(3, order_book.get_price_for_volume(True, 1).result_price)
+
+    def test_composite_order_book_memoized_queries_discount_filled_orders(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 2, 2]], dtype=np.float64))
+        self.assertEqual(4, order_book.get_price_for_volume(True, 1).result_price)
+        version = order_book.version
+        order_book.record_filled_order(OrderFilledEvent(
+            timestamp=3, order_id="order", trading_pair="COINALPHA-HBOT", trade_type=TradeType.BUY,
+            order_type=OrderType.MARKET, price=4.0, amount=0.5, trade_fee=AddedToCostTradeFee()))
+        self.assertGreater(order_book.version, version)
+        self.assertEqual(5, order_book.get_price_for_volume(True, 1).result_price)
+        order_book.clear_traded_order_book()
+        self.assertEqual(4, order_book.get_price_for_volume(True, 1).result_price)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,200 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookMessageReader,
+    OrderBookMessageWriter,
+    OrderBookRecorder,
+    recording_path,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+def diff_message(trading_pair: str, update_id: int, bids: List, asks: List, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks,
+    }, timestamp=timestamp)
+
+
+def snapshot_message(trading_pair: str, update_id: int, bids: List, asks: List, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": trading_pair, "update_id": update_id, "bids": bids, "asks": asks,
+    }, timestamp=timestamp)
+
+
+def trade_message(trading_pair: str, trade_id, price: float, amount: float, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": trading_pair, "trade_type": 1.0, "trade_id": trade_id, "update_id": -1,
+        "price": str(price), "amount": str(amount),
+    }, timestamp=timestamp)
+
+
+class OrderBookMessageWriterTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_time = 1704067200.0  # 2024-01-01 00:00:00 UTC
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "recording.obr")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def messages(self) -> List[OrderBookMessage]:
+        messages = [snapshot_message(self.trading_pair, 1, [["99.5", "2"], [99, 1]], [[100.5, 1]], self.start_time)]
+        for i in range(1, 25):
+            messages.append(diff_message(self.trading_pair, i + 1, [[99 - i * 0.1, i]], [], self.start_time + i))
+            if i % 5 == 0:
+                messages.append(trade_message(self.trading_pair, i if i % 10 else f"t-{i}", 100.5, 0.1,
+                                              self.start_time + i + 0.5))
+        return messages
+
+    def assert_messages_equal(self, expected: List[OrderBookMessage], messages: List[OrderBookMessage]):
+        self.assertEqual(len(expected), len(messages))
+        for expected_message, message in zip(expected, messages):
+            self.assertEqual(expected_message.type, message.type)
+            self.assertEqual(expected_message.timestamp, message.timestamp)
+            self.assertEqual(self.trading_pair, message.trading_pair)
+            if expected_message.type is OrderBookMessageType.TRADE:
+                self.assertEqual(expected_message.trade_id, message.trade_id)
+                self.assertEqual(float(expected_message.content["price"]), message.content["price"])
+                self.assertEqual(float(expected_message.content["amount"]), message.content["amount"])
+                self.assertEqual(expected_message.content["trade_type"], message.content["trade_type"])
+            else:
+                self.assertEqual(expected_message.update_id, message.update_id)
+                self.assertEqual(expected_message.bids, message.bids)
+                self.assertEqual(expected_message.asks, message.asks)
+
+    def test_write_and_read_chunks(self):
+        messages = self.messages()
+        writer = OrderBookMessageWriter(self.path, self.trading_pair, chunk_size=4)
+        for message in messages:
+            writer.write(message)
+        writer.close()
+
+        reader = OrderBookMessageReader(self.path)
+        self.assertEqual(self.trading_pair, reader.trading_pair)
+        self.assertEqual(8, len(reader.chunks()))
+        self.assert_messages_equal(messages, list(reader.read()))
+        self.assert_messages_equal([message for message in messages
+                                    if self.start_time + 10 <= message.timestamp <= self.start_time + 15],
+                                   list(reader.read(self.start_time + 10, self.start_time + 15)))
+
+    def test_chunks_are_written_when_they_span_max_chunk_seconds(self):
+        writer = OrderBookMessageWriter(self.path, self.trading_pair, chunk_size=1000, max_chunk_seconds=10)
+        for message in self.messages():
+            writer.write(message)
+        self.assertEqual(2, len(OrderBookMessageReader(self.path).chunks()))
+        writer.close()
+        self.assertEqual(3, len(OrderBookMessageReader(self.path).chunks()))
+
+    def test_append_to_existing_recording(self):
+        messages = self.messages()
+        writer = OrderBookMessageWriter(self.path, self.trading_pair, chunk_size=10)
+        for message in messages[:12]:
+            writer.write(message)
+        writer.close()
+        writer = OrderBookMessageWriter(self.path, self.trading_pair, chunk_size=10)
+        for message in messages[12:]:
+            writer.write(message)
+        writer.close()
+        self.assert_messages_equal(messages, list(OrderBookMessageReader(self.path).read()))
+
+        with self.assertRaises(ValueError):
+            OrderBookMessageWriter(self.path, "OTHER-PAIR")
+
+    def test_incomplete_chunks_and_missing_index(self):
+        messages = self.messages()
+        writer = OrderBookMessageWriter(self.path, self.trading_pair, chunk_size=10, compress=False)
+        for message in messages:
+            writer.write(message)
+        writer.close()
+        os.remove(f"{self.path}.idx")
+        with open(self.path, "rb+") as f:
+            f.truncate(os.path.getsize(self.path) - 10)
+
+        reader = OrderBookMessageReader(self.path)
+        self.assertEqual(2, len(reader.chunks()))
+        self.assert_messages_equal(messages[:20], list(reader.read()))
+
+
+class OrderBookRecorderTest(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_time = 1704067200.0
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        order_book = OrderBook()
+        order_book.apply_snapshot(*self.snapshot_rows(), 1)
+        self.tracker._order_books[self.trading_pair] = order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.recorder = OrderBookRecorder(self.tracker, connector_name="exchange", root_path=self.tmp_dir.name)
+
+    def tearDown(self):
+        self.recorder.stop()
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def snapshot_rows(self):
+        message = snapshot_message(self.trading_pair, 1, [[99, 1], [98, 2]], [[101, 1], [102, 2]], self.start_time)
+        return message.bids, message.asks
+
+    async def process_messages(self, messages: List[OrderBookMessage]):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        for message in messages:
+            message_queue.put_nowait(message)
+        tracking_task = asyncio.get_event_loop().create_task(self.tracker._track_single_book(self.trading_pair))
+        while not message_queue.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        tracking_task.cancel()
+
+    async def test_records_the_messages_applied_by_the_tracker(self):
+        self.recorder.start()
+        messages = [diff_message(self.trading_pair, i, [[99 - i, i]], [[101 + i, 0]], self.start_time + i)
+                    for i in range(2, 6)]
+        await self.process_messages(messages)
+        self.recorder.stop()
+
+        path = recording_path(self.tmp_dir.name, "exchange", self.trading_pair, int(self.start_time // 86400))
+        recorded = list(OrderBookMessageReader(path).read())
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, recorded[0].type)
+        self.assertEqual([message.update_id for message in messages], [message.update_id for message in recorded[1:]])
+
+        replayed_order_book = OrderBook()
+        replayed_order_book.apply_snapshot(recorded[0].bids, recorded[0].asks, recorded[0].update_id)
+        for message in recorded[1:]:
+            replayed_order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        tracked_bids, tracked_asks = self.tracker.order_books[self.trading_pair].snapshot
+        replayed_bids, replayed_asks = replayed_order_book.snapshot
+        self.assertEqual(tracked_bids[["price", "amount"]].values.tolist(),
+                         replayed_bids[["price", "amount"]].values.tolist())
+        self.assertEqual(tracked_asks[["price", "amount"]].values.tolist(),
+                         replayed_asks[["price", "amount"]].values.tolist())
+
+    async def test_new_file_per_day_starts_with_a_snapshot(self):
+        self.recorder.start()
+        await self.process_messages([diff_message(self.trading_pair, 2, [[97, 1]], [], self.start_time - 1),
+                                     diff_message(self.trading_pair, 3, [[96, 1]], [], self.start_time + 1)])
+        self.recorder.stop()
+
+        day = int(self.start_time // 86400)
+        previous_day = list(OrderBookMessageReader(
+            recording_path(self.tmp_dir.name, "exchange", self.trading_pair, day - 1)).read())
+        current_day = list(OrderBookMessageReader(
+            recording_path(self.tmp_dir.name, "exchange", self.trading_pair, day)).read())
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF],
+                         [message.type for message in previous_day])
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF],
+                         [message.type for message in current_day])
+        self.assertIn(97.0, [row.price for row in current_day[0].bids])
+        self.assertEqual(self.start_time + 1, current_day[0].timestamp)
@@ -0,0 +1,114 @@
+import asyncio
+import tempfile
+from test.hummingbot.core.data_type.test_order_book_recorder import diff_message, snapshot_message, trade_message
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookMessageWriter, recording_path
+from hummingbot.core.data_type.order_book_replay import OrderBookReplay, OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookReplayTest(IsolatedAsyncioWrapperTestCase):
+    trading_pairs = ["COINALPHA-HBOT", "WETH-USDT"]
+    start_time = 1704067200.0  # 2024-01-01 00:00:00 UTC
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.recorded: Dict[str, List[OrderBookMessage]] = {}
+        rng = np.random.default_rng(11)
+        for offset, trading_pair in enumerate(self.trading_pairs):
+            messages = []
+            # Two days of recordings, each file starting with a snapshot
+            for day_start in [self.start_time - 86400, self.start_time]:
+                messages.append(snapshot_message(trading_pair, int(day_start), [[99, 1], [98, 1]],
+                                                 [[101, 1], [102, 1]], day_start + offset))
+                for i in range(1, 200):
+                    timestamp = day_start + i * 60 + offset
+                    messages.append(diff_message(trading_pair, int(timestamp),
+                                                 [[float(rng.integers(90, 100)), float(rng.integers(0, 3))]],
+                                                 [[float(rng.integers(101, 111)), float(rng.integers(0, 3))]],
+                                                 timestamp))
+                    if i % 7 == 0:
+                        messages.append(trade_message(trading_pair, int(timestamp), 101, 0.5, timestamp + 0.5))
+            for message in messages:
+                day = int(message.timestamp // 86400)
+                path = recording_path(self.tmp_dir.name, "exchange", trading_pair, day)
+                writer = OrderBookMessageWriter(path, trading_pair, chunk_size=50)
+                writer.write(message)
+                writer.close()
+            self.recorded[trading_pair] = messages
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def expected_order_book(self, trading_pair: str, timestamp: float) -> OrderBook:
+        order_book = OrderBook()
+        for message in self.recorded[trading_pair]:
+            if message.timestamp <= timestamp and message.type is not OrderBookMessageType.TRADE:
+                OrderBookReplay.apply(order_book, message)
+        return order_book
+
+    def assert_order_books_equal(self, expected: OrderBook, order_book: OrderBook):
+        expected_bids, expected_asks = expected.get_depth_arrays()
+        bids, asks = order_book.get_depth_arrays()
+        self.assertEqual(expected_bids[:, :2].tolist(), bids[:, :2].tolist())
+        self.assertEqual(expected_asks[:, :2].tolist(), asks[:, :2].tolist())
+
+    def test_messages_start_with_the_order_books_at_start_time(self):
+        start_time = self.start_time - 86400 + 100 * 60 + 30
+        end_time = self.start_time + 50 * 60
+        replay = OrderBookReplay("exchange", self.trading_pairs, start_time, end_time, root_path=self.tmp_dir.name)
+        messages = list(replay.messages())
+
+        self.assertEqual(self.trading_pairs, [message.trading_pair for message in messages[:2]])
+        self.assertTrue(all(message.type is OrderBookMessageType.SNAPSHOT for message in messages[:2]))
+        timestamps = [message.timestamp for message in messages]
+        self.assertEqual(sorted(timestamps), timestamps)
+        self.assertTrue(start_time <= timestamps[0] and timestamps[-1] <= end_time)
+
+        order_books = {trading_pair: OrderBook() for trading_pair in self.trading_pairs}
+        for message in messages[:2]:
+            replay.apply(order_books[message.trading_pair], message)
+        for trading_pair in self.trading_pairs:
+            self.assert_order_books_equal(self.expected_order_book(trading_pair, start_time), order_books[trading_pair])
+
+        trades = []
+        for message in messages[2:]:
+            replay.apply(order_books[message.trading_pair], message)
+            if message.type is OrderBookMessageType.TRADE:
+                trades.append(message)
+        for trading_pair in self.trading_pairs:
+            self.assert_order_books_equal(self.expected_order_book(trading_pair, end_time), order_books[trading_pair])
+            self.assertEqual(101, order_books[trading_pair].last_trade_price)
+        self.assertEqual(len([message for messages in self.recorded.values() for message in messages
+                              if message.type is OrderBookMessageType.TRADE and
+                              start_time <= message.timestamp <= end_time]), len(trades))
+
+    async def test_replay_data_source_feeds_order_book_tracker(self):
+        end_time = self.start_time + 120 * 60
+        data_source = OrderBookReplayDataSource(self.trading_pairs, "exchange", start_time=self.start_time + 30,
+                                                end_time=end_time, root_path=self.tmp_dir.name)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs)
+        with patch.object(OrderBookTracker, "_sleep"):
+            tracker.start()
+            await asyncio.wait_for(tracker.wait_ready(), timeout=5)
+            await asyncio.wait_for(data_source.replay_finished.wait(), timeout=5)
+            while any(queue.qsize() > 0 for queue in tracker._tracking_message_queues.values()) or \
+                    tracker._order_book_diff_stream.qsize() > 0:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.01)
+            tracker.stop()
+
+        for trading_pair in self.trading_pairs:
+            self.assert_order_books_equal(self.expected_order_book(trading_pair, end_time),
+                                          tracker.order_books[trading_pair])
+        self.assertEqual({trading_pair: 101.0 for trading_pair in self.trading_pairs},
+                         await data_source.get_last_traded_prices(self.trading_pairs))
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTest(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self):
+        super().setUp()
+        self.tracking_task = None
+
+    def tearDown(self):
+        if self.tracking_task is not None:
+            self.tracking_task.cancel()
+        super().tearDown()
+
+    def diff_message(self, update_id: int, bids: List, asks: List, timestamp: float = None) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks,
+        }, timestamp=timestamp if timestamp is not None else time.time())
+
+    def snapshot_message(self, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks,
+        }, timestamp=time.time())
+
+    def random_diffs(self, n_messages: int) -> List[OrderBookMessage]:
+        rng = np.random.default_rng(3)
+        messages = []
+        for update_id in range(2, n_messages + 2):
+            bids = [[float(price), float(rng.choice([0, rng.uniform(1, 5)]))]
+                    for price in rng.integers(90, 100, size=3)]
+            asks = [[float(price), float(rng.choice([0, rng.uniform(1, 5)]))]
+                    for price in rng.integers(101, 111, size=3)]
+            messages.append(self.diff_message(update_id, bids, asks))
+        return messages
+
+    def new_tracker(self, batch_diffs: bool) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair], batch_diffs=batch_diffs)
+        order_book = OrderBook()
+        snapshot = self.snapshot_message(1, [[95.0, 1.0]], [[105.0, 1.0]])
+        order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        tracker._order_books[self.trading_pair] = order_book
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        return tracker
+
+    async def process_messages(self, tracker: OrderBookTracker, messages: List[OrderBookMessage]):
+        message_queue = tracker._tracking_message_queues[self.trading_pair]
+        for message in messages:
+            message_queue.put_nowait(message)
+        self.tracking_task = asyncio.get_event_loop().create_task(tracker._track_single_book(self.trading_pair))
+        while not message_queue.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.tracking_task.cancel()
+        self.tracking_task = None
+
+    async def test_batched_diffs_match_diffs_applied_one_by_one(self):
+        messages = self.random_diffs(50)
+        batched_tracker = self.new_tracker(batch_diffs=True)
+        sequential_tracker = self.new_tracker(batch_diffs=False)
+        await self.process_messages(batched_tracker, messages)
+        await self.process_messages(sequential_tracker, messages)
+
+        batched_bids, batched_asks = batched_tracker.order_books[self.trading_pair].snapshot
+        sequential_bids, sequential_asks = sequential_tracker.order_books[self.trading_pair].snapshot
+        self.assertEqual(sequential_bids.values.tolist(), batched_bids.values.tolist())
+        self.assertEqual(sequential_asks.values.tolist(), batched_asks.values.tolist())
+        self.assertEqual(51, batched_tracker.order_books[self.trading_pair].last_diff_uid)
+
+        batched_metrics = batched_tracker.metrics[self.trading_pair]
+        self.assertEqual(50, batched_metrics.diffs_applied)
+        self.assertEqual(1, batched_metrics.batches_applied)
+        self.assertEqual(50, batched_metrics.max_batch_size)
+        self.assertGreater(batched_metrics.price_levels_coalesced, 0)
+        self.assertEqual(0, batched_metrics.queue_depth)
+        self.assertEqual(50, sequential_tracker.metrics[self.trading_pair].batches_applied)
+        self.assertEqual(messages[-OrderBookTracker.PAST_DIFF_WINDOW_SIZE:],
+                         list(batched_tracker._past_diffs_windows[self.trading_pair]))
+
+    async def test_batch_stops_at_snapshot(self):
+        messages = [
+            self.diff_message(2, [[96.0, 2.0]], []),
+            self.diff_message(3, [[96.0, 3.0]], []),
+            self.snapshot_message(4, [[90.0, 1.0]], [[110.0, 1.0]]),
+            self.diff_message(5, [[91.0, 1.0]], []),
+        ]
+        batched_tracker = self.new_tracker(batch_diffs=True)
+        sequential_tracker = self.new_tracker(batch_diffs=False)
+        await self.process_messages(batched_tracker, messages)
+        await self.process_messages(sequential_tracker, messages)
+
+        batched_bids, batched_asks = batched_tracker.order_books[self.trading_pair].snapshot
+        sequential_bids, sequential_asks = sequential_tracker.order_books[self.trading_pair].snapshot
+        self.assertEqual(sequential_bids.values.tolist(), batched_bids.values.tolist())
+        self.assertEqual(sequential_asks.values.tolist(), batched_asks.values.tolist())
+        self.assertEqual(4, batched_tracker.order_books[self.trading_pair].snapshot_uid)
+        self.assertIn(91.0, batched_bids["price"].tolist())
+        metrics = batched_tracker.metrics[self.trading_pair]
+        self.assertEqual(3, metrics.diffs_applied)
+        self.assertEqual(2, metrics.batches_applied)
+        self.assertEqual(1, metrics.price_levels_coalesced)
+
+    async def test_metrics_report_queue_depth_and_lag(self):
+        tracker = self.new_tracker(batch_diffs=True)
+        tracker._saved_message_queues[self.trading_pair].append(self.diff_message(2, [[96.0, 1.0]], []))
+        tracker._tracking_message_queues[self.trading_pair].put_nowait(self.diff_message(3, [[97.0, 1.0]], []))
+        metrics = tracker.metrics[self.trading_pair]
+        self.assertEqual(2, metrics.queue_depth)
+        self.assertEqual(0, tracker._metrics[self.trading_pair].queue_depth)
+
+        # Timestamp in milliseconds, two seconds ago
+        await self.process_messages(tracker, [self.diff_message(4, [[98.0, 1.0]], [], (time.time() - 2) * 1e3)])
+        self.assertEqual(2, metrics.queue_depth)
+        metrics = tracker.metrics[self.trading_pair]
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertEqual(3, metrics.last_batch_size)
+        self.assertGreaterEqual(metrics.last_lag, 2)
+        self.assertLess(metrics.last_lag, 10)
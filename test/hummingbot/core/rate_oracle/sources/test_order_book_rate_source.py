@@ -0,0 +1,84 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.rate_oracle.sources.order_book_rate_source import OrderBookRateSource
+
+
+class OrderBookRateSourceTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=["COINALPHA-HBOT"])
+        self.connector = MagicMock()
+        self.connector.name = "test_exchange"
+        self.connector.order_book_tracker = self.tracker
+        self.published_prices: List[Dict[str, Decimal]] = []
+
+    def on_price(self, trading_pair: str, price: Decimal):
+        self.published_prices.append({trading_pair: price})
+
+    @staticmethod
+    def order_book(bid: float, ask: float) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            bids=[OrderBookRow(bid, 1, 1)] if bid else [],
+            asks=[OrderBookRow(ask, 1, 1)] if ask else [],
+            update_id=1)
+        return order_book
+
+    def apply(self, trading_pair: str, order_book: OrderBook):
+        self.tracker.order_books[trading_pair] = order_book
+        self.tracker._notify_message_listeners(OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": trading_pair, "update_id": 1, "bids": [], "asks": []},
+            timestamp=1))
+
+    async def test_publishes_the_prices_of_the_tracked_books(self):
+        self.tracker.order_books["COINALPHA-HBOT"] = self.order_book(bid=9, ask=11)
+        source = OrderBookRateSource()
+        source.add_price_listener(self.on_price)
+
+        self.assertTrue(source.add_connector(self.connector))
+        self.assertEqual([{"COINALPHA-HBOT": Decimal("10")}], self.published_prices)
+
+        self.apply("COINALPHA-HBOT", self.order_book(bid=19, ask=21))
+        self.apply("COINALPHA-HBOT", self.order_book(bid=19, ask=21))
+        self.apply("EXTRA-HBOT", self.order_book(bid=0, ask=5))
+
+        self.assertEqual([{"COINALPHA-HBOT": Decimal("10")}, {"COINALPHA-HBOT": Decimal("20")}],
+                         self.published_prices)
+        self.assertEqual({"COINALPHA-HBOT": Decimal("20")}, await source.get_prices())
+
+    def test_best_bid_and_last_trade_prices(self):
+        order_book = self.order_book(bid=0, ask=11)
+        order_book.last_trade_price = 10.5
+        self.tracker.order_books["COINALPHA-HBOT"] = order_book
+
+        bid_source = OrderBookRateSource(price_type=PriceType.BestBid)
+        bid_source.add_connector(self.connector)
+        self.assertEqual({"COINALPHA-HBOT": Decimal("10.5")}, bid_source.prices)
+
+        self.apply("COINALPHA-HBOT", self.order_book(bid=9, ask=11))
+        self.assertEqual({"COINALPHA-HBOT": Decimal("9")}, bid_source.prices)
+
+    def test_remove_connector(self):
+        self.tracker.order_books["COINALPHA-HBOT"] = self.order_book(bid=9, ask=11)
+        source = OrderBookRateSource()
+        source.add_connector(self.connector)
+
+        source.remove_connector(self.connector)
+        self.apply("COINALPHA-HBOT", self.order_book(bid=19, ask=21))
+
+        self.assertEqual({}, source.prices)
+        self.assertEqual(0, len(source.trading_pairs))
+
+    def test_add_connector_without_order_books(self):
+        source = OrderBookRateSource()
+        self.assertFalse(source.add_connector(MagicMock(spec=["name"])))
@@ -2,14 +2,17 @@ from copy import deepcopy
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import Dict, Optional
+from unittest.mock import MagicMock
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -80,6 +83,60 @@ class RateOracleTest(IsolatedAsyncioWrapperTestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rate_through_multi_hop_routes(self):
+        prices = {"HBOT-BTC": Decimal("0.005"), "BTC-EUR": Decimal("18000"), "GBP-EUR": Decimal("1.2"),
+                  "BTC-USDT": Decimal("20000")}
+        graph = RateConversionGraph()
+
+        self.assertEqual(Decimal("0.005") * Decimal("18000") / Decimal("1.2"), graph.find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(Decimal("1.2") / Decimal("18000"), graph.find_rate(prices, "GBP-BTC"))
+        self.assertIsNone(graph.find_rate(prices, "HBOT-JPY"))
+
+        # Price updates are used by the memoized routes, new pairs are indexed incrementally
+        prices["BTC-EUR"] = Decimal("19000")
+        prices["JPY-GBP"] = Decimal("0.005")
+        self.assertEqual(Decimal("1.2") / Decimal("19000"), graph.find_rate(prices, "GBP-BTC"))
+        self.assertEqual(Decimal("1") / Decimal("0.005"), graph.find_rate(prices, "GBP-JPY"))
+
+        # A shorter route replaces the memoized one
+        prices["HBOT-GBP"] = Decimal("80")
+        self.assertEqual(Decimal("80") / Decimal("0.005"), graph.find_rate(prices, "HBOT-JPY"))
+        self.assertIsNone(graph.find_rate(prices, "USDT-JPY"))
+
+        del prices["JPY-GBP"]
+        self.assertIsNone(graph.find_rate(prices, "HBOT-JPY"))
+
+    def test_rate_oracle_rates_from_local_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle.set_price("HBOT-USDT", Decimal("100"))
+        rate_oracle.set_price("AAVE-USDT", Decimal("50"))
+
+        self.assertEqual(Decimal("2"), rate_oracle.get_pair_rate("HBOT-AAVE"))
+
+        rate_oracle.set_price("USDT-GBP", Decimal("0.75"))
+
+        self.assertEqual({"HBOT-GBP": Decimal("75"), "AAVE-HBOT": Decimal("0.5"), "ZBOT-USDT": None},
+                         rate_oracle.get_rates(["HBOT-GBP", "AAVE-HBOT", "ZBOT-USDT"]))
+
+    def test_rate_oracle_live_order_book_prices_not_replaced_by_polled_prices(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot(bids=[OrderBookRow(9, 1, 1)], asks=[OrderBookRow(11, 1, 1)], update_id=1)
+        connector = MagicMock()
+        connector.name = "test_exchange"
+        connector.order_book_tracker.order_books = {self.trading_pair: order_book}
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: Decimal("12"),
+                                                                    "HBOT-USDT": Decimal("2")}))
+
+        self.assertTrue(rate_oracle.add_order_book_connector(connector))
+        rate_oracle.start()
+        self.run_async_with_timeout(rate_oracle.get_ready())
+
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate(self.trading_pair))
+        self.assertEqual(Decimal("20"), rate_oracle.get_pair_rate("COINALPHA-USDT"))
+
+        rate_oracle.remove_order_book_connector(connector)
+        rate_oracle.stop()
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -11,6 +11,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector, MetricsCollector
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.clock import Clock
 from hummingbot.core.trading_core import StrategyType, TradingCore
 from hummingbot.exceptions import InvalidScriptModule
@@ -404,6 +405,25 @@ class TradingCoreTest(IsolatedAsyncioWrapperTestCase):
             # Verify
             self.assertEqual(mock_create.call_count, 2)
             mock_init_recorder.assert_called_once()
+            self.assertEqual({"binance", "kucoin"}, set(self.trading_core.startup_timings))
+
+    @patch.object(TradingCore, "initialize_markets_recorder")
+    async def test_initialize_markets_loads_cached_reference_data_and_reports_timings(self, _):
+        exchange_connector = Mock(spec=ExchangePyBase)
+        exchange_connector.ready = False
+        exchange_connector.load_cached_reference_data = AsyncMock(return_value=True)
+        self.trading_core.connector_manager.connectors = {"binance": exchange_connector}
+
+        with patch.object(self.trading_core.connector_manager, "create_connector", return_value=exchange_connector):
+            await self.trading_core.initialize_markets([("binance", ["BTC-USDT"])])
+            exchange_connector.load_cached_reference_data.assert_awaited_once()
+            self.assertIn("cached_reference_data", self.trading_core.startup_timings["binance"])
+
+            exchange_connector.ready = True
+            await self.trading_core._startup_timings_task
+
+        self.assertEqual(["create", "cached_reference_data", "ready"],
+                         list(self.trading_core.startup_timings["binance"]))
 
     @patch.object(TradingCore, "stop_strategy")
     @patch.object(TradingCore, "stop_clock")
@@ -6,6 +6,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.web_assistant.connections.data_types import EndpointRESTRequest, RESTMethod, RESTResponse
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder
 
 
 class DataTypesTest(IsolatedAsyncioWrapperTestCase):
@@ -45,6 +46,28 @@ class DataTypesTest(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(body_str, text)
         await (aiohttp_client_session.close())
 
+    @aioresponses()
+    async def test_rest_response_json_decodes_body_bytes_with_decoder(self, mocked_api):
+        url = "https://some.url"
+        body = {"one": 1}
+        mocked_api.get(url=url, body=json.dumps(body), headers={"content-type": "application/json"})
+        mocked_api.get(url=url, body="", headers={"content-type": "application/json"})
+        decoded_payloads = []
+
+        class RecordingDecoder(JSONDecoder):
+            def loads(self, data):
+                decoded_payloads.append(data)
+                return super().loads(data)
+
+        aiohttp_client_session = aiohttp.ClientSession()
+        response = RESTResponse(await aiohttp_client_session.get(url), json_decoder=RecordingDecoder())
+        empty_response = RESTResponse(await aiohttp_client_session.get(url), json_decoder=RecordingDecoder())
+
+        self.assertEqual(body, await response.json())
+        self.assertEqual([json.dumps(body).encode()], decoded_payloads)
+        self.assertIsNone(await empty_response.json())
+        await aiohttp_client_session.close()
+
     @aioresponses()
     async def test_rest_response_with_test_properties(self, mocked_api):
         url = "https://some.url"
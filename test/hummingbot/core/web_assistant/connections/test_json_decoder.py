@@ -0,0 +1,64 @@
+import json
+import unittest
+from typing import List, TypedDict
+
+from hummingbot.core.web_assistant.connections import json_decoder
+from hummingbot.core.web_assistant.connections.json_decoder import (
+    JSONDecoder,
+    MsgspecDecoder,
+    OrjsonDecoder,
+    default_json_decoder,
+    get_json_decoder,
+)
+
+
+class EventMessage(TypedDict):
+    e: str
+
+
+class StreamMessage(EventMessage, total=False):
+    s: str
+    b: List[List[str]]
+    p: str
+
+
+class JSONDecoderTests(unittest.TestCase):
+    message = {"e": "depthUpdate", "E": 1, "s": "COINALPHAHBOT", "b": [["0.1", "1"]], "a": []}
+
+    def test_stdlib_decoder_decodes_str_and_bytes(self):
+        decoder = JSONDecoder()
+        payload = json.dumps(self.message)
+
+        self.assertEqual(self.message, decoder.loads(payload))
+        self.assertEqual(self.message, decoder.loads(payload.encode()))
+        self.assertEqual(self.message, decoder.loads(memoryview(payload.encode())))
+        self.assertEqual(self.message, decoder.decode(payload, schema=StreamMessage))
+        with self.assertRaises(ValueError):
+            decoder.loads("pong")
+
+    @unittest.skipIf(json_decoder.orjson is None, "orjson is not installed")
+    def test_orjson_decoder_decodes_as_stdlib_decoder(self):
+        decoder = get_json_decoder("orjson")
+        payload = json.dumps(self.message)
+
+        self.assertIsInstance(decoder, OrjsonDecoder)
+        self.assertIsInstance(default_json_decoder(), OrjsonDecoder)
+        self.assertEqual(self.message, decoder.loads(payload))
+        self.assertEqual(self.message, decoder.loads(payload.encode()))
+        with self.assertRaises(ValueError):
+            decoder.loads("pong")
+
+    @unittest.skipIf(json_decoder.msgspec is None, "msgspec is not installed")
+    def test_msgspec_decoder_decodes_into_schema(self):
+        decoder = get_json_decoder("msgspec")
+        schema = StreamMessage
+
+        self.assertIsInstance(decoder, MsgspecDecoder)
+        self.assertEqual({"e": "depthUpdate", "s": "COINALPHAHBOT", "b": [["0.1", "1"]]},
+                         decoder.decode(json.dumps(self.message), schema=schema))
+        with self.assertRaises(ValueError):
+            decoder.decode(json.dumps({"result": None, "id": 1}), schema=schema)
+
+    def test_unknown_decoder_raises(self):
+        with self.assertRaises(ValueError):
+            get_json_decoder("yaml")
@@ -9,6 +9,7 @@ from aiohttp import WebSocketError
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -121,6 +122,24 @@ class WSConnectionTest(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_decodes_with_the_decoder_and_message_schema(self, ws_connect_mock):
+        class SchemaDecoder(JSONDecoder):
+            def decode(self, data, schema=None):
+                if schema is not None and "result" in data:
+                    raise ValueError("Not in schema")
+                return {"schema": schema, "data": self.loads(data)}
+
+        ws_connection = WSConnection(self.client_session, json_decoder=SchemaDecoder())
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await ws_connection.connect(self.ws_url, message_schema=dict)
+        for message in [json.dumps({"one": 1}), json.dumps({"result": None}), "pong"]:
+            self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=message)
+
+        self.assertEqual({"schema": dict, "data": {"one": 1}}, (await ws_connection.receive()).data)
+        self.assertEqual({"result": None}, (await ws_connection.receive()).data)
+        self.assertEqual("pong", (await ws_connection.receive()).data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     async def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
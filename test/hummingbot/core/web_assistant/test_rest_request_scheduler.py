@@ -0,0 +1,98 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_request_scheduler import (
+    RESTRequestScheduler,
+    StaleRequestError,
+    request_priority,
+)
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+
+class RESTRequestSchedulerTest(IsolatedAsyncioWrapperTestCase):
+    limit_id = "TEST"
+
+    def throttler(self, limit: int = 1, time_interval: float = 0.1) -> AsyncThrottler:
+        return AsyncThrottler(rate_limits=[RateLimit(limit_id=self.limit_id, limit=limit,
+                                                     time_interval=time_interval)])
+
+    async def test_requests_wait_for_capacity_in_priority_order(self):
+        throttler = self.throttler()
+        scheduler = RESTRequestScheduler()
+        executed: List[str] = []
+
+        async def request(name: str, priority: RequestPriority):
+            with request_priority(priority):
+                async with scheduler.schedule(throttler=throttler, limit_id=self.limit_id):
+                    executed.append(name)
+
+        await request("first", RequestPriority.STATUS)
+        await asyncio.gather(request("balance", RequestPriority.BALANCE),
+                             request("status", RequestPriority.STATUS),
+                             request("create", RequestPriority.CREATE),
+                             request("cancel", RequestPriority.CANCEL))
+
+        self.assertEqual(["first", "cancel", "create", "status", "balance"], executed)
+
+    async def test_concurrent_requests_capped_per_priority(self):
+        throttler = AsyncThrottler(rate_limits=[])
+        scheduler = RESTRequestScheduler(max_concurrent_requests={RequestPriority.BALANCE: 1})
+        executing = {RequestPriority.BALANCE: 0, RequestPriority.STATUS: 0}
+        max_executing = {RequestPriority.BALANCE: 0, RequestPriority.STATUS: 0}
+
+        async def request(priority: RequestPriority):
+            async with scheduler.schedule(throttler=throttler, limit_id=self.limit_id, priority=priority):
+                executing[priority] += 1
+                max_executing[priority] = max(max_executing[priority], executing[priority])
+                await asyncio.sleep(0.01)
+                executing[priority] -= 1
+
+        await asyncio.gather(*[request(RequestPriority.BALANCE) for _ in range(3)],
+                             *[request(RequestPriority.STATUS) for _ in range(3)])
+
+        self.assertEqual(1, max_executing[RequestPriority.BALANCE])
+        self.assertEqual(3, max_executing[RequestPriority.STATUS])
+
+    async def test_stale_low_priority_requests_are_dropped(self):
+        throttler = self.throttler(time_interval=10)
+        scheduler = RESTRequestScheduler(max_wait_times={RequestPriority.REFERENCE_DATA: 0.05})
+
+        async with scheduler.schedule(throttler=throttler, limit_id=self.limit_id, priority=RequestPriority.STATUS):
+            pass
+        with self.assertRaises(StaleRequestError):
+            async with scheduler.schedule(throttler=throttler, limit_id=self.limit_id,
+                                          priority=RequestPriority.REFERENCE_DATA):
+                pass
+
+        self.assertEqual({RequestPriority.REFERENCE_DATA: 1}, scheduler.dropped_requests)
+        self.assertEqual(0, throttler._scheduler.waiting_requests)
+
+    async def test_rest_assistants_use_the_priority_of_the_context(self):
+        throttler = AsyncThrottler(rate_limits=[])
+        factory = WebAssistantsFactory(throttler=throttler)
+        rest_assistant = await factory.get_rest_assistant()
+        priorities = []
+        execute_task = throttler.execute_task
+
+        def register_priority(limit_id: str, priority: int):
+            priorities.append(priority)
+            return execute_task(limit_id=limit_id, priority=priority)
+
+        async def response(request, timeout=None):
+            return MagicMock(status=200)
+
+        with patch.object(throttler, "execute_task", side_effect=register_priority):
+            with patch.object(rest_assistant, "call", side_effect=response):
+                await rest_assistant.execute_request_and_get_response(url="https://test.com", throttler_limit_id="ID")
+                with request_priority(RequestPriority.CANCEL):
+                    await rest_assistant.execute_request_and_get_response(
+                        url="https://test.com", throttler_limit_id="ID", method=RESTMethod.DELETE)
+                    await rest_assistant.execute_request_and_get_response(
+                        url="https://test.com", throttler_limit_id="ID", priority=RequestPriority.BALANCE)
+
+        self.assertEqual([RequestPriority.DEFAULT, RequestPriority.CANCEL, RequestPriority.BALANCE], priorities)
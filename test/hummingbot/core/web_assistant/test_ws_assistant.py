@@ -47,7 +47,8 @@ class WSAssistantTest(IsolatedAsyncioWrapperTestCase):
                                         ws_headers={},
                                         ping_timeout=ping_timeout,
                                         message_timeout=message_timeout,
-                                        max_msg_size=max_msg_size)
+                                        max_msg_size=max_msg_size,
+                                        message_schema=None)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.disconnect")
     async def test_disconnect(self, disconnect_mock):
@@ -0,0 +1,159 @@
+import asyncio
+import json
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Iterable, List, Optional
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_multiplexer import SharedWSAssistant, WSMultiplexer, WSStreamRouter
+
+
+class TestStreamRouter(WSStreamRouter):
+    max_streams_per_connection = 3
+
+    def subscribed_streams(self, request: WSRequest) -> Optional[List[str]]:
+        return request.payload["streams"] if request.payload.get("op") == "subscribe" else None
+
+    def unsubscribed_streams(self, request: WSRequest) -> Optional[List[str]]:
+        return request.payload["streams"] if request.payload.get("op") == "unsubscribe" else None
+
+    def subscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"op": "subscribe", "streams": streams})
+
+    def unsubscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"op": "unsubscribe", "streams": streams})
+
+    def message_stream_keys(self, data: Any) -> Iterable[str]:
+        return [data["stream"]] if "stream" in data else []
+
+
+class WSMultiplexerTest(IsolatedAsyncioWrapperTestCase):
+    ws_url = "wss://test.com/ws"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.multiplexer = WSMultiplexer.for_endpoint(
+            ws_url=self.ws_url,
+            router=TestStreamRouter(),
+            api_factory=WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[])))
+        self.multiplexer.UNSUBSCRIBE_DELAY = 0
+        self.multiplexer.RECONNECT_DELAY = 0
+
+    @staticmethod
+    def subscribe_request(*streams: str) -> WSJSONRequest:
+        return WSJSONRequest(payload={"op": "subscribe", "streams": list(streams)})
+
+    def add_message(self, ws_mock: AsyncMock, message: dict):
+        self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock=ws_mock, message=json.dumps(message))
+
+    async def receive(self, consumer: SharedWSAssistant) -> Any:
+        response = await asyncio.wait_for(consumer.receive(), timeout=1)
+        return response.data
+
+    async def test_multiplexer_shared_per_endpoint(self):
+        self.assertIs(self.multiplexer, WSMultiplexer.for_endpoint(
+            ws_url=self.ws_url, router=TestStreamRouter(), api_factory=WebAssistantsFactory(throttler=AsyncMock())))
+        self.assertIsNot(self.multiplexer, WSMultiplexer.for_endpoint(
+            ws_url="wss://other.com/ws", router=TestStreamRouter(), api_factory=AsyncMock()))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_consumers_share_the_connection_and_receive_their_streams(self, ws_connect_mock):
+        ws_mock = ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        order_book = self.multiplexer.get_ws_assistant()
+        candles = self.multiplexer.get_ws_assistant()
+
+        await order_book.send(self.subscribe_request("btc@trade", "btc@depth"))
+        await candles.send(self.subscribe_request("btc@trade", "btc@kline"))
+
+        self.add_message(ws_mock, {"stream": "btc@kline", "id": 1})
+        self.add_message(ws_mock, {"stream": "btc@depth", "id": 2})
+        self.add_message(ws_mock, {"stream": "btc@trade", "id": 3})
+        self.add_message(ws_mock, {"result": None})
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(
+            [{"op": "subscribe", "streams": ["btc@trade", "btc@depth"]},
+             {"op": "subscribe", "streams": ["btc@kline"]}],
+            self.mocking_assistant.json_messages_sent_through_websocket(ws_mock))
+        self.assertEqual(2, (await self.receive(order_book))["id"])
+        self.assertEqual(3, (await self.receive(order_book))["id"])
+        self.assertEqual({"result": None}, await self.receive(order_book))
+        self.assertEqual(1, (await self.receive(candles))["id"])
+        self.assertEqual(3, (await self.receive(candles))["id"])
+        self.assertEqual({"result": None}, await self.receive(candles))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_streams_over_the_connection_capacity_use_a_new_connection(self, ws_connect_mock):
+        ws_mocks = [self.mocking_assistant.create_websocket_mock(), self.mocking_assistant.create_websocket_mock()]
+        ws_connect_mock.side_effect = ws_mocks
+        consumer = self.multiplexer.get_ws_assistant()
+
+        await consumer.send(self.subscribe_request("a", "b"))
+        await consumer.send(self.subscribe_request("c", "d"))
+
+        self.assertEqual(2, self.multiplexer.connections_count)
+        self.assertEqual([{"op": "subscribe", "streams": ["a", "b"]}, {"op": "subscribe", "streams": ["c"]}],
+                         self.mocking_assistant.json_messages_sent_through_websocket(ws_mocks[0]))
+        self.assertEqual([{"op": "subscribe", "streams": ["d"]}],
+                         self.mocking_assistant.json_messages_sent_through_websocket(ws_mocks[1]))
+
+        self.add_message(ws_mocks[1], {"stream": "d"})
+        self.assertEqual({"stream": "d"}, await self.receive(consumer))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_reconnects_and_subscribes_all_the_streams_after_an_interruption(self, ws_connect_mock):
+        ws_mocks = [self.mocking_assistant.create_websocket_mock(), self.mocking_assistant.create_websocket_mock()]
+        ws_connect_mock.side_effect = ws_mocks
+        first_consumer = self.multiplexer.get_ws_assistant()
+        second_consumer = self.multiplexer.get_ws_assistant()
+        await first_consumer.send(self.subscribe_request("a"))
+        await second_consumer.send(self.subscribe_request("b"))
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_mocks[0], message="", message_type=aiohttp.WSMsgType.CLOSED)
+
+        with self.assertRaises(ConnectionError):
+            await asyncio.wait_for(first_consumer.receive(), timeout=1)
+        with self.assertRaises(ConnectionError):
+            await asyncio.wait_for(second_consumer.receive(), timeout=1)
+
+        # The consumers restart with new assistants, their streams are still subscribed in the new connection
+        await first_consumer.disconnect()
+        restarted_consumer = self.multiplexer.get_ws_assistant()
+        await restarted_consumer.send(self.subscribe_request("a"))
+        self.add_message(ws_mocks[1], {"stream": "a"})
+
+        self.assertEqual({"stream": "a"}, await self.receive(restarted_consumer))
+        self.assertEqual(2, ws_connect_mock.call_count)
+        self.assertEqual([{"op": "subscribe", "streams": ["a", "b"]}],
+                         self.mocking_assistant.json_messages_sent_through_websocket(ws_mocks[1]))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_unused_streams_are_unsubscribed_and_empty_connections_closed(self, ws_connect_mock):
+        ws_mock = ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        first_consumer = self.multiplexer.get_ws_assistant()
+        second_consumer = self.multiplexer.get_ws_assistant()
+        await first_consumer.send(self.subscribe_request("a", "b"))
+        await second_consumer.send(self.subscribe_request("b", "c"))
+
+        await first_consumer.disconnect()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(["b", "c"], sorted(self.multiplexer.streams))
+        self.assertEqual({"op": "unsubscribe", "streams": ["a"]},
+                         self.mocking_assistant.json_messages_sent_through_websocket(ws_mock)[-1])
+
+        await second_consumer.send(WSJSONRequest(payload={"op": "unsubscribe", "streams": ["b"]}))
+        await second_consumer.disconnect()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([], self.multiplexer.streams)
+        self.assertEqual(0, self.multiplexer.connections_count)
+        self.assertIsNot(self.multiplexer, WSMultiplexer.for_endpoint(
+            ws_url=self.ws_url, router=TestStreamRouter(), api_factory=AsyncMock()))
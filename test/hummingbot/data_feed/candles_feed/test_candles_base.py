@@ -90,6 +90,18 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_cached_until_candles_change(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        version = self.data_feed.candles_version
+        candles_df = self.data_feed.candles_df
+        candles_df["close"] = 0
+        self.data_feed._candles[-1] = self._candles_data_mock()[-1]
+        self.assertEqual(version, self.data_feed.candles_version)
+        expected_df = pd.DataFrame(self._candles_data_mock(), columns=self.data_feed.columns, dtype=float)
+        pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
+        self.assertFalse(self.data_feed.candles_array.flags.writeable)
+        np.testing.assert_array_equal(expected_df.to_numpy(), self.data_feed.candles_array)
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -103,6 +115,14 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
         self.data_feed.load_candles_from_csv("/path/to/data")
         self.assertEqual(len(self.data_feed._candles), 4)
 
+    @patch("os.path.exists", return_value=True)
+    @patch("pandas.read_csv")
+    def test_load_candles_from_empty_csv(self, mock_read_csv, _):
+        mock_read_csv.return_value = pd.DataFrame(columns=self.data_feed.columns)
+
+        self.data_feed.load_candles_from_csv("/path/to/data")
+        self.assertEqual(len(self.data_feed._candles), 0)
+
     @patch("os.path.exists", return_value=False)
     def test_load_candles_from_csv_file_not_found(self, _):
         data_path = "/path/to/data"
@@ -416,3 +436,68 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
             result = await self.data_feed.get_historical_candles(config)
             self.assertIsInstance(result, pd.DataFrame)
             mock_fetch_candles.assert_called_once()
+
+    async def test_get_historical_candles_with_store_fetches_only_missing_ranges(self):
+        import tempfile
+
+        from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+        from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+        interval = self.data_feed.interval_in_seconds
+        start_time = 1622505600 - 1622505600 % interval
+        candles = np.array([[start_time + i * interval, 50000, 50100, 49900, 50050, 1000, 0, 0, 0, 0]
+                            for i in range(10)], dtype=float)
+
+        async def fetch_candles(start_time, end_time, limit):
+            return candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= end_time)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.object(self.data_feed, "initialize_exchange_data", new_callable=AsyncMock), \
+                patch.object(self.data_feed, "fetch_candles", side_effect=fetch_candles) as mock_fetch_candles, \
+                patch.object(self.data_feed, "_time", return_value=start_time + 100 * interval):
+            self.data_feed.candles_store = CandlesStore(tmp_dir)
+            config = HistoricalCandlesConfig(connector_name="test", trading_pair=self.trading_pair,
+                                             interval=self.interval, start_time=start_time,
+                                             end_time=start_time + 4 * interval)
+            first_result = await self.data_feed.get_historical_candles(config)
+            calls_after_first_request = mock_fetch_candles.call_count
+            second_result = await self.data_feed.get_historical_candles(config)
+            self.assertEqual(calls_after_first_request, mock_fetch_candles.call_count)
+            pd.testing.assert_frame_equal(first_result.reset_index(drop=True), second_result.reset_index(drop=True))
+            self.assertEqual(5, len(second_result))
+
+            config.end_time = start_time + 9 * interval
+            extended_result = await self.data_feed.get_historical_candles(config)
+            self.assertEqual(10, len(extended_result))
+            first_new_fetch = mock_fetch_candles.call_args_list[calls_after_first_request]
+            self.assertEqual(start_time + 5 * interval, first_new_fetch.kwargs["start_time"])
+            self.data_feed.candles_store = None
+
+    async def test_get_historical_candles_with_store_only_covers_fetched_range(self):
+        import tempfile
+
+        from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+        interval = self.data_feed.interval_in_seconds
+        start_time = 1622505600 - 1622505600 % interval
+        # The exchange only has candles from the 6th interval on, e.g. because the pair was listed later
+        candles = np.array([[start_time + i * interval, 50000, 50100, 49900, 50050, 1000, 0, 0, 0, 0]
+                            for i in range(5, 10)], dtype=float)
+
+        async def fetch_candles(start_time, end_time, limit):
+            return candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= end_time)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.object(self.data_feed, "fetch_candles", side_effect=fetch_candles), \
+                patch.object(self.data_feed, "_time", return_value=start_time + 100 * interval):
+            self.data_feed.candles_store = CandlesStore(tmp_dir)
+            result = await self.data_feed._get_historical_candles_with_store(start_time, start_time + 9 * interval)
+            self.assertEqual(5, len(result))
+            self.assertEqual([[start_time + 5 * interval, start_time + 9 * interval]],
+                             self.data_feed.candles_store.coverage(self.data_feed.name, self.data_feed.interval))
+
+            candles = np.empty((0, 10))
+            await self.data_feed._get_historical_candles_with_store(start_time - 10 * interval, start_time)
+            self.assertEqual([[start_time + 5 * interval, start_time + 9 * interval]],
+                             self.data_feed.candles_store.coverage(self.data_feed.name, self.data_feed.interval))
+            self.data_feed.candles_store = None
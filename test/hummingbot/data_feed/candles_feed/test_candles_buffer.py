@@ -0,0 +1,83 @@
+import unittest
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTest(unittest.TestCase):
+    columns = ["timestamp", "close"]
+
+    @staticmethod
+    def rows(start: int, n_rows: int):
+        return [[float(timestamp), float(timestamp) * 10] for timestamp in range(start, start + n_rows)]
+
+    def assert_matches_deque(self, buffer: CandlesBuffer, expected: deque):
+        self.assertEqual(len(expected), len(buffer))
+        self.assertEqual(list(expected), list(buffer))
+        self.assertEqual(list(reversed(expected)), list(reversed(buffer)))
+        if expected:
+            self.assertEqual(expected[0], buffer[0])
+            self.assertEqual(expected[-1], buffer[-1])
+
+    def test_operations_match_deque(self):
+        buffer = CandlesBuffer(maxlen=5, n_columns=2)
+        expected = deque(maxlen=5)
+        operations = [
+            ("extend", []),
+            ("extendleft", []),
+            ("append", self.rows(10, 1)[0]),
+            ("extend", self.rows(11, 3)),
+            ("append", self.rows(14, 1)[0]),
+            ("append", self.rows(15, 1)[0]),
+            ("extendleft", self.rows(7, 2)[::-1]),
+            ("appendleft", self.rows(6, 1)[0]),
+            ("extend", self.rows(20, 12)),
+            ("extendleft", self.rows(0, 7)[::-1]),
+            ("extend", []),
+            ("extendleft", iter([])),
+            ("clear", None),
+            ("extendleft", self.rows(3, 2)[::-1]),
+        ]
+        for _ in range(3):
+            operations.extend(("append", row) for row in self.rows(40, 7))
+        for operation, argument in operations:
+            if argument is None:
+                getattr(buffer, operation)()
+                getattr(expected, operation)()
+            else:
+                getattr(buffer, operation)(argument)
+                getattr(expected, operation)(argument)
+            self.assert_matches_deque(buffer, expected)
+
+    def test_set_item_only_changes_version_when_candle_changes(self):
+        buffer = CandlesBuffer(maxlen=3, n_columns=2)
+        buffer.extend(self.rows(0, 2))
+        version = buffer.version
+        buffer[-1] = [1.0, 10.0]
+        self.assertEqual(version, buffer.version)
+        buffer[-1] = [1.0, 11.0]
+        self.assertEqual(version + 1, buffer.version)
+        self.assertEqual([1.0, 11.0], buffer[-1])
+        with self.assertRaises(IndexError):
+            buffer[2] = [2.0, 20.0]
+
+    def test_values_view_and_dataframe_cache(self):
+        buffer = CandlesBuffer(maxlen=3, n_columns=2)
+        buffer.extend(self.rows(0, 4))
+        values = buffer.values
+        self.assertFalse(values.flags.writeable)
+        np.testing.assert_array_equal(np.array(self.rows(1, 3)), values)
+        np.testing.assert_array_equal(values, np.array(buffer))
+
+        df = buffer.to_dataframe(self.columns)
+        self.assertIs(df, buffer.to_dataframe(self.columns))
+        pd.testing.assert_frame_equal(pd.DataFrame(self.rows(1, 3), columns=self.columns), df)
+
+        buffer.append(self.rows(4, 1)[0])
+        updated_df = buffer.to_dataframe(self.columns)
+        self.assertIsNot(df, updated_df)
+        self.assertEqual(4.0, updated_df["timestamp"].iloc[-1])
+        self.assertEqual(3.0, df["timestamp"].iloc[-1])
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTest(unittest.TestCase):
+    feed_name = "binance_BTC-USDT"
+    interval = "1h"
+    interval_in_seconds = 3600
+    start_time = 1704067200  # 2024-01-01 00:00:00 UTC
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def candles(self, start_time: int, n_records: int) -> np.ndarray:
+        timestamps = start_time + self.interval_in_seconds * np.arange(n_records)
+        candles = np.zeros((n_records, 10))
+        candles[:, 0] = timestamps
+        candles[:, 4] = np.arange(n_records) + 100
+        return candles
+
+    def test_missing_ranges_without_coverage(self):
+        end_time = self.start_time + 10 * self.interval_in_seconds
+        self.assertEqual([(self.start_time, end_time)],
+                         self.store.missing_ranges(self.feed_name, self.interval, self.interval_in_seconds,
+                                                   self.start_time, end_time))
+
+    def test_write_and_read_across_days(self):
+        candles = self.candles(self.start_time, 48)
+        end_time = int(candles[-1, 0])
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, candles, self.start_time, end_time)
+
+        self.assertEqual([[self.start_time, end_time]], self.store.coverage(self.feed_name, self.interval))
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir.name, self.feed_name, self.interval, "20240101.npy")))
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir.name, self.feed_name, self.interval, "20240102.npy")))
+        np.testing.assert_array_equal(candles, self.store.read(self.feed_name, self.interval, self.start_time, end_time))
+        np.testing.assert_array_equal(candles[5:30], self.store.read(self.feed_name, self.interval,
+                                                                     int(candles[5, 0]), int(candles[29, 0])))
+
+    def test_read_single_day_is_memory_mapped(self):
+        candles = self.candles(self.start_time, 24)
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, candles, self.start_time,
+                         int(candles[-1, 0]))
+        result = self.store.read(self.feed_name, self.interval, self.start_time, int(candles[10, 0]))
+        self.assertIsInstance(result, np.memmap)
+        result[0, 4] = -1
+        self.assertEqual(100, self.store.read(self.feed_name, self.interval, self.start_time, self.start_time)[0, 4])
+
+    def test_missing_ranges_and_coverage_merge(self):
+        first = self.candles(self.start_time, 10)
+        second = self.candles(self.start_time + 20 * self.interval_in_seconds, 10)
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, first, self.start_time,
+                         int(first[-1, 0]))
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, second, int(second[0, 0]),
+                         int(second[-1, 0]))
+        end_time = self.start_time + 40 * self.interval_in_seconds
+
+        missing = self.store.missing_ranges(self.feed_name, self.interval, self.interval_in_seconds,
+                                            self.start_time, end_time)
+        self.assertEqual([(int(first[-1, 0]) + self.interval_in_seconds, int(second[0, 0]) - self.interval_in_seconds),
+                          (int(second[-1, 0]) + self.interval_in_seconds, end_time)], missing)
+
+        gap = self.candles(missing[0][0], 10)
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, gap, missing[0][0], missing[0][1])
+        self.assertEqual([[self.start_time, int(second[-1, 0])]], self.store.coverage(self.feed_name, self.interval))
+
+    def test_coverage_is_persisted_and_overlapping_candles_replaced(self):
+        candles = self.candles(self.start_time, 10)
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, candles, self.start_time,
+                         int(candles[-1, 0]))
+        updated = candles[5:].copy()
+        updated[:, 4] = 0
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, updated, int(updated[0, 0]),
+                         int(updated[-1, 0]))
+
+        reopened_store = CandlesStore(self.tmp_dir.name)
+        self.assertEqual([[self.start_time, int(candles[-1, 0])]], reopened_store.coverage(self.feed_name, self.interval))
+        result = reopened_store.read(self.feed_name, self.interval, self.start_time, int(candles[-1, 0]))
+        self.assertEqual(10, len(result))
+        np.testing.assert_array_equal(candles[:5, 4], result[:5, 4])
+        np.testing.assert_array_equal(np.zeros(5), result[5:, 4])
+
+    def test_writes_of_other_instances_are_kept(self):
+        other_store = CandlesStore(self.tmp_dir.name)
+        first = self.candles(self.start_time, 10)
+        second = self.candles(self.start_time + 30 * self.interval_in_seconds, 10)
+        # Both instances cache the empty coverage before any of them writes
+        self.assertEqual([], self.store.coverage(self.feed_name, self.interval))
+        self.assertEqual([], other_store.coverage(self.feed_name, self.interval))
+        self.store.write(self.feed_name, self.interval, self.interval_in_seconds, first, self.start_time,
+                         int(first[-1, 0]))
+        other_store.write(self.feed_name, self.interval, self.interval_in_seconds, second, int(second[0, 0]),
+                          int(second[-1, 0]))
+
+        expected_coverage = [[self.start_time, int(first[-1, 0])], [int(second[0, 0]), int(second[-1, 0])]]
+        self.assertEqual(expected_coverage, other_store.coverage(self.feed_name, self.interval))
+        self.assertEqual(expected_coverage, CandlesStore(self.tmp_dir.name).coverage(self.feed_name, self.interval))
+        self.assertEqual(20, len(self.store.read(self.feed_name, self.interval, self.start_time, int(second[-1, 0]))))
+        self.assertEqual({"20240101.npy", "20240102.npy", "coverage.json", ".lock"},
+                         set(os.listdir(os.path.join(self.tmp_dir.name, self.feed_name, self.interval))))
+
+    def test_get_store_returns_one_instance_per_directory(self):
+        store = CandlesStore.get_store(self.tmp_dir.name)
+        self.assertIs(store, CandlesStore.get_store(os.path.join(self.tmp_dir.name, ".")))
+        self.assertIsNot(store, CandlesStore.get_store(os.path.join(self.tmp_dir.name, "other")))
@@ -0,0 +1,104 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta  # noqa: F401
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.streaming_indicators import (
+    ATR,
+    EMA,
+    MACD,
+    NATR,
+    RSI,
+    SMA,
+    BBands,
+    CandlesIndicators,
+    SuperTrend,
+)
+
+
+class StreamingIndicatorsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = np.random.default_rng(7)
+        n_candles = 300
+        close = 30000 + np.cumsum(rng.normal(0, 20, n_candles))
+        cls.candles = np.zeros((n_candles, len(CandlesBase.columns)))
+        cls.candles[:, 0] = 1700000000 + 60 * np.arange(n_candles)
+        cls.candles[:, 1] = close + rng.normal(0, 5, n_candles)
+        cls.candles[:, 2] = close + rng.random(n_candles) * 30
+        cls.candles[:, 3] = close - rng.random(n_candles) * 30
+        cls.candles[:, 4] = close
+
+    def new_indicators(self, max_records: int = 1000) -> CandlesIndicators:
+        return CandlesIndicators([BBands(length=20, lower_std=2.0, upper_std=2.0), MACD(12, 26, 9),
+                                  SuperTrend(length=7, multiplier=3.0), NATR(14), ATR(14), RSI(14), EMA(10),
+                                  SMA(10)], max_records=max_records)
+
+    def pandas_ta_frame(self, candles: np.ndarray) -> pd.DataFrame:
+        df = pd.DataFrame(candles, columns=CandlesBase.columns)
+        df.ta.bbands(length=20, lower_std=2.0, upper_std=2.0, append=True)
+        df.ta.macd(fast=12, slow=26, signal=9, append=True)
+        df.ta.supertrend(length=7, multiplier=3.0, append=True)
+        df.ta.natr(length=14, append=True)
+        df.ta.atr(length=14, append=True)
+        df.ta.rsi(length=14, append=True)
+        df.ta.ema(length=10, append=True)
+        df.ta.sma(length=10, append=True)
+        return df
+
+    def assert_matches_pandas_ta(self, indicators: CandlesIndicators, candles: np.ndarray):
+        expected = self.pandas_ta_frame(candles)
+        result = indicators.to_frame()
+        self.assertEqual(list(expected.columns), list(result.columns))
+        for column in expected.columns:
+            np.testing.assert_allclose(expected[column].to_numpy(), result[column].to_numpy(), rtol=1e-9, atol=1e-8,
+                                       equal_nan=True, err_msg=column)
+
+    def test_streaming_updates_match_pandas_ta(self):
+        indicators = self.new_indicators()
+        for i in range(len(self.candles)):
+            open_candle = self.candles[:i + 1].copy()
+            open_candle[-1, 4] += 10
+            self.assertTrue(indicators.update(open_candle))
+            self.assertTrue(indicators.update(self.candles[:i + 1]))
+        self.assert_matches_pandas_ta(indicators, self.candles)
+
+    def test_batch_update_and_latest(self):
+        indicators = self.new_indicators()
+        indicators.update(self.candles)
+        self.assert_matches_pandas_ta(indicators, self.candles)
+        expected = self.pandas_ta_frame(self.candles).iloc[-1]
+        latest = indicators.latest
+        self.assertEqual(indicators.columns, list(latest.keys()))
+        np.testing.assert_allclose(expected[indicators.columns].to_numpy(dtype=float), list(latest.values()),
+                                   rtol=1e-9, equal_nan=True)
+
+    def test_history_is_limited_to_max_records(self):
+        indicators = self.new_indicators(max_records=50)
+        indicators.update(self.candles)
+        frame = indicators.to_frame()
+        self.assertEqual(50, len(frame))
+        expected = self.pandas_ta_frame(self.candles).iloc[-50:].reset_index(drop=True)
+        pd.testing.assert_series_equal(expected["RSI_14"], frame["RSI_14"])
+        self.assertEqual(50, len(indicators.indicators[0].history))
+
+    def test_update_skips_unchanged_candles_and_recomputes_after_backfill(self):
+        indicators = self.new_indicators()
+        self.assertTrue(indicators.update(self.candles[200:], version=1))
+        frame = indicators.to_frame()
+        self.assertFalse(indicators.update(self.candles[200:], version=1))
+        self.assertFalse(indicators.update(self.candles[200:], version=2))
+        pd.testing.assert_frame_equal(frame, indicators.to_frame())
+
+        self.assertTrue(indicators.update(self.candles[100:], version=3))
+        self.assert_matches_pandas_ta(indicators, self.candles[100:])
+
+    def test_sliding_window_of_candles(self):
+        indicators = self.new_indicators()
+        for i in range(100, len(self.candles) + 1):
+            indicators.update(self.candles[i - 100:i])
+        self.assert_matches_pandas_ta(indicators, self.candles)
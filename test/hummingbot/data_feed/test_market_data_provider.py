@@ -3,6 +3,7 @@ from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.trading_rule import TradingRule
@@ -10,7 +11,9 @@ from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import SMA, BBands
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -71,6 +74,44 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_candles_feeds_use_candles_store(self):
+        config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100)
+        self.provider.initialize_candles_feed(config)
+        self.assertIs(CandlesStore.get_store(), self.provider.candles_store)
+        self.assertIs(self.provider.candles_store, self.provider.candles_feeds["binance_BTC-USDT_1m"].candles_store)
+
+        provider_without_store = MarketDataProvider(self.connectors, use_candles_store=False)
+        provider_without_store.initialize_candles_feed(config)
+        self.assertIsNone(provider_without_store.candles_store)
+        self.assertIsNone(provider_without_store.candles_feeds["binance_BTC-USDT_1m"].candles_store)
+
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_get_candles_indicators(self):
+        self.provider.initialize_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        candles_feed = self.provider.candles_feeds["binance_BTC-USDT_1m"]
+        candles_feed._candles.extend([[1700000000 + 60 * i, 100 + i, 101 + i, 99 + i, 100 + i, 1, 0, 0, 0, 0]
+                                      for i in range(5)])
+
+        indicators = self.provider.get_candles_indicators("binance", "BTC-USDT", "1m", [SMA(length=3)], 100)
+        self.assertEqual([101.0, 102.0, 103.0], indicators.to_frame()["SMA_3"].dropna().tolist())
+        candles_feed._candles.append([1700000300, 105, 106, 104, 105, 1, 0, 0, 0, 0])
+        same_indicators = self.provider.get_candles_indicators("binance", "BTC-USDT", "1m", [SMA(length=3)], 100)
+        self.assertIs(indicators, same_indicators)
+        self.assertEqual(104.0, same_indicators.latest["SMA_3"])
+
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_get_candles_indicators_is_cached_by_indicator_parameters(self):
+        self.provider.initialize_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        population_std = self.provider.get_candles_indicators("binance", "BTC-USDT", "1m", [BBands(length=3, ddof=0)])
+        sample_std = self.provider.get_candles_indicators("binance", "BTC-USDT", "1m", [BBands(length=3, ddof=1)])
+        self.assertIsNot(population_std, sample_std)
+        self.assertEqual(0, population_std.indicators[0].ddof)
+        self.assertIs(population_std, self.provider.get_candles_indicators("binance", "BTC-USDT", "1m",
+                                                                           [BBands(length=3, ddof=0)]))
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
@@ -91,6 +132,18 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_depth(self):
+        mock_order_book = MagicMock()
+        mock_order_book.get_depth_arrays.return_value = (np.zeros((5, 3)), np.ones((5, 3)))
+        mock_order_book.get_cumulative_depth_arrays.return_value = (np.zeros((2, 3)), np.ones((2, 3)))
+        self.mock_connector.get_order_book.return_value = mock_order_book
+        bids, asks = self.provider.get_order_book_depth("mock_connector", "BTC-USDT", 5)
+        self.assertEqual((5, 3), bids.shape)
+        mock_order_book.get_depth_arrays.assert_called_once_with(5)
+        bids, asks = self.provider.get_order_book_depth("mock_connector", "BTC-USDT", 2, cumulative=True)
+        self.assertEqual((2, 3), asks.shape)
+        mock_order_book.get_cumulative_depth_arrays.assert_called_once_with(2)
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))
@@ -328,6 +381,31 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
 
         mock_oracle_instance.set_price.assert_called_with("BTC-USDT", Decimal("50000"))
 
+    @patch('hummingbot.core.rate_oracle.rate_oracle.RateOracle.get_instance')
+    async def test_update_rates_task_skips_pairs_with_live_order_books(self, mock_rate_oracle):
+        mock_oracle_instance = MagicMock()
+        mock_oracle_instance.order_book_source.trading_pairs = {"BTC-USDT"}
+        mock_oracle_instance.add_order_book_connector.return_value = True
+        mock_rate_oracle.return_value = mock_oracle_instance
+
+        self.provider.initialize_rate_sources([ConnectorPair(connector_name="mock_connector", trading_pair="BTC-USDT"),
+                                               ConnectorPair(connector_name="binance", trading_pair="BTC-USDT"),
+                                               ConnectorPair(connector_name="binance", trading_pair="ETH-USDT")])
+        mock_oracle_instance.add_order_book_connector.assert_called_once_with(self.mock_connector)
+
+        with patch.object(self.provider, '_safe_get_last_traded_prices',
+                          return_value={"ETH-USDT": Decimal("3000")}) as get_prices_mock:
+            with patch('asyncio.sleep', side_effect=asyncio.CancelledError()):
+                with self.assertRaises(asyncio.CancelledError):
+                    await self.provider.update_rates_task()
+
+        get_prices_mock.assert_called_once()
+        self.assertEqual(["ETH-USDT"], get_prices_mock.call_args.kwargs["trading_pairs"])
+        mock_oracle_instance.set_price.assert_called_once_with("ETH-USDT", Decimal("3000"))
+
+        self.provider.stop()
+        mock_oracle_instance.remove_order_book_connector.assert_called_once_with(self.mock_connector)
+
     @patch('hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_instance')
     async def test_update_rates_task_gateway_error(self, mock_gateway_client):
         # Test gateway connector with error handling
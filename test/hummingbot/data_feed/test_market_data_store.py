@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.data_feed.market_data_store import SECONDS_PER_DAY, MarketDataPartition, MarketDataStore
+
+
+class MarketDataStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = MarketDataStore(self.temp_dir.name)
+        self.day_start = 1700006400  # 2023-11-15 00:00:00 UTC
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def book_rows(best_price: float, levels: int, step: float) -> np.ndarray:
+        return np.array([[best_price + i * step, i + 1, 1] for i in range(levels)], dtype=np.float64)
+
+    def test_append_order_book_reads_the_top_levels(self):
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(self.book_rows(99, 50, -1), self.book_rows(101, 50, 1))
+
+        self.store.append_order_book("binance", "ETH-USDT", self.day_start + 10, order_book, depth=3)
+
+        data = self.store.read("binance", "ETH-USDT", self.day_start, self.day_start + 60)
+        self.assertEqual([self.day_start + 10], data["timestamp"].tolist())
+        self.assertEqual([100], data["mid_price"].tolist())
+        self.assertEqual([99], data["best_bid"].tolist())
+        self.assertEqual([101], data["best_ask"].tolist())
+        self.assertEqual([2], data["spread"].tolist())
+        self.assertEqual([[99, 98, 97]], data["bid_price"].tolist())
+        self.assertEqual([[1, 2, 3]], data["bid_amount"].tolist())
+        self.assertEqual([[101, 102, 103]], data["ask_price"].tolist())
+        self.assertEqual([[1, 2, 3]], data["ask_amount"].tolist())
+
+    def test_read_time_range_and_columns(self):
+        for i in range(10):
+            self.store.append("binance", "ETH-USDT", self.day_start + i * 60,
+                              self.book_rows(99 + i, 2, -1), self.book_rows(101 + i, 1, 1), depth=2)
+
+        data = self.store.read("binance", "ETH-USDT", self.day_start + 120, self.day_start + 300,
+                               columns=["mid_price", "ask_price"])
+
+        self.assertEqual({"timestamp", "mid_price", "ask_price"}, set(data))
+        self.assertEqual([self.day_start + i * 60 for i in range(2, 6)], data["timestamp"].tolist())
+        self.assertEqual([102, 103, 104, 105], data["mid_price"].tolist())
+        # Missing levels are NaN
+        self.assertEqual(103, data["ask_price"][0, 0])
+        self.assertTrue(np.isnan(data["ask_price"][:, 1]).all())
+
+    def test_read_across_days_as_dataframe(self):
+        for timestamp in [self.day_start - 60, self.day_start, self.day_start + 60]:
+            self.store.append("binance", "ETH-USDT", timestamp,
+                              self.book_rows(99, 2, -1), self.book_rows(101, 2, 1), depth=2)
+        self.assertEqual(["ETH-USDT"], self.store.trading_pairs("binance"))
+        self.assertEqual(2, len(os.listdir(os.path.join(self.temp_dir.name, "binance", "ETH-USDT"))))
+
+        df = self.store.read_df("binance", "ETH-USDT", self.day_start - SECONDS_PER_DAY, self.day_start + 60,
+                                columns=["mid_price", "bid_price"])
+
+        self.assertEqual([self.day_start - 60, self.day_start, self.day_start + 60], df.index.tolist())
+        self.assertEqual(["mid_price", "bid_price_0", "bid_price_1"], df.columns.tolist())
+        self.assertEqual([98, 98, 98], df["bid_price_1"].tolist())
+
+    def test_read_missing_trading_pair(self):
+        data = self.store.read("binance", "BTC-USDT", self.day_start, self.day_start + 60)
+
+        self.assertEqual(0, len(data["timestamp"]))
+        self.assertEqual(0, len(self.store.read_df("binance", "BTC-USDT", self.day_start, self.day_start + 60)))
+
+    def test_partially_written_sample_is_discarded(self):
+        self.store.append("binance", "ETH-USDT", self.day_start, self.book_rows(99, 2, -1),
+                          self.book_rows(101, 2, 1), depth=2)
+        self.store.close()
+        partition_path = os.path.join(self.temp_dir.name, "binance", "ETH-USDT", "20231115")
+        # A crash after writing some columns of the next sample
+        for column in MarketDataPartition.SCALAR_COLUMNS:
+            with open(os.path.join(partition_path, f"{column}.f64"), "ab") as f:
+                f.write(np.float64(1).tobytes())
+
+        self.assertEqual(1, len(self.store.read("binance", "ETH-USDT", self.day_start, self.day_start + 60)["mid_price"]))
+
+        self.store.append("binance", "ETH-USDT", self.day_start + 60, self.book_rows(199, 2, -1),
+                          self.book_rows(201, 2, 1), depth=2)
+        data = self.store.read("binance", "ETH-USDT", self.day_start, self.day_start + 60)
+        self.assertEqual([100, 200], data["mid_price"].tolist())
+        self.assertEqual([[99, 98], [199, 198]], data["bid_price"].tolist())
+
+    def test_partition_keeps_its_depth(self):
+        self.store.append("binance", "ETH-USDT", self.day_start, self.book_rows(99, 5, -1),
+                          self.book_rows(101, 5, 1), depth=2)
+        self.store.close()
+        self.store.append("binance", "ETH-USDT", self.day_start + 60, self.book_rows(99, 5, -1),
+                          self.book_rows(101, 5, 1), depth=4)
+
+        data = self.store.read("binance", "ETH-USDT", self.day_start, self.day_start + 60, columns=["bid_price"])
+        self.assertEqual((2, 2), data["bid_price"].shape)
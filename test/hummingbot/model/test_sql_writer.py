@@ -0,0 +1,112 @@
+import tempfile
+import threading
+import unittest
+from os.path import join
+
+from sqlalchemy import text
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_writer import SQLWriter
+
+
+class SQLWriterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                            db_path=join(self.temp_dir.name, "test.sqlite"))
+        self.writer = SQLWriter(self.manager, flush_interval=0.05, max_batch_size=10)
+
+    def tearDown(self) -> None:
+        self.writer.stop()
+        self.manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def metadata_values(self):
+        with self.manager.get_new_session() as session:
+            return {m.key: m.value for m in session.query(Metadata).filter(Metadata.key.like("test_%"))}
+
+    def write_metadata(self, key: str, value: str):
+        def write(session):
+            record = session.query(Metadata).filter(Metadata.key == key).one_or_none()
+            if record is None:
+                session.add(Metadata(key=key, value=value))
+            else:
+                record.value = value
+        return write
+
+    def test_file_database_is_written_behind_in_wal_mode(self):
+        self.assertTrue(self.writer.write_behind)
+        with self.manager.engine.connect() as conn:
+            self.assertEqual("wal", conn.execute(text("PRAGMA journal_mode")).scalar())
+
+        writer_threads = []
+        self.writer.submit(lambda session: writer_threads.append(threading.current_thread()))
+        self.writer.submit(self.write_metadata("test_a", "1"))
+        self.assertTrue(self.writer.flush(timeout=5))
+
+        self.assertEqual({"test_a": "1"}, self.metadata_values())
+        self.assertNotEqual([threading.current_thread()], writer_threads)
+
+    def test_writes_are_flushed_after_the_flush_interval(self):
+        written = threading.Event()
+        self.writer.submit(self.write_metadata("test_a", "1"))
+        self.writer.submit(lambda session: written.set())
+
+        self.assertTrue(written.wait(timeout=5))
+        self.writer.flush(timeout=5)
+        self.assertEqual({"test_a": "1"}, self.metadata_values())
+        metrics = self.writer.get_metrics()
+        self.assertEqual(1, metrics["batches"])
+        self.assertEqual(2, metrics["writes"])
+        self.assertEqual(0, metrics["queue_depth"])
+        self.assertEqual(2, metrics["max_queue_depth"])
+
+    def test_writes_with_the_same_coalesce_key_in_a_batch_write_the_last_one(self):
+        for i in range(5):
+            self.writer.submit(self.write_metadata("test_a", str(i)), coalesce_key="test_a")
+        self.writer.submit(self.write_metadata("test_b", "1"))
+        self.writer.flush(timeout=5)
+
+        self.assertEqual({"test_a": "4", "test_b": "1"}, self.metadata_values())
+        self.assertEqual(4, self.writer.get_metrics()["coalesced_writes"])
+
+    def test_failed_write_does_not_discard_the_other_writes_of_the_batch(self):
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        self.writer.submit(self.write_metadata("test_a", "1"))
+        self.writer.submit(failing_write)
+        self.writer.submit(self.write_metadata("test_b", "2"))
+        with self.assertLogs("hummingbot.model.sql_writer", level="ERROR"):
+            self.writer.flush(timeout=5)
+
+        self.assertEqual({"test_a": "1", "test_b": "2"}, self.metadata_values())
+        self.assertEqual(1, self.writer.get_metrics()["failed_writes"])
+
+    def test_stop_writes_the_pending_writes(self):
+        self.writer.submit(self.write_metadata("test_a", "1"))
+        self.writer.stop()
+
+        self.assertEqual({"test_a": "1"}, self.metadata_values())
+
+        self.writer.submit(self.write_metadata("test_b", "2"))
+        self.writer.flush(timeout=5)
+        self.assertEqual({"test_a": "1", "test_b": "2"}, self.metadata_values())
+
+    def test_in_memory_database_is_written_inline(self):
+        manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                       db_path=":memory:")
+        writer = SQLWriter(manager)
+        writer_threads = []
+        writer.submit(lambda session: writer_threads.append(threading.current_thread()))
+
+        self.assertTrue(manager.is_in_memory)
+        self.assertFalse(writer.write_behind)
+        self.assertEqual([threading.current_thread()], writer_threads)
+        self.assertTrue(writer.flush())
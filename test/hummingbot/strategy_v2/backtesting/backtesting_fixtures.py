@@ -0,0 +1,129 @@
+"""
+Controllers and candles shared by the backtesting tests.
+"""
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+
+
+def synthetic_candles(start: int, rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    1m candles of a random walk starting at 100.
+    """
+    rng = np.random.default_rng(seed)
+    timestamps = start + 60 * np.arange(rows)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.001, rows)) * close
+    return pd.DataFrame({
+        "timestamp": timestamps.astype(float),
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "volume": rng.uniform(1, 10, rows),
+    })
+
+
+class ParityControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name: str = "parity_controller"
+    fast_length: int = 5
+    slow_length: int = 20
+    limit_entry_offset: Decimal = Decimal("0")
+    use_dca_executors: bool = False
+    constant_signal: bool = False
+
+    def get_controller_class(self):
+        # The module defines several controllers, the engines load the base one
+        return ParityController
+
+
+class ParityController(DirectionalTradingControllerBase):
+    async def update_processed_data(self):
+        df = self.market_data_provider.get_candles_df(connector_name=self.config.connector_name,
+                                                      trading_pair=self.config.trading_pair,
+                                                      interval="1m").copy()
+        fast = df["close"].rolling(self.config.fast_length).mean()
+        slow = df["close"].rolling(self.config.slow_length).mean()
+        df["signal"] = 0
+        if not self.config.constant_signal:
+            df.loc[fast > slow * 1.001, "signal"] = 1
+            df.loc[fast < slow * 0.999, "signal"] = -1
+        self.processed_data["signal"] = df["signal"].iloc[-1]
+        self.processed_data["features"] = df
+
+    def get_executor_config(self, trade_type: TradeType, price: Decimal, amount: Decimal):
+        if self.config.use_dca_executors:
+            step = Decimal("-0.003") if trade_type == TradeType.BUY else Decimal("0.003")
+            return DCAExecutorConfig(
+                timestamp=self.market_data_provider.time(),
+                connector_name=self.config.connector_name,
+                trading_pair=self.config.trading_pair,
+                side=trade_type,
+                amounts_quote=[amount * price / 2] * 2,
+                prices=[price, price * (1 + step)],
+                take_profit=self.config.take_profit,
+                stop_loss=self.config.stop_loss,
+                time_limit=self.config.time_limit,
+                leverage=self.config.leverage,
+            )
+        triple_barrier_config = self.config.triple_barrier_config
+        if self.config.limit_entry_offset > 0:
+            offset = -self.config.limit_entry_offset if trade_type == TradeType.BUY else self.config.limit_entry_offset
+            price = price * (1 + offset)
+            triple_barrier_config = triple_barrier_config.model_copy(update={"open_order_type": OrderType.LIMIT})
+        return PositionExecutorConfig(
+            timestamp=self.market_data_provider.time(),
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            side=trade_type,
+            entry_price=price,
+            amount=amount,
+            triple_barrier_config=triple_barrier_config,
+            leverage=self.config.leverage,
+        )
+
+
+class MarketMakingParityController(ParityController):
+    """
+    Quotes on a fixed schedule like a market making controller, so the signal column never changes.
+    """
+    def create_actions_proposal(self):
+        minute = int(self.market_data_provider.time() // 60)
+        if minute % 17 != 0 or any(executor_info.is_active for executor_info in self.executors_info):
+            return []
+        price = self.market_data_provider.get_price_by_type(self.config.connector_name, self.config.trading_pair,
+                                                            PriceType.MidPrice)
+        trade_type = TradeType.BUY if minute % 34 == 0 else TradeType.SELL
+        return [CreateExecutorAction(controller_id=self.config.id, executor_config=self.get_executor_config(
+            trade_type, price, self.config.total_amount_quote / price))]
+
+
+class EarlyStopParityController(ParityController):
+    early_stop_time = 60 * 7
+
+    def stop_actions_proposal(self):
+        return [StopExecutorAction(controller_id=self.config.id, executor_id=executor_info.id)
+                for executor_info in self.executors_info
+                if executor_info.is_active and
+                self.market_data_provider.time() - executor_info.timestamp >= self.early_stop_time]
+
+
+class ScheduledEntryParityController(ParityController):
+    """
+    Follows the signal but only enters on some minutes, so its actions change on rows where the signal doesn't.
+    """
+    def create_actions_proposal(self):
+        if int(self.market_data_provider.time() // 60) % 7 != 0:
+            return []
+        return super().create_actions_proposal()
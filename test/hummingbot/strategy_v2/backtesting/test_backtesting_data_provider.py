@@ -0,0 +1,51 @@
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+
+class TestBacktestingDataProvider(IsolatedAsyncioWrapperTestCase):
+    start_time = 1704067200  # 2024-01-01 00:00:00 UTC
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.provider = BacktestingDataProvider(connectors={})
+        self.provider.candles_store = CandlesStore(self.tmp_dir.name)
+        self.provider.update_backtesting_time(self.start_time, self.start_time + 60 * 59)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_uses_candles_store_by_default(self):
+        self.assertIs(CandlesStore.get_store(), BacktestingDataProvider(connectors={}).candles_store)
+        self.assertIsNone(BacktestingDataProvider(connectors={}, use_candles_store=False).candles_store)
+
+    async def test_get_candles_feed_reads_stored_candles(self):
+        candles = np.zeros((100, 10))
+        candles[:, 0] = self.start_time - 60 * 40 + 60 * np.arange(100)
+        candles[:, 4] = 100 + np.arange(100)
+
+        async def fetch_candles(start_time, end_time, limit):
+            return candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= end_time)]
+
+        config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=10)
+        with patch.object(BinanceSpotCandles, "initialize_exchange_data", new_callable=AsyncMock), \
+                patch.object(BinanceSpotCandles, "fetch_candles", side_effect=fetch_candles) as mock_fetch_candles:
+            candles_df = await self.provider.get_candles_feed(config)
+            fetch_calls = mock_fetch_candles.call_count
+            self.provider.candles_feeds.clear()
+            stored_candles_df = await self.provider.get_candles_feed(config)
+
+        self.assertEqual(fetch_calls, mock_fetch_candles.call_count)
+        self.assertEqual(70, len(stored_candles_df))
+        self.assertEqual(candles_df["close"].tolist(), stored_candles_df["close"].tolist())
+        self.assertEqual([[self.start_time - 60 * 10, self.start_time + 60 * 59]],
+                         self.provider.candles_store.coverage("binance_BTC-USDT", "1m"))
@@ -0,0 +1,116 @@
+import os
+import tempfile
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.backtesting_fixtures import ParityControllerConfig, synthetic_candles
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.data_feed.candles_feed.binance_perpetual_candles.binance_perpetual_candles import (
+    BinancePerpetualCandles,
+)
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.parameter_sweep import ParameterSweepRunner, SharedCandlesFeed
+
+
+class TestParameterSweepRunner(IsolatedAsyncioWrapperTestCase):
+    start = 1700000000
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.candles = synthetic_candles(cls.start, 3000)
+        cls.end = int(cls.candles["timestamp"].iloc[-1])
+
+    def setUp(self):
+        super().setUp()
+        self.base_config = ParityControllerConfig(stop_loss=Decimal("0.01"), take_profit=Decimal("0.008"),
+                                                  time_limit=60 * 30, cooldown_time=60 * 5)
+        self.runner = ParameterSweepRunner(base_config=self.base_config, start=self.start, end=self.end,
+                                           max_workers=2)
+        data_provider = self.runner.engine.backtesting_data_provider
+        data_provider.candles_feeds["binance_perpetual_WLD-USDT_1m"] = self.candles.copy()
+        data_provider.trading_rules = {"binance_perpetual": {"WLD-USDT": TradingRule("WLD-USDT")}}
+
+    def test_grid(self):
+        parameter_sets = ParameterSweepRunner.grid({"stop_loss": [Decimal("0.01"), Decimal("0.02")],
+                                                    "fast_length": [3, 5, 8]})
+        self.assertEqual(6, len(parameter_sets))
+        self.assertEqual({"stop_loss": Decimal("0.01"), "fast_length": 3}, parameter_sets[0])
+        self.assertEqual({"stop_loss": Decimal("0.02"), "fast_length": 8}, parameter_sets[-1])
+
+    def test_random_search(self):
+        parameter_space = {"fast_length": (3, 10), "stop_loss": (Decimal("0.005"), Decimal("0.02")),
+                           "time_limit": [600, 1800]}
+        parameter_sets = ParameterSweepRunner.random_search(parameter_space, n_samples=20, seed=1)
+        self.assertEqual(20, len(parameter_sets))
+        self.assertEqual(parameter_sets, ParameterSweepRunner.random_search(parameter_space, n_samples=20, seed=1))
+        for parameter_set in parameter_sets:
+            self.assertIsInstance(parameter_set["fast_length"], int)
+            self.assertTrue(3 <= parameter_set["fast_length"] <= 10)
+            self.assertIsInstance(parameter_set["stop_loss"], Decimal)
+            self.assertTrue(Decimal("0.005") <= parameter_set["stop_loss"] <= Decimal("0.02"))
+            self.assertIn(parameter_set["time_limit"], [600, 1800])
+
+    def test_build_config(self):
+        config = self.runner.build_config({"stop_loss": "0.02", "fast_length": 8})
+        self.assertIsInstance(config, ParityControllerConfig)
+        self.assertEqual(Decimal("0.02"), config.stop_loss)
+        self.assertEqual(8, config.fast_length)
+        self.assertEqual(self.base_config.take_profit, config.take_profit)
+        self.assertEqual(Decimal("0.01"), self.base_config.stop_loss)
+
+    def test_shared_candles_feed(self):
+        shared_feed, shared_memory = SharedCandlesFeed.from_dataframe(self.candles)
+        try:
+            candles_df, attached_memory = shared_feed.attach()
+            pd.testing.assert_frame_equal(self.candles, candles_df)
+            self.assertFalse(candles_df["close"].to_numpy().flags.writeable)
+            self.assertTrue(np.shares_memory(candles_df["close"].to_numpy(),
+                                             np.ndarray(shared_feed.shape, dtype=np.float64, buffer=attached_memory.buf)))
+            del candles_df
+            attached_memory.close()
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    async def test_run_matches_sequential_backtests(self):
+        parameter_sets = ParameterSweepRunner.grid({"take_profit": [Decimal("0.005"), Decimal("0.01")],
+                                                    "cooldown_time": [60, 600]})
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.object(BacktestingDataProvider, "initialize_rate_sources"):
+            results_path = os.path.join(tmp_dir, "sweep.csv")
+            results_df = await self.runner.run(parameter_sets, results_path=results_path)
+            csv_df = pd.read_csv(results_path)
+
+            self.assertEqual(list(range(len(parameter_sets))), results_df["run_id"].tolist())
+            self.assertEqual(len(parameter_sets), len(csv_df))
+            self.assertTrue(results_df["error"].isna().all())
+            for run_id, parameters in enumerate(parameter_sets):
+                expected = await self.runner.engine.run_backtesting(self.runner.build_config(parameters),
+                                                                    self.start, self.end, "1m")
+                row = results_df.iloc[run_id]
+                self.assertEqual(expected["results"]["total_executors"], row["total_executors"])
+                self.assertAlmostEqual(expected["results"]["net_pnl_quote"], row["net_pnl_quote"], places=9)
+
+    async def test_run_with_unaligned_end_fetches_candles_once(self):
+        # The last candle opens before the end, the workers must still reuse the candles loaded by the runner
+        end = self.end + 30
+        runner = ParameterSweepRunner(base_config=self.base_config, start=self.start, end=end, max_workers=2)
+        runner.engine.backtesting_data_provider.trading_rules = {
+            "binance_perpetual": {"WLD-USDT": TradingRule("WLD-USDT")}}
+        parameter_sets = ParameterSweepRunner.grid({"take_profit": [Decimal("0.005"), Decimal("0.01")]})
+        with patch.object(BacktestingDataProvider, "initialize_rate_sources"), \
+                patch.object(BinancePerpetualCandles, "get_historical_candles",
+                             new_callable=AsyncMock, return_value=self.candles.copy()) as get_historical_candles:
+            results_df = await runner.run(parameter_sets)
+            expected = await runner.engine.run_backtesting(runner.build_config(parameter_sets[0]), self.start, end,
+                                                           "1m")
+
+        get_historical_candles.assert_called_once()
+        self.assertTrue(results_df["error"].isna().all())
+        self.assertEqual(expected["results"]["total_executors"], results_df.iloc[0]["total_executors"])
+        self.assertAlmostEqual(expected["results"]["net_pnl_quote"], results_df.iloc[0]["net_pnl_quote"], places=9)
@@ -0,0 +1,134 @@
+from decimal import Decimal
+from test.hummingbot.strategy_v2.backtesting.backtesting_fixtures import (
+    EarlyStopParityController,
+    MarketMakingParityController,
+    ParityController,
+    ParityControllerConfig,
+    ScheduledEntryParityController,
+    synthetic_candles,
+)
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.vectorized_backtesting_engine import (
+    CandleExtremaIndex,
+    VectorizedBacktestingEngine,
+)
+from hummingbot.strategy_v2.executors.position_executor.data_types import TrailingStop
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TestVectorizedBacktestingEngine(IsolatedAsyncioWrapperTestCase):
+    start = 1700000000
+    rows = 3000
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.candles = synthetic_candles(cls.start, cls.rows)
+
+    async def run_engine(self, engine: BacktestingEngineBase, config: ParityControllerConfig,
+                         controller_class: type = ParityController):
+        provider = engine.backtesting_data_provider
+        provider.update_backtesting_time(self.start, self.start + 60 * self.rows)
+        provider.candles_feeds[f"{config.connector_name}_{config.trading_pair}_1m"] = self.candles.copy()
+        with patch.object(BacktestingDataProvider, "initialize_rate_sources"):
+            engine.controller = controller_class(config=config, market_data_provider=provider, actions_queue=None)
+        engine.backtesting_resolution = "1m"
+        await engine.controller.update_processed_data()
+        executors_info = await engine.simulate_execution(trade_cost=0.0006)
+        return executors_info, engine.summarize_results(executors_info, config.total_amount_quote)
+
+    @staticmethod
+    def executor_key(executor_info):
+        return (executor_info.timestamp, executor_info.side, executor_info.close_type, executor_info.close_timestamp,
+                executor_info.is_active, executor_info.status)
+
+    async def assert_parity(self, config_kwargs: dict, controller_class: type = ParityController):
+        base_info, base_results = await self.run_engine(BacktestingEngineBase(), ParityControllerConfig(**config_kwargs),
+                                                        controller_class)
+        vectorized_info, vectorized_results = await self.run_engine(VectorizedBacktestingEngine(),
+                                                                    ParityControllerConfig(**config_kwargs),
+                                                                    controller_class)
+        self.assertGreater(len(base_info), 0)
+        self.assertEqual([self.executor_key(ei) for ei in base_info],
+                         [self.executor_key(ei) for ei in vectorized_info])
+        for base, vectorized in zip(base_info, vectorized_info):
+            self.assertAlmostEqual(float(base.net_pnl_quote), float(vectorized.net_pnl_quote), places=9)
+            self.assertAlmostEqual(float(base.filled_amount_quote), float(vectorized.filled_amount_quote), places=9)
+            self.assertAlmostEqual(float(base.cum_fees_quote), float(vectorized.cum_fees_quote), places=9)
+        self.assertEqual(base_results["close_types"], vectorized_results["close_types"])
+        for key in ["net_pnl_quote", "total_volume", "max_drawdown_usd", "sharpe_ratio", "profit_factor"]:
+            self.assertAlmostEqual(base_results[key], vectorized_results[key], places=6)
+        for key in ["total_executors", "total_positions", "total_long", "total_short", "win_signals", "loss_signals"]:
+            self.assertEqual(base_results[key], vectorized_results[key])
+
+    async def test_parity_take_profit_stop_loss_time_limit(self):
+        await self.assert_parity({"stop_loss": Decimal("0.01"), "take_profit": Decimal("0.008"),
+                                  "time_limit": 60 * 30, "cooldown_time": 60 * 5})
+
+    async def test_parity_trailing_stop(self):
+        await self.assert_parity({"stop_loss": Decimal("0.02"), "take_profit": Decimal("0.03"),
+                                  "time_limit": 60 * 120, "cooldown_time": 60,
+                                  "trailing_stop": TrailingStop(activation_price=Decimal("0.004"),
+                                                                trailing_delta=Decimal("0.002"))})
+
+    async def test_parity_without_time_limit(self):
+        await self.assert_parity({"stop_loss": Decimal("0.015"), "take_profit": Decimal("0.01"),
+                                  "time_limit": None, "cooldown_time": 60 * 10, "max_executors_per_side": 3})
+
+    async def test_parity_limit_entry(self):
+        await self.assert_parity({"stop_loss": Decimal("0.01"), "take_profit": Decimal("0.01"),
+                                  "time_limit": 60 * 60, "cooldown_time": 60 * 15,
+                                  "limit_entry_offset": Decimal("0.002")})
+
+    async def test_parity_dca_executors(self):
+        await self.assert_parity({"stop_loss": Decimal("0.015"), "take_profit": Decimal("0.006"),
+                                  "time_limit": 60 * 45, "cooldown_time": 60 * 10, "use_dca_executors": True})
+
+    async def test_parity_stop_executor_actions(self):
+        config_kwargs = {"stop_loss": Decimal("0.03"), "take_profit": Decimal("0.03"), "time_limit": 60 * 60,
+                         "cooldown_time": 60 * 5}
+        engine = VectorizedBacktestingEngine()
+        executors_info, _ = await self.run_engine(engine, ParityControllerConfig(**config_kwargs),
+                                                  EarlyStopParityController)
+        self.assertTrue(engine.requires_every_row())
+        self.assertIn(CloseType.EARLY_STOP, [executor_info.close_type for executor_info in executors_info])
+        await self.assert_parity(config_kwargs, EarlyStopParityController)
+
+    async def test_parity_constant_signal(self):
+        config_kwargs = {"stop_loss": Decimal("0.01"), "take_profit": Decimal("0.005"), "time_limit": 60 * 30,
+                         "constant_signal": True}
+        engine = VectorizedBacktestingEngine()
+        await self.run_engine(engine, ParityControllerConfig(**config_kwargs), MarketMakingParityController)
+        self.assertTrue(engine.requires_every_row())
+        await self.assert_parity(config_kwargs, MarketMakingParityController)
+
+    async def test_parity_custom_actions_proposal(self):
+        config_kwargs = {"stop_loss": Decimal("0.01"), "take_profit": Decimal("0.008"), "time_limit": 60 * 30,
+                         "cooldown_time": 60 * 5}
+        engine = VectorizedBacktestingEngine()
+        await self.run_engine(engine, ParityControllerConfig(**config_kwargs), ScheduledEntryParityController)
+        self.assertTrue(engine.requires_every_row())
+        await self.assert_parity(config_kwargs, ScheduledEntryParityController)
+
+    async def test_requires_every_row_only_for_signal_driven_controllers(self):
+        engine = VectorizedBacktestingEngine()
+        await self.run_engine(engine, ParityControllerConfig(stop_loss=Decimal("0.01"), take_profit=Decimal("0.01")))
+        self.assertFalse(engine.requires_every_row())
+        engine.signal_columns = ("signal", "missing_signal")
+        self.assertTrue(engine.requires_every_row())
+
+    def test_candle_extrema_index_matches_linear_search(self):
+        rng = np.random.default_rng(7)
+        values = rng.normal(0, 1, 1000)
+        index = CandleExtremaIndex(values, block_size=16)
+        for start, stop, threshold in [(0, 1000, 2.5), (5, 300, 1.0), (17, 18, -5), (990, 1000, 0.5), (100, 50, 0)]:
+            above = [i for i in range(start, stop) if values[i] > threshold]
+            below = [i for i in range(start, stop) if values[i] <= -threshold]
+            self.assertEqual(above[0] if above else None, index.first_above(threshold, start, stop))
+            self.assertEqual(below[0] if below else None, index.first_below(-threshold, start, stop, inclusive=True))
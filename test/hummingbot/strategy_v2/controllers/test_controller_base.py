@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.strategy_v2.models.executors_info import ExecutorsChangeSet
 
 
 class TestControllerBase(IsolatedAsyncioWrapperTestCase):
@@ -86,6 +87,28 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
         # Check that no action is put in the queue
         self.mock_actions_queue.put.assert_not_called()
 
+    async def test_control_task_resets_the_processed_executors_changes(self):
+        type(self.controller.market_data_provider).ready = PropertyMock(return_value=True)
+        self.controller.executors_update_event.set()
+        self.controller.determine_executor_actions = MagicMock(return_value=[])
+        first_info, second_info, third_info = MagicMock(id="first"), MagicMock(id="second"), MagicMock(id="third")
+        self.controller.executors_changes = ExecutorsChangeSet.model_construct(updated=[first_info, second_info],
+                                                                               removed=[])
+        new_changes = ExecutorsChangeSet.model_construct(updated=[third_info], removed=["second"])
+
+        async def update_processed_data():
+            # Changes reported by the strategy while the controller processes its data
+            self.controller.executors_changes = self.controller.executors_changes.merge(new_changes)
+
+        self.controller.update_processed_data = update_processed_data
+        await self.controller.control_task()
+        self.assertEqual([first_info, third_info], self.controller.executors_changes.updated)
+        self.assertEqual(["second"], self.controller.executors_changes.removed)
+
+        self.controller.update_processed_data = AsyncMock()
+        await self.controller.control_task()
+        self.assertTrue(self.controller.executors_changes.is_empty)
+
     def test_to_format_status(self):
         # Test the to_format_status method
         status = self.controller.to_format_status()
@@ -18,6 +18,7 @@ from hummingbot.core.event.events import (
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
 
@@ -169,3 +170,35 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
     def test_get_in_flight_order(self):
         in_flight_orders = self.component.get_in_flight_order("connector1", "OID-BUY-1")
         self.assertEqual(in_flight_orders, None)
+
+    def test_executor_info_is_built_again_only_when_the_executor_changes(self):
+        config = PositionExecutorConfig(id="test", timestamp=1234567890, trading_pair="ETH-USDT",
+                                        connector_name="connector1", side=TradeType.BUY, amount=Decimal("1"))
+        executor = ExecutorBase(strategy=self.strategy, connectors=["connector1"], config=config)
+        executor.get_net_pnl_quote = MagicMock(return_value=Decimal("1"))
+        executor.get_net_pnl_pct = MagicMock(return_value=Decimal("0.01"))
+        executor.get_cum_fees_quote = MagicMock(return_value=Decimal("NaN"))
+        executor.get_custom_info = MagicMock(return_value={})
+
+        executor_info = executor.executor_info
+        self.assertIs(executor_info, executor.executor_info)
+        self.assertEqual(Decimal("0"), executor_info.cum_fees_quote)
+        executor.get_custom_info.assert_called_once()
+
+        executor.get_net_pnl_quote.return_value = Decimal("2")
+        updated_executor_info = executor.executor_info
+        self.assertIsNot(executor_info, updated_executor_info)
+        self.assertEqual(Decimal("2"), updated_executor_info.net_pnl_quote)
+
+        executor._create_buy_order_forwarder(BuyOrderCreatedEvent(
+            timestamp=1234567890,
+            order_id="OID-BUY-1",
+            trading_pair="ETH-USDT",
+            amount=Decimal("1.0"),
+            type=OrderType.LIMIT,
+            price=Decimal("1000.0"),
+            exchange_order_id="ED140",
+            creation_timestamp=1234567890
+        ))
+        self.assertIsNot(updated_executor_info, executor.executor_info)
+        self.assertEqual(3, executor.get_custom_info.call_count)
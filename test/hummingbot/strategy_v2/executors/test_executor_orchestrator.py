@@ -700,3 +700,49 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(len(result["controller2"]["executors"]), 0)
         self.assertEqual(len(result["controller3"]["executors"]), 0)
         self.assertEqual(len(result["controller3"]["positions"]), 0)
+
+    def test_get_all_reports_updates_the_performance_of_the_changed_executors(self):
+        config = PositionExecutorConfig(
+            id="executor_1", timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(status: RunnableStatus, net_pnl_quote: Decimal, close_type=None) -> ExecutorInfo:
+            return ExecutorInfo(
+                id="executor_1", timestamp=1234, type="position_executor", status=status, config=config,
+                close_type=close_type, filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote,
+                net_pnl_pct=Decimal(0), cum_fees_quote=Decimal(0), is_trading=True, is_active=True, custom_info={})
+
+        executor = MagicMock(spec=PositionExecutor)
+        executor.config = config
+        executor.is_active = False
+        executor.executor_info = executor_info(RunnableStatus.RUNNING, Decimal(5))
+        self.orchestrator.cached_performance["test"] = PerformanceReport()
+        self.orchestrator.active_executors["test"] = [executor]
+
+        report = self.orchestrator.get_all_reports()["test"]
+        self.assertEqual([executor.executor_info], report["executors"])
+        self.assertEqual([executor.executor_info], report["executors_changes"].updated)
+        self.assertEqual(Decimal(5), report["performance"].unrealized_pnl_quote)
+        self.assertEqual(Decimal(100), report["performance"].volume_traded)
+
+        report = self.orchestrator.get_all_reports()["test"]
+        self.assertTrue(report["executors_changes"].is_empty)
+        self.assertEqual(Decimal(5), report["performance"].unrealized_pnl_quote)
+
+        executor.executor_info = executor_info(RunnableStatus.TERMINATED, Decimal(7), CloseType.TAKE_PROFIT)
+        report = self.orchestrator.get_all_reports()["test"]
+        self.assertEqual([executor.executor_info], report["executors_changes"].updated)
+        self.assertEqual(Decimal(0), report["performance"].unrealized_pnl_quote)
+        self.assertEqual(Decimal(7), report["performance"].realized_pnl_quote)
+        self.assertEqual(Decimal(100), report["performance"].volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, report["performance"].close_type_counts)
+
+        with patch.object(MarketsRecorder, "get_instance"):
+            self.orchestrator.execute_action(StoreExecutorAction(executor_id="executor_1", controller_id="test"))
+        report = self.orchestrator.get_all_reports()["test"]
+        self.assertEqual([], report["executors"])
+        self.assertEqual(["executor_1"], report["executors_changes"].removed)
+        self.assertEqual(Decimal(7), report["performance"].realized_pnl_quote)
+        self.assertEqual(Decimal(100), report["performance"].volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, report["performance"].close_type_counts)
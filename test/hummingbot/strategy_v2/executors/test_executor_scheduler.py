@@ -0,0 +1,119 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler, TickDurationHistogram
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+
+
+class CountingExecutor(ExecutorBase):
+
+    def __init__(self, strategy: ScriptStrategyBase, executor_id: str, update_interval: float):
+        config = PositionExecutorConfig(id=executor_id, timestamp=1234, trading_pair="ETH-USDT",
+                                        connector_name="binance", side=TradeType.BUY, amount=Decimal("1"))
+        super().__init__(strategy=strategy, connectors=["binance"], config=config, update_interval=update_interval)
+        self.starts = 0
+        self.ticks = 0
+        self.stops = 0
+
+    async def on_start(self):
+        self.starts += 1
+
+    async def control_task(self):
+        self.ticks += 1
+
+    def on_stop(self):
+        self.stops += 1
+
+
+class ExecutorSchedulerTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=["ETH-USDT"])
+        connector = MagicMock()
+        connector.order_book_tracker = self.tracker
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"binance": connector}
+        self.strategy.current_timestamp = 1234
+        self.scheduler = ExecutorScheduler(resolution=0.01, min_tick_interval=0.05)
+
+    def tearDown(self) -> None:
+        self.scheduler.stop()
+        super().tearDown()
+
+    def create_executor(self, executor_id: str, update_interval: float) -> CountingExecutor:
+        executor = CountingExecutor(self.strategy, executor_id, update_interval)
+        executor.set_scheduler(self.scheduler)
+        executor.start()
+        return executor
+
+    async def test_executors_run_in_the_scheduler_task(self):
+        executors = [self.create_executor(f"executor_{i}", update_interval=0.05) for i in range(10)]
+        tasks_count = len(asyncio.all_tasks())
+
+        await asyncio.sleep(0.22)
+
+        self.assertEqual(tasks_count, len(asyncio.all_tasks()))
+        for executor in executors:
+            self.assertEqual(1, executor.starts)
+            self.assertGreaterEqual(executor.ticks, 3)
+            self.assertEqual(executor.ticks, self.scheduler.tick_durations[executor.config.id].count)
+
+        executors[0].stop()
+        await asyncio.sleep(0.1)
+        self.assertEqual(1, executors[0].stops)
+        self.assertNotIn(executors[0], self.scheduler.executors)
+        self.assertEqual(9, len(self.scheduler.get_tick_durations()))
+
+    async def test_wake_runs_the_control_task_early(self):
+        executor = self.create_executor("executor", update_interval=10)
+        await asyncio.sleep(0.02)
+        self.assertEqual(1, executor.ticks)
+
+        self.scheduler.wake(executor)
+        await asyncio.sleep(0.02)
+        self.assertEqual(1, executor.ticks)
+        await asyncio.sleep(0.05)
+        self.assertEqual(2, executor.ticks)
+
+    async def test_order_book_updates_wake_the_executors_of_the_trading_pair(self):
+        executor = self.create_executor("executor", update_interval=10)
+        await asyncio.sleep(0.07)
+        self.assertEqual(1, executor.ticks)
+
+        self.tracker._notify_message_listeners(OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": "BTC-USDT", "update_id": 1, "bids": [], "asks": []},
+            timestamp=1))
+        await asyncio.sleep(0.03)
+        self.assertEqual(1, executor.ticks)
+
+        self.tracker._notify_message_listeners(OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": "ETH-USDT", "update_id": 2, "bids": [], "asks": []},
+            timestamp=1))
+        await asyncio.sleep(0.03)
+        self.assertEqual(2, executor.ticks)
+
+        executor.stop()
+        await asyncio.sleep(0.08)
+        self.assertEqual(1, executor.stops)
+        self.assertEqual([], self.tracker._message_listeners)
+
+    def test_tick_duration_histogram(self):
+        histogram = TickDurationHistogram()
+        for duration in [0.0005, 0.002, 0.002, 0.3]:
+            histogram.observe(duration)
+
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(0.3, histogram.max)
+        self.assertEqual(0.0025, histogram.percentile(50))
+        self.assertEqual(0.3, histogram.percentile(100))
+        self.assertEqual(2, histogram.to_dict()["buckets"][0.0025])